@@ -5,6 +5,7 @@
 
 
 import re
+import sys
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -16,6 +17,11 @@ from pontos.changelog.errors import ChangelogBuilderError
 from pontos.git import Git
 from pontos.typing import SupportsStr
 
+if sys.version_info >= (3, 11):
+    from re import _parser as re_parser  # type: ignore[attr-defined]
+else:
+    import sre_parse as re_parser
+
 ADDRESS = "https://github.com/"
 
 DEFAULT_CHANGELOG_CONFIG = """commit_types = [
@@ -27,6 +33,28 @@ DEFAULT_CHANGELOG_CONFIG = """commit_types = [
 ]
 """
 
+_TYPE_GROUP = "commit_type_"
+
+_GROUP_REFERENCES = (re_parser.GROUPREF, re_parser.GROUPREF_EXISTS)
+
+
+def _refers_to_groups(value: object) -> bool:
+    if isinstance(value, re_parser.SubPattern):
+        return any(
+            op in _GROUP_REFERENCES or _refers_to_groups(av) for op, av in value
+        )
+    if isinstance(value, (list, tuple)):
+        return any(_refers_to_groups(item) for item in value)
+    return False
+
+
+def _has_group_references(pattern: str) -> bool:
+    """
+    Check if a pattern contains backreferences or conditionals. These refer
+    to the group numbers which change in a combined expression.
+    """
+    return _refers_to_groups(re_parser.parse(pattern, re.IGNORECASE))
+
 
 class CommitType(TypedDict):
     message: str
@@ -82,6 +110,36 @@ class ConventionalCommits:
         else:
             self._config = tomlkit.parse(DEFAULT_CHANGELOG_CONFIG)
 
+        self._groups = [
+            str(commit_type["group"]) for commit_type in self.commit_types()
+        ]
+        patterns = [
+            rf"{commit_type['message']}\s?[:|-]"
+            for commit_type in self.commit_types()
+        ]
+        # compile the patterns separately first to report invalid ones
+        self._expressions = [
+            re.compile(pattern, flags=re.IGNORECASE) for pattern in patterns
+        ]
+        # a single alternation of all commit types. the name of the matching
+        # group is the index of the commit type.
+        self._classifier: re.Pattern[str] | None = None
+        if patterns and not any(
+            _has_group_references(pattern) for pattern in patterns
+        ):
+            try:
+                self._classifier = re.compile(
+                    "|".join(
+                        f"(?P<{_TYPE_GROUP}{index}>{pattern})"
+                        for index, pattern in enumerate(patterns)
+                    ),
+                    flags=re.IGNORECASE,
+                )
+            except re.error:
+                # for example global inline flags or duplicate group names in
+                # the patterns. fall back to matching the types one by one.
+                pass
+
     def get_commits(
         self,
         from_ref: SupportsStr | None = None,
@@ -107,6 +165,30 @@ class ConventionalCommits:
     def commit_types(self) -> list[CommitType]:
         return self._config.get("commit_types", [])
 
+    def _classify(self, message: str) -> list[list[str]]:
+        """
+        Get the group and the cleaned message of a commit message
+
+        The message is matched against all commit types at once. The first
+        matching commit type of the config wins.
+        """
+        if self._classifier:
+            match = self._classifier.match(message)
+            if not match:
+                return []
+            # the group of the commit type is always the last matched group
+            index = int(match.lastgroup.removeprefix(_TYPE_GROUP))  # type: ignore[union-attr]
+        else:
+            for index, reg in enumerate(self._expressions):
+                match = reg.match(message)
+                if match:
+                    break
+            else:
+                return []
+
+        # remove the commit tag from commit message
+        return [[self._groups[index], message[match.end() :].strip()]]
+
     def _get_git_log(
         self, from_ref: SupportsStr | None, to_ref: SupportsStr = "HEAD"
     ) -> list[str]:
@@ -155,31 +237,13 @@ class ConventionalCommits:
         Returns
             The dict containing the commit messages
         """
-        expressions = [
-            (
-                commit_type["group"],
-                re.compile(
-                    rf"{commit_type['message']}\s?[:|-]", flags=re.IGNORECASE
-                ),
-            )
-            for commit_type in self.commit_types()
-        ]
         commit_dict = defaultdict(list)
-        if commits and len(commits) > 0:
-            for commit in commits:
-                commit_id, message = commit.split(" ", maxsplit=1)
-                for group, reg in expressions:
-                    match = reg.match(message)
-                    if match:
-                        # remove the commit tag from commit message
-                        cleaned_msg = message.replace(
-                            match.group(0), ""
-                        ).strip()
-                        commit_dict[group].append(
-                            CommitLogEntry(
-                                commit_id=commit_id, message=cleaned_msg
-                            )
-                        )
+        for commit in commits:
+            commit_id, message = commit.split(" ", maxsplit=1)
+            for group, cleaned_msg in self._classify(message):
+                commit_dict[group].append(
+                    CommitLogEntry(commit_id=commit_id, message=cleaned_msg)
+                )
 
         return commit_dict
 
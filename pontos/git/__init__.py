@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
+from ._async import AsyncGit
+from ._cat_file import GitCatFile, GitObject
 from ._git import (
     DEFAULT_TAG_PREFIX,
     DEFAULT_TAG_SORT_SUFFIX,
@@ -13,17 +15,27 @@ from ._git import (
     ResetMode,
     TagSort,
 )
-from ._status import Status, StatusEntry
+from ._log import GitCommit
+from ._multi import DEFAULT_MULTI_GIT_CONCURRENCY, MultiGit, RepositoryResult
+from ._status import Status, StatusEntry, SubmoduleStatus
 
 __all__ = (
+    "DEFAULT_MULTI_GIT_CONCURRENCY",
     "DEFAULT_TAG_PREFIX",
     "DEFAULT_TAG_SORT_SUFFIX",
+    "AsyncGit",
     "ConfigScope",
     "Git",
+    "GitCatFile",
+    "GitCommit",
     "GitError",
+    "GitObject",
     "MergeStrategy",
+    "MultiGit",
+    "RepositoryResult",
     "ResetMode",
     "Status",
     "StatusEntry",
+    "SubmoduleStatus",
     "TagSort",
 )
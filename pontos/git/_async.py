@@ -0,0 +1,400 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from os import PathLike, fspath
+from pathlib import Path
+
+from ._errors import GitError
+from ._git import (
+    ConfigScope,
+    MergeStrategy,
+    ResetMode,
+    TagSort,
+    _GitBase,
+)
+from ._status import StatusEntry, parse_git_status
+
+
+async def exec_git_async(
+    *args: str,
+    ignore_errors: bool | None = False,
+    cwd: PathLike | None = None,
+) -> str:
+    """
+    Internal module function to abstract calling git via an asyncio
+    subprocess. Most of the cases the AsyncGit class should be used.
+
+    Args:
+        ignore_errors: Set to True if errors while running git should be
+            ignored. Default: False.
+        cwd: Set the current working directory
+
+    Raises:
+        GitError: Will be raised if ignore_errors is False and git returns with
+            an exit code != 0.
+
+    Returns:
+        stdout output of git command or empty string if ignore_errors is True
+        and git returns with an exit code != 0.
+    """
+    cmd_args = ["git"]
+    cmd_args.extend(args)
+    process = await asyncio.create_subprocess_exec(
+        *cmd_args,
+        cwd=fspath(cwd) if cwd else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    output = stdout.decode("utf8", errors="replace")
+
+    if process.returncode:
+        if ignore_errors:
+            return ""
+        raise GitError(
+            process.returncode,
+            cmd_args,
+            output,
+            stderr.decode("utf8", errors="replace"),
+        )
+
+    return output
+
+
+class AsyncGit(_GitBase):
+    """
+    Run git commands as asyncio subprocesses
+
+    AsyncGit provides the same API as :py:class:`Git` but all commands are
+    coroutines. Therefore running git doesn't block the event loop and git
+    commands can run concurrently to network requests, for example of the
+    GitHub API.
+
+    Example:
+        .. code-block:: python
+
+            import asyncio
+
+            from pontos.git import AsyncGit
+            from pontos.github.api import GitHubAsyncRESTApi
+
+            git = AsyncGit()
+            async with GitHubAsyncRESTApi(token) as api:
+                tags, release = await asyncio.gather(
+                    git.list_tags(), api.releases.get("foo/bar", "v1.2.3")
+                )
+    """
+
+    def __init__(self, cwd: Path | None = None) -> None:
+        """
+        Create a new AsyncGit instance
+
+        Args:
+            cwd: Set the current working directory for the git commands
+        """
+        super().__init__(cwd)
+
+    async def version(self) -> str:
+        """
+        Get the version string of the installed git
+
+        In contrast to :py:attr:`Git.version` this is a coroutine method and
+        not a property.
+        """
+        return self._parse_version(await self.exec("--version"))
+
+    async def exec(self, *args: str) -> str:
+        return await exec_git_async(*args, cwd=self._cwd)
+
+    async def init(self, *, bare: bool | None = False) -> None:
+        """
+        Init a git repository
+
+        See :py:meth:`Git.init` for details.
+        """
+        await self.exec(*self._init_args(bare))
+
+    async def create_branch(
+        self, branch: str, *, start_point: str | None = None
+    ) -> None:
+        """
+        Create a new branch
+
+        See :py:meth:`Git.create_branch` for details.
+        """
+        await self.exec(*self._create_branch_args(branch, start_point))
+
+    async def rebase(
+        self,
+        base: str,
+        *,
+        head: str | None = None,
+        onto: str | None = None,
+        strategy: MergeStrategy | None = None,
+    ) -> None:
+        """
+        Rebase a branch
+
+        See :py:meth:`Git.rebase` for details.
+        """
+        await self.exec(*self._rebase_args(base, head, onto, strategy))
+
+    async def clone(
+        self,
+        repo_url: str,
+        destination: Path,
+        *,
+        branch: str | None = None,
+        remote: str | None = None,
+        depth: int | None = None,
+    ) -> None:
+        """
+        Clone a repository
+
+        See :py:meth:`Git.clone` for details.
+        """
+        await self.exec(
+            *self._clone_args(repo_url, destination, branch, remote, depth)
+        )
+
+    async def push(
+        self,
+        refspec: str | Iterable[str] | None = None,
+        *,
+        remote: str | None = None,
+        branch: str | None = None,
+        follow_tags: bool = False,
+        force: bool | None = None,
+        delete: bool | None = None,
+    ) -> None:
+        """
+        Push changes to remote repository
+
+        See :py:meth:`Git.push` for details.
+        """
+        await self.exec(
+            *self._push_args(
+                refspec, remote, branch, follow_tags, force, delete
+            )
+        )
+
+    async def config(
+        self,
+        key: str,
+        value: str | None = None,
+        *,
+        scope: ConfigScope | str | None = None,
+    ) -> str:
+        """
+        Get and set a git config
+
+        See :py:meth:`Git.config` for details.
+        """
+        return await self.exec(*self._config_args(key, value, scope))
+
+    async def cherry_pick(self, commits: str | list[str]) -> None:
+        """
+        Apply changes of a commit(s) to the current branch
+
+        See :py:meth:`Git.cherry_pick` for details.
+        """
+        await self.exec(*self._cherry_pick_args(commits))
+
+    async def list_tags(
+        self,
+        *,
+        sort: TagSort | str | None = None,
+        tag_name: str | None = None,
+        sort_suffix: list[str] | None = None,
+    ) -> list[str]:
+        """
+        List all available tags
+
+        See :py:meth:`Git.list_tags` for details.
+        """
+        output = await self.exec(
+            *self._list_tags_args(sort, tag_name, sort_suffix)
+        )
+        return output.splitlines()
+
+    async def add(
+        self,
+        files: str | PathLike[str] | Sequence[PathLike[str] | str],
+    ) -> None:
+        """
+        Add files to the git staging area
+
+        See :py:meth:`Git.add` for details.
+        """
+        await self.exec(*self._add_args(files))
+
+    async def commit(
+        self,
+        message: str,
+        *,
+        verify: bool | None = None,
+        gpg_sign: bool | None = None,
+        gpg_signing_key: str | None = None,
+    ) -> None:
+        """
+        Create a new commit
+
+        See :py:meth:`Git.commit` for details.
+        """
+        await self.exec(
+            *self._commit_args(message, verify, gpg_sign, gpg_signing_key)
+        )
+
+    async def tag(
+        self,
+        tag: str,
+        *,
+        gpg_key_id: str | None = None,
+        message: str | None = None,
+        force: bool | None = False,
+        sign: bool | None = None,
+    ) -> None:
+        """
+        Create a Tag
+
+        See :py:meth:`Git.tag` for details.
+        """
+        await self.exec(*self._tag_args(tag, gpg_key_id, message, force, sign))
+
+    async def delete_tag(self, tag: str) -> None:
+        """
+        Delete a Tag
+
+        See :py:meth:`Git.delete_tag` for details.
+        """
+        await self.exec("tag", "-d", tag)
+
+    async def fetch(
+        self,
+        remote: str | None = None,
+        refspec: str | None = None,
+        *,
+        verbose: bool = False,
+    ) -> None:
+        """
+        Fetch from changes from remote
+
+        See :py:meth:`Git.fetch` for details.
+        """
+        await self.exec(*self._fetch_args(remote, refspec, verbose))
+
+    async def add_remote(self, remote: str, url: str) -> None:
+        """
+        Add a new git remote
+
+        See :py:meth:`Git.add_remote` for details.
+        """
+        await self.exec("remote", "add", remote, url)
+
+    async def remote_url(self, remote: str = "origin") -> str:
+        """
+        Get the url of a remote
+
+        See :py:meth:`Git.remote_url` for details.
+        """
+        return await self.exec("remote", "get-url", remote)
+
+    async def checkout(
+        self, branch: str, *, start_point: str | None = None
+    ) -> None:
+        """
+        Checkout a branch
+
+        See :py:meth:`Git.checkout` for details.
+        """
+        await self.exec(*self._checkout_args(branch, start_point))
+
+    async def log(
+        self,
+        *log_args: str,
+        oneline: bool | None = None,
+        format: str | None = None,  # noqa: A002
+    ) -> list[str]:
+        """
+        Get log of a git repository
+
+        See :py:meth:`Git.log` for details.
+        """
+        output = await self.exec(*self._log_args(log_args, oneline, format))
+        return output.splitlines()
+
+    async def show(
+        self,
+        *show_args: str,
+        format: str | None = None,  # noqa: A002
+        oneline: bool | None = None,
+        patch: bool | None = None,
+        objects: str | Collection[str] | None = None,
+    ) -> str | list[str]:
+        """
+        Show various types of git objects
+
+        See :py:meth:`Git.show` for details.
+        """
+        objects = self._show_objects(objects)
+        output = await self.exec(
+            *self._show_args(show_args, format, oneline, patch, objects)
+        )
+        return self._parse_show(output, objects)
+
+    async def rev_list(
+        self,
+        *commit: str,
+        max_parents: int | None = None,
+        abbrev_commit: bool | None = False,
+    ) -> list[str]:
+        """
+        Lists commit objects in reverse chronological order
+
+        See :py:meth:`Git.rev_list` for details.
+        """
+        output = await self.exec(
+            *self._rev_list_args(commit, max_parents, abbrev_commit)
+        )
+        return output.splitlines()
+
+    async def move(self, old: PathLike, new: PathLike) -> None:
+        """
+        Move a file from old to new
+        """
+        await self.exec("mv", fspath(old), fspath(new))
+
+    async def remove(self, to_remove: PathLike) -> None:
+        """
+        Remove a file from git
+        """
+        await self.exec("rm", fspath(to_remove))
+
+    async def status(
+        self,
+        files: Iterable[PathLike] | None = None,
+    ) -> Iterator[StatusEntry]:
+        """
+        Get information about the current git status
+
+        See :py:meth:`Git.status` for details.
+        """
+        output = await self.exec(*self._status_args(files))
+        return parse_git_status(output)
+
+    async def reset(
+        self,
+        commit,
+        *,
+        mode: ResetMode | str,
+    ) -> None:
+        """
+        Reset the git history
+
+        See :py:meth:`Git.reset` for details.
+        """
+        await self.exec("reset", f"--{mode}", commit)
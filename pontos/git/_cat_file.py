@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import queue
+import subprocess
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from os import PathLike, fspath
+from types import TracebackType
+from typing import IO
+
+from typing_extensions import Self
+
+from ._errors import GitError
+
+# responses of git cat-file for objects that can't be resolved
+_UNRESOLVED = (b" missing", b" ambiguous")
+
+
+@dataclass(frozen=True)
+class GitObject:
+    """
+    A git object read via git cat-file
+
+    Attributes:
+        oid: The full object ID
+        type: Type of the object (commit, tree, blob or tag)
+        size: Size of the object content in bytes
+        content: Raw content of the object. None if only the object
+            information has been requested.
+    """
+
+    oid: str
+    type: str
+    size: int
+    content: bytes | None = None
+
+    @property
+    def text(self) -> str:
+        """
+        The content of the object decoded as UTF-8
+        """
+        return (self.content or b"").decode("utf8", errors="replace")
+
+
+class GitCatFile:
+    """
+    A long-lived git cat-file session for reading many git objects
+
+    All objects are requested from the same git process. Therefore reading
+    thousands of objects requires only a single process and the repository
+    is opened only once. The processes are started on first use and stopped
+    when closing the session.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.git import Git
+
+            git = Git()
+            with git.cat_file() as cat_file:
+                commit = cat_file.get("HEAD")
+                for blob in cat_file.get_many(["HEAD:README.md", "v1.0.0"]):
+                    if blob:
+                        print(blob.oid, blob.size)
+    """
+
+    def __init__(self, cwd: PathLike | None = None) -> None:
+        """
+        Create a new cat-file session
+
+        Args:
+            cwd: Directory of the git repository
+        """
+        self._cwd = cwd
+        self._processes: dict[str, subprocess.Popen[bytes]] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _process(self, mode: str) -> subprocess.Popen[bytes]:
+        process = self._processes.get(mode)
+        if process is None:
+            process = subprocess.Popen(
+                ["git", "cat-file", mode],
+                cwd=fspath(self._cwd) if self._cwd else None,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            self._processes[mode] = process
+        return process
+
+    def _stop(self, mode: str, *, kill: bool = False) -> int:
+        process = self._processes.pop(mode)
+        if kill:
+            process.kill()
+        try:
+            process.stdin.close()  # type: ignore[union-attr]
+        except OSError:
+            # git has already exited
+            pass
+        returncode = process.wait()
+        process.stdout.close()  # type: ignore[union-attr]
+        process.stderr.close()  # type: ignore[union-attr]
+        return returncode
+
+    def _error(self, mode: str) -> GitError:
+        stderr = self._processes[mode].stderr.read()  # type: ignore[union-attr]
+        returncode = self._stop(mode)
+        return GitError(
+            returncode,
+            ["git", "cat-file", mode],
+            "",
+            stderr.decode("utf8", errors="replace"),
+        )
+
+    def _read(self, mode: str) -> GitObject | None:
+        stdout: IO[bytes] = self._processes[mode].stdout  # type: ignore[assignment]
+        header = stdout.readline()
+        if not header:
+            raise self._error(mode)
+
+        header = header.rstrip(b"\n")
+        if header.endswith(_UNRESOLVED):
+            return None
+
+        oid, object_type, size = header.decode("utf8").split(" ")
+        content = None
+        if mode == "--batch":
+            content = stdout.read(int(size))
+            # each content is terminated by a newline
+            stdout.read(1)
+        return GitObject(oid, object_type, int(size), content)
+
+    def _request(self, mode: str, name: str) -> GitObject | None:
+        stdin: IO[bytes] = self._process(mode).stdin  # type: ignore[assignment]
+        try:
+            stdin.write(f"{name}\n".encode())
+            stdin.flush()
+        except BrokenPipeError:
+            raise self._error(mode) from None
+        return self._read(mode)
+
+    def _stream(
+        self, mode: str, names: Iterable[str]
+    ) -> Iterator[GitObject | None]:
+        stdin: IO[bytes] = self._process(mode).stdin  # type: ignore[assignment]
+        # a token for each written request and None after the last one
+        pending: queue.SimpleQueue[bool | None] = queue.SimpleQueue()
+
+        def write() -> None:
+            # write the requests from a separate thread. otherwise git could
+            # block writing the responses while we block writing requests.
+            try:
+                for name in names:
+                    stdin.write(f"{name}\n".encode())
+                    pending.put(True)
+                stdin.flush()
+            except (OSError, ValueError):
+                # git has exited or the session has been closed
+                pass
+            finally:
+                pending.put(None)
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        completed = False
+        try:
+            while pending.get():
+                yield self._read(mode)
+            completed = True
+        finally:
+            if not completed and mode in self._processes:
+                # the iteration has been stopped early. restart git to not
+                # mix up the pending responses with later requests.
+                self._stop(mode, kill=True)
+            writer.join()
+
+    def get(self, name: str) -> GitObject | None:
+        """
+        Read a git object including its content
+
+        Args:
+            name: A git object name like a commit ID, a ref or <ref>:<path>
+
+        Raises:
+            GitError: If the git process has failed, for example because the
+                directory isn't a git repository.
+
+        Returns:
+            The object or None if the object doesn't exist
+        """
+        return self._request("--batch", name)
+
+    def info(self, name: str) -> GitObject | None:
+        """
+        Read the ID, type and size of a git object without its content
+
+        Args:
+            name: A git object name like a commit ID, a ref or <ref>:<path>
+
+        Raises:
+            GitError: If the git process has failed, for example because the
+                directory isn't a git repository.
+
+        Returns:
+            The object without content or None if the object doesn't exist
+        """
+        return self._request("--batch-check", name)
+
+    def get_many(self, names: Iterable[str]) -> Iterator[GitObject | None]:
+        """
+        Read many git objects including their content
+
+        The requests are streamed to git while the responses are read.
+
+        Args:
+            names: Git object names like commit IDs, refs or <ref>:<path>
+
+        Raises:
+            GitError: If the git process has failed, for example because the
+                directory isn't a git repository.
+
+        Returns:
+            An iterator yielding an object or None for each name in the same
+            order as the names
+        """
+        return self._stream("--batch", names)
+
+    def info_many(self, names: Iterable[str]) -> Iterator[GitObject | None]:
+        """
+        Read the ID, type and size of many git objects without their content
+
+        Args:
+            names: Git object names like commit IDs, refs or <ref>:<path>
+
+        Raises:
+            GitError: If the git process has failed, for example because the
+                directory isn't a git repository.
+
+        Returns:
+            An iterator yielding an object without content or None for each
+            name in the same order as the names
+        """
+        return self._stream("--batch-check", names)
+
+    def close(self) -> None:
+        """
+        Stop all git processes of the session
+        """
+        for mode in list(self._processes):
+            self._stop(mode)
@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2022-2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import subprocess
+
+from pontos.errors import PontosError
+
+
+class GitError(subprocess.CalledProcessError, PontosError):
+    """
+    Error raised while executing a git command
+    """
+
+    def __str__(self) -> str:
+        cmd = " ".join(self.cmd)
+        return (
+            f"Git command '{cmd}' returned "
+            f"non-zero exit status {self.returncode!s}"
+        )
@@ -4,14 +4,26 @@
 #
 
 import subprocess
-from collections.abc import Collection, Iterable, Iterator, Sequence
+import tempfile
+from collections.abc import (
+    Collection,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from datetime import datetime
 from os import PathLike, fspath
 from pathlib import Path
+from typing import IO
 
 from pontos.enum import StrEnum
-from pontos.errors import PontosError
 
-from ._status import StatusEntry, parse_git_status
+from ._cat_file import GitCatFile
+from ._errors import GitError
+from ._log import GIT_LOG_FORMAT, GitCommit, parse_git_log
+from ._pygit2 import Pygit2Repository
+from ._status import StatusEntry, parse_git_status, parse_git_status_v2
 
 DEFAULT_TAG_SORT_SUFFIX = [
     "-alpha",
@@ -24,18 +36,7 @@ DEFAULT_TAG_SORT_SUFFIX = [
 
 DEFAULT_TAG_PREFIX = "v"
 
-
-class GitError(subprocess.CalledProcessError, PontosError):
-    """
-    Error raised while executing a git command
-    """
-
-    def __str__(self) -> str:
-        cmd = " ".join(self.cmd)
-        return (
-            f"Git command '{cmd}' returned "
-            f"non-zero exit status {self.returncode!s}"
-        )
+_STREAM_CHUNK_SIZE = 64 * 1024
 
 
 def exec_git(
@@ -79,6 +80,64 @@ def exec_git(
         raise GitError(e.returncode, e.cmd, e.output, e.stderr) from None
 
 
+def stream_git(
+    *args: str,
+    separator: str = "\0",
+    cwd: PathLike | None = None,
+) -> Generator[str, None, None]:
+    """
+    Internal module function to run git and read its output incrementally.
+    Most of the cases the Git class should be used.
+
+    Args:
+        separator: Separator of the output records. Default: NUL.
+        cwd: Set the current working directory
+
+    Raises:
+        GitError: Will be raised after all records have been read if git
+            returns with an exit code != 0.
+
+    Returns:
+        An iterator yielding the records of the stdout output
+    """
+    cmd_args = ["git"]
+    cmd_args.extend(args)
+    delimiter = separator.encode()
+    with (
+        tempfile.TemporaryFile() as stderr,
+        subprocess.Popen(
+            cmd_args,
+            cwd=fspath(cwd) if cwd else None,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+        ) as process,
+    ):
+        stdout: IO[bytes] = process.stdout  # type: ignore[assignment]
+        completed = False
+        try:
+            remainder = b""
+            while chunk := stdout.read(_STREAM_CHUNK_SIZE):
+                *records, remainder = (remainder + chunk).split(delimiter)
+                for record in records:
+                    yield record.decode("utf8", errors="replace")
+            if remainder:
+                yield remainder.decode("utf8", errors="replace")
+            completed = True
+        finally:
+            if not completed:
+                # the iteration has been stopped early
+                process.kill()
+
+        if process.wait():
+            stderr.seek(0)
+            raise GitError(
+                process.returncode,
+                cmd_args,
+                "",
+                stderr.read().decode("utf8", errors="replace"),
+            )
+
+
 class MergeStrategy(StrEnum):
     """
     Possible strategies for a merge
@@ -139,18 +198,12 @@ class ResetMode(StrEnum):
     KEEP = "keep"
 
 
-class Git:
+class _GitBase:
     """
-    Run git commands as subprocesses
+    Shared state and command line building of Git and AsyncGit
     """
 
     def __init__(self, cwd: Path | None = None) -> None:
-        """
-        Create a new Git instance
-
-        Args:
-            cwd: Set the current working directory for the git commands
-        """
         self._cwd = cwd.absolute() if cwd else None
 
     @property
@@ -167,17 +220,375 @@ class Git:
         """
         self._cwd = cwd.absolute()
 
+    @staticmethod
+    def _parse_version(output: str) -> str:
+        # git --version returns "git version 2.3.4"
+        return output.strip().rsplit(" ", 1)[1]
+
+    @staticmethod
+    def _init_args(bare: bool | None) -> list[str]:
+        args = ["init"]
+        if bare:
+            args.append("--bare")
+        return args
+
+    @staticmethod
+    def _create_branch_args(branch: str, start_point: str | None) -> list[str]:
+        args = ["checkout", "-b", branch]
+        if start_point:
+            args.append(start_point)
+        return args
+
+    @staticmethod
+    def _rebase_args(
+        base: str,
+        head: str | None,
+        onto: str | None,
+        strategy: MergeStrategy | None,
+    ) -> list[str]:
+        args = ["rebase"]
+
+        if strategy:
+            if strategy == MergeStrategy.ORT_OURS:
+                args.extend(["--strategy", "ort", "-X", "ours"])
+            else:
+                args.extend(["--strategy", str(strategy)])
+
+        if onto:
+            args.extend(["--onto", onto])
+
+        args.append(base)
+
+        if head:
+            args.append(head)
+
+        return args
+
+    @staticmethod
+    def _clone_args(
+        repo_url: str,
+        destination: Path,
+        branch: str | None,
+        remote: str | None,
+        depth: int | None,
+    ) -> list[str]:
+        args = ["clone"]
+        if remote:
+            args.extend(["-o", remote])
+        if branch:
+            args.extend(["-b", branch])
+        if depth:
+            args.extend(["--depth", str(depth)])
+        args.extend([repo_url, str(destination.absolute())])
+        return args
+
+    @staticmethod
+    def _push_args(
+        refspec: str | Iterable[str] | None,
+        remote: str | None,
+        branch: str | None,
+        follow_tags: bool,
+        force: bool | None,
+        delete: bool | None,
+    ) -> list[str]:
+        args = ["push"]
+        if follow_tags:
+            args.append("--follow-tags")
+        if force:
+            args.append("--force")
+        if delete:
+            args.append("--delete")
+        if remote:
+            args.append(remote)
+            if branch:
+                args.append(branch)
+        if refspec:
+            if isinstance(refspec, str):
+                args.append(refspec)
+            else:
+                args.extend(refspec)
+        return args
+
+    @staticmethod
+    def _config_args(
+        key: str, value: str | None, scope: ConfigScope | str | None
+    ) -> list[str]:
+        args = ["config"]
+        if scope:
+            args.append(f"--{scope}")
+
+        args.append(key)
+
+        if value is not None:
+            args.append(value)
+
+        return args
+
+    @staticmethod
+    def _cherry_pick_args(commits: str | list[str]) -> list[str]:
+        if isinstance(commits, str):
+            commits = [commits]
+
+        args = ["cherry-pick"]
+        args.extend(commits)
+        return args
+
+    @staticmethod
+    def _list_tags_args(
+        sort: TagSort | str | None,
+        tag_name: str | None,
+        sort_suffix: list[str] | None,
+    ) -> list[str]:
+        if sort:
+            args = []
+
+            if sort_suffix:
+                for suffix in sort_suffix:
+                    args.extend(["-c", f"versionsort.suffix={suffix}"])
+
+            args.extend(["tag", "-l"])
+            args.append(f"--sort={sort}")
+        else:
+            args = ["tag", "-l"]
+
+        if tag_name:
+            args.append(tag_name)
+
+        return args
+
+    @staticmethod
+    def _add_args(
+        files: str | PathLike[str] | Sequence[PathLike[str] | str],
+    ) -> list[str]:
+        if isinstance(files, (PathLike, str)):
+            files = [files]
+
+        args = ["add"]
+        args.extend([fspath(file) for file in files])
+        return args
+
+    @staticmethod
+    def _commit_args(
+        message: str,
+        verify: bool | None,
+        gpg_sign: bool | None,
+        gpg_signing_key: str | None,
+    ) -> list[str]:
+        args = ["commit"]
+        if verify is False:
+            args.append("--no-verify")
+        if gpg_signing_key:
+            args.append(f"-S{gpg_signing_key}")
+        if gpg_sign is False:
+            args.append("--no-gpg-sign")
+
+        args.extend(["-m", message])
+        return args
+
+    @staticmethod
+    def _tag_args(
+        tag: str,
+        gpg_key_id: str | None,
+        message: str | None,
+        force: bool | None,
+        sign: bool | None,
+    ) -> list[str]:
+        args = ["tag"]
+
+        if gpg_key_id:
+            args.extend(["-u", gpg_key_id])
+
+        if message:
+            args.extend(["-m", message])
+
+        if force:
+            args.append("--force")
+
+        if sign is False:
+            args.append("--no-sign")
+
+        args.append(tag)
+        return args
+
+    @staticmethod
+    def _fetch_args(
+        remote: str | None, refspec: str | None, verbose: bool
+    ) -> list[str]:
+        args = ["fetch"]
+
+        if remote:
+            args.append(remote)
+        if refspec:
+            args.append(refspec)
+
+        if verbose:
+            args.append("-v")
+
+        return args
+
+    @staticmethod
+    def _checkout_args(branch: str, start_point: str | None) -> list[str]:
+        if start_point:
+            return ["checkout", "-b", branch, start_point]
+        return ["checkout", branch]
+
+    @staticmethod
+    def _log_args(
+        log_args: Iterable[str],
+        oneline: bool | None,
+        format: str | None,  # noqa: A002
+    ) -> list[str]:
+        args = ["log"]
+
+        if format:
+            args.append(f"--format={format}")
+
+        if oneline:
+            args.append("--oneline")
+
+        args.extend(log_args)
+        return args
+
+    @staticmethod
+    def _show_args(
+        show_args: Iterable[str],
+        format: str | None,  # noqa: A002
+        oneline: bool | None,
+        patch: bool | None,
+        objects: Collection[str],
+    ) -> list[str]:
+        args = ["show"]
+
+        if format:
+            args.append(f"--format={format}")
+
+        if oneline:
+            args.append("--oneline")
+
+        if patch is not None:
+            if patch:
+                args.append("--patch")
+            else:
+                args.append("--no-patch")
+
+        args.extend(objects)
+        args.extend(show_args)
+        return args
+
+    @staticmethod
+    def _show_objects(
+        objects: str | Collection[str] | None,
+    ) -> Collection[str]:
+        if not objects:
+            return []
+        return [objects] if isinstance(objects, str) else objects
+
+    @staticmethod
+    def _parse_show(output: str, objects: Collection[str]) -> str | list[str]:
+        output = output.strip()
+        return output.splitlines() if len(objects) > 1 else output
+
+    @staticmethod
+    def _rev_list_args(
+        commit: Iterable[str],
+        max_parents: int | None,
+        abbrev_commit: bool | None,
+    ) -> list[str]:
+        args = ["rev-list"]
+        if max_parents is not None:
+            args.append(f"--max-parents={max_parents}")
+        if abbrev_commit:
+            args.append("--abbrev-commit")
+
+        args.extend(commit)
+        return args
+
+    @staticmethod
+    def _status_args(files: Iterable[PathLike] | None) -> list[str]:
+        args = [
+            "status",
+            "-z",
+            "--ignore-submodules",
+            "--untracked-files=no",
+        ]
+
+        if files:
+            args.append("--")
+            args.extend([fspath(f) for f in files])
+
+        return args
+
+
+class Git(_GitBase):
+    """
+    Run git commands as subprocesses
+
+    If pygit2 is installed and in_process is set, the read operations
+    :py:meth:`list_tags`, :py:meth:`rev_list`, :py:meth:`log`,
+    :py:meth:`show`, :py:meth:`remote_url` and :py:meth:`status` are executed
+    in-process instead of spawning git. Options that are not supported
+    in-process fall back to running git.
+    """
+
+    def __init__(
+        self, cwd: Path | None = None, *, in_process: bool = False
+    ) -> None:
+        """
+        Create a new Git instance
+
+        Args:
+            cwd: Set the current working directory for the git commands
+            in_process: Set to True to use pygit2 for read operations if it
+                is installed. Default: False.
+        """
+        super().__init__(cwd)
+        self._in_process = in_process
+        self._repository: Pygit2Repository | None = None
+        self._repository_cwd: Path | None = None
+
+    def _pygit2(self) -> Pygit2Repository | None:
+        if not self._in_process:
+            return None
+
+        cwd = (self._cwd or Path.cwd()).resolve()
+        if self._repository is None or self._repository_cwd != cwd:
+            self._repository = Pygit2Repository.discover(cwd)
+            self._repository_cwd = cwd
+        return self._repository
+
     @property
     def version(self) -> str:
         """
         Get the version string of the installed git
         """
-        # git --version returns "git version 2.3.4"
-        return self.exec("--version").strip().rsplit(" ", 1)[1]
+        return self._parse_version(self.exec("--version"))
 
     def exec(self, *args: str) -> str:
         return exec_git(*args, cwd=self._cwd)
 
+    def cat_file(self) -> GitCatFile:
+        """
+        Start a session for reading many git objects via a single long-lived
+        git cat-file process
+
+        Use the session as a context manager to stop the git processes
+        afterwards.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.git import Git
+
+                git = Git()
+                with git.cat_file() as cat_file:
+                    for obj in cat_file.get_many(git.rev_list("HEAD")):
+                        print(obj.text)
+
+        Returns:
+            A new cat-file session for the repository
+        """
+        return GitCatFile(self._cwd)
+
     def init(self, *, bare: bool | None = False) -> None:
         """
         Init a git repository
@@ -186,11 +597,7 @@ class Git:
             bare: Wether to create a `bare` repository or not.
                   Defaults to false.
         """
-        args = ["init"]
-        if bare:
-            args.append("--bare")
-
-        self.exec(*args)
+        self.exec(*self._init_args(bare))
 
     def create_branch(
         self, branch: str, *, start_point: str | None = None
@@ -203,11 +610,7 @@ class Git:
             start_point: An optional git reference (branch, tag, sha, ...) from
                          where to start the branch
         """
-        args = ["checkout", "-b", branch]
-        if start_point:
-            args.append(start_point)
-
-        self.exec(*args)
+        self.exec(*self._create_branch_args(branch, start_point))
 
     def rebase(
         self,
@@ -227,23 +630,7 @@ class Git:
             onto: Apply changes on top of this branch.
             strategy: Merge strategy to use.
         """
-        args = ["rebase"]
-
-        if strategy:
-            if strategy == MergeStrategy.ORT_OURS:
-                args.extend(["--strategy", "ort", "-X", "ours"])
-            else:
-                args.extend(["--strategy", str(strategy)])
-
-        if onto:
-            args.extend(["--onto", onto])
-
-        args.append(base)
-
-        if head:
-            args.append(head)
-
-        self.exec(*args)
+        self.exec(*self._rebase_args(base, head, onto, strategy))
 
     def clone(
         self,
@@ -263,16 +650,9 @@ class Git:
             branch: Branch to checkout. By default the default branch is used.
             remote: Store repo url under this remote name
         """
-        args = ["clone"]
-        if remote:
-            args.extend(["-o", remote])
-        if branch:
-            args.extend(["-b", branch])
-        if depth:
-            args.extend(["--depth", str(depth)])
-        args.extend([repo_url, str(destination.absolute())])
-
-        self.exec(*args)
+        self.exec(
+            *self._clone_args(repo_url, destination, branch, remote, depth)
+        )
 
     def push(
         self,
@@ -297,24 +677,11 @@ class Git:
             force: Force push changes.
             delete: Delete remote refspec
         """
-        args = ["push"]
-        if follow_tags:
-            args.append("--follow-tags")
-        if force:
-            args.append("--force")
-        if delete:
-            args.append("--delete")
-        if remote:
-            args.append(remote)
-            if branch:
-                args.append(branch)
-        if refspec:
-            if isinstance(refspec, str):
-                args.append(refspec)
-            else:
-                args.extend(refspec)
-
-        self.exec(*args)
+        self.exec(
+            *self._push_args(
+                refspec, remote, branch, follow_tags, force, delete
+            )
+        )
 
     def config(
         self,
@@ -331,16 +698,7 @@ class Git:
             value: Value to set for a Git setting.
             scope: Scope of the setting.
         """
-        args = ["config"]
-        if scope:
-            args.append(f"--{scope}")
-
-        args.append(key)
-
-        if value is not None:
-            args.append(value)
-
-        return self.exec(*args)
+        return self.exec(*self._config_args(key, value, scope))
 
     def cherry_pick(self, commits: str | list[str]) -> None:
         """
@@ -350,13 +708,7 @@ class Git:
             commit: A single git reference (e.g. sha) of the commit or a list
                     of git references.
         """
-        if isinstance(commits, str):
-            commits = [commits]
-
-        args = ["cherry-pick"]
-        args.extend(commits)
-
-        self.exec(*args)
+        self.exec(*self._cherry_pick_args(commits))
 
     def list_tags(
         self,
@@ -374,23 +726,34 @@ class Git:
             tag_name: Filter list by the tagname pattern. For example: "22.4*"
             sort_suffix: A list of version suffix to consider.
         """
+        repository = self._pygit2()
+        if repository and not sort:
+            tags = repository.list_tags(tag_name)
+            if tags is not None:
+                return tags
 
-        if sort:
-            args = []
+        return self.exec(
+            *self._list_tags_args(sort, tag_name, sort_suffix)
+        ).splitlines()
 
-            if sort_suffix:
-                for suffix in sort_suffix:
-                    args.extend(["-c", f"versionsort.suffix={suffix}"])
-
-            args.extend(["tag", "-l"])
-            args.append(f"--sort={sort}")
-        else:
-            args = ["tag", "-l"]
-
-        if tag_name:
-            args.append(tag_name)
+    def tag_refs(self) -> dict[str, str]:
+        """
+        Get all tags with their object IDs via a single git for-each-ref call
 
-        return self.exec(*args).splitlines()
+        Returns:
+            The object ID per tag name. For annotated tags the ID of the tag
+            object is used, for lightweight tags the ID of the commit.
+        """
+        output = self.exec(
+            "for-each-ref",
+            "--format=%(objectname) %(refname:strip=2)",
+            "refs/tags",
+        )
+        refs = {}
+        for line in output.splitlines():
+            oid, _, name = line.partition(" ")
+            refs[name] = oid
+        return refs
 
     def add(
         self,
@@ -402,13 +765,7 @@ class Git:
         Args:
             files: A single file or a list of files to add to the staging area
         """
-        if isinstance(files, (PathLike, str)):
-            files = [files]
-
-        args = ["add"]
-        args.extend([fspath(file) for file in files])
-
-        self.exec(*args)
+        self.exec(*self._add_args(files))
 
     def commit(
         self,
@@ -427,17 +784,9 @@ class Git:
             gpg_sign: Set to False to skip signing the commit via GPG
             gpg_signing_key: GPG Key ID to use to sign the commit
         """
-        args = ["commit"]
-        if verify is False:
-            args.append("--no-verify")
-        if gpg_signing_key:
-            args.append(f"-S{gpg_signing_key}")
-        if gpg_sign is False:
-            args.append("--no-gpg-sign")
-
-        args.extend(["-m", message])
-
-        self.exec(*args)
+        self.exec(
+            *self._commit_args(message, verify, gpg_sign, gpg_signing_key)
+        )
 
     def tag(
         self,
@@ -458,23 +807,7 @@ class Git:
             force: True to replace an existing tag.
             sign: Set to False to deactivate signing of the tag.
         """
-        args = ["tag"]
-
-        if gpg_key_id:
-            args.extend(["-u", gpg_key_id])
-
-        if message:
-            args.extend(["-m", message])
-
-        if force:
-            args.append("--force")
-
-        if sign is False:
-            args.append("--no-sign")
-
-        args.append(tag)
-
-        self.exec(*args)
+        self.exec(*self._tag_args(tag, gpg_key_id, message, force, sign))
 
     def delete_tag(
         self,
@@ -486,8 +819,7 @@ class Git:
         Args:
             tag: Tag name to delete
         """
-        args = ["tag", "-d", tag]
-        self.exec(*args)
+        self.exec("tag", "-d", tag)
 
     def fetch(
         self,
@@ -505,17 +837,7 @@ class Git:
                 update.
             verbose: Print verbose output.
         """
-        args = ["fetch"]
-
-        if remote:
-            args.append(remote)
-        if refspec:
-            args.append(refspec)
-
-        if verbose:
-            args.append("-v")
-
-        self.exec(*args)
+        self.exec(*self._fetch_args(remote, refspec, verbose))
 
     def add_remote(self, remote: str, url: str) -> None:
         """
@@ -525,10 +847,7 @@ class Git:
             remote: Name of the new remote
             url: Git URL of the remote repository
         """
-
-        args = ["remote", "add", remote, url]
-
-        self.exec(*args)
+        self.exec("remote", "add", remote, url)
 
     def remote_url(self, remote: str = "origin") -> str:
         """
@@ -537,8 +856,12 @@ class Git:
         Args:
             remote: Name of the remote. Default: origin.
         """
-        args = ["remote", "get-url", remote]
-        return self.exec(*args)
+        repository = self._pygit2()
+        url = repository.remote_url(remote) if repository else None
+        if url is not None:
+            return url
+
+        return self.exec("remote", "get-url", remote)
 
     def checkout(self, branch: str, *, start_point: str | None = None) -> None:
         """
@@ -549,13 +872,7 @@ class Git:
                 given.
             start_point: Create a new branch from this git ref.
         """
-
-        if start_point:
-            args = ["checkout", "-b", branch, start_point]
-        else:
-            args = ["checkout", branch]
-
-        self.exec(*args)
+        self.exec(*self._checkout_args(branch, start_point))
 
     def log(
         self,
@@ -572,17 +889,117 @@ class Git:
             oneline: Print the abbreviated commit id and commit message in one
                 line per commit
         """
-        args = ["log"]
+        repository = self._pygit2()
+        if repository and format and not oneline:
+            lines = repository.log(log_args, format)
+            if lines is not None:
+                return lines
 
-        if format:
-            args.append(f"--format={format}")
+        return self.exec(
+            *self._log_args(log_args, oneline, format)
+        ).splitlines()
 
-        if oneline:
-            args.append("--oneline")
+    def iter_log(
+        self,
+        *log_args: str,
+        files: bool = False,
+    ) -> Iterator[GitCommit]:
+        """
+        Iterate over the log of a git repository
+
+        In contrast to :py:meth:`log` the output of git is read incrementally
+        and parsed into commit records. Therefore the memory usage doesn't
+        grow with the size of the log.
+
+        Args:
+            log_args: Additional arguments for git log like a revision range
+            files: Also get the paths of the files changed by each commit
+
+        Raises:
+            GitError: If git log has failed, for example because of an
+                unknown revision.
 
+        Returns:
+            An iterator yielding the commits in the order of git log
+
+        Example:
+            .. code-block:: python
+
+                from pontos.git import Git
+
+                git = Git()
+                for commit in git.iter_log("v1.0.0..HEAD", files=True):
+                    print(commit.sha, commit.subject, commit.files)
+        """
+        args = ["log", "-z", f"--format={GIT_LOG_FORMAT}"]
+        if files:
+            args.append("--name-only")
         args.extend(log_args)
 
-        return self.exec(*args).splitlines()
+        return parse_git_log(stream_git(*args, cwd=self._cwd))
+
+    def last_modified(
+        self, files: Iterable[PathLike] | None = None
+    ) -> dict[Path, datetime]:
+        """
+        Get the date of the last modification of files from the git history
+
+        The history is walked only once for all files, from the newest commit
+        to the oldest one. The walk stops as soon as the dates of all
+        requested files are known.
+
+        Args:
+            files: Files to get the dates for. If not set the dates of all
+                files contained in the history are returned.
+
+        Raises:
+            GitError: If the current working directory isn't a git
+                repository.
+
+        Returns:
+            The author date of the last commit changing a file per resolved
+            absolute file path. Files without a commit are missing.
+
+        Example:
+            .. code-block:: python
+
+                from pathlib import Path
+                from pontos.git import Git
+
+                git = Git()
+                dates = git.last_modified([Path("README.md")])
+                print(dates[Path("README.md").resolve()].year)
+        """
+        toplevel = Path(self.exec("rev-parse", "--show-toplevel").strip())
+        wanted = (
+            None if files is None else {Path(file).resolve() for file in files}
+        )
+        modified: dict[Path, datetime] = {}
+        if wanted is not None and not wanted:
+            return modified
+
+        records = stream_git(
+            "log",
+            "-z",
+            "--name-only",
+            f"--format={GIT_LOG_FORMAT}",
+            cwd=self._cwd,
+        )
+        try:
+            for commit in parse_git_log(records):
+                for name in commit.files:
+                    path = toplevel / name
+                    if path not in modified and (
+                        wanted is None or path in wanted
+                    ):
+                        modified[path] = commit.author_date
+
+                if wanted is not None and len(modified) == len(wanted):
+                    break
+        finally:
+            records.close()
+
+        return modified
 
     def show(
         self,
@@ -607,31 +1024,22 @@ class Git:
             A list of details about the passed object the object if more then
             one object is passed. Otherwise a single details is returned.
         """
-        args = ["show"]
-
-        if format:
-            args.append(f"--format={format}")
-
-        if oneline:
-            args.append("--oneline")
-
-        if patch is not None:
-            if patch:
-                args.append("--patch")
-            else:
-                args.append("--no-patch")
-
-        if objects:
-            if isinstance(objects, str):
-                objects = [objects]
-
-            args.extend(objects)
-
-        args.extend(show_args)
-
-        output = self.exec(*args).strip()
-
-        return output.splitlines() if objects and len(objects) > 1 else output
+        objects = self._show_objects(objects)
+        repository = self._pygit2()
+        output = None
+        if (
+            repository
+            and format
+            and patch is False
+            and not oneline
+            and not show_args
+        ):
+            output = repository.show(objects, format)
+        if output is None:
+            output = self.exec(
+                *self._show_args(show_args, format, oneline, patch, objects)
+            )
+        return self._parse_show(output, objects)
 
     def rev_list(
         self,
@@ -669,14 +1077,15 @@ class Git:
                 git.rev_list("foo", max_parents=0)
 
         """
-        args = ["rev-list"]
-        if max_parents is not None:
-            args.append(f"--max-parents={max_parents}")
-        if abbrev_commit:
-            args.append("--abbrev-commit")
+        repository = self._pygit2()
+        if repository and not abbrev_commit:
+            commits = repository.rev_list(commit, max_parents)
+            if commits is not None:
+                return commits
 
-        args.extend(commit)
-        return self.exec(*args).splitlines()
+        return self.exec(
+            *self._rev_list_args(commit, max_parents, abbrev_commit)
+        ).splitlines()
 
     def move(self, old: PathLike, new: PathLike) -> None:
         """
@@ -704,19 +1113,70 @@ class Git:
             An iterator of :py:class:`StatusEntry` instances that contain the
             status of the specific files.
         """
+        repository = self._pygit2()
+        output = None
+        if repository:
+            files = list(files) if files else None
+            output = repository.status(
+                [self._repository_cwd / file for file in files]  # type: ignore[operator]
+                if files
+                else None
+            )
+        if output is None:
+            output = self.exec(*self._status_args(files))
+        return parse_git_status(output)
+
+    def iter_status(
+        self,
+        files: Iterable[PathLike] | None = None,
+        *,
+        untracked: bool = False,
+        ignored: bool = False,
+    ) -> Iterator[StatusEntry]:
+        """
+        Iterate over the current git status
+
+        In contrast to :py:meth:`status` the porcelain v2 output of git is
+        read and parsed incrementally. The entries additionally contain the
+        similarity score of renamed and copied files and the status of
+        submodules.
+
+        Args:
+            files: specify an iterable of :py:class:`os.PathLike` and
+                exclude all other paths for the status.
+            untracked: Include untracked files
+            ignored: Include ignored files
+
+        Raises:
+            GitError: If git status has failed.
+
+        Returns:
+            An iterator of :py:class:`StatusEntry` instances that contain the
+            status of the specific files.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.git import Git
+
+                git = Git()
+                for entry in git.iter_status(untracked=True):
+                    print(entry, entry.submodule)
+        """
         args = [
             "status",
+            "--porcelain=v2",
             "-z",
-            "--ignore-submodules",
-            "--untracked-files=no",
+            f"--untracked-files={'all' if untracked else 'no'}",
         ]
+        if ignored:
+            args.append("--ignored")
 
         if files:
             args.append("--")
             args.extend([fspath(f) for f in files])
 
-        output = self.exec(*args)
-        return parse_git_status(output)
+        return parse_git_status_v2(stream_git(*args, cwd=self._cwd))
 
     def reset(
         self,
@@ -742,5 +1202,4 @@ class Git:
                 git = Git()
                 git.reset("HEAD^", mode=ResetMode.HARD)
         """
-        args = ["reset", f"--{mode}", commit]
-        self.exec(*args)
+        self.exec("reset", f"--{mode}", commit)
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# marks the start of a commit. it is output as a field of its own and can't
+# be confused with a commit message or file name field.
+_COMMIT_MARKER = "\x1e"
+
+_FIELDS = (
+    "%H",  # sha
+    "%P",  # parents
+    "%an",  # author name
+    "%ae",  # author email
+    "%aI",  # author date
+    "%cn",  # committer name
+    "%ce",  # committer email
+    "%cI",  # committer date
+    "%s",  # subject
+    "%b",  # body
+)
+
+# git log format for NUL separated commit fields
+GIT_LOG_FORMAT = "%x1e%x00" + "%x00".join(_FIELDS)
+
+
+@dataclass(frozen=True)
+class GitCommit:
+    """
+    A commit of the git log
+
+    Attributes:
+        sha: The full commit ID
+        parents: IDs of the parent commits
+        author_name: Name of the author
+        author_email: Email address of the author
+        author_date: Date the commit has been authored
+        committer_name: Name of the committer
+        committer_email: Email address of the committer
+        committer_date: Date the commit has been committed
+        subject: First line of the commit message
+        body: Commit message without the subject
+        files: Paths of the changed files. Only set if requested.
+    """
+
+    sha: str
+    parents: list[str]
+    author_name: str
+    author_email: str
+    author_date: datetime
+    committer_name: str
+    committer_email: str
+    committer_date: datetime
+    subject: str
+    body: str
+    files: list[str] = field(default_factory=list)
+
+
+def _create_commit(fields: list[str]) -> GitCommit:
+    # the last field of the output may be missing if it is empty
+    fields.extend([""] * (len(_FIELDS) - len(fields)))
+    (
+        sha,
+        parents,
+        author_name,
+        author_email,
+        author_date,
+        committer_name,
+        committer_email,
+        committer_date,
+        subject,
+        body,
+    ) = fields[: len(_FIELDS)]
+    files = fields[len(_FIELDS) :]
+    if files:
+        # git separates the file list from the format by a newline
+        files[0] = files[0].removeprefix("\n")
+
+    return GitCommit(
+        sha=sha,
+        parents=parents.split(),
+        author_name=author_name,
+        author_email=author_email,
+        author_date=datetime.fromisoformat(author_date),
+        committer_name=committer_name,
+        committer_email=committer_email,
+        committer_date=datetime.fromisoformat(committer_date),
+        subject=subject,
+        body=body.strip(),
+        files=[file for file in files if file],
+    )
+
+
+def parse_git_log(fields: Iterable[str]) -> Iterator[GitCommit]:
+    """
+    Parse the NUL separated fields of git log -z --format=GIT_LOG_FORMAT
+
+    Only the fields of a single commit are held in memory at a time.
+    """
+    current: list[str] | None = None
+    for value in fields:
+        if value == _COMMIT_MARKER:
+            if current is not None:
+                yield _create_commit(current)
+            current = []
+        elif current is not None:
+            current.append(value)
+
+    if current is not None:
+        yield _create_commit(current)
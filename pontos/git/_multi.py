@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from ._async import AsyncGit
+from ._errors import GitError
+
+DEFAULT_MULTI_GIT_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RepositoryResult(Generic[T]):
+    """
+    Result of a git operation in a single repository
+
+    Attributes:
+        path: Path of the repository
+        result: Return value of the operation. None if the operation failed.
+        error: The error if git has failed or couldn't be run, for example
+            because the path doesn't exist
+        duration: Duration of the operation in seconds
+    """
+
+    path: Path
+    result: T | None = None
+    error: GitError | OSError | None = None
+    duration: float = 0.0
+
+    @property
+    def failed(self) -> bool:
+        """
+        True if the operation has failed for this repository
+        """
+        return self.error is not None
+
+
+class MultiGit:
+    """
+    Run the same git operation in many repositories concurrently
+
+    At most concurrency git processes are running at the same time. A
+    failing repository doesn't stop the operation in the other repositories.
+    Instead the :py:class:`GitError` or the :py:class:`OSError`, if git
+    couldn't be run in the repository, is returned as part of the result of
+    the repository. Therefore running an operation in many repositories
+    takes about the time of the slowest repository.
+
+    Concurrently updating the same ref of a shared remote, for example by
+    pushing the same tag from several repositories, can fail because git
+    locks the ref.
+
+    Example:
+        .. code-block:: python
+
+            from pathlib import Path
+
+            from pontos.git import MultiGit
+
+            multi = MultiGit(Path("repos").iterdir(), concurrency=4)
+            for result in await multi.fetch("origin"):
+                if result.failed:
+                    print(f"Failed to fetch {result.path}: {result.error}")
+
+            results = await multi.run(lambda git: git.list_tags())
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        *,
+        concurrency: int = DEFAULT_MULTI_GIT_CONCURRENCY,
+    ) -> None:
+        """
+        Create a new MultiGit instance
+
+        Args:
+            paths: Paths of the repositories
+            concurrency: Maximum number of concurrently running git
+                operations
+        """
+        self._paths = [Path(path) for path in paths]
+        self._concurrency = concurrency
+
+    @property
+    def paths(self) -> list[Path]:
+        """
+        Paths of the repositories
+        """
+        return list(self._paths)
+
+    async def _as_completed(
+        self,
+        operation: Callable[[AsyncGit], Awaitable[T]],
+    ) -> AsyncIterator[tuple[int, RepositoryResult[T]]]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def run_operation(
+            index: int, path: Path
+        ) -> tuple[int, RepositoryResult[T]]:
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    result = await operation(AsyncGit(path))
+                except (GitError, OSError) as e:
+                    return index, RepositoryResult(
+                        path, error=e, duration=time.monotonic() - start
+                    )
+                return index, RepositoryResult(
+                    path, result, duration=time.monotonic() - start
+                )
+
+        tasks = [
+            asyncio.create_task(run_operation(index, path))
+            for index, path in enumerate(self._paths)
+        ]
+        try:
+            for coroutine in asyncio.as_completed(tasks):
+                yield await coroutine
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def as_completed(
+        self,
+        operation: Callable[[AsyncGit], Awaitable[T]],
+    ) -> AsyncIterator[RepositoryResult[T]]:
+        """
+        Run an operation in all repositories
+
+        Args:
+            operation: A function getting an :py:class:`AsyncGit` instance
+                for the repository and returning an awaitable of the result
+
+        Returns:
+            An async iterator yielding the results as they are finished
+        """
+        async for _, result in self._as_completed(operation):
+            yield result
+
+    async def run(
+        self,
+        operation: Callable[[AsyncGit], Awaitable[T]],
+    ) -> list[RepositoryResult[T]]:
+        """
+        Run an operation in all repositories and wait until it is finished
+        everywhere
+
+        Args:
+            operation: A function getting an :py:class:`AsyncGit` instance
+                for the repository and returning an awaitable of the result
+
+        Returns:
+            The results in the order of the repository paths
+        """
+        # index based because the same path may be passed several times
+        results = {
+            index: result
+            async for index, result in self._as_completed(operation)
+        }
+        return [results[index] for index in range(len(self._paths))]
+
+    async def clone(
+        self,
+        repo_url: Callable[[Path], str],
+        *,
+        branch: str | None = None,
+        remote: str | None = None,
+        depth: int | None = None,
+    ) -> list[RepositoryResult[None]]:
+        """
+        Clone a repository into each of the paths
+
+        See :py:meth:`Git.clone` for details.
+
+        Args:
+            repo_url: A function returning the URL of the repository to
+                clone for a destination path
+        """
+
+        async def clone(git: AsyncGit) -> None:
+            destination: Path = git.cwd  # type: ignore[assignment]
+            # the destination doesn't exist yet and can't be the cwd of git
+            await AsyncGit().clone(
+                repo_url(destination),
+                destination,
+                branch=branch,
+                remote=remote,
+                depth=depth,
+            )
+
+        return await self.run(clone)
+
+    async def fetch(
+        self,
+        remote: str | None = None,
+        refspec: str | None = None,
+        *,
+        verbose: bool = False,
+    ) -> list[RepositoryResult[None]]:
+        """
+        Fetch changes from a remote in all repositories
+
+        See :py:meth:`Git.fetch` for details.
+        """
+        return await self.run(
+            lambda git: git.fetch(remote, refspec, verbose=verbose)
+        )
+
+    async def push(
+        self,
+        refspec: str | Iterable[str] | None = None,
+        *,
+        remote: str | None = None,
+        branch: str | None = None,
+        follow_tags: bool = False,
+        force: bool | None = None,
+        delete: bool | None = None,
+    ) -> list[RepositoryResult[None]]:
+        """
+        Push changes to a remote in all repositories
+
+        See :py:meth:`Git.push` for details.
+        """
+        return await self.run(
+            lambda git: git.push(
+                refspec,
+                remote=remote,
+                branch=branch,
+                follow_tags=follow_tags,
+                force=force,
+                delete=delete,
+            )
+        )
+
+    async def tag(
+        self,
+        tag: str,
+        *,
+        gpg_key_id: str | None = None,
+        message: str | None = None,
+        force: bool | None = False,
+        sign: bool | None = None,
+    ) -> list[RepositoryResult[None]]:
+        """
+        Create the same tag in all repositories
+
+        See :py:meth:`Git.tag` for details.
+        """
+        return await self.run(
+            lambda git: git.tag(
+                tag,
+                gpg_key_id=gpg_key_id,
+                message=message,
+                force=force,
+                sign=sign,
+            )
+        )
@@ -0,0 +1,324 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Optional in-process implementation of git read operations based on pygit2
+
+All methods return None if a call can't be answered exactly like the git
+command line would answer it. In that case the caller falls back to running
+git as a subprocess.
+"""
+
+import re
+from collections.abc import Collection, Iterable, Iterator
+from fnmatch import fnmatchcase
+from os import PathLike, fspath
+from pathlib import Path
+from typing import Any
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore[assignment]
+
+_TAG_PREFIX = "refs/tags/"
+
+_PLACEHOLDER = re.compile(r"%(x[0-9a-fA-F]{2}|an|ae|cn|ce|[HPsbBn%])")
+_LITERAL = re.compile(r"[^%]*")
+
+
+def is_available() -> bool:
+    """
+    Check if pygit2 is installed
+    """
+    return pygit2 is not None
+
+
+def _subject_and_body(message: str) -> tuple[str, str]:
+    # like git the subject is the first paragraph joined into a single line
+    paragraphs = message.lstrip("\n").split("\n\n", 1)
+    subject = " ".join(line.strip() for line in paragraphs[0].splitlines())
+    body = paragraphs[1].lstrip("\n") if len(paragraphs) > 1 else ""
+    return subject, body
+
+
+def _compile_format(format: str) -> list[str] | None:  # noqa: A002
+    """
+    Split a pretty format into literals and placeholders. Returns None for
+    unsupported placeholders.
+    """
+    parts = []
+    position = 0
+    while position < len(format):
+        literal = _LITERAL.match(format, position)
+        if literal and literal.end() > position:
+            parts.append(literal.group())
+            position = literal.end()
+            continue
+
+        placeholder = _PLACEHOLDER.match(format, position)
+        if not placeholder:
+            return None
+        code = placeholder.group(1)
+        if code.startswith("x"):
+            # a hex byte is a literal too
+            parts.append(bytes.fromhex(code[1:]).decode("latin-1"))
+        else:
+            parts.append(placeholder.group())
+        position = placeholder.end()
+    return parts
+
+
+class Pygit2Repository:
+    """
+    Read operations of a git repository executed in-process via pygit2
+    """
+
+    def __init__(self, repository: Any) -> None:
+        self._repo = repository
+
+    @classmethod
+    def discover(cls, path: Path) -> "Pygit2Repository | None":
+        """
+        Open the repository containing a path
+
+        Returns:
+            The repository or None if pygit2 isn't available or the path
+            isn't within a git repository
+        """
+        if pygit2 is None:
+            return None
+
+        git_dir = pygit2.discover_repository(fspath(path))
+        if not git_dir:
+            return None
+        return cls(pygit2.Repository(git_dir))
+
+    def _resolve(self, revision: str) -> Any:
+        try:
+            return self._repo.revparse_single(revision).peel(pygit2.Commit)
+        except (KeyError, ValueError, pygit2.GitError):
+            return None
+
+    def _walk(self, revisions: Iterable[str]) -> Iterator[Any] | None:
+        include = []
+        exclude = []
+        for revision in revisions:
+            if revision.startswith("-"):
+                # options aren't supported
+                return None
+
+            if ".." in revision:
+                if "..." in revision:
+                    return None
+                start, end = revision.split("..", 1)
+                exclude.append(start or "HEAD")
+                include.append(end or "HEAD")
+            elif revision.startswith("^"):
+                exclude.append(revision[1:])
+            else:
+                include.append(revision)
+
+        if not include:
+            include.append("HEAD")
+
+        included = [self._resolve(revision) for revision in include]
+        excluded = [self._resolve(revision) for revision in exclude]
+        if None in included or None in excluded:
+            # let git report the error
+            return None
+
+        walker = self._repo.walk(included[0].id, pygit2.GIT_SORT_NONE)
+        for commit in included[1:]:
+            walker.push(commit.id)
+        for commit in excluded:
+            walker.hide(commit.id)
+        return walker
+
+    def _format(self, commit: Any, parts: list[str]) -> str:
+        message = commit.message
+        subject, body = _subject_and_body(message)
+        values = {
+            "%H": str(commit.id),
+            "%P": " ".join(str(parent) for parent in commit.parent_ids),
+            "%an": commit.author.name,
+            "%ae": commit.author.email,
+            "%cn": commit.committer.name,
+            "%ce": commit.committer.email,
+            "%s": subject,
+            "%b": body,
+            "%B": message,
+            "%n": "\n",
+            "%%": "%",
+        }
+        return "".join(values.get(part, part) for part in parts)
+
+    def list_tags(self, tag_name: str | None = None) -> list[str] | None:
+        """
+        List the tags sorted by name like git tag -l
+
+        Returns None if the repository configures another sort order
+        """
+        if "tag.sort" in self._repo.config:
+            return None
+
+        tags = [
+            reference[len(_TAG_PREFIX) :]
+            for reference in self._repo.references
+            if reference.startswith(_TAG_PREFIX)
+        ]
+        if tag_name:
+            tags = [tag for tag in tags if fnmatchcase(tag, tag_name)]
+        return sorted(tags)
+
+    def rev_list(
+        self, revisions: Iterable[str], max_parents: int | None = None
+    ) -> list[str] | None:
+        """
+        List the commit IDs like git rev-list
+        """
+        walker = self._walk(revisions)
+        if walker is None:
+            return None
+
+        return [
+            str(commit.id)
+            for commit in walker
+            if max_parents is None or len(commit.parent_ids) <= max_parents
+        ]
+
+    def log(
+        self,
+        revisions: Iterable[str],
+        format: str,  # noqa: A002
+    ) -> list[str] | None:
+        """
+        Get the formatted log like git log --format
+        """
+        parts = _compile_format(format)
+        walker = self._walk(revisions)
+        if parts is None or walker is None:
+            return None
+
+        return "".join(
+            f"{self._format(commit, parts)}\n" for commit in walker
+        ).splitlines()
+
+    def show(
+        self,
+        objects: Collection[str],
+        format: str,  # noqa: A002
+    ) -> str | None:
+        """
+        Get the formatted output of git show --no-patch --format for commits
+        """
+        parts = _compile_format(format)
+        if parts is None or not objects:
+            return None
+
+        output = []
+        for name in objects:
+            try:
+                obj = self._repo.revparse_single(name)
+            except (KeyError, ValueError, pygit2.GitError):
+                return None
+            if obj.type != pygit2.GIT_OBJECT_COMMIT:
+                # git show prints additional information for tags and trees
+                return None
+            output.append(f"{self._format(obj, parts)}\n")
+        return "".join(output)
+
+    def remote_url(self, remote: str) -> str | None:
+        """
+        Get the url of a remote like git remote get-url
+        """
+        for entry in self._repo.config:
+            if entry.name.startswith("url."):
+                # let git apply the insteadOf url rewriting
+                return None
+
+        try:
+            url = self._repo.remotes[remote].url
+        except (KeyError, ValueError):
+            return None
+        return f"{url}\n"
+
+    def status(self, files: Iterable[PathLike] | None = None) -> str | None:
+        """
+        Get the status of the tracked files in the format of git status -z
+        """
+        if (
+            self._repo.is_bare
+            or (Path(self._repo.workdir) / ".gitmodules").exists()
+        ):
+            # let git handle the submodules
+            return None
+
+        try:
+            status = self._repo.status(untracked_files="no")
+        except TypeError:
+            # older pygit2 versions
+            status = self._repo.status()
+
+        prefixes = None
+        if files:
+            workdir = Path(self._repo.workdir).resolve()
+            try:
+                prefixes = [
+                    Path(file).resolve().relative_to(workdir).as_posix()
+                    for file in files
+                ]
+            except ValueError:
+                return None
+
+        unsupported = (
+            pygit2.GIT_STATUS_INDEX_RENAMED
+            | pygit2.GIT_STATUS_INDEX_TYPECHANGE
+            | pygit2.GIT_STATUS_WT_TYPECHANGE
+            | pygit2.GIT_STATUS_WT_RENAMED
+            | pygit2.GIT_STATUS_WT_UNREADABLE
+            | pygit2.GIT_STATUS_CONFLICTED
+        )
+        index_states = (
+            (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+            (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+            (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        )
+        working_tree_states = (
+            (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+            (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        )
+
+        entries = []
+        added = deleted = False
+        for path, flags in sorted(status.items()):
+            if flags & unsupported:
+                return None
+            if prefixes is not None and not any(
+                prefix in (".", path) or path.startswith(f"{prefix}/")
+                for prefix in prefixes
+            ):
+                continue
+
+            index = next(
+                (value for flag, value in index_states if flags & flag), " "
+            )
+            working_tree = next(
+                (value for flag, value in working_tree_states if flags & flag),
+                " ",
+            )
+            if index == working_tree == " ":
+                # untracked or ignored
+                continue
+
+            added = added or index == "A"
+            deleted = deleted or index == "D"
+            entries.append(f"{index}{working_tree} {path}\0")
+
+        if added and deleted:
+            # git detects renames which libgit2 doesn't report by default
+            return None
+
+        return "".join(entries)
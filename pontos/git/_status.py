@@ -3,7 +3,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
@@ -17,6 +18,7 @@ class Status(Enum):
     MODIFIED = "M"
     ADDED = "A"
     DELETED = "D"
+    TYPE_CHANGED = "T"
     RENAMED = "R"
     COPIED = "C"
     UPDATED = "U"
@@ -24,6 +26,22 @@ class Status(Enum):
     IGNORED = "!"
 
 
+@dataclass(frozen=True)
+class SubmoduleStatus:
+    """
+    Status of a submodule in git
+
+    Attributes:
+        commit_changed: The checked out commit differs from the recorded one
+        tracked_changes: The submodule contains modified tracked files
+        untracked_changes: The submodule contains untracked files
+    """
+
+    commit_changed: bool = False
+    tracked_changes: bool = False
+    untracked_changes: bool = False
+
+
 class StatusEntry:
     """
     Status of a file in the git index and working tree.
@@ -34,10 +52,20 @@ class StatusEntry:
         index: Status in the index
         working_tree: Status in the working tree
         path: Path to the file
-        old_path: Set for renamed files
+        old_path: Set for renamed and copied files
+        score: Similarity score in percent of a renamed or copied file. Only
+            available for porcelain v2 status output.
+        submodule: Status of a submodule. None if the file isn't a submodule
+            or the status has been parsed from porcelain v1 output.
     """
 
-    def __init__(self, status_string: str) -> None:
+    def __init__(
+        self,
+        status_string: str,
+        *,
+        score: int | None = None,
+        submodule: SubmoduleStatus | None = None,
+    ) -> None:
         status = status_string[:2]
         filename = status_string[3:]
 
@@ -46,7 +74,7 @@ class StatusEntry:
         # Status in the working directory
         self.working_tree = Status(status[1])
 
-        if self.index == Status.RENAMED:
+        if "\0" in filename:
             new_filename, old_filename = filename.split("\0")
             self.path = Path(new_filename)
             self.old_path = Path(old_filename)
@@ -54,6 +82,9 @@ class StatusEntry:
             # path of the file in git
             self.path = Path(filename)
 
+        self.score = score
+        self.submodule = submodule
+
     def __str__(self) -> str:
         return f"{self.index.value}{self.working_tree.value} {self.path}"
 
@@ -69,10 +100,64 @@ def parse_git_status(output: str) -> Iterator[StatusEntry]:
     if not output:
         return
 
-    output_list = output.split("\0")
-    while output_list:
-        line = output_list.pop(0)
-        if line[0] == Status.RENAMED.value:
-            yield StatusEntry(f"{line}\0{output_list.pop(0)}")
+    records = iter(output.split("\0"))
+    for line in records:
+        if line[0] in (Status.RENAMED.value, Status.COPIED.value):
+            yield StatusEntry(f"{line}\0{next(records)}")
         else:
             yield StatusEntry(line)
+
+
+def _parse_submodule(value: str) -> SubmoduleStatus | None:
+    # N... for files or S<c><m><u> for submodules
+    if value[0] != "S":
+        return None
+
+    return SubmoduleStatus(
+        commit_changed=value[1] == "C",
+        tracked_changes=value[2] == "M",
+        untracked_changes=value[3] == "U",
+    )
+
+
+def parse_git_status_v2(records: Iterable[str]) -> Iterator[StatusEntry]:
+    """
+    Parse the NUL separated records of git status --porcelain=v2 -z
+
+    The records are consumed lazily and each record is handled only once.
+    Header lines are skipped.
+    """
+    records = iter(records)
+    for record in records:
+        if not record:
+            continue
+
+        kind = record[0]
+        if kind in ("?", "!"):
+            # untracked or ignored file
+            yield StatusEntry(f"{kind}{kind} {record[2:]}")
+            continue
+
+        if kind == "1":
+            # 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
+            _, xy, sub, _, _, _, _, _, path = record.split(" ", 8)
+            score = None
+        elif kind == "2":
+            # 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path>
+            # followed by the original path as separate record
+            _, xy, sub, _, _, _, _, _, change, path = record.split(" ", 9)
+            path = f"{path}\0{next(records)}"
+            score = int(change[1:])
+        elif kind == "u":
+            # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+            _, xy, sub, _, _, _, _, _, _, _, path = record.split(" ", 10)
+            score = None
+        else:
+            # header lines starting with #
+            continue
+
+        yield StatusEntry(
+            f"{xy.replace('.', ' ')} {path}",
+            score=score,
+            submodule=_parse_submodule(sub),
+        )
@@ -3,27 +3,58 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
+from .access_graph import AccessGraph, GitHubAsyncRESTAccessGraph
 from .api import GitHubAsyncRESTApi
+from .artifact_retention import (
+    ArtifactRetentionPolicy,
+    ArtifactStatistics,
+    ArtifactSummary,
+)
 from .artifacts import GitHubAsyncRESTArtifacts
 from .branch import GitHubAsyncRESTBranches, update_from_applied_settings
+from .cache import CachedResponse, ResponseCache
 from .contents import GitHubAsyncRESTContent
 from .dependabot import GitHubAsyncRESTDependabot
+from .download import FileDownload, download_file
 from .errors import GitHubApiError
+from .graphql import GitHubAsyncGraphQL
 from .helper import (
     DEFAULT_GITHUB_API_URL,
     DEFAULT_TIMEOUT_CONFIG,
     JSON,
     JSON_OBJECT,
 )
+from .inventory import (
+    GitHubAsyncRESTInventory,
+    InventoryDiff,
+    InventorySnapshot,
+    RepositoryInventory,
+)
 from .labels import GitHubAsyncRESTLabels
 from .organizations import GitHubAsyncRESTOrganizations
+from .package_retention import PackageRetentionPolicy, PackageVersionIndex
 from .packages import GitHubAsyncRESTPackages
 from .pull_requests import GitHubAsyncRESTPullRequests
+from .rate_limit import RateLimit, RateLimitScheduler
 from .release import GitHubAsyncRESTReleases
 from .repositories import GitHubAsyncRESTRepositories
+from .sarif import SarifUpload, encode_sarif
 from .search import GitHubAsyncRESTSearch
+from .security_alerts import (
+    GitHubAsyncRESTSecurityAlerts,
+    SecurityAlert,
+    SecurityAlertStore,
+    SecurityAlertType,
+)
 from .tags import GitHubAsyncRESTTags
 from .teams import GitHubAsyncRESTTeams
+from .upload import AssetUpload, create_checksum_manifest
+from .workflow_history import (
+    DurationPercentiles,
+    WorkflowRunHistory,
+    WorkflowRunRecord,
+    WorkflowRunStatistics,
+)
 from .workflows import GitHubAsyncRESTWorkflows
 
 __all__ = [
@@ -31,12 +62,23 @@ __all__ = [
     "DEFAULT_TIMEOUT_CONFIG",
     "JSON",
     "JSON_OBJECT",
+    "AccessGraph",
+    "ArtifactRetentionPolicy",
+    "ArtifactStatistics",
+    "ArtifactSummary",
+    "AssetUpload",
+    "CachedResponse",
+    "DurationPercentiles",
+    "FileDownload",
     "GitHubApiError",
+    "GitHubAsyncGraphQL",
+    "GitHubAsyncRESTAccessGraph",
     "GitHubAsyncRESTApi",
     "GitHubAsyncRESTArtifacts",
     "GitHubAsyncRESTBranches",
     "GitHubAsyncRESTContent",
     "GitHubAsyncRESTDependabot",
+    "GitHubAsyncRESTInventory",
     "GitHubAsyncRESTLabels",
     "GitHubAsyncRESTOrganizations",
     "GitHubAsyncRESTPackages",
@@ -44,8 +86,27 @@ __all__ = [
     "GitHubAsyncRESTReleases",
     "GitHubAsyncRESTRepositories",
     "GitHubAsyncRESTSearch",
+    "GitHubAsyncRESTSecurityAlerts",
     "GitHubAsyncRESTTags",
     "GitHubAsyncRESTTeams",
     "GitHubAsyncRESTWorkflows",
+    "InventoryDiff",
+    "InventorySnapshot",
+    "PackageRetentionPolicy",
+    "PackageVersionIndex",
+    "RateLimit",
+    "RateLimitScheduler",
+    "RepositoryInventory",
+    "ResponseCache",
+    "SarifUpload",
+    "SecurityAlert",
+    "SecurityAlertStore",
+    "SecurityAlertType",
+    "WorkflowRunHistory",
+    "WorkflowRunRecord",
+    "WorkflowRunStatistics",
+    "create_checksum_manifest",
+    "download_file",
+    "encode_sarif",
     "update_from_applied_settings",
 ]
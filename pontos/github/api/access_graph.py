@@ -0,0 +1,433 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import json
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from os import PathLike
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pontos.github.api.client import GitHubAsyncREST
+from pontos.github.api.organizations import GitHubAsyncRESTOrganizations
+from pontos.github.api.teams import GitHubAsyncRESTTeams
+from pontos.github.models.base import Permission
+from pontos.github.models.organization import MemberRole
+
+__all__ = (
+    "AccessGraph",
+    "GitHubAsyncRESTAccessGraph",
+)
+
+DEFAULT_ACCESS_GRAPH_CONCURRENCY = 10
+
+T = TypeVar("T")
+
+# permissions ordered from the lowest to the highest level
+_PERMISSION_LEVELS = (
+    Permission.PULL,
+    Permission.TRIAGE,
+    Permission.PUSH,
+    Permission.MAINTAIN,
+    Permission.ADMIN,
+)
+
+
+def _level(permission: Permission | str) -> int:
+    return _PERMISSION_LEVELS.index(Permission(permission))
+
+
+def _highest(permissions: Iterable[Permission]) -> Permission | None:
+    return max(permissions, key=_level, default=None)
+
+
+def _highest_permission(flags: Any) -> Permission | None:
+    """
+    Get the highest permission from permission flags like the permissions of
+    a repository or a collaborator
+    """
+    if not flags:
+        return None
+
+    return _highest(
+        permission
+        for permission in _PERMISSION_LEVELS
+        if (
+            flags.get(permission.value)
+            if isinstance(flags, dict)
+            else getattr(flags, permission.value, None)
+        )
+    )
+
+
+@dataclass
+class AccessGraph:
+    """
+    A graph of the users, teams and repositories of an organization and the
+    permissions between them
+
+    Team members include the members of child teams. Therefore the access
+    inherited from parent teams is covered by the members of the parent
+    teams. The base permission of the organization isn't taken into account.
+
+    Attributes:
+        organization: Name of the organization
+        taken_at: Date the graph has been built
+        owners: Logins of the organization owners. Owners have admin access
+            to all repositories.
+        members: Logins of all organization members including the owners
+        outside_collaborators: Logins of the outside collaborators
+        teams: Team names per team slug
+        team_members: Member logins per team slug
+        team_repositories: Permissions per full repository name per team slug
+        collaborators: Permissions of direct collaborators per login per full
+            repository name. Only available if requested when building the
+            graph.
+    """
+
+    organization: str
+    taken_at: datetime
+    owners: set[str] = field(default_factory=set)
+    members: set[str] = field(default_factory=set)
+    outside_collaborators: set[str] = field(default_factory=set)
+    teams: dict[str, str] = field(default_factory=dict)
+    team_members: dict[str, set[str]] = field(default_factory=dict)
+    team_repositories: dict[str, dict[str, Permission]] = field(
+        default_factory=dict
+    )
+    collaborators: dict[str, dict[str, Permission]] = field(
+        default_factory=dict
+    )
+
+    def teams_of(self, user: str) -> list[str]:
+        """
+        Get the slugs of the teams of a user
+        """
+        return sorted(
+            slug
+            for slug, members in self.team_members.items()
+            if user in members
+        )
+
+    def permission(self, user: str, repository: str) -> Permission | None:
+        """
+        Get the effective permission of a user for a repository
+
+        Args:
+            user: Login of the user
+            repository: Full name (owner/name) of the repository
+
+        Returns:
+            The highest permission granted by the organization role, the
+            teams or a direct collaboration. None if the user has no access.
+        """
+        if user in self.owners:
+            return Permission.ADMIN
+
+        permissions = []
+        for slug in self.teams_of(user):
+            team_permission = self.team_repositories.get(slug, {}).get(
+                repository
+            )
+            if team_permission:
+                permissions.append(team_permission)
+        direct = self.collaborators.get(repository, {}).get(user)
+        if direct:
+            permissions.append(direct)
+        return _highest(permissions)
+
+    def users(
+        self,
+        repository: str,
+        permission: Permission | str = Permission.PULL,
+    ) -> dict[str, Permission]:
+        """
+        Get the users having at least a permission for a repository
+
+        Args:
+            repository: Full name (owner/name) of the repository
+            permission: The minimum permission, for example push for all
+                users who can write to the repository
+
+        Returns:
+            The effective permissions per user login
+        """
+        users = set(self.owners)
+        for slug, repositories in self.team_repositories.items():
+            if repository in repositories:
+                users.update(self.team_members.get(slug, ()))
+        users.update(self.collaborators.get(repository, {}))
+
+        minimum = _level(permission)
+        permissions = {}
+        for user in sorted(users):
+            effective = self.permission(user, repository)
+            if effective and _level(effective) >= minimum:
+                permissions[user] = effective
+        return permissions
+
+    def repositories(self, user: str) -> dict[str, Permission]:
+        """
+        Get the repositories a user has access to via teams or a direct
+        collaboration
+
+        Args:
+            user: Login of the user
+
+        Returns:
+            The effective permissions per full repository name
+        """
+        repositories: set[str] = set()
+        for slug in self.teams_of(user):
+            repositories.update(self.team_repositories.get(slug, {}))
+        repositories.update(
+            repository
+            for repository, users in self.collaborators.items()
+            if user in users
+        )
+        return {
+            repository: self.permission(user, repository)  # type: ignore[misc]
+            for repository in sorted(repositories)
+        }
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Convert the graph into JSON serializable data
+        """
+        return {
+            "organization": self.organization,
+            "taken_at": self.taken_at.isoformat(),
+            "owners": sorted(self.owners),
+            "members": sorted(self.members),
+            "outside_collaborators": sorted(self.outside_collaborators),
+            "teams": self.teams,
+            "team_members": {
+                slug: sorted(members)
+                for slug, members in self.team_members.items()
+            },
+            "team_repositories": {
+                slug: {name: str(value) for name, value in repos.items()}
+                for slug, repos in self.team_repositories.items()
+            },
+            "collaborators": {
+                repository: {
+                    login: str(value) for login, value in users.items()
+                }
+                for repository, users in self.collaborators.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "AccessGraph":
+        """
+        Create a graph from data created by to_json
+        """
+        return cls(
+            organization=data["organization"],
+            taken_at=datetime.fromisoformat(data["taken_at"]),
+            owners=set(data.get("owners", [])),
+            members=set(data.get("members", [])),
+            outside_collaborators=set(data.get("outside_collaborators", [])),
+            teams=dict(data.get("teams", {})),
+            team_members={
+                slug: set(members)
+                for slug, members in data.get("team_members", {}).items()
+            },
+            team_repositories={
+                slug: {name: Permission(value) for name, value in repos.items()}
+                for slug, repos in data.get("team_repositories", {}).items()
+            },
+            collaborators={
+                repository: {
+                    login: Permission(value) for login, value in users.items()
+                }
+                for repository, users in data.get("collaborators", {}).items()
+            },
+        )
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """
+        Store the graph in a JSON file
+        """
+        path = Path(path)
+        temp_path = path.with_suffix(f"{path.suffix}.tmp")
+        temp_path.write_text(json.dumps(self.to_json(), indent=2))
+        temp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "AccessGraph | None":
+        """
+        Load a graph from a JSON file
+
+        Returns:
+            The graph or None if the file doesn't exist
+        """
+        try:
+            return cls.from_json(json.loads(Path(path).read_text()))
+        except FileNotFoundError:
+            return None
+
+
+class GitHubAsyncRESTAccessGraph(GitHubAsyncREST):
+    async def _collaborators(self, repository: str) -> dict[str, Permission]:
+        api = f"/repos/{repository}/collaborators"
+        params = {"affiliation": "direct", "per_page": "100"}
+        collaborators = {}
+        async for response in self._client.get_all(api, params=params):
+            response.raise_for_status()
+            for user in response.json():
+                permission = _highest_permission(user.get("permissions"))
+                if permission:
+                    collaborators[user["login"]] = permission
+        return collaborators
+
+    async def build(
+        self,
+        organization: str,
+        *,
+        include_collaborators: bool = False,
+        concurrency: int = DEFAULT_ACCESS_GRAPH_CONCURRENCY,
+    ) -> AccessGraph:
+        """
+        Build the access graph of an organization
+
+        The members, outside collaborators and teams are requested
+        concurrently. Afterwards the members and repositories of all teams
+        are requested in parallel.
+
+        Args:
+            organization: GitHub organization to use
+            include_collaborators: Also request the direct collaborators of
+                all repositories of the organization. This requires one
+                additional request per repository.
+            concurrency: Maximum number of parallel requests for the teams
+                and repositories
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Returns:
+            The access graph
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import AccessGraph, GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    graph = await api.access_graph.build("foo")
+
+                graph.save("access.json")
+                for user, permission in graph.users(
+                    "foo/bar", "push"
+                ).items():
+                    print(user, permission)
+        """
+        taken_at = datetime.now(timezone.utc)
+        organizations = GitHubAsyncRESTOrganizations(self._client)
+        teams_api = GitHubAsyncRESTTeams(self._client)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(awaitable: Awaitable[T]) -> T:
+            async with semaphore:
+                return await awaitable
+
+        async def owners() -> set[str]:
+            return {
+                user.login
+                async for user in organizations.members(
+                    organization, role=MemberRole.ADMIN
+                )
+            }
+
+        async def members() -> set[str]:
+            return {
+                user.login async for user in organizations.members(organization)
+            }
+
+        async def outside_collaborators() -> set[str]:
+            return {
+                user.login
+                async for user in organizations.outside_collaborators(
+                    organization
+                )
+            }
+
+        async def teams() -> dict[str, str]:
+            return {
+                team.slug: team.name
+                async for team in teams_api.get_all(organization)
+            }
+
+        async def team_members(slug: str) -> set[str]:
+            return {
+                user.login
+                async for user in teams_api.members(organization, slug)
+            }
+
+        async def team_repositories(slug: str) -> dict[str, Permission]:
+            repositories = {}
+            async for repository in teams_api.repositories(organization, slug):
+                repositories[repository.full_name] = (
+                    _highest_permission(repository.permissions)
+                    or Permission.PULL
+                )
+            return repositories
+
+        async def repositories() -> list[str]:
+            if not include_collaborators:
+                return []
+            return [
+                repository.full_name
+                async for repository in organizations.get_repositories(
+                    organization
+                )
+            ]
+
+        graph = AccessGraph(organization=organization, taken_at=taken_at)
+        (
+            graph.owners,
+            graph.members,
+            graph.outside_collaborators,
+            graph.teams,
+            repository_names,
+        ) = await asyncio.gather(
+            owners(),
+            members(),
+            outside_collaborators(),
+            teams(),
+            repositories(),
+        )
+
+        slugs = sorted(graph.teams)
+        coroutines: list[Awaitable[Any]] = [
+            *(team_members(slug) for slug in slugs),
+            *(team_repositories(slug) for slug in slugs),
+            *(self._collaborators(name) for name in repository_names),
+        ]
+        tasks = [
+            asyncio.create_task(limited(coroutine)) for coroutine in coroutines
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        count = len(slugs)
+        graph.team_members = dict(zip(slugs, results[:count]))
+        graph.team_repositories = dict(zip(slugs, results[count : 2 * count]))
+        graph.collaborators = {
+            name: collaborators
+            for name, collaborators in zip(
+                repository_names, results[2 * count :]
+            )
+            if collaborators
+        }
+        return graph
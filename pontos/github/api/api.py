@@ -9,25 +9,31 @@ from types import TracebackType
 import httpx
 from typing_extensions import Self
 
+from pontos.github.api.access_graph import GitHubAsyncRESTAccessGraph
 from pontos.github.api.artifacts import GitHubAsyncRESTArtifacts
 from pontos.github.api.billing import GitHubAsyncRESTBilling
 from pontos.github.api.branch import GitHubAsyncRESTBranches
+from pontos.github.api.cache import ResponseCache
 from pontos.github.api.client import GitHubAsyncRESTClient
 from pontos.github.api.code_scanning import GitHubAsyncRESTCodeScanning
 from pontos.github.api.contents import GitHubAsyncRESTContent
 from pontos.github.api.dependabot import GitHubAsyncRESTDependabot
+from pontos.github.api.graphql import GitHubAsyncGraphQL
 from pontos.github.api.helper import (
     DEFAULT_GITHUB_API_URL,
     DEFAULT_TIMEOUT_CONFIG,
 )
+from pontos.github.api.inventory import GitHubAsyncRESTInventory
 from pontos.github.api.labels import GitHubAsyncRESTLabels
 from pontos.github.api.organizations import GitHubAsyncRESTOrganizations
 from pontos.github.api.packages import GitHubAsyncRESTPackages
 from pontos.github.api.pull_requests import GitHubAsyncRESTPullRequests
+from pontos.github.api.rate_limit import RateLimitScheduler
 from pontos.github.api.release import GitHubAsyncRESTReleases
 from pontos.github.api.repositories import GitHubAsyncRESTRepositories
 from pontos.github.api.search import GitHubAsyncRESTSearch
 from pontos.github.api.secret_scanning import GitHubAsyncRESTSecretScanning
+from pontos.github.api.security_alerts import GitHubAsyncRESTSecurityAlerts
 from pontos.github.api.tags import GitHubAsyncRESTTags
 from pontos.github.api.teams import GitHubAsyncRESTTeams
 from pontos.github.api.users import GitHubAsyncRESTUsers
@@ -56,14 +62,28 @@ class GitHubAsyncRESTApi(AbstractAsyncContextManager):
         url: str | None = DEFAULT_GITHUB_API_URL,
         *,
         timeout: httpx.Timeout | None = DEFAULT_TIMEOUT_CONFIG,
+        rate_limit: RateLimitScheduler | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """
         Args:
             token: GitHub API token
             url: GitHub URL
             timeout: Timeout settings to use
+            rate_limit: An optional scheduler for respecting the GitHub rate
+                limits. Requests are sent without any delay if not set.
+            cache: An optional cache for sending conditional get requests
         """
-        self._client = GitHubAsyncRESTClient(token, url, timeout=timeout)
+        self._client = GitHubAsyncRESTClient(
+            token, url, timeout=timeout, rate_limit=rate_limit, cache=cache
+        )
+
+    @property
+    def rate_limit(self) -> RateLimitScheduler | None:
+        """
+        The rate limit scheduler providing the current rate limit budget
+        """
+        return self._client.rate_limit
 
     @property
     def organizations(self) -> GitHubAsyncRESTOrganizations:
@@ -72,6 +92,13 @@ class GitHubAsyncRESTApi(AbstractAsyncContextManager):
         """
         return GitHubAsyncRESTOrganizations(self._client)
 
+    @property
+    def access_graph(self) -> GitHubAsyncRESTAccessGraph:
+        """
+        Organization access graph API
+        """
+        return GitHubAsyncRESTAccessGraph(self._client)
+
     @property
     def artifacts(self) -> GitHubAsyncRESTArtifacts:
         """
@@ -114,6 +141,20 @@ class GitHubAsyncRESTApi(AbstractAsyncContextManager):
         """
         return GitHubAsyncRESTDependabot(self._client)
 
+    @property
+    def graphql(self) -> GitHubAsyncGraphQL:
+        """
+        GraphQL API for batched reads
+        """
+        return GitHubAsyncGraphQL(self._client)
+
+    @property
+    def inventory(self) -> GitHubAsyncRESTInventory:
+        """
+        Organization inventory snapshots
+        """
+        return GitHubAsyncRESTInventory(self._client)
+
     @property
     def labels(self) -> GitHubAsyncRESTLabels:
         """
@@ -172,6 +213,13 @@ class GitHubAsyncRESTApi(AbstractAsyncContextManager):
         """
         return GitHubAsyncRESTRepositories(self._client)
 
+    @property
+    def security_alerts(self) -> GitHubAsyncRESTSecurityAlerts:
+        """
+        Combined dependabot, code scanning and secret scanning alerts
+        """
+        return GitHubAsyncRESTSecurityAlerts(self._client)
+
     @property
     def secret_scanning(self) -> GitHubAsyncRESTSecretScanning:
         """
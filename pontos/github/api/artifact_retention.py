@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from pontos.github.models.artifact import Artifact
+
+__all__ = (
+    "ArtifactRetentionPolicy",
+    "ArtifactStatistics",
+    "ArtifactSummary",
+)
+
+# upper bounds of the age buckets in days and their names
+AGE_BUCKETS = (
+    (1, "< 1 day"),
+    (7, "1-7 days"),
+    (30, "7-30 days"),
+    (90, "30-90 days"),
+)
+OLDEST_AGE_BUCKET = "> 90 days"
+UNKNOWN_AGE_BUCKET = "unknown"
+UNKNOWN_BRANCH = ""
+
+
+def _created_at(artifact: Artifact) -> datetime:
+    return artifact.created_at or datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _age_bucket(artifact: Artifact, now: datetime) -> str:
+    if not artifact.created_at:
+        return UNKNOWN_AGE_BUCKET
+
+    age = now - artifact.created_at
+    for days, name in AGE_BUCKETS:
+        if age < timedelta(days=days):
+            return name
+    return OLDEST_AGE_BUCKET
+
+
+@dataclass
+class ArtifactSummary:
+    """
+    Aggregated numbers of a group of artifacts
+
+    Attributes:
+        count: Number of artifacts
+        expired: Number of expired artifacts
+        size_in_bytes: Size of all not expired artifacts in bytes
+    """
+
+    count: int = 0
+    expired: int = 0
+    size_in_bytes: int = 0
+
+    def add(self, artifact: Artifact) -> None:
+        """
+        Add an artifact to the summary
+        """
+        self.count += 1
+        if artifact.expired:
+            self.expired += 1
+        else:
+            self.size_in_bytes += artifact.size_in_bytes
+
+
+@dataclass
+class ArtifactStatistics:
+    """
+    Statistics of the artifacts of a repository
+
+    Expired artifacts are counted but don't use storage anymore.
+
+    Attributes:
+        total: Summary of all artifacts
+        by_workflow_run: Summaries per workflow run ID
+        by_branch: Summaries per head branch of the workflow run
+        by_age: Summaries per age bucket, for example "7-30 days"
+    """
+
+    total: ArtifactSummary = field(default_factory=ArtifactSummary)
+    by_workflow_run: dict[int, ArtifactSummary] = field(
+        default_factory=lambda: defaultdict(ArtifactSummary)
+    )
+    by_branch: dict[str, ArtifactSummary] = field(
+        default_factory=lambda: defaultdict(ArtifactSummary)
+    )
+    by_age: dict[str, ArtifactSummary] = field(
+        default_factory=lambda: defaultdict(ArtifactSummary)
+    )
+
+    def add(self, artifact: Artifact, *, now: datetime | None = None) -> None:
+        """
+        Add an artifact to the statistics
+
+        Args:
+            artifact: The artifact to add
+            now: Reference time for calculating the age. Defaults to the
+                current time.
+        """
+        now = now or datetime.now(timezone.utc)
+
+        self.total.add(artifact)
+        run = artifact.workflow_run
+        if run:
+            self.by_workflow_run[run.id].add(artifact)
+        self.by_branch[run.head_branch if run else UNKNOWN_BRANCH].add(artifact)
+        self.by_age[_age_bucket(artifact, now)].add(artifact)
+
+    @classmethod
+    def from_artifacts(
+        cls, artifacts: Iterable[Artifact], *, now: datetime | None = None
+    ) -> "ArtifactStatistics":
+        """
+        Create statistics for artifacts
+        """
+        now = now or datetime.now(timezone.utc)
+        statistics = cls()
+        for artifact in artifacts:
+            statistics.add(artifact, now=now)
+        return statistics
+
+
+@dataclass(frozen=True)
+class ArtifactRetentionPolicy:
+    """
+    A policy selecting artifacts for deletion
+
+    An artifact is deleted if any of the rules selects it. Expired artifacts
+    are never selected because they are removed by GitHub already.
+
+    Attributes:
+        max_age: Delete artifacts older than this age
+        keep_last: Keep only the newest N artifacts per artifact name. The
+            name of an artifact usually identifies the workflow job that
+            uploaded it.
+        max_total_size: Size budget in bytes. Delete the oldest of the
+            remaining artifacts until their total size fits into the budget.
+
+    Example:
+        .. code-block:: python
+
+            from datetime import timedelta
+            from pontos.github.api import ArtifactRetentionPolicy
+
+            policy = ArtifactRetentionPolicy(
+                max_age=timedelta(days=30),
+                keep_last=5,
+                max_total_size=10 * 1024**3,
+            )
+    """
+
+    max_age: timedelta | None = None
+    keep_last: int | None = None
+    max_total_size: int | None = None
+
+    def select(
+        self, artifacts: Iterable[Artifact], *, now: datetime | None = None
+    ) -> list[Artifact]:
+        """
+        Select the artifacts to delete
+
+        Args:
+            artifacts: The artifacts of a repository
+            now: Reference time for calculating the age. Defaults to the
+                current time.
+
+        Returns:
+            The artifacts to delete, oldest first
+        """
+        now = now or datetime.now(timezone.utc)
+        # newest first
+        candidates = sorted(
+            (artifact for artifact in artifacts if not artifact.expired),
+            key=_created_at,
+            reverse=True,
+        )
+        selected: set[int] = set()
+
+        if self.max_age is not None:
+            selected.update(
+                artifact.id
+                for artifact in candidates
+                if artifact.created_at
+                and now - artifact.created_at > self.max_age
+            )
+
+        if self.keep_last is not None:
+            seen: dict[str, int] = defaultdict(int)
+            for artifact in candidates:
+                seen[artifact.name] += 1
+                if seen[artifact.name] > self.keep_last:
+                    selected.add(artifact.id)
+
+        if self.max_total_size is not None:
+            total = 0
+            for artifact in candidates:
+                if artifact.id in selected:
+                    continue
+                total += artifact.size_in_bytes
+                if total > self.max_total_size:
+                    selected.add(artifact.id)
+
+        return [
+            artifact
+            for artifact in reversed(candidates)
+            if artifact.id in selected
+        ]
@@ -3,26 +3,50 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Iterable
 from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from pathlib import Path
 
+import httpx
+
+from pontos.github.api.artifact_retention import (
+    ArtifactRetentionPolicy,
+    ArtifactStatistics,
+)
 from pontos.github.api.client import GitHubAsyncREST, Params
+from pontos.github.api.download import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    FileDownload,
+    download_file,
+)
 from pontos.github.models.artifact import Artifact
 from pontos.helper import AsyncDownloadProgressIterable, download_async
 
+DEFAULT_ARTIFACTS_CONCURRENCY = 10
+
 
 class GitHubAsyncRESTArtifacts(GitHubAsyncREST):
     def _get_paged_artifacts(
-        self, api, *, params: Params | None = None
+        self,
+        api,
+        *,
+        params: Params | None = None,
+        concurrency: int | None = None,
     ) -> AsyncIterator[Artifact]:
         return self._get_paged_items(
             api,
             "artifacts",
             Artifact,
             params=params,  # type: ignore
+            concurrency=concurrency,
         )
 
-    def get_all(self, repo: str) -> AsyncIterator[Artifact]:
+    def get_all(
+        self, repo: str, *, concurrency: int | None = None
+    ) -> AsyncIterator[Artifact]:
         """
         List all artifacts of a repository
 
@@ -30,6 +54,7 @@ class GitHubAsyncRESTArtifacts(GitHubAsyncREST):
 
         Args:
             repo: GitHub repository (owner/name) to use
+            concurrency: Optional number of pages to request in parallel
 
         Raises:
             HTTPStatusError: A httpx.HTTPStatusError is raised if the request
@@ -48,7 +73,7 @@ class GitHubAsyncRESTArtifacts(GitHubAsyncREST):
                         print(artifact)
         """
         api = f"/repos/{repo}/actions/artifacts"
-        return self._get_paged_artifacts(api)
+        return self._get_paged_artifacts(api, concurrency=concurrency)
 
     async def get(self, repo: str, artifact: str | int) -> Artifact:
         """
@@ -172,3 +197,214 @@ class GitHubAsyncRESTArtifacts(GitHubAsyncREST):
         """
         api = f"/repos/{repo}/actions/artifacts/{artifact}/zip"
         return download_async(self._client.stream(api))
+
+    async def download_to_file(
+        self,
+        repo: str,
+        artifact: str | int,
+        destination: Path,
+        *,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        expected_digest: str | None = None,
+    ) -> FileDownload:
+        """
+        Download a repository artifact zip file directly into a file
+
+        The artifact is downloaded with parallel HTTP range requests and an
+        interrupted download is resumed when called again with the same
+        destination.
+
+        https://docs.github.com/en/rest/actions/artifacts#download-an-artifact
+
+        Args:
+            repo: GitHub repository (owner/name) to use
+            artifact: ID of the artifact
+            destination: Path of the file to write the artifact to
+            part_size: Size of the parts requested in parallel in bytes
+            concurrency: Maximum number of parallel range requests
+            expected_digest: Optional SHA-256 hex digest the artifact must
+                match
+
+        Raises:
+            HTTPStatusError: If a request was invalid
+            GitHubApiError: If the download is incomplete or doesn't match
+                the expected digest
+
+        Returns:
+            Information about the downloaded file including its SHA-256 digest
+
+        Example:
+            .. code-block:: python
+
+                from pathlib import Path
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    download = await api.artifacts.download_to_file(
+                        "org/repo", 123, Path("artifact.zip")
+                    )
+                    print(download.path, download.digest)
+        """
+        api = f"/repos/{repo}/actions/artifacts/{artifact}/zip"
+        return await download_file(
+            self._client,
+            api,
+            destination,
+            part_size=part_size,
+            concurrency=concurrency,
+            expected_digest=expected_digest,
+        )
+
+    async def statistics(
+        self,
+        repo: str,
+        *,
+        concurrency: int = DEFAULT_ARTIFACTS_CONCURRENCY,
+        now: datetime | None = None,
+    ) -> ArtifactStatistics:
+        """
+        Aggregate the artifacts of a repository by workflow run, branch and
+        age
+
+        The pages of the artifacts list are requested in parallel.
+
+        Args:
+            repo: GitHub repository (owner/name) to use
+            concurrency: Maximum number of pages to request in parallel
+            now: Reference time for calculating the age of the artifacts.
+                Defaults to the current time.
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if the request
+                failed.
+
+        Returns:
+            The statistics of the artifacts
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    statistics = await api.artifacts.statistics("foo/bar")
+                    print(statistics.total.size_in_bytes)
+                    for branch, summary in statistics.by_branch.items():
+                        print(branch, summary.count, summary.size_in_bytes)
+        """
+        statistics = ArtifactStatistics()
+        async for artifact in self.get_all(repo, concurrency=concurrency):
+            statistics.add(artifact, now=now)
+        return statistics
+
+    async def delete_many(
+        self,
+        repo: str,
+        artifacts: Iterable[str | int],
+        *,
+        concurrency: int = DEFAULT_ARTIFACTS_CONCURRENCY,
+    ) -> None:
+        """
+        Delete several artifacts of a repository in parallel
+
+        Artifacts that don't exist anymore are ignored.
+
+        https://docs.github.com/en/rest/actions/artifacts#delete-an-artifact
+
+        Args:
+            repo: GitHub repository (owner/name) to use
+            artifacts: IDs of the artifacts to delete
+            concurrency: Maximum number of parallel delete requests
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    await api.artifacts.delete_many("foo/bar", [123, 456])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def delete(artifact: str | int) -> None:
+            async with semaphore:
+                api = f"/repos/{repo}/actions/artifacts/{artifact}"
+                response = await self._client.delete(api)
+                if response.status_code != httpx.codes.NOT_FOUND:
+                    response.raise_for_status()
+
+        tasks = [
+            asyncio.create_task(delete(artifact)) for artifact in artifacts
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def cleanup(
+        self,
+        repo: str,
+        policy: ArtifactRetentionPolicy,
+        *,
+        concurrency: int = DEFAULT_ARTIFACTS_CONCURRENCY,
+        dry_run: bool = False,
+        now: datetime | None = None,
+    ) -> list[Artifact]:
+        """
+        Delete the artifacts of a repository selected by a retention policy
+
+        The pages of the artifacts list are requested and the artifacts are
+        deleted in parallel.
+
+        Args:
+            repo: GitHub repository (owner/name) to use
+            policy: The policy selecting the artifacts to delete
+            concurrency: Maximum number of parallel requests
+            dry_run: Only select the artifacts but don't delete them
+            now: Reference time for calculating the age of the artifacts.
+                Defaults to the current time.
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Returns:
+            The selected artifacts, oldest first
+
+        Example:
+            .. code-block:: python
+
+                from datetime import timedelta
+                from pontos.github.api import (
+                    ArtifactRetentionPolicy,
+                    GitHubAsyncRESTApi,
+                )
+
+                policy = ArtifactRetentionPolicy(
+                    max_age=timedelta(days=14), keep_last=3
+                )
+                async with GitHubAsyncRESTApi(token) as api:
+                    deleted = await api.artifacts.cleanup("foo/bar", policy)
+                    print(sum(a.size_in_bytes for a in deleted), "bytes freed")
+        """
+        artifacts = [
+            artifact
+            async for artifact in self.get_all(repo, concurrency=concurrency)
+        ]
+        selected = policy.select(artifacts, now=now)
+
+        if not dry_run:
+            await self.delete_many(
+                repo,
+                [artifact.id for artifact in selected],
+                concurrency=concurrency,
+            )
+
+        return selected
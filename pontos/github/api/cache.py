@@ -0,0 +1,258 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import base64
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+__all__ = (
+    "CachedResponse",
+    "ResponseCache",
+)
+
+DEFAULT_MAX_SIZE = 1000
+
+# headers describing the transfer of the original response. they must not be
+# replayed because the cached content is already decoded.
+_TRANSFER_HEADERS = frozenset(
+    ("content-encoding", "content-length", "transfer-encoding")
+)
+
+
+@dataclass
+class CachedResponse:
+    """
+    A cached response of a GitHub API request
+
+    Attributes:
+        url: URL of the request
+        status_code: HTTP status code of the original response
+        headers: Headers of the original response
+        content: Body of the original response
+        etag: ETag of the original response
+        last_modified: Last-Modified header of the original response
+    """
+
+    url: str
+    status_code: int
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CachedResponse":
+        """
+        Create a cached response from a response
+        """
+        return cls(
+            url=str(response.url),
+            status_code=response.status_code,
+            content=response.content,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _TRANSFER_HEADERS
+            },
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Get the headers for a conditional request for this response
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """
+        Create a response replaying the cached content for a request
+        """
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Convert the cached response into JSON serializable data
+        """
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content": base64.b64encode(self.content).decode("ascii"),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "CachedResponse":
+        """
+        Create a cached response from data created by to_json
+        """
+        return cls(
+            url=data["url"],
+            status_code=data["status_code"],
+            headers=data["headers"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            content=base64.b64decode(data["content"]),
+        )
+
+
+class ResponseCache:
+    """
+    A cache for conditional GitHub API requests
+
+    Responses containing an ETag or Last-Modified header are cached. Following
+    requests to the same URL are sent with If-None-Match and If-Modified-Since
+    headers. If GitHub answers with 304 Not Modified the cached response is
+    replayed. Conditional requests answered with 304 don't count against the
+    primary rate limit.
+
+    The responses are kept in a least recently used in-memory cache and
+    optionally in a directory to share the cache between runs.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.api import GitHubAsyncRESTApi, ResponseCache
+
+            cache = ResponseCache(directory="~/.cache/pontos/github")
+            async with GitHubAsyncRESTApi(token, cache=cache) as api:
+                release = await api.releases.get("foo/bar", "v1.2.3")
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+        directory: str | PathLike[str] | None = None,
+    ) -> None:
+        """
+        Args:
+            max_size: Maximum number of responses kept in memory
+            directory: Optional directory for persisting the cached responses
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._directory = Path(directory).expanduser() if directory else None
+
+        if self._directory:
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Mapping[str, Any] | list[tuple[str, Any]] | None,
+        headers: Any,
+    ) -> str:
+        """
+        Create a cache key for a request
+
+        The key depends on the URL, the params and the Accept and
+        Authorization headers because the responses differ for these.
+        """
+        # keep repeated params and the order of their values
+        query = sorted(
+            httpx.QueryParams(params).multi_items(), key=lambda item: item[0]
+        )
+        parts = [
+            url,
+            json.dumps(query),
+            headers.get("Accept", ""),
+            headers.get("Authorization", ""),
+        ]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"  # type: ignore[operator]
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Get a cached response
+
+        Args:
+            key: Key of the request
+
+        Returns:
+            The cached response or None if there is no cached response
+        """
+        entry = self._entries.get(key)
+        if entry:
+            self._entries.move_to_end(key)
+            return entry
+
+        if not self._directory:
+            return None
+
+        path = self._path(key)
+        try:
+            entry = CachedResponse.from_json(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError):
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """
+        Cache a response if it can be used for conditional requests
+
+        Args:
+            key: Key of the request
+            response: The response to cache
+        """
+        if not response.is_success:
+            return
+
+        if not (
+            response.headers.get("etag")
+            or response.headers.get("last-modified")
+        ):
+            return
+
+        entry = CachedResponse.from_response(response)
+        self._remember(key, entry)
+
+        if self._directory:
+            path = self._path(key)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(entry.to_json()))
+            temp_path.replace(path)
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses
+        """
+        self._entries.clear()
+        if self._directory:
+            for path in self._directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,8 +3,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
-
-from collections.abc import AsyncIterator, Mapping
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 from typing import Any
@@ -12,13 +13,17 @@ from typing import Any
 import httpx
 from typing_extensions import Self
 
+from pontos.github.api.cache import ResponseCache
 from pontos.github.api.helper import (
     DEFAULT_GITHUB_API_URL,
     DEFAULT_TIMEOUT_CONFIG,
     JSON,
     JSON_OBJECT,
+    _get_last_url,
     _get_next_url,
+    _get_page,
 )
+from pontos.github.api.rate_limit import RateLimitScheduler
 from pontos.github.models.base import GitHubModel
 
 Headers = Mapping[str, str]
@@ -52,9 +57,13 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         url: str | None = DEFAULT_GITHUB_API_URL,
         *,
         timeout: httpx.Timeout | None = DEFAULT_TIMEOUT_CONFIG,
+        rate_limit: RateLimitScheduler | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         self.token = token
         self.url = url
+        self.rate_limit = rate_limit
+        self.cache = cache
         self._client = httpx.AsyncClient(timeout=timeout, http2=True)
 
     def _request_headers(
@@ -103,6 +112,44 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
             else self._request_api_url(api_or_url)
         )
 
+    def request_url(self, api_or_url: str) -> str:
+        """
+        Get the URL a request for an API path or URL is sent to
+
+        Args:
+            api_or_url: API path or full URL
+
+        Returns:
+            The full URL for the request
+        """
+        return self._request_url(api_or_url)
+
+    async def _send(
+        self,
+        url: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        mutating: bool = False,
+        retry: bool = True,
+    ) -> httpx.Response:
+        """
+        Send a request respecting the rate limits if a scheduler is set
+        """
+        if not self.rate_limit:
+            return await send()
+
+        path = httpx.URL(url).path
+        if path.startswith("/search/"):
+            resource = "search"
+        elif path in ("/graphql", "/api/graphql"):
+            resource = "graphql"
+        else:
+            resource = "core"
+
+        return await self.rate_limit.run(
+            send, resource=resource, mutating=mutating, retry=retry
+        )
+
     async def get(
         self,
         api: str,
@@ -119,19 +166,39 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         url = self._request_url(api)
         headers = self._request_headers()
         kwargs = self._request_kwargs()
-        return await self._client.get(  # type: ignore
+
+        cached = None
+        if self.cache is not None:
+            key = self.cache.key(url, params, headers)
+            cached = self.cache.get(key)
+            if cached:
+                headers = {**headers, **cached.conditional_headers()}
+
+        response = await self._send(
             url,
-            headers=headers,
-            params=params,
-            follow_redirects=True,
-            **kwargs,
+            lambda: self._client.get(  # type: ignore
+                url,
+                headers=headers,
+                params=params,
+                follow_redirects=True,
+                **kwargs,
+            ),
         )
 
+        if self.cache is not None:
+            if cached and response.status_code == 304:
+                return cached.to_response(response.request)
+
+            self.cache.store(key, response)
+
+        return response
+
     async def get_all(
         self,
         api: str,
         *,
         params: Params | None = None,
+        concurrency: int | None = None,
     ) -> AsyncIterator[httpx.Response]:
         """
         Get paginated content of a get GitHub API request
@@ -139,11 +206,25 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         Args:
             api: API path to use for the get request
             params: Optional params to use for the get request
+            concurrency: If set and the first response links to the last page,
+                request all remaining pages concurrently with at most this
+                number of parallel requests. The responses are returned in
+                page order nevertheless. By default the pages are requested
+                one after the other by following the next links.
         """
         response = await self.get(api, params=params)
 
         yield response
 
+        last_url = _get_last_url(response) if concurrency else None
+        last_page = _get_page(last_url) if last_url else None
+        if concurrency and last_url and last_page:
+            async for response in self._get_pages(
+                last_url, last_page, params=params, concurrency=concurrency
+            ):
+                yield response
+            return
+
         next_url = _get_next_url(response)
 
         while next_url:
@@ -157,6 +238,39 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
 
             next_url = _get_next_url(response)
 
+    async def _get_pages(
+        self,
+        last_url: str,
+        last_page: int,
+        *,
+        params: Params | None,
+        concurrency: int,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Request the pages 2 to last_page concurrently and yield the responses
+        in page order
+        """
+        url = httpx.URL(last_url)
+        pending: deque[asyncio.Task[httpx.Response]] = deque()
+        try:
+            for page in range(2, last_page + 1):
+                page_url = url.copy_set_param("page", page)
+                # Workaround for https://github.com/encode/httpx/issues/3433
+                new_params = page_url.params.merge(params) if params else None
+                pending.append(
+                    asyncio.create_task(
+                        self.get(str(page_url), params=new_params)
+                    )
+                )
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def delete(
         self, api: str, *, params: Params | None = None
     ) -> httpx.Response:
@@ -169,7 +283,11 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         """
         headers = self._request_headers()
         url = self._request_url(api)
-        return await self._client.delete(url, params=params, headers=headers)
+        return await self._send(
+            url,
+            lambda: self._client.delete(url, params=params, headers=headers),
+            mutating=True,
+        )
 
     async def post(
         self,
@@ -180,6 +298,7 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         content: str | None = None,
         content_type: str | None = None,
         content_length: int | None = None,
+        mutating: bool = True,
     ) -> httpx.Response:
         """
         Post request to a GitHub API
@@ -188,13 +307,22 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
             api: API path to use for the post request
             params: Optional params to use for the post request
             data: Optional data to include in the post request
+            mutating: Set to False if the request only reads data, like a
+                GraphQL query. Such requests aren't delayed like mutating
+                requests by the rate limit scheduler.
         """
         headers = self._request_headers(
             content_type=content_type, content_length=content_length
         )
         url = self._request_url(api)
-        return await self._client.post(
-            url, params=params, headers=headers, json=data, content=content
+        return await self._send(
+            url,
+            lambda: self._client.post(
+                url, params=params, headers=headers, json=data, content=content
+            ),
+            mutating=mutating,
+            # streamed content can't be sent again
+            retry=content is None or isinstance(content, str | bytes),
         )
 
     async def put(
@@ -216,8 +344,12 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         """
         headers = self._request_headers(content_type=content_type)
         url = self._request_url(api)
-        return await self._client.put(
-            url, params=params, headers=headers, json=data, content=content
+        return await self._send(
+            url,
+            lambda: self._client.put(
+                url, params=params, headers=headers, json=data, content=content
+            ),
+            mutating=True,
         )
 
     async def patch(
@@ -239,8 +371,12 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         """
         headers = self._request_headers(content_type=content_type)
         url = self._request_url(api)
-        return await self._client.patch(
-            url, params=params, headers=headers, json=data, content=content
+        return await self._send(
+            url,
+            lambda: self._client.patch(
+                url, params=params, headers=headers, json=data, content=content
+            ),
+            mutating=True,
         )
 
     def stream(
@@ -248,6 +384,8 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
         api: str,
         *,
         accept: str | None = None,
+        headers: Headers | None = None,
+        authenticated: bool = True,
     ) -> AbstractAsyncContextManager[httpx.Response]:
         """
         Stream data from a GitHub API
@@ -256,11 +394,20 @@ class GitHubAsyncRESTClient(AbstractAsyncContextManager):
             api: API path to use for the post request
             accept: Expected content type in the response.
                 Default "application/octet-stream".
+            headers: Additional headers to send, for example a Range header
+            authenticated: Set to False to not send the token. Should be used
+                for requests to pre-signed download URLs that are not part of
+                the GitHub API.
         """
-        headers = self._request_headers(accept=accept)
+        request_headers = dict(self._request_headers(accept=accept))
+        if headers:
+            request_headers.update(headers)
+        if not authenticated:
+            request_headers.pop("Authorization", None)
+
         url = self._request_url(api)
         return self._client.stream(
-            "GET", url, headers=headers, follow_redirects=True
+            "GET", url, headers=request_headers, follow_redirects=True
         )
 
     async def __aenter__(self) -> Self:
@@ -293,6 +440,7 @@ class GitHubAsyncREST:
         model_cls: type[GitHubModel],
         *,
         params: Params | None = None,
+        concurrency: int | None = None,
     ) -> AsyncIterator[GitHubModel]:
         """
         Internal method to get the paged items information from different REST
@@ -303,7 +451,13 @@ class GitHubAsyncREST:
             request_params.update(params)
         request_params["per_page"] = "100"  # max number
 
-        async for response in self._client.get_all(api, params=request_params):
+        kwargs = {}
+        if concurrency:
+            kwargs["concurrency"] = concurrency
+
+        async for response in self._client.get_all(
+            api, params=request_params, **kwargs
+        ):
             response.raise_for_status()
             data: JSON_OBJECT = response.json()
             for item in data.get(name, []):  # type: ignore
@@ -2,13 +2,26 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import asyncio
 import base64
 import gzip
+import json
+import time
 from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
+from pathlib import Path
+
+import httpx
 
 from pontos.github.api.client import GitHubAsyncREST
+from pontos.github.api.errors import GitHubApiError
 from pontos.github.api.helper import JSON_OBJECT
+from pontos.github.api.sarif import (
+    DEFAULT_SARIF_CHUNK_SIZE,
+    DEFAULT_SARIF_UPLOAD_CONCURRENCY,
+    SarifUpload,
+    encode_sarif_file,
+)
 from pontos.github.models.base import SortOrder
 from pontos.github.models.code_scanning import (
     AlertSort,
@@ -22,6 +35,7 @@ from pontos.github.models.code_scanning import (
     Instance,
     Language,
     QuerySuite,
+    SarifProcessingStatus,
     SarifUploadInformation,
     Severity,
 )
@@ -636,6 +650,30 @@ class GitHubAsyncRESTCodeScanning(GitHubAsyncREST):
         response.raise_for_status()
         return response.json()
 
+    @staticmethod
+    def _sarif_upload_data(
+        commit_sha: str,
+        ref: str,
+        *,
+        checkout_uri: str | None,
+        started_at: datetime | None,
+        tool_name: str | None,
+        validate: bool | None,
+    ) -> JSON_OBJECT:
+        data: JSON_OBJECT = {
+            "commit_sha": commit_sha,
+            "ref": ref,
+        }
+        if checkout_uri:
+            data["checkout_uri"] = checkout_uri
+        if started_at:
+            data["started_at"] = started_at.isoformat(timespec="seconds")
+        if tool_name:
+            data["tool_name"] = tool_name
+        if validate is not None:
+            data["validate"] = validate
+        return data
+
     async def upload_sarif_data(
         self,
         repo: str,
@@ -692,18 +730,14 @@ class GitHubAsyncRESTCodeScanning(GitHubAsyncREST):
                     print(json["id"])
         """
         api = f"/repos/{repo}/code-scanning/sarifs"
-        data: JSON_OBJECT = {
-            "commit_sha": commit_sha,
-            "ref": ref,
-        }
-        if checkout_uri:
-            data["checkout_uri"] = checkout_uri
-        if started_at:
-            data["started_at"] = started_at.isoformat(timespec="seconds")
-        if tool_name:
-            data["tool_name"] = tool_name
-        if validate is not None:
-            data["validate"] = validate
+        data = self._sarif_upload_data(
+            commit_sha,
+            ref,
+            checkout_uri=checkout_uri,
+            started_at=started_at,
+            tool_name=tool_name,
+            validate=validate,
+        )
 
         compressed = gzip.compress(sarif, mtime=0)
         encoded = base64.b64encode(compressed).decode(encoding="ascii")
@@ -750,3 +784,262 @@ class GitHubAsyncRESTCodeScanning(GitHubAsyncREST):
         response = await self._client.get(api)
         response.raise_for_status()
         return SarifUploadInformation.from_dict(response.json())
+
+    async def upload_sarif_file(
+        self,
+        repo: str,
+        commit_sha: str,
+        ref: str,
+        sarif_file: Path,
+        *,
+        checkout_uri: str | None = None,
+        started_at: datetime | None = None,
+        tool_name: str | None = None,
+        validate: bool | None = None,
+        chunk_size: int = DEFAULT_SARIF_CHUNK_SIZE,
+    ) -> dict[str, str]:
+        """
+        Upload a SARIF file containing the results of a code scanning
+        analysis to make the results available in a repository
+
+        In contrast to upload_sarif_data the file is compressed, encoded and
+        sent in chunks. Therefore the memory usage is independent of the size
+        of the file.
+
+        https://docs.github.com/en/rest/code-scanning/code-scanning#upload-an-analysis-as-sarif-data
+
+        Args:
+            repo: GitHub repository (owner/name)
+            commit_sha: The SHA of the commit to which the analysis you are
+                uploading relates
+            ref: The full Git reference, formatted as refs/heads/<branch name>,
+                refs/pull/<number>/merge, or refs/pull/<number>/head
+            sarif_file: Path to the SARIF file
+            checkout_uri: The base directory used in the analysis, as it appears
+                in the SARIF file
+            started_at: The time that the analysis run began
+            tool_name: The name of the tool used to generate the code scanning
+                analysis
+            validate: Whether the SARIF file will be validated according to the
+                code scanning specifications
+            chunk_size: Size of the chunks read from the file in bytes
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if the request
+                failed.
+
+        Returns:
+            See the GitHub documentation for the response object
+
+        Example:
+            .. code-block:: python
+
+                from pathlib import Path
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    json = await api.code_scanning.upload_sarif_file(
+                        "org/repo",
+                        commit_sha="4b6472266afd7b471e86085a6659e8c7f2b119da",
+                        ref="refs/heads/main",
+                        sarif_file=Path("/path/to/sarif.file"),
+                    )
+                    print(json["id"])
+        """
+        api = f"/repos/{repo}/code-scanning/sarifs"
+        data = self._sarif_upload_data(
+            commit_sha,
+            ref,
+            checkout_uri=checkout_uri,
+            started_at=started_at,
+            tool_name=tool_name,
+            validate=validate,
+        )
+        # the encoded SARIF data is streamed into the sarif string value of
+        # the JSON document. base64 doesn't need any JSON escaping.
+        document = json.dumps({**data, "sarif": ""}).encode("ascii")
+        head, tail = document[:-2], document[-2:]
+
+        async def content() -> AsyncIterator[bytes]:
+            yield head
+            async for chunk in encode_sarif_file(
+                sarif_file, chunk_size=chunk_size
+            ):
+                yield chunk
+            yield tail
+
+        response = await self._client.post(
+            api,
+            content=content(),  # type: ignore[arg-type]
+            content_type="application/json",
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def wait_for_sarif(
+        self,
+        repo: str,
+        sarif_id: str,
+        *,
+        timeout: float = 600.0,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> SarifUploadInformation:
+        """
+        Wait until a SARIF upload has been processed
+
+        The processing status is polled with an exponentially increasing
+        interval. A not yet available SARIF upload is considered as pending.
+
+        Args:
+            repo: GitHub repository (owner/name)
+            sarif_id: The SARIF ID obtained after uploading
+            timeout: Maximum time to wait in seconds
+            poll_interval: Initial interval between polls in seconds. The
+                interval doubles with every poll.
+            max_poll_interval: Maximum interval between polls in seconds
+
+        Raises:
+            GitHubApiError: If the processing hasn't finished within the
+                timeout.
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Returns:
+            Information about the processed SARIF upload. The processing
+            status is either complete or failed.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    sarif = await api.code_scanning.wait_for_sarif(
+                        "org/repo",
+                        "47177e22-5596-11eb-80a1-c1e54ef945c6",
+                    )
+                    print(sarif.processing_status)
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            try:
+                information = await self.sarif(repo, sarif_id)
+                if (
+                    information.processing_status
+                    != SarifProcessingStatus.PENDING
+                ):
+                    return information
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != httpx.codes.NOT_FOUND:
+                    raise
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise GitHubApiError(
+                    f"Processing of SARIF upload {sarif_id} for {repo} "
+                    f"hasn't finished within {timeout} seconds."
+                )
+
+            await asyncio.sleep(min(interval, max_poll_interval, remaining))
+            interval *= 2
+
+    async def upload_sarif_files(
+        self,
+        repo: str,
+        commit_sha: str,
+        ref: str,
+        sarif_files: Iterable[Path],
+        *,
+        checkout_uri: str | None = None,
+        started_at: datetime | None = None,
+        validate: bool | None = None,
+        concurrency: int = DEFAULT_SARIF_UPLOAD_CONCURRENCY,
+        wait: bool = True,
+        timeout: float = 600.0,
+        chunk_size: int = DEFAULT_SARIF_CHUNK_SIZE,
+    ) -> AsyncIterator[SarifUpload]:
+        """
+        Upload several SARIF files concurrently, for example the results of
+        different analyzers for the same commit
+
+        Each file is streamed like with upload_sarif_file. Optionally the
+        processing of each upload is awaited like with wait_for_sarif.
+
+        Args:
+            repo: GitHub repository (owner/name)
+            commit_sha: The SHA of the commit to which the analyses relate
+            ref: The full Git reference, formatted as refs/heads/<branch name>,
+                refs/pull/<number>/merge, or refs/pull/<number>/head
+            sarif_files: Paths of the SARIF files
+            checkout_uri: The base directory used in the analyses, as it
+                appears in the SARIF files
+            started_at: The time that the analysis runs began
+            validate: Whether the SARIF files will be validated according to
+                the code scanning specifications
+            concurrency: Maximum number of parallel uploads
+            wait: Wait for the processing of the uploads
+            timeout: Maximum time to wait for the processing of an upload in
+                seconds
+            chunk_size: Size of the chunks read from the files in bytes
+
+        Raises:
+            GitHubApiError: If the processing hasn't finished within the
+                timeout.
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Returns:
+            An async iterator yielding the uploads as they are finished
+
+        Example:
+            .. code-block:: python
+
+                from pathlib import Path
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    async for upload in api.code_scanning.upload_sarif_files(
+                        "org/repo",
+                        commit_sha="4b6472266afd7b471e86085a6659e8c7f2b119da",
+                        ref="refs/heads/main",
+                        sarif_files=Path("results").glob("*.sarif"),
+                    ):
+                        print(upload.path, upload.failed)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload(sarif_file: Path) -> SarifUpload:
+            start = time.monotonic()
+            async with semaphore:
+                response = await self.upload_sarif_file(
+                    repo,
+                    commit_sha,
+                    ref,
+                    sarif_file,
+                    checkout_uri=checkout_uri,
+                    started_at=started_at,
+                    validate=validate,
+                    chunk_size=chunk_size,
+                )
+            # waiting for the processing doesn't block other uploads
+            sarif_upload = SarifUpload(path=sarif_file, sarif_id=response["id"])
+            if wait:
+                sarif_upload.information = await self.wait_for_sarif(
+                    repo, sarif_upload.sarif_id, timeout=timeout
+                )
+            sarif_upload.duration = time.monotonic() - start
+            return sarif_upload
+
+        tasks = [
+            asyncio.create_task(upload(sarif_file))
+            for sarif_file in sarif_files
+        ]
+        try:
+            for coroutine in asyncio.as_completed(tasks):
+                yield await coroutine
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,401 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+import httpx
+
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.errors import GitHubApiError
+
+__all__ = (
+    "FileDownload",
+    "download_file",
+)
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024  # 8 MiB
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+DEFAULT_HASH_ALGORITHM = "sha256"
+CHUNK_SIZE = 64 * 1024  # 64 KiB
+
+_CONTENT_RANGE_REGEX = re.compile(r"bytes\s+\d+-\d+/(?P<size>\d+)")
+_EMPTY_CONTENT_RANGE_REGEX = re.compile(r"bytes\s+\*/0$")
+
+
+@dataclass
+class FileDownload:
+    """
+    A file downloaded from GitHub
+
+    Attributes:
+        path: Path of the downloaded file
+        size: Size of the downloaded file in bytes
+        digest: Hex digest of the file content
+        hash_algorithm: Name of the hash algorithm used for the digest
+        resumed: True if a previously interrupted download has been resumed
+    """
+
+    path: Path
+    size: int
+    digest: str
+    hash_algorithm: str = DEFAULT_HASH_ALGORITHM
+    resumed: bool = False
+
+
+def _write_at(
+    file: IO[bytes], data: bytes, offset: int, lock: threading.Lock
+) -> None:
+    if hasattr(os, "pwrite"):
+        os.pwrite(file.fileno(), data, offset)
+        return
+
+    # the parts are written from several threads
+    with lock:
+        file.seek(offset)
+        file.write(data)
+
+
+def _truncate(path: Path, size: int) -> None:
+    with path.open("wb") as f:
+        f.truncate(size)
+
+
+def _read_at(
+    file: IO[bytes], size: int, offset: int, lock: threading.Lock
+) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(file.fileno(), size, offset)
+
+    with lock:
+        file.seek(offset)
+        return file.read(size)
+
+
+class _DownloadState:
+    """
+    Persisted state of a ranged download to allow resuming it
+    """
+
+    def __init__(self, path: Path, size: int, validator: str | None) -> None:
+        self.path = path
+        self.size = size
+        self.validator = validator
+        self.completed: set[int] = set()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def load(
+        cls, path: Path, size: int, validator: str | None
+    ) -> "_DownloadState":
+        state = cls(path, size, validator)
+        try:
+            data: dict[str, Any] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return state
+
+        if data.get("size") == size and data.get("validator") == validator:
+            state.completed = set(data.get("completed", []))
+        return state
+
+    def _write(self, data: str) -> None:
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(data)
+        temp_path.replace(self.path)
+
+    async def save(self) -> None:
+        # serialize in the event loop while no part can be added. the lock
+        # writes the snapshots in order.
+        data = json.dumps(
+            {
+                "size": self.size,
+                "validator": self.validator,
+                "completed": sorted(self.completed),
+            }
+        )
+        async with self._lock:
+            await asyncio.to_thread(self._write, data)
+
+
+class _RangedDownload:
+    def __init__(
+        self,
+        client: GitHubAsyncRESTClient,
+        url: str,
+        *,
+        authenticated: bool,
+        file: IO[bytes],
+        size: int,
+        part_size: int,
+        state: _DownloadState,
+        hash_algorithm: str,
+    ) -> None:
+        self._client = client
+        self._url = url
+        self._authenticated = authenticated
+        self._file = file
+        self._size = size
+        self._part_size = part_size
+        self._state = state
+        self._hash = hashlib.new(hash_algorithm)
+        self._hash_lock = asyncio.Lock()
+        self._file_lock = threading.Lock()
+        self._hashed_parts = 0
+        self._parts = (size + part_size - 1) // part_size
+
+    def _part_range(self, index: int) -> tuple[int, int]:
+        start = index * self._part_size
+        end = min(start + self._part_size, self._size) - 1
+        return start, end
+
+    def _update_hash(self) -> None:
+        """
+        Feed all completed parts following the already hashed parts into the
+        running hash
+        """
+        while self._hashed_parts in self._state.completed:
+            start, end = self._part_range(self._hashed_parts)
+            offset = start
+            while offset <= end:
+                data = _read_at(
+                    self._file,
+                    min(CHUNK_SIZE, end - offset + 1),
+                    offset,
+                    self._file_lock,
+                )
+                if not data:
+                    raise GitHubApiError(
+                        f"Unexpected end of partially downloaded file at "
+                        f"offset {offset}."
+                    )
+                self._hash.update(data)
+                offset += len(data)
+            self._hashed_parts += 1
+
+    async def _update_hash_in_thread(self) -> None:
+        # reading back the parts blocks. only one thread may feed the hash.
+        async with self._hash_lock:
+            await asyncio.to_thread(self._update_hash)
+
+    async def _download_part(
+        self, index: int, semaphore: asyncio.Semaphore
+    ) -> None:
+        start, end = self._part_range(index)
+        async with (
+            semaphore,
+            self._client.stream(
+                self._url,
+                headers={"Range": f"bytes={start}-{end}"},
+                authenticated=self._authenticated,
+            ) as response,
+        ):
+            response.raise_for_status()
+            if response.status_code != httpx.codes.PARTIAL_CONTENT:
+                raise GitHubApiError(
+                    f"Range request for {self._url} returned status "
+                    f"{response.status_code} instead of 206."
+                )
+
+            offset = start
+            async for content in response.aiter_bytes(CHUNK_SIZE):
+                if offset + len(content) > end + 1:
+                    raise GitHubApiError(
+                        f"Received more data than requested for bytes "
+                        f"{start}-{end} of {self._url}."
+                    )
+                await asyncio.to_thread(
+                    _write_at, self._file, content, offset, self._file_lock
+                )
+                offset += len(content)
+
+        if offset != end + 1:
+            raise GitHubApiError(
+                f"Incomplete data for bytes {start}-{end} of {self._url}. "
+                f"Received {offset - start} bytes."
+            )
+
+        self._state.completed.add(index)
+        await self._state.save()
+        await self._update_hash_in_thread()
+
+    async def run(self, concurrency: int) -> str:
+        await self._update_hash_in_thread()
+
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [
+            asyncio.create_task(self._download_part(index, semaphore))
+            for index in range(self._parts)
+            if index not in self._state.completed
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return self._hash.hexdigest()
+
+
+def _is_empty(response: httpx.Response) -> bool:
+    # the first byte of an empty file can't be requested
+    return bool(
+        response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+        and _EMPTY_CONTENT_RANGE_REGEX.match(
+            response.headers.get("content-range", "")
+        )
+    )
+
+
+def _get_size(response: httpx.Response) -> int | None:
+    if _is_empty(response):
+        return 0
+
+    if response.status_code != httpx.codes.PARTIAL_CONTENT:
+        return None
+
+    match = _CONTENT_RANGE_REGEX.match(
+        response.headers.get("content-range", "")
+    )
+    return int(match.group("size")) if match else None
+
+
+async def download_file(
+    client: GitHubAsyncRESTClient,
+    api: str,
+    destination: Path,
+    *,
+    part_size: int = DEFAULT_PART_SIZE,
+    concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
+    expected_digest: str | None = None,
+) -> FileDownload:
+    """
+    Download a file from GitHub using parallel HTTP range requests
+
+    The file is split into parts of part_size bytes which are requested
+    concurrently and written at their offsets into a preallocated temporary
+    file next to the destination. A hash of the content is calculated while
+    the download progresses. The completed parts are recorded in a state file
+    so that an interrupted download is resumed on the next call. If the
+    server doesn't support range requests the file is downloaded in a single
+    request.
+
+    Args:
+        client: The GitHub REST client to use
+        api: API path or URL of the file to download
+        destination: Path to write the file to
+        part_size: Size of the parts in bytes
+        concurrency: Maximum number of parallel range requests
+        hash_algorithm: Name of the hash algorithm for the digest of the file
+        expected_digest: Optional hex digest the downloaded file must match
+
+    Raises:
+        HTTPStatusError: If a request was invalid
+        GitHubApiError: If the downloaded data is incomplete or doesn't match
+            the expected digest
+
+    Returns:
+        Information about the downloaded file
+
+    Example:
+        .. code-block:: python
+
+            from pathlib import Path
+            from pontos.github.api import GitHubAsyncRESTApi
+
+            async with GitHubAsyncRESTApi(token) as api:
+                download = await api.artifacts.download_to_file(
+                    "foo/bar", 123, Path("artifact.zip")
+                )
+                print(download.digest)
+    """
+    destination = Path(destination)
+    data_path = destination.with_name(f"{destination.name}.download")
+    state_path = destination.with_name(f"{destination.name}.download.json")
+
+    async with client.stream(api, headers={"Range": "bytes=0-0"}) as response:
+        if not _is_empty(response):
+            response.raise_for_status()
+        ranged_size = _get_size(response)
+
+        if ranged_size is None:
+            # no support for range requests. use the already started response
+            # for downloading the whole file.
+            file_hash = hashlib.new(hash_algorithm)
+            size = 0
+            f = await asyncio.to_thread(data_path.open, "wb")
+            try:
+                async for content in response.aiter_bytes(CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, content)
+                    file_hash.update(content)
+                    size += len(content)
+            finally:
+                await asyncio.to_thread(f.close)
+            digest = file_hash.hexdigest()
+            resumed = False
+
+        url = str(response.url)
+        # don't send the token to pre-signed URLs of other hosts
+        authenticated = (
+            response.url.host == httpx.URL(client.request_url(api)).host
+        )
+        validator = response.headers.get("etag") or response.headers.get(
+            "last-modified"
+        )
+
+    if ranged_size is not None:
+        size = ranged_size
+        state = await asyncio.to_thread(
+            _DownloadState.load, state_path, size, validator
+        )
+        if state.completed and (
+            not data_path.exists() or data_path.stat().st_size != size
+        ):
+            state.completed.clear()
+
+        resumed = bool(state.completed)
+        if not resumed:
+            await asyncio.to_thread(_truncate, data_path, size)
+
+        with data_path.open("r+b", buffering=0) as f:
+            download = _RangedDownload(
+                client,
+                url,
+                authenticated=authenticated,
+                file=f,  # type: ignore[arg-type]
+                size=size,
+                part_size=part_size,
+                state=state,
+                hash_algorithm=hash_algorithm,
+            )
+            digest = await download.run(concurrency)
+
+    if expected_digest and digest.lower() != expected_digest.lower():
+        data_path.unlink(missing_ok=True)
+        state_path.unlink(missing_ok=True)
+        raise GitHubApiError(
+            f"Digest {digest} of downloaded file {destination} doesn't match "
+            f"the expected digest {expected_digest}."
+        )
+
+    data_path.replace(destination)
+    state_path.unlink(missing_ok=True)
+
+    return FileDownload(
+        path=destination,
+        size=size,
+        digest=digest,
+        hash_algorithm=hash_algorithm,
+        resumed=resumed,
+    )
@@ -0,0 +1,483 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+from collections.abc import AsyncIterator, Iterable
+from itertools import islice
+from typing import Any
+
+from pontos.github.api.client import GitHubAsyncREST
+from pontos.github.api.errors import GitHubApiError
+from pontos.github.api.helper import DEFAULT_GITHUB_API_URL
+from pontos.github.models.branch import BranchProtection
+from pontos.github.models.release import Release
+
+__all__ = ("GitHubAsyncGraphQL",)
+
+DEFAULT_BATCH_SIZE = 50
+GRAPHQL_API = "/graphql"
+DEFAULT_GITHUB_UPLOADS_URL = "https://uploads.github.com"
+
+_TOPICS_FIELDS = "repositoryTopics(first: 100) { nodes { topic { name } } }"
+_DEFAULT_BRANCH_FIELDS = "defaultBranchRef { name }"
+_RELEASE_FIELDS = """latestRelease {
+    databaseId
+    id
+    name
+    tagName
+    description
+    createdAt
+    publishedAt
+    isDraft
+    isPrerelease
+    url
+    tagCommit { oid }
+}"""
+_BRANCH_PROTECTION_RULE_FIELDS = """branchProtectionRule {
+    isAdminEnforced
+    requiresLinearHistory
+    allowsForcePushes
+    allowsDeletions
+    blocksCreations
+    requiresConversationResolution
+    lockBranch
+    lockAllowsFetchAndMerge
+    requiresCommitSignatures
+    requiresApprovingReviews
+    requiredApprovingReviewCount
+    dismissesStaleReviews
+    requiresCodeOwnerReviews
+    requireLastPushApproval
+    requiresStatusChecks
+    requiresStrictStatusChecks
+    requiredStatusChecks { context app { databaseId } }
+}"""
+
+
+def _split_repository(repo: str) -> tuple[str, str]:
+    owner, sep, name = repo.partition("/")
+    if not sep or not owner or not name:
+        raise GitHubApiError(
+            f"Invalid repository '{repo}'. Expected format is owner/name."
+        )
+    return owner, name
+
+
+def _batches(repos: Iterable[str], batch_size: int) -> Iterable[list[str]]:
+    it = iter(repos)
+    while batch := list(islice(it, batch_size)):
+        yield batch
+
+
+class GitHubAsyncGraphQL(GitHubAsyncREST):
+    """
+    Batched reads via the GitHub GraphQL API
+
+    Reading a single fact from many repositories via the REST API requires a
+    request per repository. The GraphQL API allows to query many repositories
+    in a single request. The results are returned as the models of the REST
+    API. Because the GraphQL API doesn't provide all information of the REST
+    API, some optional attributes of the returned models are not set.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.api import GitHubAsyncRESTApi
+
+            async with GitHubAsyncRESTApi(token) as api:
+                topics = await api.graphql.topics(["foo/bar", "foo/baz"])
+                print(topics["foo/bar"])
+    """
+
+    async def query(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Run a GraphQL query
+
+        https://docs.github.com/en/graphql/guides/forming-calls-with-graphql
+
+        Args:
+            query: The GraphQL query document
+            variables: Values for the variables of the query
+
+        Raises:
+            httpx.HTTPStatusError: If the request was invalid
+            GitHubApiError: If the query didn't return any data
+
+        Returns:
+            The data of the response. If the query partially failed, for
+            example because a repository doesn't exist, the failed fields
+            are None.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    data = await api.graphql.query(
+                        "query { viewer { login } }"
+                    )
+                    print(data["viewer"]["login"])
+        """
+        request: dict[str, Any] = {"query": query}
+        if variables:
+            request["variables"] = variables
+
+        # queries only read data and don't need the delay between mutating
+        # requests
+        response = await self._client.post(
+            self._graphql_url(), data=request, mutating=False
+        )
+        response.raise_for_status()
+
+        result = response.json()
+        data = result.get("data")
+        if data is None:
+            messages = ", ".join(
+                error.get("message", "") for error in result.get("errors", [])
+            )
+            raise GitHubApiError(f"GraphQL query failed: {messages}")
+
+        return data
+
+    async def _batch_query(
+        self,
+        repos: Iterable[str],
+        fields: str,
+        *,
+        batch_size: int,
+        variables: dict[str, tuple[str, Any]] | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any] | None]]:
+        """
+        Query the same fields for many repositories
+
+        Args:
+            repos: Repositories (owner/name) to query
+            fields: The fields to query for each repository
+            batch_size: Number of repositories per query
+            variables: Additional variables used in fields mapped to their
+                GraphQL type and value
+
+        Yields:
+            The repository and its data or None if the repository couldn't be
+            queried
+        """
+        for batch in _batches(repos, batch_size):
+            definitions = [
+                f"${name}: {graphql_type}"
+                for name, (graphql_type, _) in (variables or {}).items()
+            ]
+            values = {
+                name: value for name, (_, value) in (variables or {}).items()
+            }
+            selections = []
+            for index, repo in enumerate(batch):
+                owner, name = _split_repository(repo)
+                definitions.append(f"$owner{index}: String!")
+                definitions.append(f"$name{index}: String!")
+                values[f"owner{index}"] = owner
+                values[f"name{index}"] = name
+                selections.append(
+                    f"repo{index}: repository("
+                    f"owner: $owner{index}, name: $name{index}) "
+                    f"{{ {fields} }}"
+                )
+
+            query = (
+                f"query({', '.join(definitions)}) {{ {' '.join(selections)} }}"
+            )
+            data = await self.query(query, values)
+
+            for index, repo in enumerate(batch):
+                yield repo, data.get(f"repo{index}")
+
+    async def topics(
+        self, repos: Iterable[str], *, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> dict[str, list[str] | None]:
+        """
+        Get the topics of many repositories
+
+        Args:
+            repos: Repositories (owner/name) to get the topics for
+            batch_size: Number of repositories per request
+
+        Raises:
+            httpx.HTTPStatusError: If a request was invalid
+            GitHubApiError: If a query didn't return any data
+
+        Returns:
+            A dict mapping the repositories to their topics. None if the
+            repository couldn't be queried.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    topics = await api.graphql.topics(["foo/bar", "foo/baz"])
+                    for repo, repo_topics in topics.items():
+                        print(repo, repo_topics)
+        """
+        topics: dict[str, list[str] | None] = {}
+        async for repo, data in self._batch_query(
+            repos, _TOPICS_FIELDS, batch_size=batch_size
+        ):
+            topics[repo] = (
+                [
+                    node["topic"]["name"]
+                    for node in data["repositoryTopics"]["nodes"]
+                ]
+                if data
+                else None
+            )
+        return topics
+
+    async def default_branches(
+        self, repos: Iterable[str], *, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> dict[str, str | None]:
+        """
+        Get the default branch of many repositories
+
+        Args:
+            repos: Repositories (owner/name) to get the default branch for
+            batch_size: Number of repositories per request
+
+        Raises:
+            httpx.HTTPStatusError: If a request was invalid
+            GitHubApiError: If a query didn't return any data
+
+        Returns:
+            A dict mapping the repositories to the name of their default
+            branch. None if the repository couldn't be queried or is empty.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    branches = await api.graphql.default_branches(
+                        ["foo/bar", "foo/baz"]
+                    )
+        """
+        branches: dict[str, str | None] = {}
+        async for repo, data in self._batch_query(
+            repos, _DEFAULT_BRANCH_FIELDS, batch_size=batch_size
+        ):
+            ref = data.get("defaultBranchRef") if data else None
+            branches[repo] = ref["name"] if ref else None
+        return branches
+
+    def _api_url(self) -> str:
+        return self._client.url or DEFAULT_GITHUB_API_URL
+
+    def _graphql_url(self) -> str:
+        api_url = self._api_url()
+        if api_url == DEFAULT_GITHUB_API_URL:
+            return f"{api_url}{GRAPHQL_API}"
+        # GitHub Enterprise Server
+        return f"{api_url.removesuffix('/api/v3')}/api{GRAPHQL_API}"
+
+    def _uploads_url(self) -> str:
+        api_url = self._api_url()
+        if api_url == DEFAULT_GITHUB_API_URL:
+            return DEFAULT_GITHUB_UPLOADS_URL
+        # GitHub Enterprise Server
+        return f"{api_url.removesuffix('/api/v3')}/api/uploads"
+
+    def _release(self, repo: str, data: dict[str, Any]) -> Release:
+        release_id = data["databaseId"]
+        url = f"{self._api_url()}/repos/{repo}/releases/{release_id}"
+        tag_commit = data.get("tagCommit")
+        return Release.from_dict(
+            {
+                "assets_url": f"{url}/assets",
+                "body": data.get("description"),
+                "created_at": data["createdAt"],
+                "draft": data["isDraft"],
+                "html_url": data["url"],
+                "id": release_id,
+                "name": data.get("name"),
+                "node_id": data["id"],
+                "prerelease": data["isPrerelease"],
+                "published_at": data.get("publishedAt"),
+                "tag_name": data["tagName"],
+                "target_commitish": tag_commit["oid"]
+                if tag_commit
+                else data["tagName"],
+                "upload_url": f"{self._uploads_url()}/repos/{repo}/releases/"
+                f"{release_id}/assets{{?name,label}}",
+                "url": url,
+            }
+        )
+
+    async def latest_releases(
+        self, repos: Iterable[str], *, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> dict[str, Release | None]:
+        """
+        Get the latest release of many repositories
+
+        The assets, author and reactions of the releases are not set. The
+        target_commitish is the commit of the release tag.
+
+        Args:
+            repos: Repositories (owner/name) to get the latest release for
+            batch_size: Number of repositories per request
+
+        Raises:
+            httpx.HTTPStatusError: If a request was invalid
+            GitHubApiError: If a query didn't return any data
+
+        Returns:
+            A dict mapping the repositories to their latest release. None if
+            the repository couldn't be queried or has no release.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    releases = await api.graphql.latest_releases(
+                        ["foo/bar", "foo/baz"]
+                    )
+                    for repo, release in releases.items():
+                        if release:
+                            print(repo, release.tag_name)
+        """
+        releases: dict[str, Release | None] = {}
+        async for repo, data in self._batch_query(
+            repos, _RELEASE_FIELDS, batch_size=batch_size
+        ):
+            release = data.get("latestRelease") if data else None
+            releases[repo] = self._release(repo, release) if release else None
+        return releases
+
+    def _branch_protection(
+        self, repo: str, branch: str, rule: dict[str, Any]
+    ) -> BranchProtection:
+        url = f"{self._api_url()}/repos/{repo}/branches/{branch}/protection"
+        data: dict[str, Any] = {
+            "url": url,
+            "enforce_admins": {
+                "enabled": rule["isAdminEnforced"],
+                "url": f"{url}/enforce_admins",
+            },
+            "required_linear_history": {
+                "enabled": rule["requiresLinearHistory"]
+            },
+            "allow_force_pushes": {"enabled": rule["allowsForcePushes"]},
+            "allow_deletions": {"enabled": rule["allowsDeletions"]},
+            "block_creations": {"enabled": rule["blocksCreations"]},
+            "required_conversation_resolution": {
+                "enabled": rule["requiresConversationResolution"]
+            },
+            "lock_branch": {"enabled": rule["lockBranch"]},
+            "allow_fork_syncing": {"enabled": rule["lockAllowsFetchAndMerge"]},
+            "required_signatures": {
+                "enabled": rule["requiresCommitSignatures"],
+                "url": f"{url}/required_signatures",
+            },
+        }
+
+        if rule["requiresApprovingReviews"]:
+            data["required_pull_request_reviews"] = {
+                "url": f"{url}/required_pull_request_reviews",
+                "dismiss_stale_reviews": rule["dismissesStaleReviews"],
+                "require_code_owner_reviews": rule["requiresCodeOwnerReviews"],
+                "required_approving_review_count": rule[
+                    "requiredApprovingReviewCount"
+                ],
+                "require_last_push_approval": rule["requireLastPushApproval"],
+            }
+
+        if rule["requiresStatusChecks"]:
+            data["required_status_checks"] = {
+                "url": f"{url}/required_status_checks",
+                "strict": rule["requiresStrictStatusChecks"],
+                "checks": [
+                    {
+                        "context": check["context"],
+                        "app_id": check["app"]["databaseId"]
+                        if check.get("app")
+                        else None,
+                    }
+                    for check in rule.get("requiredStatusChecks") or []
+                ],
+            }
+
+        return BranchProtection.from_dict(data)
+
+    async def branch_protections(
+        self,
+        repos: Iterable[str],
+        *,
+        branch: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict[str, BranchProtection | None]:
+        """
+        Get the branch protection of a branch in many repositories
+
+        Push restrictions and dismissal restrictions are not set in the
+        returned branch protections.
+
+        Args:
+            repos: Repositories (owner/name) to get the branch protection for
+            branch: Name of the branch. Defaults to the default branch of each
+                repository.
+            batch_size: Number of repositories per request
+
+        Raises:
+            httpx.HTTPStatusError: If a request was invalid
+            GitHubApiError: If a query didn't return any data
+
+        Returns:
+            A dict mapping the repositories to the branch protection. None if
+            the repository couldn't be queried, the branch doesn't exist or
+            isn't protected.
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    protections = await api.graphql.branch_protections(
+                        ["foo/bar", "foo/baz"], branch="main"
+                    )
+                    unprotected = [
+                        repo
+                        for repo, protection in protections.items()
+                        if not protection
+                    ]
+        """
+        if branch:
+            fields = (
+                "ref(qualifiedName: $ref) { name "
+                f"{_BRANCH_PROTECTION_RULE_FIELDS} }}"
+            )
+            variables = {"ref": ("String!", f"refs/heads/{branch}")}
+            ref_field = "ref"
+        else:
+            fields = (
+                f"defaultBranchRef {{ name {_BRANCH_PROTECTION_RULE_FIELDS} }}"
+            )
+            variables = None
+            ref_field = "defaultBranchRef"
+
+        protections: dict[str, BranchProtection | None] = {}
+        async for repo, data in self._batch_query(
+            repos, fields, batch_size=batch_size, variables=variables
+        ):
+            ref = data.get(ref_field) if data else None
+            rule = ref.get("branchProtectionRule") if ref else None
+            protections[repo] = (
+                self._branch_protection(repo, ref["name"], rule)  # type: ignore[index]
+                if rule
+                else None
+            )
+        return protections
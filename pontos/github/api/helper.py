@@ -20,3 +20,20 @@ def _get_next_url(response: httpx.Response) -> str | None:
             pass
 
     return None
+
+
+def _get_last_url(response: httpx.Response) -> str | None:
+    if response and response.links:
+        try:
+            return response.links["last"]["url"]
+        except KeyError:
+            pass
+
+    return None
+
+
+def _get_page(url: str) -> int | None:
+    try:
+        return int(httpx.URL(url).params["page"])
+    except (KeyError, ValueError):
+        return None
@@ -0,0 +1,405 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import json
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timezone
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from pontos.github.api.client import GitHubAsyncREST
+from pontos.github.api.organizations import GitHubAsyncRESTOrganizations
+from pontos.github.models.organization import Repository, RepositoryType
+
+__all__ = (
+    "GitHubAsyncRESTInventory",
+    "InventoryDiff",
+    "InventorySnapshot",
+    "RepositoryInventory",
+)
+
+DEFAULT_INVENTORY_CONCURRENCY = 10
+
+# facets which are not compared for detecting changes between snapshots
+_UNCOMPARED_FIELDS = frozenset(("name", "pushed_at", "updated_at"))
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+@dataclass
+class RepositoryInventory:
+    """
+    The inventory facets of a single repository
+
+    Attributes:
+        name: Full name (owner/name) of the repository
+        pushed_at: Date of the last push to the repository
+        updated_at: Last modification date of the repository
+        archived: True if the repository is archived
+        default_branch: Name of the default branch
+        topics: Topics of the repository
+        branch_protected: True if the default branch is protected. None if
+            the protection could not be read, for example because of missing
+            permissions.
+        open_dependabot_alerts: Number of open dependabot alerts. None if
+            dependabot alerts are disabled or can't be read.
+    """
+
+    name: str
+    pushed_at: str | None = None
+    updated_at: str | None = None
+    archived: bool = False
+    default_branch: str | None = None
+    topics: list[str] = field(default_factory=list)
+    branch_protected: bool | None = None
+    open_dependabot_alerts: int | None = None
+
+    def is_unchanged(self, repository: Repository) -> bool:
+        """
+        Check if a repository has not been pushed or updated since this
+        inventory was taken
+        """
+        return self.pushed_at == _isoformat(
+            repository.pushed_at
+        ) and self.updated_at == _isoformat(repository.updated_at)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "RepositoryInventory":
+        names = {f.name for f in fields(cls)}
+        return cls(
+            **{key: value for key, value in data.items() if key in names}
+        )
+
+
+@dataclass
+class InventoryDiff:
+    """
+    Differences between two inventory snapshots
+
+    Attributes:
+        added: Names of repositories that have been added
+        removed: Names of repositories that have been removed
+        changed: Changed facets per repository name as mapping of the facet
+            name to a tuple of the old and new value
+    """
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: dict[str, dict[str, tuple[Any, Any]]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass
+class InventorySnapshot:
+    """
+    A snapshot of the inventory of all repositories of an organization
+
+    Attributes:
+        organization: Name of the organization
+        taken_at: Date the snapshot has been taken
+        repositories: Inventory per full repository name
+        refetched: Names of the repositories whose facets have been requested
+            for this snapshot. The facets of all other repositories have been
+            taken from the previous snapshot.
+    """
+
+    organization: str
+    taken_at: datetime
+    repositories: dict[str, RepositoryInventory] = field(default_factory=dict)
+    refetched: list[str] = field(default_factory=list)
+
+    def unprotected(self) -> list[RepositoryInventory]:
+        """
+        Get the not archived repositories without a protected default branch
+        """
+        return [
+            repository
+            for repository in self.repositories.values()
+            if not repository.archived and repository.branch_protected is False
+        ]
+
+    def with_dependabot_alerts(self) -> list[RepositoryInventory]:
+        """
+        Get the repositories with open dependabot alerts
+        """
+        return [
+            repository
+            for repository in self.repositories.values()
+            if repository.open_dependabot_alerts
+        ]
+
+    def without_topic(
+        self, topic: str | None = None
+    ) -> list[RepositoryInventory]:
+        """
+        Get the repositories missing a topic
+
+        Args:
+            topic: The topic to look for. If not set the repositories without
+                any topic are returned.
+        """
+        return [
+            repository
+            for repository in self.repositories.values()
+            if (
+                topic not in repository.topics
+                if topic
+                else not repository.topics
+            )
+        ]
+
+    def diff(self, previous: "InventorySnapshot") -> InventoryDiff:
+        """
+        Compare this snapshot with a previous one
+
+        Args:
+            previous: The previous snapshot
+
+        Returns:
+            The differences between the snapshots
+        """
+        diff = InventoryDiff(
+            added=sorted(
+                self.repositories.keys() - previous.repositories.keys()
+            ),
+            removed=sorted(
+                previous.repositories.keys() - self.repositories.keys()
+            ),
+        )
+
+        for name in sorted(
+            self.repositories.keys() & previous.repositories.keys()
+        ):
+            old = asdict(previous.repositories[name])
+            new = asdict(self.repositories[name])
+            changes = {
+                key: (old[key], new[key])
+                for key in new
+                if key not in _UNCOMPARED_FIELDS and old[key] != new[key]
+            }
+            if changes:
+                diff.changed[name] = changes
+
+        return diff
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Convert the snapshot into JSON serializable data
+        """
+        return {
+            "organization": self.organization,
+            "taken_at": self.taken_at.isoformat(),
+            "repositories": [
+                asdict(repository) for repository in self.repositories.values()
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "InventorySnapshot":
+        """
+        Create a snapshot from data created by to_json
+        """
+        repositories = [
+            RepositoryInventory.from_json(repository)
+            for repository in data.get("repositories", [])
+        ]
+        return cls(
+            organization=data["organization"],
+            taken_at=datetime.fromisoformat(data["taken_at"]),
+            repositories={
+                repository.name: repository for repository in repositories
+            },
+        )
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """
+        Store the snapshot in a JSON file
+        """
+        path = Path(path)
+        temp_path = path.with_suffix(f"{path.suffix}.tmp")
+        temp_path.write_text(json.dumps(self.to_json(), indent=2))
+        temp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "InventorySnapshot | None":
+        """
+        Load a snapshot from a JSON file
+
+        Returns:
+            The snapshot or None if the file doesn't exist
+        """
+        try:
+            return cls.from_json(json.loads(Path(path).read_text()))
+        except FileNotFoundError:
+            return None
+
+
+class GitHubAsyncRESTInventory(GitHubAsyncREST):
+    async def _branch_protected(self, repo: str, branch: str) -> bool | None:
+        response = await self._client.get(
+            f"/repos/{repo}/branches/{branch}/protection"
+        )
+        if response.status_code == httpx.codes.NOT_FOUND:
+            return False
+        if response.status_code == httpx.codes.FORBIDDEN:
+            return None
+        response.raise_for_status()
+        return True
+
+    async def _open_dependabot_alerts(self, repo: str) -> int | None:
+        count = 0
+        async for response in self._client.get_all(
+            f"/repos/{repo}/dependabot/alerts",
+            params={"state": "open", "per_page": "100"},
+        ):
+            if response.status_code in (
+                httpx.codes.FORBIDDEN,
+                httpx.codes.NOT_FOUND,
+            ):
+                # dependabot alerts are disabled or not accessible
+                return None
+            response.raise_for_status()
+            count += len(response.json())
+        return count
+
+    async def repository(self, repository: Repository) -> RepositoryInventory:
+        """
+        Gather the inventory facets of a repository
+
+        Args:
+            repository: The repository as returned by listing the repositories
+                of an organization
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Returns:
+            The inventory of the repository
+        """
+        name = repository.full_name
+        inventory = RepositoryInventory(
+            name=name,
+            pushed_at=_isoformat(repository.pushed_at),
+            updated_at=_isoformat(repository.updated_at),
+            archived=bool(repository.archived),
+            default_branch=repository.default_branch,
+            topics=sorted(repository.topics or []),
+        )
+
+        if repository.default_branch:
+            (
+                inventory.branch_protected,
+                inventory.open_dependabot_alerts,
+            ) = await asyncio.gather(
+                self._branch_protected(name, repository.default_branch),
+                self._open_dependabot_alerts(name),
+            )
+        else:
+            # an empty repository
+            inventory.open_dependabot_alerts = (
+                await self._open_dependabot_alerts(name)
+            )
+        return inventory
+
+    async def snapshot(
+        self,
+        organization: str,
+        *,
+        previous: InventorySnapshot | None = None,
+        repository_type: RepositoryType | str = RepositoryType.ALL,
+        concurrency: int = DEFAULT_INVENTORY_CONCURRENCY,
+    ) -> InventorySnapshot:
+        """
+        Take an inventory snapshot of all repositories of an organization
+
+        The facets of the repositories are requested concurrently. If a
+        previous snapshot is passed only the repositories that have been
+        pushed or updated since then are requested again. The facets of all
+        other repositories are taken from the previous snapshot. Combine
+        with a RateLimitScheduler for large organizations.
+
+        Args:
+            organization: GitHub organization to use
+            previous: Optional previous snapshot of the organization
+            repository_type: Only include repositories of this type
+            concurrency: Maximum number of repositories to request in
+                parallel
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Returns:
+            The new snapshot
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import (
+                    GitHubAsyncRESTApi,
+                    InventorySnapshot,
+                    RateLimitScheduler,
+                )
+
+                previous = InventorySnapshot.load("inventory.json")
+                scheduler = RateLimitScheduler(max_concurrency=20)
+                async with GitHubAsyncRESTApi(
+                    token, rate_limit=scheduler
+                ) as api:
+                    snapshot = await api.inventory.snapshot(
+                        "foo", previous=previous
+                    )
+
+                snapshot.save("inventory.json")
+                for repository in snapshot.unprotected():
+                    print(repository.name)
+        """
+        taken_at = datetime.now(timezone.utc)
+        organizations = GitHubAsyncRESTOrganizations(self._client)
+        previous_repositories = previous.repositories if previous else {}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def gather(repository: Repository) -> RepositoryInventory:
+            async with semaphore:
+                return await self.repository(repository)
+
+        repositories: dict[str, RepositoryInventory] = {}
+        tasks: list[asyncio.Task[RepositoryInventory]] = []
+        try:
+            async for repository in organizations.get_repositories(
+                organization, repository_type=repository_type
+            ):
+                known = previous_repositories.get(repository.full_name)
+                if known and known.is_unchanged(repository):
+                    repositories[repository.full_name] = known
+                else:
+                    tasks.append(asyncio.create_task(gather(repository)))
+
+            for inventory in await asyncio.gather(*tasks):
+                repositories[inventory.name] = inventory
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return InventorySnapshot(
+            organization=organization,
+            taken_at=taken_at,
+            repositories=dict(sorted(repositories.items())),
+            refetched=sorted(
+                name
+                for name, inventory in repositories.items()
+                if previous_repositories.get(name) is not inventory
+            ),
+        )
@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from dateutil import parser as dateparser
+
+from pontos.github.models.packages import PackageVersion
+
+__all__ = (
+    "PackageRetentionPolicy",
+    "PackageVersionIndex",
+)
+
+
+def _tags(version: PackageVersion) -> list[str]:
+    container = version.metadata.container if version.metadata else None
+    return container.tags if container else []
+
+
+def _created_at(version: PackageVersion) -> datetime:
+    created_at = dateparser.isoparse(version.created_at)
+    if not created_at.tzinfo:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at
+
+
+class PackageVersionIndex:
+    """
+    An index of the versions of a package by their tags
+
+    The index is built once from all versions of a package. Afterwards
+    looking up a tag doesn't require any additional request.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.api import GitHubAsyncRESTApi
+            from pontos.github.models.packages import PackageType
+
+            async with GitHubAsyncRESTApi(token) as api:
+                index = await api.packages.version_index(
+                    "foo", PackageType.CONTAINER, "bar"
+                )
+                version = index.get("latest")
+    """
+
+    def __init__(self, versions: Iterable[PackageVersion]) -> None:
+        # newest first
+        self._versions = sorted(versions, key=_created_at, reverse=True)
+        self._tags: dict[str, PackageVersion] = {}
+        for version in self._versions:
+            for tag in _tags(version):
+                self._tags.setdefault(tag, version)
+
+    @property
+    def versions(self) -> list[PackageVersion]:
+        """
+        All versions of the package, newest first
+        """
+        return list(self._versions)
+
+    @property
+    def tags(self) -> dict[str, PackageVersion]:
+        """
+        Mapping of all tags to their versions
+        """
+        return dict(self._tags)
+
+    @property
+    def untagged(self) -> list[PackageVersion]:
+        """
+        The versions without any tag, newest first
+        """
+        return [version for version in self._versions if not _tags(version)]
+
+    def get(self, tag: str) -> PackageVersion | None:
+        """
+        Get the version of a tag
+
+        Returns:
+            The version or None if the tag doesn't exist
+        """
+        return self._tags.get(tag)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._tags
+
+
+@dataclass(frozen=True)
+class PackageRetentionPolicy:
+    """
+    A policy selecting package versions for deletion
+
+    A version is deleted if any of the rules selects it and none of its tags
+    is protected.
+
+    Attributes:
+        delete_untagged: Delete versions without any tag. Use with care for
+            multi-arch container images: the manifests of the single
+            platforms are untagged versions referenced by the tagged
+            manifest list. The package API doesn't report these references,
+            so they are deleted too, which breaks pulling the tagged image.
+        max_age: Delete versions older than this age
+        keep_last: Keep only the newest N versions per tag prefix. Versions
+            without a tag matching one of the prefixes aren't affected.
+        tag_prefixes: Tag prefixes for grouping versions with keep_last, for
+            example "pr-" and "nightly-". A version matching several prefixes
+            is counted for the first one.
+        protected_tags: Versions with one of these tags are never deleted
+
+    Example:
+        .. code-block:: python
+
+            from datetime import timedelta
+            from pontos.github.api import PackageRetentionPolicy
+
+            policy = PackageRetentionPolicy(
+                delete_untagged=True,
+                max_age=timedelta(days=90),
+                keep_last=5,
+                tag_prefixes=("pr-", "nightly-"),
+                protected_tags=frozenset(("latest", "stable")),
+            )
+    """
+
+    delete_untagged: bool = False
+    max_age: timedelta | None = None
+    keep_last: int | None = None
+    tag_prefixes: tuple[str, ...] = ()
+    protected_tags: frozenset[str] = field(default_factory=frozenset)
+
+    def _prefix(self, tags: list[str]) -> str | None:
+        for prefix in self.tag_prefixes:
+            if any(tag.startswith(prefix) for tag in tags):
+                return prefix
+        return None
+
+    def select(
+        self,
+        versions: Iterable[PackageVersion] | PackageVersionIndex,
+        *,
+        now: datetime | None = None,
+    ) -> list[PackageVersion]:
+        """
+        Select the package versions to delete
+
+        Args:
+            versions: The versions of a package or an index of them
+            now: Reference time for calculating the age. Defaults to the
+                current time.
+
+        Returns:
+            The versions to delete, oldest first
+        """
+        now = now or datetime.now(timezone.utc)
+        index = (
+            versions
+            if isinstance(versions, PackageVersionIndex)
+            else PackageVersionIndex(versions)
+        )
+        kept: dict[str, int] = defaultdict(int)
+        selected = []
+
+        # newest first
+        for version in index.versions:
+            tags = _tags(version)
+            if self.protected_tags.intersection(tags):
+                continue
+
+            if self.delete_untagged and not tags:
+                selected.append(version)
+                continue
+
+            if (
+                self.max_age is not None
+                and now - _created_at(version) > self.max_age
+            ):
+                selected.append(version)
+                continue
+
+            if self.keep_last is not None:
+                prefix = self._prefix(tags)
+                if prefix is not None:
+                    kept[prefix] += 1
+                    if kept[prefix] > self.keep_last:
+                        selected.append(version)
+
+        selected.reverse()
+        return selected
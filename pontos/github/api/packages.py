@@ -3,12 +3,22 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+
+import httpx
 
 from pontos.github.api.client import GitHubAsyncREST
 from pontos.github.api.errors import GitHubApiError
+from pontos.github.api.package_retention import (
+    PackageRetentionPolicy,
+    PackageVersionIndex,
+)
 from pontos.github.models.packages import Package, PackageType, PackageVersion
 
+DEFAULT_PACKAGES_CONCURRENCY = 10
+
 
 class GitHubAsyncRESTPackages(GitHubAsyncREST):
     async def exists(  # type: ignore[return]
@@ -369,3 +379,181 @@ class GitHubAsyncRESTPackages(GitHubAsyncREST):
                 response = await self._client.delete(api)
                 if not response.is_success:
                     raise GitHubApiError(response)
+
+    async def version_index(
+        self,
+        organization: str,
+        package_type: PackageType,
+        package_name: str,
+        *,
+        concurrency: int = DEFAULT_PACKAGES_CONCURRENCY,
+    ) -> PackageVersionIndex:
+        """
+        Get all versions of a package indexed by their tags
+
+        The pages of the version list are requested in parallel and the tags
+        are taken from the version metadata. Therefore no request per version
+        is required.
+
+        Args:
+            organization: GitHub organization to use
+            package_type: Type of the package
+            package_name: Name of the package
+            concurrency: Maximum number of parallel page requests
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed.
+
+        Returns:
+            The index of the package versions
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+                from pontos.github.models.packages import PackageType
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    index = await api.packages.version_index(
+                        "foo", PackageType.CONTAINER, "bar"
+                    )
+                    print(index.get("latest"))
+        """
+        api = f"/orgs/{organization}/packages/{package_type}/{package_name}/versions"
+        versions: list[PackageVersion] = []
+        async for response in self._client.get_all(
+            api, params={"per_page": "100"}, concurrency=concurrency
+        ):
+            response.raise_for_status()
+            versions.extend(
+                PackageVersion.from_dict(version) for version in response.json()
+            )
+        return PackageVersionIndex(versions)
+
+    async def delete_package_versions(
+        self,
+        organization: str,
+        package_type: PackageType,
+        package_name: str,
+        versions: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_PACKAGES_CONCURRENCY,
+    ) -> None:
+        """
+        Delete several versions of a package in parallel
+
+        Versions that don't exist anymore are ignored.
+
+        Args:
+            organization: GitHub organization to use
+            package_type: Type of the package
+            package_name: Name of the package
+            versions: IDs of the versions to delete
+            concurrency: Maximum number of parallel delete requests
+
+        Raises:
+            GitHubApiError: If a version couldn't be deleted
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+                from pontos.github.models.packages import PackageType
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    await api.packages.delete_package_versions(
+                        "foo", PackageType.CONTAINER, "bar", [123, 456]
+                    )
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def delete(version: int) -> None:
+            async with semaphore:
+                api = f"/orgs/{organization}/packages/{package_type}/{package_name}/versions/{version}"
+                response = await self._client.delete(api)
+                if (
+                    not response.is_success
+                    and response.status_code != httpx.codes.NOT_FOUND
+                ):
+                    raise GitHubApiError(response)
+
+        tasks = [asyncio.create_task(delete(version)) for version in versions]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def prune(
+        self,
+        organization: str,
+        package_type: PackageType,
+        package_name: str,
+        policy: PackageRetentionPolicy,
+        *,
+        concurrency: int = DEFAULT_PACKAGES_CONCURRENCY,
+        dry_run: bool = False,
+        now: datetime | None = None,
+    ) -> list[PackageVersion]:
+        """
+        Delete the versions of a package selected by a retention policy
+
+        The version list is requested once and the versions are deleted in
+        parallel. See :py:class:`PackageRetentionPolicy` about deleting the
+        untagged versions of multi-arch container images.
+
+        Args:
+            organization: GitHub organization to use
+            package_type: Type of the package
+            package_name: Name of the package
+            policy: The policy selecting the versions to delete
+            concurrency: Maximum number of parallel requests
+            dry_run: Only select the versions but don't delete them
+            now: Reference time for calculating the age of the versions.
+                Defaults to the current time.
+
+        Raises:
+            GitHubApiError: If a version couldn't be deleted
+            HTTPStatusError: A httpx.HTTPStatusError is raised if requesting
+                the versions failed.
+
+        Returns:
+            The selected versions, oldest first
+
+        Example:
+            .. code-block:: python
+
+                from datetime import timedelta
+                from pontos.github.api import (
+                    GitHubAsyncRESTApi,
+                    PackageRetentionPolicy,
+                )
+                from pontos.github.models.packages import PackageType
+
+                policy = PackageRetentionPolicy(
+                    max_age=timedelta(days=90),
+                    protected_tags=frozenset(("latest",)),
+                )
+                async with GitHubAsyncRESTApi(token) as api:
+                    deleted = await api.packages.prune(
+                        "foo", PackageType.CONTAINER, "bar", policy
+                    )
+                    print(len(deleted), "versions deleted")
+        """
+        index = await self.version_index(
+            organization, package_type, package_name, concurrency=concurrency
+        )
+        selected = policy.select(index, now=now)
+
+        if not dry_run:
+            await self.delete_package_versions(
+                organization,
+                package_type,
+                package_name,
+                [version.id for version in selected],
+                concurrency=concurrency,
+            )
+
+        return selected
@@ -0,0 +1,306 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import httpx
+
+__all__ = (
+    "RateLimit",
+    "RateLimitScheduler",
+)
+
+DEFAULT_RESOURCE = "core"
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_SECONDARY_RATE_LIMIT_DELAY = 60.0  # in seconds
+DEFAULT_MUTATING_REQUEST_DELAY = 1.0  # in seconds
+DEFAULT_PACING_THRESHOLD = 0.1
+RESET_OFFSET = 1.0  # in seconds
+
+# https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
+RATE_LIMIT_STATUS_CODES = (403, 429)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A GitHub rate limit budget as reported by the response headers
+
+    Attributes:
+        resource: The rate limit resource (core, search, graphql, ...)
+        limit: Maximum number of requests per hour
+        remaining: Number of requests remaining in the current window
+        used: Number of requests made in the current window
+        reset: Time at which the current window resets
+    """
+
+    resource: str
+    limit: int
+    remaining: int
+    used: int
+    reset: datetime
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "RateLimit | None":
+        """
+        Create a rate limit from the headers of a response
+
+        Returns:
+            The rate limit or None if the response doesn't contain rate limit
+            headers
+        """
+        headers = response.headers
+        try:
+            limit = int(headers["x-ratelimit-limit"])
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = int(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return None
+
+        return cls(
+            resource=headers.get("x-ratelimit-resource", DEFAULT_RESOURCE),
+            limit=limit,
+            remaining=remaining,
+            used=int(headers.get("x-ratelimit-used", limit - remaining)),
+            reset=datetime.fromtimestamp(reset, tz=timezone.utc),
+        )
+
+
+class RateLimitScheduler:
+    """
+    Schedule requests according to the GitHub rate limits
+
+    The scheduler tracks the primary rate limit budget from the response
+    headers and spreads the remaining requests over the time until the budget
+    resets when the budget runs low. If the budget is exhausted requests are
+    delayed until the reset. Responses hitting a primary or secondary rate
+    limit are retried after the delay requested by GitHub or with an
+    exponential backoff. Mutating requests are delayed to be at least one
+    second apart as recommended by GitHub.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.api import GitHubAsyncRESTApi, RateLimitScheduler
+
+            scheduler = RateLimitScheduler(max_concurrency=10)
+            async with GitHubAsyncRESTApi(token, rate_limit=scheduler) as api:
+                async for repo in api.organizations.get_repositories("foo"):
+                    ...
+
+                print(scheduler.budget)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        reserve: int = 0,
+        pacing_threshold: float = DEFAULT_PACING_THRESHOLD,
+        secondary_rate_limit_delay: float = DEFAULT_SECONDARY_RATE_LIMIT_DELAY,
+        mutating_request_delay: float = DEFAULT_MUTATING_REQUEST_DELAY,
+    ) -> None:
+        """
+        Args:
+            max_concurrency: Maximum number of concurrent requests. Default is
+                no limit.
+            max_retries: Maximum number of retries for a request that hit a
+                rate limit.
+            reserve: Number of requests of the budget to keep in reserve. If
+                the remaining budget drops to this number requests are delayed
+                until the budget resets.
+            pacing_threshold: Fraction of the budget below which the remaining
+                requests are spread evenly until the budget resets.
+            secondary_rate_limit_delay: Initial delay in seconds for retrying a
+                request that hit a secondary rate limit without a retry-after
+                header. The delay doubles with every retry.
+            mutating_request_delay: Minimum delay in seconds between mutating
+                (POST, PATCH, PUT and DELETE) requests.
+        """
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+        self._max_retries = max_retries
+        self._reserve = reserve
+        self._pacing_threshold = pacing_threshold
+        self._secondary_rate_limit_delay = secondary_rate_limit_delay
+        self._mutating_request_delay = mutating_request_delay
+
+        self._budgets: dict[str, RateLimit] = {}
+        self._lock = asyncio.Lock()
+        # start time of the last scheduled mutating request
+        self._last_mutating_request: float | None = None
+        # start time of the last scheduled request per resource
+        self._scheduled: dict[str, float] = {}
+        self._blocked_until: float | None = None
+
+    @property
+    def budget(self) -> RateLimit | None:
+        """
+        The current budget of the core rate limit or None if it is not known
+        yet
+        """
+        return self._budgets.get(DEFAULT_RESOURCE)
+
+    @property
+    def budgets(self) -> dict[str, RateLimit]:
+        """
+        The current budgets of all rate limit resources seen so far
+        """
+        return dict(self._budgets)
+
+    def update(self, response: httpx.Response) -> None:
+        """
+        Update the budget from the headers of a response
+        """
+        rate_limit = RateLimit.from_response(response)
+        if rate_limit:
+            self._budgets[rate_limit.resource] = rate_limit
+
+    def _pacing_delay(self, resource: str, now: float) -> float:
+        budget = self._budgets.get(resource)
+        if not budget:
+            return 0.0
+
+        reset_in = budget.reset.timestamp() - time.time()
+        if reset_in <= 0:
+            # the budget has been reset already
+            return 0.0
+
+        if budget.remaining <= self._reserve:
+            return reset_in + RESET_OFFSET
+
+        if budget.remaining < budget.limit * self._pacing_threshold:
+            # queue up behind the requests that are already scheduled
+            scheduled = max(self._scheduled.get(resource, now) - now, 0.0)
+            return scheduled + reset_in / (budget.remaining - self._reserve)
+
+        return 0.0
+
+    def _consume(self, resource: str) -> None:
+        budget = self._budgets.get(resource)
+        if budget and budget.remaining > 0:
+            self._budgets[resource] = RateLimit(
+                resource=budget.resource,
+                limit=budget.limit,
+                remaining=budget.remaining - 1,
+                used=budget.used + 1,
+                reset=budget.reset,
+            )
+
+    async def _schedule(self, resource: str, mutating: bool) -> None:
+        # reserve a slot for the request while holding the lock but wait
+        # outside of it. otherwise a waiting request would delay all other
+        # requests, even the ones for other resources.
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._pacing_delay(resource, now)
+
+            if self._blocked_until is not None:
+                delay = max(delay, self._blocked_until - now)
+
+            if mutating and self._last_mutating_request is not None:
+                next_mutating_request = (
+                    self._last_mutating_request + self._mutating_request_delay
+                )
+                delay = max(delay, next_mutating_request - now)
+
+            delay = max(delay, 0.0)
+            self._scheduled[resource] = now + delay
+            self._consume(resource)
+            if mutating:
+                self._last_mutating_request = now + delay
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """
+        Get the delay for retrying a rate limited request or 0 if the response
+        doesn't indicate a rate limit
+        """
+        if response.status_code not in RATE_LIMIT_STATUS_CODES:
+            return 0.0
+
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        rate_limit = RateLimit.from_response(response)
+        if rate_limit and rate_limit.remaining == 0:
+            reset_in = rate_limit.reset.timestamp() - time.time()
+            return max(reset_in, 0.0) + RESET_OFFSET
+
+        if response.status_code == 403 and not _is_rate_limit_error(response):
+            # a permission error
+            return 0.0
+
+        return self._secondary_rate_limit_delay * 2**attempt
+
+    async def run(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        resource: str = DEFAULT_RESOURCE,
+        mutating: bool = False,
+        retry: bool = True,
+    ) -> httpx.Response:
+        """
+        Run a request according to the rate limits
+
+        Args:
+            send: A callable sending the request
+            resource: The rate limit resource the request is accounted to
+            mutating: True if the request changes data at GitHub
+            retry: Set to False if the request can't be sent again, for
+                example because its content is a stream.
+
+        Returns:
+            The response of the request. If the request is still rate limited
+            after the maximum number of retries the last response is returned.
+        """
+        attempt = 0
+        while True:
+            if self._semaphore:
+                async with self._semaphore:
+                    await self._schedule(resource, mutating)
+                    response = await send()
+            else:
+                await self._schedule(resource, mutating)
+                response = await send()
+
+            self.update(response)
+
+            if not retry or attempt >= self._max_retries:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            if not delay:
+                return response
+
+            # hold back all requests until the rate limit is lifted
+            blocked_until = time.monotonic() + delay
+            if (
+                self._blocked_until is None
+                or blocked_until > self._blocked_until
+            ):
+                self._blocked_until = blocked_until
+
+            attempt += 1
+
+
+def _is_rate_limit_error(response: httpx.Response) -> bool:
+    try:
+        return "rate limit" in response.text.lower()
+    except httpx.ResponseNotRead:
+        return False
@@ -11,7 +11,20 @@ from pathlib import Path
 import httpx
 
 from pontos.github.api.client import GitHubAsyncREST
+from pontos.github.api.download import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    FileDownload,
+    download_file,
+)
 from pontos.github.api.helper import JSON_OBJECT
+from pontos.github.api.upload import (
+    DEFAULT_UPLOAD_CONCURRENCY,
+    DEFAULT_UPLOAD_RETRIES,
+    AssetUpload,
+    create_checksum_manifest,
+    upload_assets,
+)
 from pontos.github.models.release import Release
 from pontos.helper import AsyncDownloadProgressIterable, download_async, upload
 
@@ -275,6 +288,87 @@ class GitHubAsyncRESTReleases(GitHubAsyncREST):
                 download_async(self._client.stream(asset_url), url=asset_url),
             )
 
+    async def download_release_assets_to(
+        self,
+        repo: str,
+        tag: str,
+        directory: Path,
+        *,
+        match_pattern: str | None = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    ) -> AsyncIterator[FileDownload]:
+        # pylint: disable=line-too-long
+        """
+        Download release assets directly into a directory
+
+        Each asset is downloaded with parallel HTTP range requests and
+        interrupted downloads are resumed when called again with the same
+        directory. The assets are downloaded one after the other and the
+        parallelism is used within each asset. If GitHub reports a SHA256
+        digest for an asset the downloaded file is verified against it.
+
+        Args:
+            repo: GitHub repository (owner/name) to use
+            tag: The git tag for the release
+            directory: Directory to write the assets to
+            match_pattern: Optional pattern which the name of the available
+                artifact must match. For example "\\*.zip". Allows to download
+                only specific artifacts.
+            part_size: Size of the parts requested in parallel in bytes
+            concurrency: Maximum number of parallel range requests per asset
+
+        Raises:
+            HTTPStatusError: If a request was invalid
+            GitHubApiError: If a download is incomplete or doesn't match the
+                digest reported by GitHub
+
+        Returns:
+            An async iterator yielding information about each downloaded file
+
+        Example:
+            .. code-block:: python
+
+                from pathlib import Path
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    async for download in api.releases.download_release_assets_to(
+                        "foo/bar", "v1.2.3", Path("dist")
+                    ):
+                        print(download.path, download.digest)
+        """
+        release = await self.get(repo, tag)
+        assets_url = release.assets_url
+        if not assets_url:
+            raise RuntimeError("assets URL not found")
+
+        response = await self._client.get(assets_url)
+        response.raise_for_status()
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for asset_json in response.json():
+            asset_url: str = asset_json.get("browser_download_url", "")
+            name: str = asset_json.get("name", "")
+            digest: str = asset_json.get("digest") or ""
+
+            if match_pattern and not Path(name).match(match_pattern):
+                continue
+
+            kwargs = {}
+            if digest.startswith("sha256:"):
+                kwargs["expected_digest"] = digest.removeprefix("sha256:")
+
+            yield await download_file(
+                self._client,
+                asset_url,
+                directory / Path(name).name,
+                part_size=part_size,
+                concurrency=concurrency,
+                **kwargs,
+            )
+
     async def upload_release_assets(
         self,
         repo: str,
@@ -347,3 +441,79 @@ class GitHubAsyncRESTReleases(GitHubAsyncREST):
             response, file_path = await coroutine
             response.raise_for_status()
             yield file_path
+
+    async def upload_release_assets_with_checksums(
+        self,
+        repo: str,
+        tag: str,
+        files: Iterable[Path | tuple[Path, str]],
+        *,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        max_retries: int = DEFAULT_UPLOAD_RETRIES,
+        manifest: Path | None = None,
+    ) -> AsyncIterator[AssetUpload]:
+        # pylint: disable=line-too-long
+        """
+        Upload release assets concurrently and calculate their checksums
+
+        The SHA-256 checksum of each file is calculated while the file is
+        read for the upload. Failed uploads are retried per asset. Assets
+        that are already attached to the release with the same checksum are
+        skipped. Therefore an interrupted upload can be resumed by calling
+        this method again.
+
+        Args:
+            repo: GitHub repository (owner/name) to use
+            tag: The git tag for the release
+            files: An iterable of file paths or an iterable of tuples
+                containing a file path and content types to upload as an asset
+            concurrency: Maximum number of parallel uploads
+            max_retries: Maximum number of retries per asset
+            manifest: Optional path to write a checksum manifest in the
+                sha256sum format to. The manifest is uploaded as an asset
+                after all other assets.
+
+        Returns:
+            yields information about each asset after its upload is finished
+
+        Raises:
+            HTTPStatusError: If an upload request was invalid
+            GitHubApiError: If an upload failed after all retries
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    files = (Path("foo.tar.gz"), Path("bar.zip"),)
+                    async for upload in api.releases.upload_release_assets_with_checksums(
+                        "foo/bar", "1.2.3", files, manifest=Path("SHA256SUMS")
+                    ):
+                        print(
+                            f"Uploaded {upload.name} {upload.sha256} "
+                            f"{upload.bytes_per_second / 1024 / 1024:.1f} MiB/s"
+                        )
+        """
+        release = await self.get(repo, tag)
+
+        uploads = []
+        async for uploaded in upload_assets(
+            self._client,
+            release,
+            files,
+            concurrency=concurrency,
+            max_retries=max_retries,
+        ):
+            uploads.append(uploaded)
+            yield uploaded
+
+        if manifest:
+            manifest.write_text(create_checksum_manifest(uploads))
+            async for uploaded in upload_assets(
+                self._client,
+                release,
+                [(manifest, "text/plain")],
+                max_retries=max_retries,
+            ):
+                yield uploaded
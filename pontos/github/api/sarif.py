@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import base64
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from pontos.github.models.code_scanning import (
+    SarifProcessingStatus,
+    SarifUploadInformation,
+)
+
+__all__ = (
+    "SarifUpload",
+    "encode_sarif",
+    "encode_sarif_file",
+)
+
+DEFAULT_SARIF_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+DEFAULT_SARIF_UPLOAD_CONCURRENCY = 4
+
+# window bits for creating a gzip container with zlib
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+@dataclass
+class SarifUpload:
+    """
+    A SARIF file uploaded for code scanning
+
+    Attributes:
+        path: Path of the uploaded SARIF file
+        sarif_id: ID of the SARIF upload
+        information: The processing information of the upload. None if the
+            processing hasn't been awaited.
+        duration: Duration of the upload and processing in seconds
+    """
+
+    path: Path
+    sarif_id: str
+    information: SarifUploadInformation | None = None
+    duration: float = 0.0
+
+    @property
+    def failed(self) -> bool:
+        """
+        True if processing of the SARIF file has failed
+        """
+        return (
+            self.information is not None
+            and self.information.processing_status
+            == SarifProcessingStatus.FAILED
+        )
+
+
+def encode_sarif(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Gzip compress and base64 encode SARIF data incrementally
+
+    Only a single chunk and the compressor state are held in memory at a
+    time. Joining the returned chunks results in the same encoding as
+    compressing and encoding the whole data at once.
+
+    Args:
+        chunks: The SARIF data in chunks of arbitrary size
+
+    Returns:
+        An iterator yielding the base64 encoded chunks as ASCII bytes
+    """
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    # base64 encodes 3 bytes into 4 characters. keep the bytes that don't
+    # fill a group for the next chunk to avoid padding in between.
+    remainder = b""
+
+    for chunk in chunks:
+        data = remainder + compressor.compress(chunk)
+        size = len(data) - len(data) % 3
+        remainder = data[size:]
+        if size:
+            yield base64.b64encode(data[:size])
+
+    yield base64.b64encode(remainder + compressor.flush())
+
+
+def _read_chunks(path: Path, chunk_size: int) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def encode_sarif_file(
+    path: Path, *, chunk_size: int = DEFAULT_SARIF_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Read, gzip compress and base64 encode a SARIF file in chunks
+
+    Reading and encoding is done in a worker thread to not block the event
+    loop.
+
+    Args:
+        path: Path of the SARIF file
+        chunk_size: Size of the chunks read from the file in bytes
+
+    Returns:
+        An async iterator yielding the base64 encoded chunks as ASCII bytes
+    """
+    encoder = encode_sarif(_read_chunks(path, chunk_size))
+    while chunk := await asyncio.to_thread(next, encoder, b""):
+        yield chunk
@@ -0,0 +1,449 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from os import PathLike
+from types import TracebackType
+from typing import Any
+
+from dateutil import parser as dateparser
+from typing_extensions import Self
+
+from pontos.errors import PontosError
+from pontos.github.api.client import GitHubAsyncREST
+from pontos.models import StrEnum
+
+__all__ = (
+    "GitHubAsyncRESTSecurityAlerts",
+    "SecurityAlert",
+    "SecurityAlertStore",
+    "SecurityAlertType",
+)
+
+
+class SecurityAlertType(StrEnum):
+    """
+    Type of a security alert
+
+    Attributes:
+        DEPENDABOT: A dependabot alert
+        CODE_SCANNING: A code scanning alert
+        SECRET_SCANNING: A secret scanning alert
+    """
+
+    DEPENDABOT = "dependabot"
+    CODE_SCANNING = "code-scanning"
+    SECRET_SCANNING = "secret-scanning"
+
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = dateparser.isoparse(value)
+    if not parsed.tzinfo:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass(frozen=True)
+class SecurityAlert:
+    """
+    A compact, normalized dependabot, code scanning or secret scanning alert
+
+    Attributes:
+        type: Type of the alert
+        repository: Full name (owner/name) of the repository of the alert
+        number: Number of the alert. Unique per repository and type.
+        state: State of the alert, for example "open"
+        severity: Severity of the alert. Secret scanning alerts have no
+            severity.
+        title: Short description like the advisory summary, the rule
+            description or the secret type
+        html_url: URL of the alert
+        created_at: Creation date of the alert
+        updated_at: Last modification date of the alert
+    """
+
+    type: SecurityAlertType
+    repository: str
+    number: int
+    state: str
+    severity: str | None
+    title: str
+    html_url: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_dict(
+        cls, alert_type: SecurityAlertType | str, data: dict[str, Any]
+    ) -> "SecurityAlert":
+        """
+        Create a security alert from the JSON data returned by the REST API
+
+        Only the required fields are read. This is considerably faster than
+        creating the complete alert models.
+        """
+        alert_type = SecurityAlertType(alert_type)
+        if alert_type == SecurityAlertType.DEPENDABOT:
+            advisory = data.get("security_advisory") or {}
+            severity = advisory.get("severity")
+            title = advisory.get("summary") or ""
+        elif alert_type == SecurityAlertType.CODE_SCANNING:
+            rule = data.get("rule") or {}
+            severity = rule.get("security_severity_level") or rule.get(
+                "severity"
+            )
+            title = rule.get("description") or rule.get("name") or ""
+        else:
+            severity = None
+            title = (
+                data.get("secret_type_display_name")
+                or data.get("secret_type")
+                or ""
+            )
+
+        created_at = _parse_datetime(data["created_at"])
+        updated_at = data.get("updated_at")
+        return cls(
+            type=alert_type,
+            repository=(data.get("repository") or {}).get("full_name", ""),
+            number=data["number"],
+            state=data["state"],
+            severity=severity,
+            title=title,
+            html_url=data["html_url"],
+            created_at=created_at,
+            updated_at=(
+                _parse_datetime(updated_at) if updated_at else created_at
+            ),
+        )
+
+
+class GitHubAsyncRESTSecurityAlerts(GitHubAsyncREST):
+    async def _organization_alerts(
+        self,
+        organization: str,
+        alert_type: SecurityAlertType,
+        since: datetime | None,
+    ) -> list[SecurityAlert]:
+        api = f"/orgs/{organization}/{alert_type}/alerts"
+        # newest changes first to be able to stop at the cursor
+        params = {"sort": "updated", "direction": "desc", "per_page": "100"}
+        alerts: list[SecurityAlert] = []
+        async for response in self._client.get_all(api, params=params):
+            response.raise_for_status()
+            for data in response.json():
+                alert = SecurityAlert.from_dict(alert_type, data)
+                if since and alert.updated_at < since:
+                    # all following alerts are unchanged
+                    return alerts
+                alerts.append(alert)
+        return alerts
+
+    async def organization_alerts(
+        self,
+        organization: str,
+        *,
+        since: Mapping[SecurityAlertType, datetime] | None = None,
+        alert_types: Iterable[SecurityAlertType | str] = tuple(
+            SecurityAlertType
+        ),
+    ) -> list[SecurityAlert]:
+        """
+        Get the dependabot, code scanning and secret scanning alerts of all
+        repositories of a GitHub organization
+
+        The alert types are requested concurrently. The alerts are requested
+        sorted by their modification date and the pagination stops at the
+        first alert older than the since date of its type.
+
+        Args:
+            organization: Name of the organization
+            since: Only return alerts changed at or after these dates per
+                alert type
+            alert_types: The types of alerts to request. Default is all
+                types.
+
+        Raises:
+            HTTPStatusError: A httpx.HTTPStatusError is raised if a request
+                failed, for example if an alert type isn't enabled for the
+                organization.
+
+        Returns:
+            The alerts of all requested types
+
+        Example:
+            .. code-block:: python
+
+                from pontos.github.api import GitHubAsyncRESTApi
+
+                async with GitHubAsyncRESTApi(token) as api:
+                    alerts = await api.security_alerts.organization_alerts(
+                        "my-org"
+                    )
+                    for alert in alerts:
+                        print(alert.type, alert.repository, alert.title)
+        """
+        since = since or {}
+        types = [SecurityAlertType(alert_type) for alert_type in alert_types]
+        results = await asyncio.gather(
+            *(
+                self._organization_alerts(
+                    organization, alert_type, since.get(alert_type)
+                )
+                for alert_type in types
+            )
+        )
+        return [alert for alerts in results for alert in alerts]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    organization TEXT NOT NULL,
+    type TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    severity TEXT,
+    title TEXT NOT NULL,
+    html_url TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (type, repository, number)
+);
+CREATE INDEX IF NOT EXISTS alerts_organization_state
+    ON alerts (organization, state);
+CREATE TABLE IF NOT EXISTS cursors (
+    organization TEXT NOT NULL,
+    type TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (organization, type)
+);
+"""
+
+_COLUMNS = (
+    "type, repository, number, state, severity, title, html_url, "
+    "created_at, updated_at"
+)
+
+
+class SecurityAlertStore:
+    """
+    A local store of the security alerts of GitHub organizations
+
+    The alerts are stored in a SQLite database together with a cursor per
+    organization and alert type. The cursor is the newest modification date
+    seen. A synchronization only requests the alerts changed since then.
+
+    Should be used as a context manager.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.api import (
+                GitHubAsyncRESTApi,
+                SecurityAlertStore,
+            )
+
+            with SecurityAlertStore("alerts.db") as store:
+                async with GitHubAsyncRESTApi(token) as api:
+                    await store.sync(api.security_alerts, "my-org")
+
+                for alert in store.alerts("my-org", state="open"):
+                    print(alert.type, alert.repository, alert.severity)
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """
+        Create a new security alert store
+
+        Args:
+            path: Path to the SQLite database file. The file is created if it
+                doesn't exist yet. Use ":memory:" for a non persistent store.
+        """
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if not self._connection:
+            raise PontosError(
+                f"{self.__class__.__name__} has not been opened yet."
+            )
+        return self._connection
+
+    def open(self) -> None:
+        """
+        Open the database and create the required tables if necessary
+        """
+        if self._connection:
+            return
+
+        self._connection = sqlite3.connect(self._path)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Close the database
+        """
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def cursors(self, organization: str) -> dict[SecurityAlertType, datetime]:
+        """
+        Get the newest modification date of the stored alerts per type
+        """
+        return {
+            SecurityAlertType(alert_type): datetime.fromisoformat(updated_at)
+            for alert_type, updated_at in self._db.execute(
+                "SELECT type, updated_at FROM cursors WHERE organization = ?",
+                (organization,),
+            )
+        }
+
+    def _store(self, organization: str, alerts: list[SecurityAlert]) -> None:
+        cursors: dict[SecurityAlertType, datetime] = {}
+        for alert in alerts:
+            cursor = cursors.get(alert.type)
+            if not cursor or alert.updated_at > cursor:
+                cursors[alert.type] = alert.updated_at
+
+        with self._db:
+            # only replace alerts with newer data
+            self._db.executemany(
+                f"INSERT INTO alerts (organization, {_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (type, repository, number) DO UPDATE SET "
+                "organization = excluded.organization, "
+                "state = excluded.state, "
+                "severity = excluded.severity, "
+                "title = excluded.title, "
+                "updated_at = excluded.updated_at "
+                "WHERE excluded.updated_at >= alerts.updated_at",
+                [
+                    (
+                        organization,
+                        str(alert.type),
+                        alert.repository,
+                        alert.number,
+                        alert.state,
+                        alert.severity,
+                        alert.title,
+                        alert.html_url,
+                        alert.created_at.astimezone(timezone.utc).isoformat(),
+                        alert.updated_at.astimezone(timezone.utc).isoformat(),
+                    )
+                    for alert in alerts
+                ],
+            )
+            self._db.executemany(
+                "INSERT INTO cursors (organization, type, updated_at) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT (organization, type) DO UPDATE SET "
+                "updated_at = MAX(cursors.updated_at, excluded.updated_at)",
+                [
+                    (
+                        organization,
+                        str(alert_type),
+                        updated_at.astimezone(timezone.utc).isoformat(),
+                    )
+                    for alert_type, updated_at in cursors.items()
+                ],
+            )
+
+    async def sync(
+        self,
+        api: GitHubAsyncRESTSecurityAlerts,
+        organization: str,
+        *,
+        alert_types: Iterable[SecurityAlertType | str] = tuple(
+            SecurityAlertType
+        ),
+    ) -> int:
+        """
+        Synchronize the local alerts of an organization with GitHub
+
+        The first synchronization requests all alerts. All following
+        synchronizations only request the alerts changed since the newest
+        known change per alert type.
+
+        Args:
+            api: The security alerts API to use for requesting the alerts
+            organization: Name of the organization to synchronize
+            alert_types: The types of alerts to synchronize. Default is all
+                types.
+
+        Returns:
+            The number of added or updated alerts
+        """
+        alerts = await api.organization_alerts(
+            organization,
+            since=self.cursors(organization),
+            alert_types=alert_types,
+        )
+        self._store(organization, alerts)
+        return len(alerts)
+
+    def alerts(
+        self,
+        organization: str,
+        *,
+        alert_type: SecurityAlertType | str | None = None,
+        state: str | None = None,
+        repository: str | None = None,
+    ) -> Iterator[SecurityAlert]:
+        """
+        Get the stored alerts of an organization, newest change first
+
+        Args:
+            organization: Name of the organization
+            alert_type: Only return alerts of this type
+            state: Only return alerts in this state, for example "open"
+            repository: Only return alerts of this repository (owner/name)
+        """
+        query = f"SELECT {_COLUMNS} FROM alerts WHERE organization = ?"
+        params: list[str] = [organization]
+        if alert_type:
+            query += " AND type = ?"
+            params.append(str(SecurityAlertType(alert_type)))
+        if state:
+            query += " AND state = ?"
+            params.append(state)
+        if repository:
+            query += " AND repository = ?"
+            params.append(repository)
+        query += " ORDER BY updated_at DESC, type, repository, number"
+
+        for row in self._db.execute(query, params):
+            yield SecurityAlert(
+                type=SecurityAlertType(row[0]),
+                repository=row[1],
+                number=row[2],
+                state=row[3],
+                severity=row[4],
+                title=row[5],
+                html_url=row[6],
+                created_at=datetime.fromisoformat(row[7]),
+                updated_at=datetime.fromisoformat(row[8]),
+            )
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import hashlib
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.errors import GitHubApiError
+from pontos.github.models.release import (
+    Release,
+    ReleaseAsset,
+    ReleaseAssetState,
+)
+
+__all__ = (
+    "AssetUpload",
+    "create_checksum_manifest",
+    "upload_assets",
+)
+
+DEFAULT_UPLOAD_CONCURRENCY = 4
+DEFAULT_UPLOAD_RETRIES = 3
+DEFAULT_UPLOAD_RETRY_DELAY = 1.0  # in seconds
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+@dataclass
+class AssetUpload:
+    """
+    A file uploaded as release asset
+
+    Attributes:
+        path: Path of the uploaded file
+        name: Name of the release asset
+        size: Size of the file in bytes
+        sha256: SHA-256 hex digest of the file content
+        duration: Duration of the successful upload in seconds
+        attempts: Number of upload attempts. 0 if the asset was already
+            uploaded.
+    """
+
+    path: Path
+    name: str
+    size: int
+    sha256: str
+    duration: float = 0.0
+    attempts: int = 1
+
+    @property
+    def skipped(self) -> bool:
+        """
+        True if the asset has already been uploaded before
+        """
+        return self.attempts == 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """
+        Throughput of the upload in bytes per second
+        """
+        return self.size / self.duration if self.duration else 0.0
+
+
+def create_checksum_manifest(uploads: Iterable[AssetUpload]) -> str:
+    """
+    Create a checksum manifest for uploaded assets
+
+    The manifest uses the format of the sha256sum tool and can be verified
+    with ``sha256sum --check``.
+
+    Args:
+        uploads: The uploaded assets
+
+    Returns:
+        The content of the manifest
+    """
+    return "".join(
+        f"{upload.sha256}  {upload.name}\n"
+        for upload in sorted(uploads, key=lambda upload: upload.name)
+    )
+
+
+async def _hashing_reader(
+    file_path: Path, file_hash: Any, chunk_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Read a file in chunks and update the hash with every chunk read
+    """
+    with file_path.open("rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            file_hash.update(chunk)
+            yield chunk
+
+
+async def _hash_file(file_path: Path, chunk_size: int) -> str:
+    file_hash = hashlib.sha256()
+    async for _ in _hashing_reader(file_path, file_hash, chunk_size):
+        pass
+    return file_hash.hexdigest()
+
+
+def _is_retryable(response: httpx.Response) -> bool:
+    return response.is_server_error or response.status_code == 429
+
+
+class _AssetUploader:
+    def __init__(
+        self,
+        client: GitHubAsyncRESTClient,
+        release: Release,
+        *,
+        max_retries: int,
+        retry_delay: float,
+        chunk_size: int,
+    ) -> None:
+        self._client = client
+        self._upload_url = release.upload_url.replace("{?name,label}", "")
+        self._assets_url = release.assets_url
+        self._existing_assets = {asset.name: asset for asset in release.assets}
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._chunk_size = chunk_size
+
+    async def _delete_asset(self, url: str) -> None:
+        response = await self._client.delete(url)
+        if response.status_code != httpx.codes.NOT_FOUND:
+            response.raise_for_status()
+
+    async def _delete_broken_asset(self, name: str) -> None:
+        # a failed upload may leave a broken asset behind. it blocks
+        # uploading an asset with the same name.
+        response = await self._client.get(self._assets_url)
+        if not response.is_success:
+            return
+
+        for asset in response.json():
+            if asset.get("name") == name:
+                await self._delete_asset(asset["url"])
+
+    async def _uploaded_digest(
+        self, file_path: Path, asset: ReleaseAsset, size: int
+    ) -> str | None:
+        """
+        Check if an existing asset matches the file. Returns the digest of
+        the file if it matches.
+        """
+        if (
+            asset.state != ReleaseAssetState.UPLOADED
+            or asset.size != size
+            or not asset.digest
+            or not asset.digest.startswith("sha256:")
+        ):
+            return None
+
+        sha256 = await _hash_file(file_path, self._chunk_size)
+        return sha256 if asset.digest == f"sha256:{sha256}" else None
+
+    async def upload(self, file_path: Path, content_type: str) -> AssetUpload:
+        name = file_path.name
+        size = file_path.stat().st_size
+
+        existing = self._existing_assets.get(name)
+        if existing:
+            sha256 = await self._uploaded_digest(file_path, existing, size)
+            if sha256:
+                return AssetUpload(
+                    path=file_path,
+                    name=name,
+                    size=size,
+                    sha256=sha256,
+                    attempts=0,
+                )
+            await self._delete_asset(existing.url)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            file_hash = hashlib.sha256()
+            start = time.monotonic()
+            try:
+                response = await self._client.post(
+                    self._upload_url,
+                    params={"name": name},
+                    content_type=content_type,
+                    content_length=size,
+                    content=_hashing_reader(  # type: ignore[arg-type]
+                        file_path, file_hash, self._chunk_size
+                    ),
+                )
+            except httpx.TransportError as e:
+                if attempt > self._max_retries:
+                    raise GitHubApiError(
+                        f"Uploading {file_path} failed after {attempt} "
+                        f"attempts. {e}"
+                    ) from e
+            else:
+                if response.is_success:
+                    return AssetUpload(
+                        path=file_path,
+                        name=name,
+                        size=size,
+                        sha256=file_hash.hexdigest(),
+                        duration=time.monotonic() - start,
+                        attempts=attempt,
+                    )
+
+                if attempt > self._max_retries or not (
+                    _is_retryable(response)
+                    or response.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+                ):
+                    response.raise_for_status()
+
+            await asyncio.sleep(self._retry_delay * 2 ** (attempt - 1))
+
+            await self._delete_broken_asset(name)
+
+
+async def upload_assets(
+    client: GitHubAsyncRESTClient,
+    release: Release,
+    files: Iterable[Path | tuple[Path, str]],
+    *,
+    concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    max_retries: int = DEFAULT_UPLOAD_RETRIES,
+    retry_delay: float = DEFAULT_UPLOAD_RETRY_DELAY,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+) -> AsyncIterator[AssetUpload]:
+    """
+    Upload files as assets of a release with bounded concurrency
+
+    The SHA-256 digest of each file is calculated while it is read for the
+    upload. Failed uploads are retried per asset. Assets already attached to
+    the release with the same name, size and digest are skipped and other
+    assets with the same name are replaced. Therefore an interrupted upload
+    can be resumed by calling this function again.
+
+    Args:
+        client: The GitHub REST client to use
+        release: The release to upload the assets to
+        files: An iterable of file paths or an iterable of tuples containing
+            a file path and content types to upload as an asset
+        concurrency: Maximum number of parallel uploads
+        max_retries: Maximum number of retries per asset
+        retry_delay: Initial delay in seconds before retrying an upload. The
+            delay doubles with every retry.
+        chunk_size: Size of the chunks read from the files in bytes
+
+    Returns:
+        An async iterator yielding the uploads as they are finished
+    """
+    uploader = _AssetUploader(
+        client,
+        release,
+        max_retries=max_retries,
+        retry_delay=retry_delay,
+        chunk_size=chunk_size,
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def upload_file(file_path: Path, content_type: str) -> AssetUpload:
+        async with semaphore:
+            return await uploader.upload(file_path, content_type)
+
+    tasks = []
+    for file_path in files:
+        if isinstance(file_path, tuple):
+            file_path, content_type = file_path  # noqa: PLW2901
+        else:
+            content_type = DEFAULT_CONTENT_TYPE
+
+        tasks.append(asyncio.create_task(upload_file(file_path, content_type)))
+
+    try:
+        for coroutine in asyncio.as_completed(tasks):
+            yield await coroutine
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,515 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import math
+import sqlite3
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from os import PathLike
+from types import TracebackType
+
+from typing_extensions import Self
+
+from pontos.errors import PontosError
+from pontos.github.api.workflows import GitHubAsyncRESTWorkflows
+from pontos.github.models.workflow import WorkflowRun, WorkflowRunStatus
+
+__all__ = (
+    "DurationPercentiles",
+    "WorkflowRunHistory",
+    "WorkflowRunRecord",
+    "WorkflowRunStatistics",
+)
+
+# conclusions of completed runs counted as failed
+FAILED_CONCLUSIONS = frozenset(("failure", "timed_out", "startup_failure"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    repository TEXT NOT NULL,
+    workflow_id INTEGER NOT NULL,
+    name TEXT,
+    head_branch TEXT,
+    event TEXT NOT NULL,
+    status TEXT,
+    conclusion TEXT,
+    run_attempt INTEGER,
+    created_at TEXT NOT NULL,
+    run_started_at TEXT,
+    updated_at TEXT NOT NULL,
+    queue_seconds REAL,
+    run_seconds REAL
+);
+CREATE INDEX IF NOT EXISTS runs_repository_created_at
+    ON runs (repository, created_at);
+"""
+
+_COLUMNS = (
+    "id, repository, workflow_id, name, head_branch, event, status, "
+    "conclusion, run_attempt, created_at, run_started_at, updated_at, "
+    "queue_seconds, run_seconds"
+)
+
+
+def _to_utc(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _from_utc(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(
+        tzinfo=timezone.utc
+    )
+
+
+def _percentile(values: list[float], p: float) -> float:
+    """
+    Calculate a percentile of sorted values with linear interpolation
+
+    Args:
+        values: Sorted list of values. Must not be empty.
+        p: The percentile between 0 and 100
+    """
+    if len(values) == 1:
+        return values[0]
+
+    rank = (len(values) - 1) * p / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+@dataclass(frozen=True)
+class WorkflowRunRecord:
+    """
+    A workflow run stored in the local history
+
+    Attributes:
+        id: ID of the workflow run
+        repository: GitHub repository (owner/name) of the run
+        workflow_id: ID of the workflow
+        name: Name of the workflow
+        head_branch: Branch the workflow run has been triggered for
+        event: Event that triggered the workflow run
+        status: Status of the workflow run
+        conclusion: Conclusion of a completed workflow run
+        run_attempt: Number of the run attempt
+        created_at: Creation date of the workflow run
+        run_started_at: Date the run started at
+        updated_at: Last modification date
+        queue_duration: Time between creation and start of the run
+        run_duration: Time between start and completion of the run
+    """
+
+    id: int
+    repository: str
+    workflow_id: int
+    name: str | None
+    head_branch: str | None
+    event: str
+    status: str | None
+    conclusion: str | None
+    run_attempt: int | None
+    created_at: datetime
+    run_started_at: datetime | None
+    updated_at: datetime
+    queue_duration: timedelta | None
+    run_duration: timedelta | None
+
+    @property
+    def failed(self) -> bool:
+        """
+        True if the workflow run has completed with a failure
+        """
+        return self.conclusion in FAILED_CONCLUSIONS
+
+
+@dataclass(frozen=True)
+class DurationPercentiles:
+    """
+    Percentiles of durations
+
+    Attributes:
+        p50: Median
+        p90: 90th percentile
+        p95: 95th percentile
+        p99: 99th percentile
+        max: Maximum
+    """
+
+    p50: timedelta
+    p90: timedelta
+    p95: timedelta
+    p99: timedelta
+    max: timedelta
+
+    @classmethod
+    def from_seconds(
+        cls, seconds: Iterable[float]
+    ) -> "DurationPercentiles | None":
+        """
+        Calculate the percentiles of durations given in seconds
+
+        Returns:
+            The percentiles or None if there are no durations
+        """
+        values = sorted(seconds)
+        if not values:
+            return None
+
+        return cls(
+            p50=timedelta(seconds=_percentile(values, 50)),
+            p90=timedelta(seconds=_percentile(values, 90)),
+            p95=timedelta(seconds=_percentile(values, 95)),
+            p99=timedelta(seconds=_percentile(values, 99)),
+            max=timedelta(seconds=values[-1]),
+        )
+
+
+@dataclass(frozen=True)
+class WorkflowRunStatistics:
+    """
+    Statistics of the completed runs of a workflow on a branch
+
+    Attributes:
+        workflow: Name of the workflow
+        branch: Head branch of the runs
+        count: Number of completed runs
+        failures: Number of failed runs
+        queue: Percentiles of the time the runs were queued
+        run: Percentiles of the run durations
+    """
+
+    workflow: str
+    branch: str
+    count: int
+    failures: int
+    queue: DurationPercentiles | None
+    run: DurationPercentiles | None
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        Fraction of failed runs
+        """
+        return self.failures / self.count if self.count else 0.0
+
+
+class WorkflowRunHistory:
+    """
+    A local incremental history of GitHub workflow runs
+
+    The runs are stored in a SQLite database keyed by their ID. A
+    synchronization only requests the runs created since the last
+    synchronization, plus the runs that weren't completed at that time.
+    Duration percentiles and failure rates are calculated from the local
+    history without requesting the history again.
+
+    Should be used as a context manager.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.api import (
+                GitHubAsyncRESTApi,
+                WorkflowRunHistory,
+            )
+
+            with WorkflowRunHistory("runs.db") as history:
+                async with GitHubAsyncRESTApi(token) as api:
+                    await history.sync(api.workflows, "foo/bar")
+
+                for statistics in history.statistics("foo/bar"):
+                    print(
+                        statistics.workflow,
+                        statistics.branch,
+                        statistics.run.p90 if statistics.run else None,
+                        f"{statistics.failure_rate:.0%}",
+                    )
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """
+        Create a new workflow run history
+
+        Args:
+            path: Path to the SQLite database file. The file is created if it
+                doesn't exist yet. Use ":memory:" for a non persistent
+                history.
+        """
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if not self._connection:
+            raise PontosError(
+                f"{self.__class__.__name__} has not been opened yet."
+            )
+        return self._connection
+
+    def open(self) -> None:
+        """
+        Open the database and create the required tables if necessary
+        """
+        if self._connection:
+            return
+
+        self._connection = sqlite3.connect(self._path)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Close the database
+        """
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def _sync_start(self, repository: str) -> str | None:
+        """
+        Get the creation date from which on runs need to be requested
+
+        All runs that haven't been completed yet need to be requested again.
+        Otherwise only the runs created after the newest known run.
+        """
+        row = self._db.execute(
+            "SELECT MIN(created_at) FROM runs WHERE repository = ? "
+            "AND (status IS NULL OR status != ?)",
+            (repository, WorkflowRunStatus.COMPLETED.value),
+        ).fetchone()
+        if row[0]:
+            return row[0]
+
+        row = self._db.execute(
+            "SELECT MAX(created_at) FROM runs WHERE repository = ?",
+            (repository,),
+        ).fetchone()
+        return row[0]
+
+    def _store(self, repository: str, runs: list[WorkflowRun]) -> int:
+        rows = []
+        for run in runs:
+            completed = run.status == WorkflowRunStatus.COMPLETED
+            started = run.run_started_at
+            queue_seconds = (
+                (started - run.created_at).total_seconds() if started else None
+            )
+            run_seconds = (
+                (run.updated_at - started).total_seconds()
+                if started and completed
+                else None
+            )
+            rows.append(
+                (
+                    run.id,
+                    repository,
+                    run.workflow_id,
+                    run.name,
+                    run.head_branch,
+                    str(run.event),
+                    str(run.status) if run.status else None,
+                    run.conclusion,
+                    run.run_attempt,
+                    _to_utc(run.created_at),
+                    _to_utc(started) if started else None,
+                    _to_utc(run.updated_at),
+                    queue_seconds,
+                    run_seconds,
+                )
+            )
+
+        with self._db:
+            # only replace runs with newer data
+            self._db.executemany(
+                f"INSERT INTO runs ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET "
+                "status = excluded.status, "
+                "conclusion = excluded.conclusion, "
+                "run_attempt = excluded.run_attempt, "
+                "run_started_at = excluded.run_started_at, "
+                "updated_at = excluded.updated_at, "
+                "queue_seconds = excluded.queue_seconds, "
+                "run_seconds = excluded.run_seconds "
+                "WHERE excluded.updated_at >= runs.updated_at",
+                rows,
+            )
+
+        return len(rows)
+
+    async def sync(
+        self,
+        workflows: GitHubAsyncRESTWorkflows,
+        repository: str,
+        *,
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Synchronize the local history of a repository with GitHub
+
+        The first synchronization requests all workflow runs of the
+        repository. All following synchronizations use the created filter to
+        only request new runs and runs that haven't been completed yet.
+
+        Args:
+            workflows: The workflows API to use for requesting the runs
+            repository: GitHub repository (owner/name) to synchronize
+            batch_size: Number of runs to store per database transaction
+
+        Returns:
+            The number of added or updated runs
+        """
+        start = self._sync_start(repository)
+        created = f">={start}" if start else None
+
+        count = 0
+        batch: list[WorkflowRun] = []
+        async for run in workflows.get_workflow_runs(
+            repository, created=created
+        ):
+            batch.append(run)
+            if len(batch) >= batch_size:
+                count += self._store(repository, batch)
+                batch = []
+
+        if batch:
+            count += self._store(repository, batch)
+
+        return count
+
+    @staticmethod
+    def _to_record(row: tuple) -> WorkflowRunRecord:
+        return WorkflowRunRecord(
+            id=row[0],
+            repository=row[1],
+            workflow_id=row[2],
+            name=row[3],
+            head_branch=row[4],
+            event=row[5],
+            status=row[6],
+            conclusion=row[7],
+            run_attempt=row[8],
+            created_at=_from_utc(row[9]),  # type: ignore[arg-type]
+            run_started_at=_from_utc(row[10]),
+            updated_at=_from_utc(row[11]),  # type: ignore[arg-type]
+            queue_duration=(
+                timedelta(seconds=row[12]) if row[12] is not None else None
+            ),
+            run_duration=(
+                timedelta(seconds=row[13]) if row[13] is not None else None
+            ),
+        )
+
+    def runs(
+        self,
+        repository: str,
+        *,
+        workflow: str | int | None = None,
+        branch: str | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[WorkflowRunRecord]:
+        """
+        Get the stored runs of a repository, oldest first
+
+        Args:
+            repository: GitHub repository (owner/name)
+            workflow: Only return runs of this workflow ID or workflow name
+            branch: Only return runs for this head branch
+            since: Only return runs created since this date
+        """
+        query = f"SELECT {_COLUMNS} FROM runs WHERE repository = ?"
+        params: list[str | int] = [repository]
+        if isinstance(workflow, int):
+            query += " AND workflow_id = ?"
+            params.append(workflow)
+        elif workflow:
+            query += " AND name = ?"
+            params.append(workflow)
+        if branch:
+            query += " AND head_branch = ?"
+            params.append(branch)
+        if since:
+            query += " AND created_at >= ?"
+            params.append(_to_utc(since))
+        query += " ORDER BY created_at, id"
+
+        for row in self._db.execute(query, params):
+            yield self._to_record(row)
+
+    def statistics(
+        self,
+        repository: str,
+        *,
+        workflow: str | int | None = None,
+        branch: str | None = None,
+        since: datetime | None = None,
+    ) -> list[WorkflowRunStatistics]:
+        """
+        Calculate queue and run duration percentiles and failure rates per
+        workflow and branch from the local history
+
+        Only completed runs are taken into account.
+
+        Args:
+            repository: GitHub repository (owner/name)
+            workflow: Only use runs of this workflow ID or workflow name
+            branch: Only use runs for this head branch
+            since: Only use runs created since this date
+
+        Returns:
+            The statistics sorted by workflow and branch
+        """
+        groups: dict[tuple[str, str], list[WorkflowRunRecord]] = defaultdict(
+            list
+        )
+        for run in self.runs(
+            repository, workflow=workflow, branch=branch, since=since
+        ):
+            if run.status != WorkflowRunStatus.COMPLETED:
+                continue
+            key = (run.name or str(run.workflow_id), run.head_branch or "")
+            groups[key].append(run)
+
+        return [
+            WorkflowRunStatistics(
+                workflow=name,
+                branch=head_branch,
+                count=len(runs),
+                failures=sum(1 for run in runs if run.failed),
+                queue=DurationPercentiles.from_seconds(
+                    run.queue_duration.total_seconds()
+                    for run in runs
+                    if run.queue_duration is not None
+                ),
+                run=DurationPercentiles.from_seconds(
+                    run.run_duration.total_seconds()
+                    for run in runs
+                    if run.run_duration is not None
+                ),
+            )
+            for (name, head_branch), runs in sorted(groups.items())
+        ]
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -49,6 +49,7 @@ class ReleaseAsset(GitHubModel):
         updated_at: Upload date
         label: Label of the asset
         uploader: User who uploaded the asset
+        digest: Digest of the asset content, for example "sha256:..."
     """
 
     url: str
@@ -64,6 +65,7 @@ class ReleaseAsset(GitHubModel):
     updated_at: datetime
     label: str | None = None
     uploader: User | None = None
+    digest: str | None = None
 
 
 @dataclass
@@ -27,11 +27,17 @@ Example:
         repo = await api.repositories.get(args.repository)
         print(repo.html_url, repo.description)
         return 0
+
+Scripts with a repository argument can be run concurrently for many
+repositories with a single GitHub API client by using the ``--fan-out-*``
+arguments or :py:func:`fan_out_github_script`.
 """
 
 import json
 import sys
 from argparse import ArgumentParser
+from collections.abc import Iterable
+from pathlib import Path
 
 import httpx
 
@@ -40,19 +46,51 @@ from pontos.errors import PontosError
 from ._parser import create_parser
 from .errors import GitHubScriptError
 from .load import (
+    GitHubScriptResult,
+    fan_out_github_script,
     load_script,
     run_add_arguments_function,
     run_github_script_function,
+    run_github_script_function_fan_out,
 )
 
 __all__ = (
     "GitHubScriptError",
+    "GitHubScriptResult",
+    "fan_out_github_script",
     "load_script",
     "run_add_arguments_function",
     "run_github_script_function",
+    "run_github_script_function_fan_out",
 )
 
 
+def _read_repositories(path: Path) -> list[str]:
+    return [
+        line.strip()
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
+def _report_results(results: Iterable[GitHubScriptResult]) -> int:
+    failed = 0
+    for result in results:
+        if result.success:
+            continue
+
+        failed += 1
+        if result.error:
+            print(f"{result.repository}: {result.error}", file=sys.stderr)
+        else:
+            print(
+                f"{result.repository}: Script returned {result.return_code}",
+                file=sys.stderr,
+            )
+
+    return 1 if failed else 0
+
+
 def main():
     """
     CLI function to run a Pontos GitHub Script
@@ -70,7 +108,25 @@ def main():
             token = args.token
             timeout = args.timeout
 
-            retval = run_github_script_function(module, token, timeout, args)
+            if args.fan_out_organization or args.fan_out_file:
+                results = run_github_script_function_fan_out(
+                    module,
+                    token,
+                    timeout,
+                    args,
+                    repositories=_read_repositories(args.fan_out_file)
+                    if args.fan_out_file
+                    else None,
+                    organization=args.fan_out_organization,
+                    concurrency=args.fan_out_concurrency,
+                    argument=args.fan_out_argument,
+                    rate_limit=args.rate_limit,
+                )
+                retval = _report_results(results)
+            else:
+                retval = run_github_script_function(
+                    module, token, timeout, args, rate_limit=args.rate_limit
+                )
 
         sys.exit(retval)
     except KeyboardInterrupt:
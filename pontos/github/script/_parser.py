@@ -5,10 +5,15 @@
 
 import os
 from argparse import ArgumentParser
+from pathlib import Path
 
 import shtab
 
 from pontos.github.api.helper import DEFAULT_TIMEOUT
+from pontos.github.script.load import (
+    DEFAULT_FAN_OUT_ARGUMENT,
+    DEFAULT_FAN_OUT_CONCURRENCY,
+)
 
 GITHUB_TOKEN = "GITHUB_TOKEN"
 
@@ -33,5 +38,46 @@ def create_parser() -> ArgumentParser:
         help="Timeout in seconds. Default: %(default)s.",
         type=float,
     )
+    parser.add_argument(
+        "--rate-limit",
+        action="store_true",
+        help="Respect the GitHub rate limits by pacing the requests and "
+        "retrying requests that hit a rate limit.",
+    )
+
+    fan_out_group = parser.add_argument_group(
+        "fan out",
+        "Run the script concurrently for many repositories. For each "
+        "repository the script argument named by --fan-out-argument is set "
+        "to the repository (owner/name). A placeholder value has to be "
+        "passed for this argument if it is required by the script.",
+    )
+    targets_group = fan_out_group.add_mutually_exclusive_group()
+    targets_group.add_argument(
+        "--fan-out-organization",
+        metavar="ORGANIZATION",
+        help="Run the script for all repositories of this organization.",
+    )
+    targets_group.add_argument(
+        "--fan-out-file",
+        metavar="FILE",
+        type=Path,
+        help="Run the script for all repositories (owner/name) listed in "
+        "this file. One repository per line.",
+    )
+    fan_out_group.add_argument(
+        "--fan-out-argument",
+        metavar="NAME",
+        default=DEFAULT_FAN_OUT_ARGUMENT,
+        help="Name of the script argument to set to the repository. "
+        "Default: %(default)s.",
+    )
+    fan_out_group.add_argument(
+        "--fan-out-concurrency",
+        metavar="N",
+        type=int,
+        default=DEFAULT_FAN_OUT_CONCURRENCY,
+        help="Maximum number of concurrent script runs. Default: %(default)s.",
+    )
     parser.add_argument("script", help="Script to run")
     return parser
@@ -7,19 +7,34 @@ import asyncio
 import importlib
 import os
 from argparse import ArgumentParser, Namespace
-from collections.abc import Generator
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+)
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
+from typing import Any, TypeVar
 
 from httpx import Timeout
 
 from pontos.github.api.api import GitHubAsyncRESTApi
+from pontos.github.api.rate_limit import RateLimitScheduler
 from pontos.github.script.errors import GitHubScriptError
 from pontos.helper import add_sys_path, ensure_unload_module
 
 GITHUB_SCRIPT_FUNCTION_NAME = "github_script"
 GITHUB_SCRIPT_PARSER_FUNCTION_NAME = "add_script_arguments"
+DEFAULT_FAN_OUT_CONCURRENCY = 10
+DEFAULT_FAN_OUT_ARGUMENT = "repository"
+
+T = TypeVar("T")
 
 
 @contextmanager
@@ -60,8 +75,49 @@ def load_script(
             yield importlib.import_module(module_name)
 
 
+def _get_github_script_function(
+    module: ModuleType,
+) -> Callable[[GitHubAsyncRESTApi, Namespace], Awaitable[int]]:
+    if not hasattr(module, GITHUB_SCRIPT_FUNCTION_NAME):
+        raise GitHubScriptError(
+            f"{module.__file__} is not a valid Pontos GitHub Script. A "
+            f"{GITHUB_SCRIPT_FUNCTION_NAME} function is missing."
+        )
+    func = getattr(module, GITHUB_SCRIPT_FUNCTION_NAME)
+    if not asyncio.iscoroutinefunction(func):
+        # it's not async
+        raise GitHubScriptError(
+            f"{module.__file__} is not a valid Pontos GitHub Script. "
+            f"{GITHUB_SCRIPT_FUNCTION_NAME} need to be an async coroutine "
+            "function."
+        )
+    return func
+
+
+def _run_until_complete(coroutine: Coroutine[Any, Any, T]) -> T:
+    loop_owner = False
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop_owner = True
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    try:
+        retval = loop.run_until_complete(coroutine)
+    finally:
+        if loop_owner:
+            loop.close()
+    return retval
+
+
 def run_github_script_function(
-    module: ModuleType, token: str, timeout: float, args: Namespace
+    module: ModuleType,
+    token: str,
+    timeout: float,
+    args: Namespace,
+    *,
+    rate_limit: bool = False,
 ) -> int:
     """
     Run a github_script function from a Python module
@@ -71,6 +127,7 @@ def run_github_script_function(
         token: A GitHub token for authentication
         timeout: Timeout for the GitHub requests in seconds
         args: Arguments forwarded to the script function
+        rate_limit: Respect the GitHub rate limits if True
 
     Raises:
         GitHubScriptError: If the module doesn't have a github_script function
@@ -93,38 +150,206 @@ def run_github_script_function(
             with load_script("some.python.module") as module:
                 return run_github_script_function(module, token, 60.0, args)
     """
-    if not hasattr(module, GITHUB_SCRIPT_FUNCTION_NAME):
-        raise GitHubScriptError(
-            f"{module.__file__} is not a valid Pontos GitHub Script. A "
-            f"{GITHUB_SCRIPT_FUNCTION_NAME} function is missing."
-        )
-    func = getattr(module, GITHUB_SCRIPT_FUNCTION_NAME)
-    if not asyncio.iscoroutinefunction(func):
-        # it's not async
-        raise GitHubScriptError(
-            f"{module.__file__} is not a valid Pontos GitHub Script. "
-            f"{GITHUB_SCRIPT_FUNCTION_NAME} need to be an async coroutine "
-            "function."
-        )
+    func = _get_github_script_function(module)
 
     async def run_async() -> int:
-        async with GitHubAsyncRESTApi(token, timeout=Timeout(timeout)) as api:
+        async with GitHubAsyncRESTApi(
+            token,
+            timeout=Timeout(timeout),
+            rate_limit=RateLimitScheduler() if rate_limit else None,
+        ) as api:
             return await func(api, args)
 
-    loop_owner = False
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop_owner = True
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    return _run_until_complete(run_async())
 
-    try:
-        retval = loop.run_until_complete(run_async())
-    finally:
-        if loop_owner:
-            loop.close()
-    return retval
+
+@dataclass
+class GitHubScriptResult:
+    """
+    Result of running a GitHub script for a single repository
+
+    Attributes:
+        repository: The repository (owner/name) the script has been run for
+        return_code: Return value of the github_script coroutine. None if the
+            script raised an error.
+        error: The error raised by the script if any
+    """
+
+    repository: str
+    return_code: int | None = None
+    error: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        """
+        True if the script didn't raise an error and returned 0
+        """
+        return self.error is None and self.return_code == 0
+
+
+async def fan_out_github_script(
+    func: Callable[[GitHubAsyncRESTApi, Namespace], Awaitable[int]],
+    api: GitHubAsyncRESTApi,
+    args: Namespace,
+    repositories: Iterable[str] | AsyncIterable[str],
+    *,
+    concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    argument: str = DEFAULT_FAN_OUT_ARGUMENT,
+) -> list[GitHubScriptResult]:
+    """
+    Run a github_script coroutine function concurrently for many repositories
+
+    For each repository the script is called with a copy of the arguments
+    where the attribute named by argument is set to the repository. All
+    scripts share the same API client.
+
+    Args:
+        func: The github_script coroutine function
+        api: GitHub REST API to pass to the script
+        args: Arguments forwarded to the script function
+        repositories: The repositories (owner/name) to run the script for
+        concurrency: Maximum number of scripts running at the same time
+        argument: Name of the argument to set to the repository
+
+    Returns:
+        The results in the order of the repositories. Errors raised by the
+        script are collected in the results and don't stop the other runs.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.api import GitHubAsyncRESTApi
+            from pontos.github.script import fan_out_github_script
+
+            async def github_script(api, args):
+                ...
+
+            async with GitHubAsyncRESTApi(token) as api:
+                results = await fan_out_github_script(
+                    github_script, api, args, ["foo/bar", "foo/baz"]
+                )
+                for result in results:
+                    print(result.repository, result.success)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_for(repository: str) -> int:
+        script_args = Namespace(**vars(args))
+        setattr(script_args, argument, repository)
+        async with semaphore:
+            return await func(api, script_args)
+
+    if isinstance(repositories, AsyncIterable):
+        repositories = [repository async for repository in repositories]
+    else:
+        repositories = list(repositories)
+
+    return_codes = await asyncio.gather(
+        *(run_for(repository) for repository in repositories),
+        return_exceptions=True,
+    )
+
+    results = []
+    for repository, return_code in zip(repositories, return_codes):
+        if isinstance(return_code, Exception):
+            results.append(GitHubScriptResult(repository, error=return_code))
+        elif isinstance(return_code, BaseException):
+            raise return_code
+        else:
+            results.append(
+                GitHubScriptResult(repository, return_code=return_code)
+            )
+    return results
+
+
+async def _organization_repositories(
+    api: GitHubAsyncRESTApi, organization: str
+) -> AsyncIterator[str]:
+    async for repository in api.organizations.get_repositories(organization):
+        yield repository.full_name
+
+
+def run_github_script_function_fan_out(
+    module: ModuleType,
+    token: str,
+    timeout: float,
+    args: Namespace,
+    *,
+    repositories: Iterable[str] | None = None,
+    organization: str | None = None,
+    concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY,
+    argument: str = DEFAULT_FAN_OUT_ARGUMENT,
+    rate_limit: bool = False,
+) -> list[GitHubScriptResult]:
+    """
+    Run a github_script function from a Python module for many repositories
+
+    The script runs concurrently for all repositories using a single GitHub
+    API client. The argument named by argument is set to the current
+    repository for each run.
+
+    Args:
+        module: Module that the GitHub script function contains
+        token: A GitHub token for authentication
+        timeout: Timeout for the GitHub requests in seconds
+        args: Arguments forwarded to the script function
+        repositories: The repositories (owner/name) to run the script for
+        organization: Run the script for all repositories of this
+            organization
+        concurrency: Maximum number of scripts running at the same time
+        argument: Name of the argument to set to the repository
+        rate_limit: Respect the GitHub rate limits if True
+
+    Raises:
+        GitHubScriptError: If the module doesn't have a github_script function,
+            if the github_script function is not an async coroutine or if
+            neither repositories nor an organization is passed.
+
+    Returns:
+        The results for all repositories
+
+    Example:
+        .. code-block:: python
+
+            from pontos.github.script import (
+                load_script,
+                run_github_script_function_fan_out,
+            )
+
+            with load_script("path/to/script.py") as module:
+                results = run_github_script_function_fan_out(
+                    module, token, 60.0, args, organization="foo"
+                )
+    """
+    func = _get_github_script_function(module)
+
+    if repositories is None and not organization:
+        raise GitHubScriptError(
+            "Either repositories or an organization is required for running "
+            "a GitHub script for many repositories."
+        )
+
+    async def run_async() -> list[GitHubScriptResult]:
+        async with GitHubAsyncRESTApi(
+            token,
+            timeout=Timeout(timeout),
+            rate_limit=RateLimitScheduler() if rate_limit else None,
+        ) as api:
+            targets: Iterable[str] | AsyncIterable[str] = (
+                repositories
+                if repositories is not None
+                else _organization_repositories(api, organization)  # type: ignore[arg-type]
+            )
+            return await fan_out_github_script(
+                func,
+                api,
+                args,
+                targets,
+                concurrency=concurrency,
+                argument=argument,
+            )
+
+    return _run_until_complete(run_async())
 
 
 def run_add_arguments_function(
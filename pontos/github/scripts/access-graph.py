@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG  # noqa: N999
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+This script builds or loads the access graph of an organization and prints
+who has access to a repository or which repositories a user can access
+"""
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from pontos.github.api import AccessGraph, GitHubAsyncRESTApi
+from pontos.github.models.base import Permission
+
+
+def add_script_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("organization")
+    parser.add_argument(
+        "--graph",
+        type=Path,
+        default=Path("access.json"),
+        help="Path to the local access graph file. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Build the graph again even if a local graph exists",
+    )
+    parser.add_argument(
+        "--collaborators",
+        action="store_true",
+        help="Include the direct collaborators of all repositories",
+    )
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument(
+        "--repository",
+        help="Print the users with access to this repository (owner/name)",
+    )
+    query.add_argument(
+        "--user", help="Print the repositories this user can access"
+    )
+    parser.add_argument(
+        "--permission",
+        choices=[p.value for p in Permission],
+        default=Permission.PULL.value,
+        help="Minimum permission for --repository. Default: %(default)s",
+    )
+
+
+async def github_script(api: GitHubAsyncRESTApi, args: Namespace) -> int:
+    graph = None if args.refresh else AccessGraph.load(args.graph)
+    if not graph or graph.organization != args.organization:
+        graph = await api.access_graph.build(
+            args.organization, include_collaborators=args.collaborators
+        )
+        graph.save(args.graph)
+
+    if args.repository:
+        permissions = graph.users(args.repository, args.permission)
+    elif args.user:
+        permissions = graph.repositories(args.user)
+    else:
+        print(
+            f"{len(graph.members)} members, "
+            f"{len(graph.outside_collaborators)} outside collaborators and "
+            f"{len(graph.teams)} teams in {graph.organization} as of "
+            f"{graph.taken_at:%Y-%m-%d %H:%M}."
+        )
+        return 0
+
+    for name, permission in permissions.items():
+        print(f"{name} {permission}")
+    return 0
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG  # noqa: N999
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+This script deletes the artifacts of a given repository according to a
+retention policy
+"""
+
+from argparse import ArgumentParser, Namespace
+from datetime import timedelta
+
+from pontos.github.api import ArtifactRetentionPolicy, GitHubAsyncRESTApi
+
+MIB = 1024 * 1024
+
+
+def add_script_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("repository")
+    parser.add_argument(
+        "--max-age",
+        type=int,
+        metavar="DAYS",
+        help="Delete artifacts older than DAYS days",
+    )
+    parser.add_argument(
+        "--keep-last",
+        type=int,
+        metavar="N",
+        help="Keep only the newest N artifacts per artifact name",
+    )
+    parser.add_argument(
+        "--max-total-size",
+        type=int,
+        metavar="MIB",
+        help="Delete the oldest artifacts until the remaining artifacts use "
+        "at most MIB MiB",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Number of parallel requests. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only print the artifacts to delete",
+    )
+
+
+async def github_script(api: GitHubAsyncRESTApi, args: Namespace) -> int:
+    policy = ArtifactRetentionPolicy(
+        max_age=(
+            timedelta(days=args.max_age) if args.max_age is not None else None
+        ),
+        keep_last=args.keep_last,
+        max_total_size=(
+            args.max_total_size * MIB
+            if args.max_total_size is not None
+            else None
+        ),
+    )
+    artifacts = await api.artifacts.cleanup(
+        args.repository,
+        policy,
+        concurrency=args.concurrency,
+        dry_run=args.dry_run,
+    )
+
+    for artifact in artifacts:
+        print(f"{artifact.id} {artifact.name} {artifact.created_at}")
+
+    size = sum(artifact.size_in_bytes for artifact in artifacts)
+    action = "Would delete" if args.dry_run else "Deleted"
+    print(f"{action} {len(artifacts)} artifacts with {size / MIB:.2f} MiB.")
+    return 0
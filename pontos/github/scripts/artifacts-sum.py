@@ -10,29 +10,52 @@ This script prints out all artifacts of a given repository
 from argparse import ArgumentParser, Namespace
 
 from rich.console import Console
+from rich.table import Table
 
-from pontos.github.api import GitHubAsyncRESTApi
+from pontos.github.api import ArtifactSummary, GitHubAsyncRESTApi
+
+MIB = 1024 * 1024
 
 
 def add_script_arguments(parser: ArgumentParser) -> None:
     parser.add_argument("repository")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Number of pages to request in parallel. Default: %(default)s",
+    )
+
+
+def summary_table(title: str, summaries: dict[str, ArtifactSummary]) -> Table:
+    table = Table(title=title)
+    table.add_column(title)
+    table.add_column("Artifacts", justify="right")
+    table.add_column("Expired", justify="right")
+    table.add_column("Size (in MiB)", justify="right")
+
+    for name, summary in sorted(
+        summaries.items(), key=lambda item: item[1].size_in_bytes, reverse=True
+    ):
+        table.add_row(
+            name or "-",
+            str(summary.count),
+            str(summary.expired),
+            f"{summary.size_in_bytes / MIB:.2f}",
+        )
+    return table
 
 
 async def github_script(api: GitHubAsyncRESTApi, args: Namespace) -> int:
-    count = 0
-    expired = 0
-    size = 0.0
-    async for artifact in api.artifacts.get_all(args.repository):
-        count += 1
-        if artifact.expired:
-            expired += 1
-            continue
-
-        size += artifact.size_in_bytes / (1024 * 1024)
+    statistics = await api.artifacts.statistics(
+        args.repository, concurrency=args.concurrency
+    )
 
     console = Console()
-    console.print(f"{count} artifacts.")
-    console.print(f"{expired} expired.")
-    console.print(f"Size {size:.2f} MiB")
+    console.print(summary_table("Branch", statistics.by_branch))
+    console.print(summary_table("Age", statistics.by_age))
+    console.print(f"{statistics.total.count} artifacts.")
+    console.print(f"{statistics.total.expired} expired.")
+    console.print(f"Size {statistics.total.size_in_bytes / MIB:.2f} MiB")
 
     return 0
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+This script takes an inventory snapshot of all repositories of an
+organization and reports repositories without a protected default branch,
+with open dependabot alerts or missing a topic. Only repositories changed
+since the previous snapshot are requested again.
+"""
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from pontos.github.api import GitHubAsyncRESTApi, InventorySnapshot
+from pontos.github.api.inventory import DEFAULT_INVENTORY_CONCURRENCY
+from pontos.github.models.organization import RepositoryType
+
+
+def add_script_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("organization")
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        default=Path("inventory.json"),
+        help="Path to the local snapshot file. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--type",
+        choices=[f.value for f in RepositoryType],
+        default=RepositoryType.ALL.value,
+        help="Only include repositories of this type. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--topic",
+        help="Report repositories missing this topic. By default "
+        "repositories without any topic are reported.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_INVENTORY_CONCURRENCY,
+        help="Number of repositories to request in parallel. "
+        "Default: %(default)s",
+    )
+
+
+def print_section(title: str, names: list[str]) -> None:
+    print(f"{title} ({len(names)}):")
+    for name in names:
+        print(f"  {name}")
+
+
+async def github_script(api: GitHubAsyncRESTApi, args: Namespace) -> int:
+    previous = InventorySnapshot.load(args.snapshot)
+    snapshot = await api.inventory.snapshot(
+        args.organization,
+        previous=previous,
+        repository_type=args.type,
+        concurrency=args.concurrency,
+    )
+    snapshot.save(args.snapshot)
+
+    print(
+        f"Requested {len(snapshot.refetched)} of "
+        f"{len(snapshot.repositories)} repositories."
+    )
+    print_section(
+        "Unprotected default branch",
+        [repository.name for repository in snapshot.unprotected()],
+    )
+    print_section(
+        "Open dependabot alerts",
+        [
+            f"{repository.name}: {repository.open_dependabot_alerts}"
+            for repository in snapshot.with_dependabot_alerts()
+        ],
+    )
+    print_section(
+        f"Missing topic {args.topic}" if args.topic else "Without topics",
+        [repository.name for repository in snapshot.without_topic(args.topic)],
+    )
+
+    if previous:
+        diff = snapshot.diff(previous)
+        print_section("Added", diff.added)
+        print_section("Removed", diff.removed)
+        print_section(
+            "Changed",
+            [
+                f"{name}: "
+                + ", ".join(
+                    f"{key} {old} -> {new}"
+                    for key, (old, new) in changes.items()
+                )
+                for name, changes in diff.changed.items()
+            ],
+        )
+
+    return 0
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG  # noqa: N999
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+This script deletes the versions of a package according to a retention
+policy
+"""
+
+from argparse import ArgumentParser, Namespace
+from datetime import timedelta
+
+from pontos.github.api import GitHubAsyncRESTApi, PackageRetentionPolicy
+from pontos.github.api.packages import DEFAULT_PACKAGES_CONCURRENCY
+from pontos.github.models.packages import PackageType
+
+
+def package_type(value: str) -> PackageType:
+    if isinstance(value, PackageType):
+        return value
+    return PackageType(value.lower())
+
+
+def add_script_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("organization", help="organization name")
+    parser.add_argument("package", help="package name")
+    parser.add_argument(
+        "--package-type",
+        type=package_type,
+        help="package type",
+        default=PackageType.CONTAINER,
+    )
+    parser.add_argument(
+        "--untagged",
+        action="store_true",
+        help="Delete versions without any tag. WARNING: This also deletes "
+        "the untagged per platform manifests of multi-arch container images "
+        "and breaks their tagged images.",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=int,
+        metavar="DAYS",
+        help="Delete versions older than DAYS days",
+    )
+    parser.add_argument(
+        "--keep-last",
+        type=int,
+        metavar="N",
+        help="Keep only the newest N versions per tag prefix",
+    )
+    parser.add_argument(
+        "--tag-prefix",
+        action="append",
+        default=[],
+        dest="tag_prefixes",
+        help="Tag prefix for grouping versions with --keep-last. Can be "
+        "passed several times.",
+    )
+    parser.add_argument(
+        "--protect",
+        action="append",
+        default=[],
+        metavar="TAG",
+        help="Never delete versions with this tag. Can be passed several "
+        "times.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_PACKAGES_CONCURRENCY,
+        help="Number of parallel requests. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only print the versions to delete",
+    )
+
+
+async def github_script(api: GitHubAsyncRESTApi, args: Namespace) -> int:
+    policy = PackageRetentionPolicy(
+        delete_untagged=args.untagged,
+        max_age=(
+            timedelta(days=args.max_age) if args.max_age is not None else None
+        ),
+        keep_last=args.keep_last,
+        tag_prefixes=tuple(args.tag_prefixes),
+        protected_tags=frozenset(args.protect),
+    )
+    versions = await api.packages.prune(
+        args.organization,
+        args.package_type,
+        args.package,
+        policy,
+        concurrency=args.concurrency,
+        dry_run=args.dry_run,
+    )
+
+    for version in versions:
+        tags = ", ".join(version.metadata.container.tags) or "untagged"
+        print(f"{version.id} {version.name} {version.created_at} ({tags})")
+
+    action = "Would delete" if args.dry_run else "Deleted"
+    print(f"{action} {len(versions)} versions of {args.package}.")
+    return 0
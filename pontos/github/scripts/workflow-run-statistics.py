@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG  # noqa: N999
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+This script synchronizes the workflow runs of a repository into a local
+history and prints duration percentiles and failure rates per workflow and
+branch
+"""
+
+from argparse import ArgumentParser, Namespace
+from datetime import timedelta
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from pontos.github.api import GitHubAsyncRESTApi, WorkflowRunHistory
+
+
+def add_script_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("repository")
+    parser.add_argument(
+        "--database",
+        type=Path,
+        default=Path("workflow-runs.db"),
+        help="Path to the local history database. Default: %(default)s",
+    )
+    parser.add_argument("--workflow", help="Only show this workflow.")
+    parser.add_argument("--branch", help="Only show this branch.")
+
+
+def format_duration(duration: timedelta | None) -> str:
+    return str(duration).split(".")[0] if duration is not None else "-"
+
+
+async def github_script(api: GitHubAsyncRESTApi, args: Namespace) -> int:
+    with WorkflowRunHistory(args.database) as history:
+        count = await history.sync(api.workflows, args.repository)
+        print(f"Synchronized {count} workflow runs.")
+
+        table = Table()
+        table.add_column("Workflow")
+        table.add_column("Branch")
+        table.add_column("Runs", justify="right")
+        table.add_column("Failure Rate", justify="right")
+        table.add_column("Queue p50", justify="right")
+        table.add_column("Queue p90", justify="right")
+        table.add_column("Run p50", justify="right")
+        table.add_column("Run p90", justify="right")
+        table.add_column("Run p99", justify="right")
+
+        for statistics in history.statistics(
+            args.repository, workflow=args.workflow, branch=args.branch
+        ):
+            queue = statistics.queue
+            run = statistics.run
+            table.add_row(
+                statistics.workflow,
+                statistics.branch,
+                str(statistics.count),
+                f"{statistics.failure_rate:.1%}",
+                format_duration(queue.p50 if queue else None),
+                format_duration(queue.p90 if queue else None),
+                format_duration(run.p50 if run else None),
+                format_duration(run.p90 if run else None),
+                format_duration(run.p99 if run else None),
+            )
+
+    console = Console()
+    console.print(table)
+    return 0
@@ -10,10 +10,14 @@ from collections.abc import Callable
 import httpx
 
 from pontos.nvd.cpe.api import CPEApi
+from pontos.nvd.cpe.dictionary import CPEDictionary
 
 from ._parser import cpe_parser, cpes_parser
 
-__all__ = ("CPEApi",)
+__all__ = (
+    "CPEApi",
+    "CPEDictionary",
+)
 
 
 async def query_cpe(args: Namespace) -> None:
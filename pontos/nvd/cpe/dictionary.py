@@ -0,0 +1,336 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from os import PathLike
+from types import TracebackType
+from typing import Any
+from uuid import UUID
+
+from typing_extensions import Self
+
+from pontos.errors import PontosError
+from pontos.nvd.api import now
+from pontos.nvd.cpe.api import CPEApi
+from pontos.nvd.models.cpe import CPE
+
+__all__ = ("CPEDictionary",)
+
+# the NVD API allows a maximum range of 120 consecutive days for the last
+# modified start and end dates
+MAX_LAST_MODIFIED_RANGE = timedelta(days=120)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cpes (
+    cpe_name_id TEXT PRIMARY KEY,
+    cpe_name TEXT NOT NULL,
+    deprecated INTEGER NOT NULL,
+    last_modified TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cpes_cpe_name ON cpes (cpe_name);
+CREATE TABLE IF NOT EXISTS deprecations (
+    cpe_name_id TEXT NOT NULL,
+    deprecated_by_cpe_name TEXT,
+    deprecated_by_cpe_name_id TEXT
+);
+CREATE INDEX IF NOT EXISTS deprecations_cpe_name_id
+    ON deprecations (cpe_name_id);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_LAST_SYNC_KEY = "last_sync"
+
+
+class CPEDictionary:
+    """
+    A local copy of the NIST NVD CPE dictionary
+
+    The dictionary is stored in a SQLite database and is kept up to date
+    incrementally by only requesting the CPEs that have been modified since
+    the last synchronization. CPEs can be looked up by their CPE Name ID and
+    by their CPE name without sending requests to the NVD API.
+
+    Should be used as a context manager.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.nvd.cpe import CPEApi, CPEDictionary
+
+            with CPEDictionary("cpes.db") as dictionary:
+                async with CPEApi(token="...") as api:
+                    await dictionary.sync(api)
+
+                cpe = dictionary.get_by_name(
+                    "cpe:2.3:o:microsoft:windows_10_22h2:-:*:*:*:*:*:arm64:*"
+                )
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """
+        Create a new CPE dictionary
+
+        Args:
+            path: Path to the SQLite database file. The file is created if it
+                doesn't exist yet. Use ":memory:" for a non persistent
+                dictionary.
+        """
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if not self._connection:
+            raise PontosError(
+                f"{self.__class__.__name__} has not been opened yet."
+            )
+        return self._connection
+
+    def open(self) -> None:
+        """
+        Open the database and create the required tables if necessary
+        """
+        if self._connection:
+            return
+
+        self._connection = sqlite3.connect(self._path)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Close the database
+        """
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    @property
+    def last_sync(self) -> datetime | None:
+        """
+        Date of the last successful synchronization or None if the dictionary
+        has never been synchronized
+        """
+        row = self._db.execute(
+            "SELECT value FROM metadata WHERE key = ?", (_LAST_SYNC_KEY,)
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def _set_last_sync(self, last_sync: datetime) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            (_LAST_SYNC_KEY, last_sync.isoformat()),
+        )
+
+    def _store(self, products: list[dict[str, Any]]) -> int:
+        cpes = []
+        deprecations = []
+        for product in products:
+            data = product["cpe"]
+            cpe_name_id = str(data["cpe_name_id"]).upper()
+            cpes.append(
+                (
+                    cpe_name_id,
+                    data["cpe_name"],
+                    int(bool(data.get("deprecated"))),
+                    data["last_modified"],
+                    json.dumps(data),
+                )
+            )
+            for deprecated_by in data.get("deprecated_by") or []:
+                deprecated_by_id = deprecated_by.get("cpe_name_id")
+                deprecations.append(
+                    (
+                        cpe_name_id,
+                        deprecated_by.get("cpe_name"),
+                        str(deprecated_by_id).upper()
+                        if deprecated_by_id
+                        else None,
+                    )
+                )
+
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM deprecations WHERE cpe_name_id = ?",
+                ((cpe[0],) for cpe in cpes),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO cpes "
+                "(cpe_name_id, cpe_name, deprecated, last_modified, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                cpes,
+            )
+            self._db.executemany(
+                "INSERT INTO deprecations (cpe_name_id, "
+                "deprecated_by_cpe_name, deprecated_by_cpe_name_id) "
+                "VALUES (?, ?, ?)",
+                deprecations,
+            )
+
+        return len(cpes)
+
+    async def sync(
+        self, api: CPEApi, *, results_per_page: int | None = None
+    ) -> int:
+        """
+        Synchronize the local dictionary with the NVD
+
+        The first synchronization downloads the complete CPE dictionary. All
+        following synchronizations only download the CPEs that have been
+        modified since the last synchronization.
+
+        Args:
+            api: The CPE API to use for requesting the CPEs
+            results_per_page: Number of CPEs to request per page
+
+        Returns:
+            The number of added or updated CPEs
+        """
+        sync_start = now()
+        last_sync = self.last_sync
+
+        if last_sync:
+            ranges: list[tuple[datetime | None, datetime | None]] = []
+            start = last_sync
+            while start < sync_start:
+                end = min(start + MAX_LAST_MODIFIED_RANGE, sync_start)
+                ranges.append((start, end))
+                start = end
+        else:
+            ranges = [(None, None)]
+
+        count = 0
+        for start_date, end_date in ranges:
+            results = api.cpes(
+                last_modified_start_date=start_date,
+                last_modified_end_date=end_date,
+                results_per_page=results_per_page,
+            )
+            while data := await results.json():
+                count += self._store(data.get("products", []))  # type: ignore
+
+        with self._db:
+            self._set_last_sync(sync_start)
+
+        return count
+
+    @staticmethod
+    def _to_cpe(row: tuple[str] | None) -> CPE | None:
+        return CPE.from_dict(json.loads(row[0])) if row else None
+
+    def get(self, cpe_name_id: str | UUID) -> CPE | None:
+        """
+        Get a CPE by its CPE Name ID
+
+        Args:
+            cpe_name_id: UUID of the CPE
+
+        Returns:
+            The CPE or None if the CPE isn't known
+        """
+        row = self._db.execute(
+            "SELECT data FROM cpes WHERE cpe_name_id = ?",
+            (str(cpe_name_id).upper(),),
+        ).fetchone()
+        return self._to_cpe(row)
+
+    def get_by_name(self, cpe_name: str) -> CPE | None:
+        """
+        Get a CPE by its CPE name
+
+        Args:
+            cpe_name: Name of the CPE, for example
+                cpe:2.3:o:microsoft:windows_10_22h2:-:*:*:*:*:*:arm64:*
+
+        Returns:
+            The CPE or None if the CPE isn't known
+        """
+        row = self._db.execute(
+            "SELECT data FROM cpes WHERE cpe_name = ?", (cpe_name,)
+        ).fetchone()
+        return self._to_cpe(row)
+
+    def deprecated_by(self, cpe_name_id: str | UUID) -> list[CPE]:
+        """
+        Get the CPEs that replace a deprecated CPE
+
+        Deprecations are followed transitively until CPEs are found that
+        aren't deprecated anymore.
+
+        Args:
+            cpe_name_id: UUID of the deprecated CPE
+
+        Returns:
+            The replacing CPEs. An empty list if the CPE isn't deprecated or
+            the replacing CPEs aren't known.
+        """
+        seen = {str(cpe_name_id).upper()}
+        pending = list(seen)
+        replacements: list[CPE] = []
+
+        while pending:
+            current = pending.pop()
+            rows = self._db.execute(
+                "SELECT deprecated_by_cpe_name, deprecated_by_cpe_name_id "
+                "FROM deprecations WHERE cpe_name_id = ?",
+                (current,),
+            ).fetchall()
+            for cpe_name, deprecated_by_id in rows:
+                cpe = (
+                    self.get(deprecated_by_id)
+                    if deprecated_by_id
+                    else self.get_by_name(cpe_name)
+                )
+                if not cpe:
+                    continue
+
+                replacement_id = str(cpe.cpe_name_id).upper()
+                if replacement_id in seen:
+                    continue
+
+                seen.add(replacement_id)
+                if cpe.deprecated:
+                    pending.append(replacement_id)
+                else:
+                    replacements.append(cpe)
+
+        return replacements
+
+    def __iter__(self) -> Iterator[CPE]:
+        for row in self._db.execute("SELECT data FROM cpes"):
+            yield self._to_cpe(row)  # type: ignore[misc]
+
+    def __contains__(self, cpe_name_id: object) -> bool:
+        if not isinstance(cpe_name_id, str | UUID):
+            return False
+
+        return (
+            self._db.execute(
+                "SELECT 1 FROM cpes WHERE cpe_name_id = ?",
+                (str(cpe_name_id).upper(),),
+            ).fetchone()
+            is not None
+        )
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM cpes").fetchone()[0]
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -11,13 +11,12 @@ Also it appends a header if it is missing in the file.
 import io
 import re
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from functools import cache
 from pathlib import Path
 
-from pontos.errors import PontosError
-from pontos.git import Git
+from pontos.git import Git, GitError
 from pontos.terminal.null import NullTerminal
 from pontos.terminal.rich import RichTerminal
 
@@ -66,14 +65,17 @@ OLD_LINES = [
 ]
 
 
-def _get_modified_year(f: Path) -> str:
-    """In case of the changed arg, update year to last modified year"""
+def _get_modified_years(files: Iterable[Path]) -> dict[Path, str]:
+    """
+    In case of the changed arg, get the last modified years of all files with
+    a single walk of the git history
+    """
     try:
-        ret = Git().log("-1", "--date=format:%Y", str(f), format="%ad")[0]
-    except IndexError:
-        raise PontosError(f'Empty "git log -1" output for {f}.')
+        modified = Git().last_modified(files)
+    except GitError:
+        return {}
 
-    return ret
+    return {path: str(date.year) for path, date in modified.items()}
 
 
 @dataclass
@@ -418,15 +420,18 @@ def main(args: Sequence[str] | None = None) -> None:
         term.error("Specify files to update!")
         sys.exit(1)
 
+    modified_years = _get_modified_years(files) if changed else {}
+
     for file in files:
         try:
             if file.absolute() in exclude_list:
                 term.warning(f"{file}: Ignoring file from exclusion list.")
             else:
+                file_year = year
                 if changed:
                     try:
-                        year = _get_modified_year(file)
-                    except PontosError:
+                        file_year = modified_years[file.resolve()]
+                    except KeyError:
                         term.warning(
                             f"{file}: Could not get date of last modification"
                             f" via git, using {year} instead."
@@ -434,7 +439,7 @@ def main(args: Sequence[str] | None = None) -> None:
 
                 update_file(
                     file,
-                    year,
+                    file_year,
                     license_id,
                     company,
                     cleanup=cleanup,
@@ -7,10 +7,12 @@ from .__version__ import __version__
 from ._calculator import VersionCalculator
 from ._errors import VersionError
 from ._main import main
+from ._tag_index import TagIndex
 from ._version import ParseVersionFuncType, Version, VersionUpdate
 
 __all__ = (
     "ParseVersionFuncType",
+    "TagIndex",
     "Version",
     "VersionCalculator",
     "VersionError",
@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import bisect
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from pontos.git import Git, GitError
+
+from ._errors import VersionError
+from ._version import ParseVersionFuncType, Version
+
+__all__ = ("TagIndex",)
+
+# increase if the format of the cache file changes
+_CACHE_FORMAT = 1
+
+
+def _scheme_name(parse_version: ParseVersionFuncType) -> str:
+    # parse_version is usually the classmethod of a versioning scheme
+    owner = getattr(parse_version, "__self__", None)
+    obj = owner if isinstance(owner, type) else parse_version
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+class TagIndex:
+    """
+    An index of the release versions of the git tags of a repository
+
+    All tags are read with a single git call. The parsed versions are
+    cached per tag object ID in the .git directory. Only new or changed tags
+    are parsed and inserted into the cached order, the other versions are
+    only created from the cache when requested. Looking up the last release
+    of a series doesn't depend on the number of tags.
+
+    For tags consisting of the prefix and a version the results are the same
+    as of :py:func:`pontos.version.helper.get_last_release_versions`. There
+    are two differences otherwise:
+
+    * Only a leading git_tag_prefix is removed from the tag. The helper
+      strips all characters of the prefix from both ends of the tag, for
+      example v1.0.0-dev becomes 1.0.0-de.
+    * The tags are ordered by their parsed versions instead of git's version
+      sort. Git sorts for example 1.0.0.dev1 after 1.0.0.
+
+    Example:
+        .. code-block:: python
+
+            from pontos.version import TagIndex
+            from pontos.version.schemes import PEP440VersioningScheme
+
+            index = TagIndex(
+                PEP440VersioningScheme.parse_version, git_tag_prefix="v"
+            )
+            last_release = index.last_release_version(
+                release_series="22.4", ignore_pre_releases=True
+            )
+    """
+
+    def __init__(
+        self,
+        parse_version: ParseVersionFuncType,
+        *,
+        git: Git | None = None,
+        git_tag_prefix: str | None = "",
+        cache: bool = True,
+    ) -> None:
+        """
+        Create a new tag index
+
+        Args:
+            parse_version: Function to parse the versions of the tags
+            git: Git instance to use
+            git_tag_prefix: Git tag prefix to remove before parsing a version
+            cache: Set to False to not read and write the cache file
+        """
+        self._parse_version = parse_version
+        self._git = git or Git()
+        self._git_tag_prefix = git_tag_prefix or ""
+        self._cache_path = self._get_cache_path() if cache else None
+
+        # version string, pre release flag and series keys per tag
+        self._entries: dict[str, dict[str, Any]] = {}
+        # tags with a valid version sorted ascending by version
+        self._order: list[str] = []
+        self._versions: dict[str, Version] = {}
+
+        self._load()
+
+        # ascending tags per release series. the whole index uses "" as key.
+        self._series: dict[str, list[str]] = {}
+        self._release_series: dict[str, list[str]] = {}
+        for tag in self._order:
+            entry = self._entries[tag]
+            for key in ("", *entry["series"]):
+                self._series.setdefault(key, []).append(tag)
+                if not entry["pre"]:
+                    self._release_series.setdefault(key, []).append(tag)
+
+    def _get_cache_path(self) -> Path | None:
+        try:
+            git_dir = self._git.exec("rev-parse", "--git-common-dir").strip()
+        except GitError:
+            return None
+
+        name = _scheme_name(self._parse_version).replace(".", "-")
+        return (
+            (self._git.cwd or Path.cwd())
+            / git_dir
+            / "pontos"
+            / f"tag-index-{name}.json"
+        )
+
+    def _read_cache(self) -> dict[str, Any]:
+        if not self._cache_path:
+            return {}
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            data.get("format") != _CACHE_FORMAT
+            or data.get("git_tag_prefix") != self._git_tag_prefix
+        ):
+            return {}
+        return data
+
+    def _write_cache(self, refs: dict[str, str]) -> None:
+        if not self._cache_path:
+            return
+
+        data = {
+            "format": _CACHE_FORMAT,
+            "git_tag_prefix": self._git_tag_prefix,
+            "tags": {
+                tag: {"sha": refs[tag], **entry}
+                for tag, entry in self._entries.items()
+            },
+            "order": self._order,
+        }
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._cache_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(data), encoding="utf8")
+            temp_path.replace(self._cache_path)
+        except OSError:
+            # the cache is an optimization only
+            pass
+
+    def _load(self) -> None:
+        refs = self._git.tag_refs()
+        data = self._read_cache()
+        cached: dict[str, dict[str, Any]] = data.get("tags", {})
+
+        # reuse the entries of all tags with an unchanged object ID
+        new_tags = []
+        for tag, sha in refs.items():
+            entry = cached.get(tag)
+            if entry and entry["sha"] == sha:
+                self._entries[tag] = {
+                    key: value for key, value in entry.items() if key != "sha"
+                }
+            else:
+                new_tags.append(tag)
+
+        # drop deleted and changed tags from the cached order
+        self._order = [
+            tag
+            for tag in data.get("order", [])
+            if self._entries.get(tag, {}).get("version") is not None
+        ]
+
+        if not new_tags and refs.keys() == cached.keys():
+            return
+
+        for tag in new_tags:
+            version_string = tag.removeprefix(self._git_tag_prefix)
+            try:
+                version = self._parse_version(version_string)
+            except VersionError:
+                # be safe and ignore invalid versions
+                self._entries[tag] = {"version": None}
+                continue
+
+            self._versions[tag] = version
+            self._entries[tag] = {
+                "version": version_string,
+                "pre": version.is_pre_release,
+                "series": [
+                    str(version.major),
+                    f"{version.major}.{version.minor}",
+                ],
+            }
+            # only the versions compared by the binary search are created
+            bisect.insort(self._order, tag, key=self._sort_key)
+
+        self._write_cache(refs)
+
+    def _sort_key(self, tag: str) -> tuple[Version, str]:
+        return self._version(tag), tag
+
+    def _version(self, tag: str) -> Version:
+        version = self._versions.get(tag)
+        if version is None:
+            version = self._parse_version(self._entries[tag]["version"])
+            self._versions[tag] = version
+        return version
+
+    def _tags(
+        self, release_series: str | None, ignore_pre_releases: bool | None
+    ) -> list[str]:
+        series = self._release_series if ignore_pre_releases else self._series
+        return series.get(release_series or "", [])
+
+    def last_release_version(
+        self,
+        *,
+        release_series: str | None = None,
+        ignore_pre_releases: bool | None = False,
+    ) -> Version | None:
+        """
+        Get the last release version
+
+        Args:
+            release_series: Only consider versions of this series, for
+                example "22" or "22.4"
+            ignore_pre_releases: Ignore pre releases and only consider non pre
+                releases. Default is False.
+
+        Returns:
+            The last released version or None if no version was found
+        """
+        tags = self._tags(release_series, ignore_pre_releases)
+        return self._version(tags[-1]) if tags else None
+
+    def last_release_versions(
+        self,
+        *,
+        release_series: str | None = None,
+        ignore_pre_releases: bool | None = False,
+    ) -> Iterator[Version]:
+        """
+        Get the released versions, newest first
+
+        Args:
+            release_series: Only consider versions of this series, for
+                example "22" or "22.4"
+            ignore_pre_releases: Ignore pre releases and only consider non pre
+                releases. Default is False.
+
+        Returns:
+            An iterator yielding the released versions
+        """
+        for tag in reversed(self._tags(release_series, ignore_pre_releases)):
+            yield self._version(tag)
+
+    def tag(self, version: Version) -> str | None:
+        """
+        Get the git tag of a version
+
+        Returns:
+            The name of the tag or None if the version isn't tagged
+        """
+        tags = self._tags(f"{version.major}.{version.minor}", False)
+        for tag in reversed(tags):
+            if self._version(tag) == version:
+                return tag
+        return None
+
+    def __len__(self) -> int:
+        return len(self._order)
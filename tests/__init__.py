@@ -5,7 +5,9 @@
 
 # pylint: disable=no-name-in-module,no-member,unnecessary-dunder-call
 
-from unittest import IsolatedAsyncioTestCase
+from contextlib import AbstractContextManager
+from typing import TypeVar
+from unittest import IsolatedAsyncioTestCase, TestCase
 from unittest.mock import AsyncMock
 
 from pontos.testing import AsyncIteratorMock
@@ -14,4 +16,20 @@ __all__ = (
     "AsyncIteratorMock",
     "AsyncMock",
     "IsolatedAsyncioTestCase",
+    "enter_context",
 )
+
+T = TypeVar("T")
+
+
+def enter_context(
+    test_case: TestCase, context_manager: AbstractContextManager[T]
+) -> T:
+    """
+    Enter a context manager and exit it during the cleanup of the test case
+
+    Like TestCase.enterContext which isn't available before Python 3.11
+    """
+    result = context_manager.__enter__()
+    test_case.addCleanup(context_manager.__exit__, None, None, None)
+    return result
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Compare the single pass commit classifier of ConventionalCommits with
+matching the commit types one by one
+
+Usage:
+    python -m tests.benchmarks.changelog_classifier [--messages N]
+"""
+
+import random
+import re
+import sys
+import timeit
+from argparse import ArgumentParser
+from pathlib import Path
+
+from pontos.changelog.conventional_commits import ConventionalCommits
+
+CONFIG = Path(__file__).parent.parent / "changelog" / "changelog.toml"
+
+PREFIXES = [
+    "Add:",
+    "Remove:",
+    "Change -",
+    "fix:",
+    "Doc:",
+    "Refactor:",
+    "Test:",
+    "Deps:",
+    "Merge",
+    "Bump",
+    "",
+]
+
+
+def compile_expressions(
+    conventional_commits: ConventionalCommits,
+) -> list[tuple[str, re.Pattern[str]]]:
+    return [
+        (
+            commit_type["group"],
+            re.compile(
+                rf"{commit_type['message']}\s?[:|-]", flags=re.IGNORECASE
+            ),
+        )
+        for commit_type in conventional_commits.commit_types()
+    ]
+
+
+def sequential_classify(
+    expressions: list[tuple[str, re.Pattern[str]]], message: str
+) -> list[list[str]]:
+    # the previous implementation trying each commit type in turn
+    classification = []
+    for group, reg in expressions:
+        match = reg.match(message)
+        if match:
+            cleaned_msg = message.replace(match.group(0), "").strip()
+            classification.append([group, cleaned_msg])
+    return classification
+
+
+def create_messages(count: int) -> list[str]:
+    generator = random.Random(42)
+    return [
+        f"{generator.choice(PREFIXES)} Update component {number} "
+        f"for issue #{generator.randint(1, 10000)}".strip()
+        for number in range(count)
+    ]
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    conventional_commits = ConventionalCommits(CONFIG)
+    expressions = compile_expressions(conventional_commits)
+    messages = create_messages(args.messages)
+
+    for message in messages:
+        expected = sequential_classify(expressions, message)
+        if conventional_commits._classify(message) != expected:
+            print(f"different classification of {message!r}", file=sys.stderr)
+            return 1
+
+    sequential_time = min(
+        timeit.repeat(
+            lambda: [
+                sequential_classify(expressions, message)
+                for message in messages
+            ],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    single_pass_time = min(
+        timeit.repeat(
+            lambda: [
+                conventional_commits._classify(message) for message in messages
+            ],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+
+    print(f"{len(messages)} messages")
+    print(f"one by one:  {sequential_time:.3f}s")
+    print(
+        f"single pass: {single_pass_time:.3f}s "
+        f"({sequential_time / single_pass_time:.1f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
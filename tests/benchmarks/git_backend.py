@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Compare the git read operations run as subprocesses with the in-process
+pygit2 backend on a synthetic repository
+
+Usage:
+    python -m tests.benchmarks.git_backend [--commits N] [--tags N]
+"""
+
+import sys
+import timeit
+from argparse import ArgumentParser
+from collections.abc import Callable
+from pathlib import Path
+
+from pontos.git import Git
+from pontos.git._pygit2 import is_available
+from pontos.testing import temp_git_repository
+
+
+def create_repository(path: Path, commits: int, tags: int) -> None:
+    git = Git(path)
+    git.add_remote("origin", "https://example.com/foo/bar.git")
+
+    tag_every = max(commits // tags, 1)
+    for number in range(commits):
+        file = path / f"file-{number % 50}.txt"
+        file.write_text(f"content {number}\n", encoding="utf8")
+        git.add(file)
+        git.commit(f"Change: Commit {number}\n\nBody {number}", gpg_sign=False)
+        if number % tag_every == 0:
+            git.tag(f"v1.{number}.0", gpg_key_id="", sign=False)
+
+    # uncommitted changes for git status
+    (path / "file-0.txt").write_text("changed\n", encoding="utf8")
+
+
+def operations(git: Git) -> dict[str, Callable[[], object]]:
+    return {
+        "list_tags": lambda: git.list_tags(tag_name="v1.*"),
+        "rev_list": lambda: git.rev_list("HEAD", max_parents=0),
+        "log": lambda: git.log("v1.0.0..HEAD", format="%H %s"),
+        "show": lambda: git.show(format="%H %s", patch=False, objects="HEAD"),
+        "remote_url": git.remote_url,
+        "status": lambda: [str(entry) for entry in git.status()],
+    }
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commits", type=int, default=200)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if not is_available():
+        print("pygit2 is not installed", file=sys.stderr)
+        return 1
+
+    with temp_git_repository() as path:
+        create_repository(path, args.commits, args.tags)
+
+        subprocess_operations = operations(Git(path))
+        in_process_operations = operations(Git(path, in_process=True))
+
+        print(f"{'operation':<12}{'subprocess':>14}{'in-process':>14}{'':>10}")
+        for name, operation in subprocess_operations.items():
+            in_process = in_process_operations[name]
+            if operation() != in_process():
+                print(f"{name}: different output", file=sys.stderr)
+                return 1
+
+            subprocess_time = (
+                min(timeit.repeat(operation, number=1, repeat=args.repeat))
+                * 1000
+            )
+            in_process_time = (
+                min(timeit.repeat(in_process, number=1, repeat=args.repeat))
+                * 1000
+            )
+            print(
+                f"{name:<12}{subprocess_time:>12.2f}ms{in_process_time:>12.2f}ms"
+                f"{subprocess_time / in_process_time:>9.1f}x"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
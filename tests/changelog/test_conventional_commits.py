@@ -15,6 +15,7 @@ from pontos.changelog.conventional_commits import (
     ConventionalCommits,
 )
 from pontos.testing import temp_directory
+from tests import enter_context
 
 
 @dataclass
@@ -528,6 +529,93 @@ class ConventionalCommitsTestCase(unittest.TestCase):
         self.assertEqual(commit_id, "42a42a4")
         self.assertEqual(message, "foo bar again")
 
+    def create(self, commit_types: str) -> ConventionalCommits:
+        config = enter_context(self, temp_directory()) / "changelog.toml"
+        config.write_text(f"commit_types = [{commit_types}]", encoding="utf8")
+        return ConventionalCommits(config)
+
+    def test_classify(self):
+        conventional_commits = ConventionalCommits()
+
+        self.assertEqual(
+            conventional_commits._classify("Add: foo"), [["Added", "foo"]]
+        )
+        self.assertEqual(
+            conventional_commits._classify("fix - foo"), [["Bug Fixes", "foo"]]
+        )
+        self.assertEqual(
+            conventional_commits._classify("DEPS: foo"),
+            [["Dependencies", "foo"]],
+        )
+        self.assertEqual(conventional_commits._classify("Adding foo"), [])
+        self.assertEqual(conventional_commits._classify("foo Add: bar"), [])
+
+    def test_classify_removes_prefix_only(self):
+        conventional_commits = ConventionalCommits()
+
+        self.assertEqual(
+            conventional_commits._classify("Add: foo Add: bar"),
+            [["Added", "foo Add: bar"]],
+        )
+
+    def test_classify_first_commit_type_wins(self):
+        conventional_commits = self.create(
+            '{ message = "^add", group = "Added"},'
+            '{ message = "^add", group = "Other"},'
+        )
+
+        self.assertEqual(
+            conventional_commits._classify("Add: foo"), [["Added", "foo"]]
+        )
+
+    def test_classify_groups_in_patterns(self):
+        conventional_commits = self.create(
+            '{ message = "^(add|new)", group = "Added"},'
+            '{ message = "^(?P<type>fix)", group = "Fixed"},'
+        )
+
+        self.assertEqual(
+            conventional_commits._classify("New: foo"), [["Added", "foo"]]
+        )
+        self.assertEqual(
+            conventional_commits._classify("Fix: foo"), [["Fixed", "foo"]]
+        )
+
+    def test_classify_fallback(self):
+        # patterns that can't be combined into a single expression
+        conventional_commits = self.create(
+            '{ message = "(?i)^add", group = "Added"},'
+            '{ message = "(?i)^fix", group = "Fixed"},'
+        )
+
+        self.assertIsNone(conventional_commits._classifier)
+        self.assertEqual(
+            conventional_commits._classify("Fix: foo"), [["Fixed", "foo"]]
+        )
+        self.assertEqual(conventional_commits._classify("Foo: bar"), [])
+
+    def test_classify_fallback_group_references(self):
+        # the group numbers change in a combined expression
+        for pattern, message in (
+            (r"^(x)\\1", "xx: foo"),
+            (r"^(x)?(?(1)y|z)", "xy: foo"),
+        ):
+            with self.subTest(pattern=pattern):
+                conventional_commits = self.create(
+                    '{ message = "^add", group = "Added"},'
+                    f'{{ message = "{pattern}", group = "Other"}},'
+                )
+
+                self.assertIsNone(conventional_commits._classifier)
+                self.assertEqual(
+                    conventional_commits._classify("Add: foo"),
+                    [["Added", "foo"]],
+                )
+                self.assertEqual(
+                    conventional_commits._classify(message),
+                    [["Other", "foo"]],
+                )
+
     def test_default_config(self):
         conventional_commits = ConventionalCommits()
 
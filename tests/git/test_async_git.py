@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from pontos.git import AsyncGit, Git, GitError, MergeStrategy, Status
+from pontos.git._async import exec_git_async
+from pontos.testing import temp_directory, temp_git_repository
+from tests import IsolatedAsyncioTestCase
+
+
+class ExecGitAsyncTestCase(IsolatedAsyncioTestCase):
+    async def test_exec(self):
+        output = await exec_git_async("--version")
+
+        self.assertTrue(output.startswith("git version"))
+
+    async def test_error(self):
+        with temp_directory() as tmp, self.assertRaises(GitError) as cm:
+            await exec_git_async("log", cwd=tmp)
+
+        self.assertEqual(cm.exception.cmd, ["git", "log"])
+        self.assertNotEqual(cm.exception.returncode, 0)
+        self.assertIn("not a git repository", cm.exception.stderr)
+
+    async def test_ignore_errors(self):
+        with temp_directory() as tmp:
+            output = await exec_git_async("log", cwd=tmp, ignore_errors=True)
+
+        self.assertEqual(output, "")
+
+
+class AsyncGitTestCase(IsolatedAsyncioTestCase):
+    @patch("pontos.git._async.exec_git_async", new_callable=AsyncMock)
+    async def test_exec(self, exec_git_mock: AsyncMock):
+        git = AsyncGit(Path("/foo"))
+        await git.exec("foo", "bar")
+
+        exec_git_mock.assert_awaited_once_with(
+            "foo", "bar", cwd=Path("/foo").absolute()
+        )
+
+    @patch("pontos.git._async.exec_git_async", new_callable=AsyncMock)
+    async def test_rebase(self, exec_git_mock: AsyncMock):
+        git = AsyncGit()
+        await git.rebase(
+            "base", head="head", onto="onto", strategy=MergeStrategy.ORT_OURS
+        )
+
+        exec_git_mock.assert_awaited_once_with(
+            "rebase",
+            "--strategy",
+            "ort",
+            "-X",
+            "ours",
+            "--onto",
+            "onto",
+            "base",
+            "head",
+            cwd=None,
+        )
+
+    @patch("pontos.git._async.exec_git_async", new_callable=AsyncMock)
+    async def test_push(self, exec_git_mock: AsyncMock):
+        git = AsyncGit()
+        await git.push(["foo", "bar"], remote="origin", follow_tags=True)
+
+        exec_git_mock.assert_awaited_once_with(
+            "push", "--follow-tags", "origin", "foo", "bar", cwd=None
+        )
+
+    @patch("pontos.git._async.exec_git_async", new_callable=AsyncMock)
+    async def test_list_tags_sorted(self, exec_git_mock: AsyncMock):
+        exec_git_mock.return_value = "v1.0.0\nv1.1.0\n"
+
+        git = AsyncGit()
+        tags = await git.list_tags(sort="version:refname", sort_suffix=["-rc"])
+
+        exec_git_mock.assert_awaited_once_with(
+            "-c",
+            "versionsort.suffix=-rc",
+            "tag",
+            "-l",
+            "--sort=version:refname",
+            cwd=None,
+        )
+        self.assertEqual(tags, ["v1.0.0", "v1.1.0"])
+
+    @patch("pontos.git._async.exec_git_async", new_callable=AsyncMock)
+    async def test_show_multiple_objects(self, exec_git_mock: AsyncMock):
+        exec_git_mock.return_value = "foo\nbar\n"
+
+        git = AsyncGit()
+        output = await git.show(format="%s", objects=["v1", "v2"])
+
+        exec_git_mock.assert_awaited_once_with(
+            "show", "--format=%s", "v1", "v2", cwd=None
+        )
+        self.assertEqual(output, ["foo", "bar"])
+
+    @patch("pontos.git._async.exec_git_async", new_callable=AsyncMock)
+    async def test_show_single_object(self, exec_git_mock: AsyncMock):
+        exec_git_mock.return_value = "foo\n"
+
+        git = AsyncGit()
+        output = await git.show(format="%s", objects="v1")
+
+        self.assertEqual(output, "foo")
+
+    async def test_version(self):
+        git = AsyncGit()
+
+        self.assertEqual(await git.version(), Git().version)
+
+    async def test_repository(self):
+        with temp_git_repository() as tmp:
+            git = AsyncGit(tmp)
+            (tmp / "foo.txt").write_text("foo", encoding="utf8")
+            await git.add("foo.txt")
+            await git.commit("Add foo", verify=False, gpg_sign=False)
+            await git.tag("v1.0.0", sign=False)
+
+            (tmp / "foo.txt").write_text("bar", encoding="utf8")
+            (tmp / "bar.txt").write_text("bar", encoding="utf8")
+            await git.add("bar.txt")
+
+            log, tags, status = await asyncio.gather(
+                git.log(format="%s"),
+                git.list_tags(),
+                git.status(),
+            )
+
+        self.assertEqual(log, ["Add foo"])
+        self.assertEqual(tags, ["v1.0.0"])
+        entries = {entry.path.name: entry for entry in status}
+        self.assertEqual(entries["bar.txt"].index, Status.ADDED)
+        self.assertEqual(entries["foo.txt"].working_tree, Status.MODIFIED)
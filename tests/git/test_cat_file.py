@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+
+from pontos.git import Git, GitCatFile, GitError
+from pontos.testing import temp_directory, temp_git_repository
+
+
+def create_commits(git: Git, count: int) -> None:
+    for i in range(count):
+        (git.cwd / "foo.txt").write_text(f"foo {i}\n", encoding="utf8")
+        git.add("foo.txt")
+        git.commit(f"Commit {i}", verify=False, gpg_sign=False)
+
+
+class GitCatFileTestCase(unittest.TestCase):
+    def test_get(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            create_commits(git, 1)
+
+            with git.cat_file() as cat_file:
+                blob = cat_file.get("HEAD:foo.txt")
+                commit = cat_file.get("HEAD")
+                missing = cat_file.get("HEAD:bar.txt")
+
+        self.assertEqual(blob.type, "blob")
+        self.assertEqual(blob.size, 6)
+        self.assertEqual(blob.content, b"foo 0\n")
+        self.assertEqual(blob.text, "foo 0\n")
+        self.assertEqual(len(blob.oid), 40)
+
+        self.assertEqual(commit.type, "commit")
+        self.assertIn("Commit 0", commit.text)
+
+        self.assertIsNone(missing)
+
+    def test_info(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            create_commits(git, 1)
+
+            with git.cat_file() as cat_file:
+                info = cat_file.info("HEAD:foo.txt")
+                missing = cat_file.info("unknown")
+
+        self.assertEqual(info.type, "blob")
+        self.assertEqual(info.size, 6)
+        self.assertIsNone(info.content)
+        self.assertIsNone(missing)
+
+    def test_get_many(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            create_commits(git, 20)
+            commits = git.rev_list("HEAD")
+
+            with git.cat_file() as cat_file:
+                objects = list(
+                    cat_file.get_many(
+                        [f"{commit}:foo.txt" for commit in commits]
+                        + ["HEAD:bar.txt"]
+                    )
+                )
+                infos = list(cat_file.info_many(commits))
+                # the session can still be used afterwards
+                head = cat_file.get("HEAD:foo.txt")
+
+        self.assertEqual(len(objects), 21)
+        self.assertEqual(
+            [obj.text for obj in objects[:-1]],
+            [f"foo {i}\n" for i in reversed(range(20))],
+        )
+        self.assertIsNone(objects[-1])
+        self.assertEqual([info.oid for info in infos], commits)
+        self.assertEqual(head.text, "foo 19\n")
+
+    def test_get_many_large_content(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            content = "x" * 1024 * 1024
+            (tmp / "large.txt").write_text(content, encoding="utf8")
+            git.add("large.txt")
+            git.commit("Add large file", verify=False, gpg_sign=False)
+
+            with git.cat_file() as cat_file:
+                objects = list(cat_file.get_many(["HEAD:large.txt"] * 100))
+
+        self.assertEqual(len(objects), 100)
+        self.assertTrue(all(obj.text == content for obj in objects))
+
+    def test_get_many_stop_early(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            create_commits(git, 10)
+            commits = git.rev_list("HEAD")
+
+            with git.cat_file() as cat_file:
+                for obj in cat_file.get_many(commits):
+                    self.assertEqual(obj.type, "commit")
+                    break
+
+                blob = cat_file.get("HEAD:foo.txt")
+
+        self.assertEqual(blob.text, "foo 9\n")
+
+    def test_not_a_repository(self):
+        with temp_directory() as tmp, GitCatFile(tmp) as cat_file:
+            with self.assertRaises(GitError) as cm:
+                cat_file.get("HEAD")
+
+            with self.assertRaises(GitError):
+                list(cat_file.get_many(["HEAD"]))
+
+        self.assertEqual(cm.exception.cmd, ["git", "cat-file", "--batch"])
+        self.assertIn("not a git repository", cm.exception.stderr)
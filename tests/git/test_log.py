@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from pontos.git import Git, GitCommit, GitError
+from pontos.git._git import stream_git
+from pontos.git._log import parse_git_log
+from pontos.testing import temp_directory, temp_git_repository
+from tests import enter_context
+
+SHA1 = "1" * 40
+SHA2 = "2" * 40
+SHA3 = "3" * 40
+
+
+def commit_fields(sha: str, parents: str, subject: str, body: str) -> list[str]:
+    return [
+        "\x1e",
+        sha,
+        parents,
+        "Foo Bar",
+        "foo@bar.com",
+        "2026-01-02T03:04:05+02:00",
+        "Lorem Ipsum",
+        "lorem@ipsum.com",
+        "2026-01-03T03:04:05+00:00",
+        subject,
+        body,
+    ]
+
+
+class ParseGitLogTestCase(unittest.TestCase):
+    def test_parse(self):
+        commits = list(
+            parse_git_log(
+                [
+                    *commit_fields(SHA3, f"{SHA1} {SHA2}", "Merge", ""),
+                    *commit_fields(SHA2, SHA1, "Change: Foo", "Some\nbody\n"),
+                    "\nfoo.txt",
+                    "bar/baz.txt",
+                    *commit_fields(SHA1, "", "Add: Initial", ""),
+                    "\nfoo.txt",
+                ]
+            )
+        )
+
+        self.assertEqual(len(commits), 3)
+
+        merge, change, initial = commits
+        self.assertEqual(merge.sha, SHA3)
+        self.assertEqual(merge.parents, [SHA1, SHA2])
+        self.assertEqual(merge.files, [])
+
+        self.assertEqual(
+            change,
+            GitCommit(
+                sha=SHA2,
+                parents=[SHA1],
+                author_name="Foo Bar",
+                author_email="foo@bar.com",
+                author_date=datetime(
+                    2026, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2))
+                ),
+                committer_name="Lorem Ipsum",
+                committer_email="lorem@ipsum.com",
+                committer_date=datetime(
+                    2026, 1, 3, 3, 4, 5, tzinfo=timezone.utc
+                ),
+                subject="Change: Foo",
+                body="Some\nbody",
+                files=["foo.txt", "bar/baz.txt"],
+            ),
+        )
+
+        self.assertEqual(initial.parents, [])
+        self.assertEqual(initial.files, ["foo.txt"])
+
+    def test_parse_missing_last_field(self):
+        commits = list(parse_git_log(commit_fields(SHA1, "", "Foo", "")[:-1]))
+
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(commits[0].body, "")
+
+    def test_parse_empty(self):
+        self.assertEqual(list(parse_git_log([])), [])
+
+
+class StreamGitTestCase(unittest.TestCase):
+    def test_stream(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            git.config("foo.bar", "baz")
+            git.config("foo.baz", "bar")
+
+            records = list(
+                stream_git("config", "-z", "--get-regexp", "^foo", cwd=tmp)
+            )
+
+        self.assertEqual(records, ["foo.bar\nbaz", "foo.baz\nbar"])
+
+    def test_error(self):
+        with temp_directory() as tmp, self.assertRaises(GitError) as cm:
+            list(stream_git("log", cwd=tmp))
+
+        self.assertEqual(cm.exception.cmd, ["git", "log"])
+        self.assertIn("not a git repository", cm.exception.stderr)
+
+
+class GitIterLogTestCase(unittest.TestCase):
+    def test_iter_log(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            for i in range(3):
+                (tmp / f"foo{i}.txt").write_text("foo", encoding="utf8")
+                (tmp / "bar.txt").write_text(f"bar {i}", encoding="utf8")
+                git.add([f"foo{i}.txt", "bar.txt"])
+                git.commit(
+                    f"Commit {i}\n\nBody {i}\nmore",
+                    verify=False,
+                    gpg_sign=False,
+                )
+            git.exec("commit", "--allow-empty", "--no-gpg-sign", "-m", "Empty")
+
+            commits = list(git.iter_log(files=True))
+            without_files = list(git.iter_log("HEAD~2..HEAD"))
+            shas = git.rev_list("HEAD")
+
+        self.assertEqual([commit.sha for commit in commits], shas)
+        self.assertEqual(
+            [commit.subject for commit in commits],
+            ["Empty", "Commit 2", "Commit 1", "Commit 0"],
+        )
+        self.assertEqual(commits[0].files, [])
+        self.assertEqual(commits[1].files, ["bar.txt", "foo2.txt"])
+        self.assertEqual(commits[1].body, "Body 2\nmore")
+        self.assertEqual(commits[1].parents, [shas[2]])
+        self.assertEqual(commits[3].parents, [])
+        self.assertEqual(commits[3].author_name, "Max Mustermann")
+        self.assertEqual(commits[3].author_email, "max.mustermann@example.com")
+        self.assertIsNotNone(commits[3].author_date.tzinfo)
+
+        self.assertEqual(len(without_files), 2)
+        self.assertTrue(all(not commit.files for commit in without_files))
+
+    def test_iter_log_stop_early(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            for i in range(5):
+                git.exec(
+                    "commit", "--allow-empty", "--no-gpg-sign", "-m", f"C{i}"
+                )
+
+            log = git.iter_log()
+            first = next(log)
+            log.close()
+
+        self.assertEqual(first.subject, "C4")
+
+    def test_iter_log_unknown_revision(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+
+            with self.assertRaises(GitError):
+                list(git.iter_log("foo..bar"))
+
+
+class GitLastModifiedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = enter_context(self, temp_git_repository())
+        self.git = Git(self.tmp)
+        (self.tmp / "sub").mkdir()
+        for date, files in (
+            ("2020-01-01T12:00:00+00:00", ["foo.txt", "sub/bar.txt"]),
+            ("2021-06-01T12:00:00+00:00", ["sub/bar.txt"]),
+            ("2022-03-01T12:00:00+00:00", ["baz.txt"]),
+        ):
+            for name in files:
+                (self.tmp / name).write_text(date, encoding="utf8")
+            self.git.add(files)
+            with patch.dict("os.environ", {"GIT_AUTHOR_DATE": date}):
+                self.git.commit("Update", verify=False, gpg_sign=False)
+
+    def test_all_files(self):
+        modified = self.git.last_modified()
+
+        tmp = self.tmp.resolve()
+        self.assertEqual(
+            {path: date.year for path, date in modified.items()},
+            {
+                tmp / "foo.txt": 2020,
+                tmp / "sub" / "bar.txt": 2021,
+                tmp / "baz.txt": 2022,
+            },
+        )
+
+    def test_files(self):
+        modified = self.git.last_modified(
+            [self.tmp / "sub" / "bar.txt", self.tmp / "unknown.txt"]
+        )
+
+        self.assertEqual(list(modified), [(self.tmp / "sub/bar.txt").resolve()])
+        self.assertEqual(
+            modified[(self.tmp / "sub/bar.txt").resolve()],
+            datetime(2021, 6, 1, 12, tzinfo=timezone.utc),
+        )
+
+    def test_no_files(self):
+        self.assertEqual(self.git.last_modified([]), {})
+
+    def test_not_a_repository(self):
+        with temp_directory() as tmp, self.assertRaises(GitError):
+            Git(tmp).last_modified()
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+import unittest
+from pathlib import Path
+
+from pontos.git import AsyncGit, Git, GitError, MultiGit
+from pontos.testing import temp_directory, temp_git_repository
+from tests import enter_context
+
+
+class MultiGitTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.upstream = enter_context(self, temp_git_repository())
+        self.tmp = enter_context(self, temp_directory())
+
+        self.git = Git(self.upstream)
+        (self.upstream / "foo.txt").write_text("foo", encoding="utf8")
+        self.git.add("foo.txt")
+        self.git.commit("Add foo", gpg_sign=False)
+
+        self.paths = [self.tmp / "a", self.tmp / "b", self.tmp / "c"]
+
+    def remote(self, path: Path) -> Path:
+        return self.tmp / "remotes" / f"{path.name}.git"
+
+    async def clone(self) -> None:
+        # a remote per clone to not push the same ref concurrently
+        for path in self.paths:
+            self.git.exec("clone", "--bare", "-q", ".", str(self.remote(path)))
+
+        results = await MultiGit(self.paths).clone(
+            lambda path: str(self.remote(path))
+        )
+        self.assertFalse(any(result.failed for result in results))
+
+    async def test_clone(self):
+        urls = []
+
+        def repo_url(path: Path) -> str:
+            urls.append(path)
+            return str(self.upstream)
+
+        results = await MultiGit(self.paths).clone(repo_url, branch="main")
+
+        self.assertEqual([result.path for result in results], self.paths)
+        self.assertFalse(any(result.failed for result in results))
+        self.assertCountEqual(urls, self.paths)
+        for path in self.paths:
+            self.assertTrue((path / "foo.txt").exists())
+
+    async def test_fetch(self):
+        await self.clone()
+        for path in self.paths:
+            Git(self.remote(path)).tag("v1.0.0", gpg_key_id="", sign=False)
+
+        results = await MultiGit(self.paths).fetch(
+            "origin", "refs/tags/*:refs/tags/*"
+        )
+
+        self.assertFalse(any(result.failed for result in results))
+        for path in self.paths:
+            self.assertEqual(Git(path).list_tags(), ["v1.0.0"])
+
+    async def test_tag_and_push(self):
+        await self.clone()
+        multi = MultiGit(self.paths, concurrency=2)
+
+        results = await multi.tag("v1.0.0", gpg_key_id="", sign=False)
+        self.assertFalse(any(result.failed for result in results))
+
+        results = await multi.push("v1.0.0", remote="origin")
+        self.assertFalse(any(result.failed for result in results))
+
+        for path in self.paths:
+            self.assertEqual(Git(self.remote(path)).list_tags(), ["v1.0.0"])
+
+    async def test_errors(self):
+        await self.clone()
+        no_repository = self.tmp / "d"
+        no_repository.mkdir()
+        self.paths.insert(1, no_repository)
+
+        results = await MultiGit(self.paths).run(
+            lambda git: git.rev_list("HEAD")
+        )
+
+        self.assertEqual([result.path for result in results], self.paths)
+        self.assertEqual(
+            [result.failed for result in results], [False, True, False, False]
+        )
+        self.assertIsInstance(results[1].error, GitError)
+        self.assertIsNone(results[1].result)
+        self.assertEqual(len(results[0].result), 1)
+
+    async def test_missing_path(self):
+        await self.clone()
+        self.paths.insert(1, self.tmp / "missing")
+
+        results = await MultiGit(self.paths).fetch("origin")
+
+        self.assertEqual([result.path for result in results], self.paths)
+        self.assertEqual(
+            [result.failed for result in results], [False, True, False, False]
+        )
+        self.assertIsInstance(results[1].error, OSError)
+
+    async def test_duplicate_paths(self):
+        await self.clone()
+        paths = [self.paths[0], self.paths[1], self.paths[0]]
+
+        results = await MultiGit(paths).run(lambda git: git.rev_list("HEAD"))
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual([result.path for result in results], paths)
+        self.assertFalse(any(result.failed for result in results))
+
+
+class MultiGitConcurrencyTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrency(self):
+        paths = [Path(f"repo-{number}") for number in range(5)]
+        running = 0
+        max_running = 0
+
+        async def operation(git: AsyncGit) -> Path:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return git.cwd
+
+        results = await MultiGit(paths, concurrency=2).run(operation)
+
+        self.assertEqual(max_running, 2)
+        self.assertEqual(
+            [result.result for result in results],
+            [path.absolute() for path in paths],
+        )
+
+    async def test_as_completed(self):
+        delays = {Path("slow"): 0.05, Path("fast"): 0.0}
+
+        async def operation(git: AsyncGit) -> None:
+            await asyncio.sleep(delays[Path(git.cwd.name)])
+
+        multi = MultiGit(delays)
+        paths = [result.path async for result in multi.as_completed(operation)]
+
+        self.assertEqual(paths, [Path("fast"), Path("slow")])
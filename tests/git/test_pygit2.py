@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pontos.git import Git, GitError
+from pontos.git._pygit2 import _compile_format, is_available
+from pontos.testing import temp_git_repository
+from tests import enter_context
+
+
+class CompileFormatTestCase(unittest.TestCase):
+    def test_compile(self):
+        self.assertEqual(
+            _compile_format("%H %s%n%x00%%foo"),
+            ["%H", " ", "%s", "%n", "\0", "%%", "foo"],
+        )
+
+    def test_unsupported(self):
+        self.assertIsNone(_compile_format("%h"))
+        self.assertIsNone(_compile_format("%aI"))
+        self.assertIsNone(_compile_format("%(trailers)"))
+
+
+@unittest.skipUnless(is_available(), "pygit2 is not installed")
+class InProcessGitTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = enter_context(self, temp_git_repository())
+
+        self.git = Git(self.tmp)
+        self.in_process = Git(self.tmp, in_process=True)
+
+        (self.tmp / "foo.txt").write_text("foo", encoding="utf8")
+        (self.tmp / "bar").mkdir()
+        (self.tmp / "bar" / "baz.txt").write_text("baz", encoding="utf8")
+        self.git.add(["foo.txt", "bar"])
+        self.git.commit("Add: Initial\n\nSome body", gpg_sign=False)
+        self.git.tag("v1.0.0", gpg_key_id="", sign=False)
+
+        for number in range(3):
+            self.git.exec(
+                "commit",
+                "--allow-empty",
+                "--no-gpg-sign",
+                "-m",
+                f"Change: Number {number}\n\nline 1\nline 2",
+            )
+        self.git.tag("v1.1.0", message="Release 1.1.0", sign=False)
+        self.git.tag("other", gpg_key_id="", sign=False)
+
+    def assert_same_output(self, method: str, *args, **kwargs):
+        with patch(
+            "pontos.git._git.exec_git", side_effect=AssertionError
+        ) as exec_git:
+            actual = getattr(self.in_process, method)(*args, **kwargs)
+            exec_git.assert_not_called()
+
+        expected = getattr(self.git, method)(*args, **kwargs)
+        if method == "status":
+            actual = [str(entry) for entry in actual]
+            expected = [str(entry) for entry in expected]
+        self.assertEqual(actual, expected)
+
+    def test_list_tags(self):
+        self.assert_same_output("list_tags")
+        self.assert_same_output("list_tags", tag_name="v1.*")
+
+    def test_rev_list(self):
+        self.assert_same_output("rev_list", "HEAD")
+        self.assert_same_output("rev_list", "v1.0.0..HEAD")
+        self.assert_same_output("rev_list", "HEAD", "^v1.0.0")
+        self.assert_same_output("rev_list", "HEAD", max_parents=0)
+
+    def test_log(self):
+        self.assert_same_output("log", format="%H %P %an <%ae>")
+        self.assert_same_output("log", "v1.0.0..HEAD", format="%s%n%b")
+        self.assert_same_output("log", "v1.1.0", format="%x00%B%x1e%cn %ce%%")
+
+    def test_show(self):
+        self.assert_same_output(
+            "show", format="%H %s", patch=False, objects="v1.0.0"
+        )
+        self.assert_same_output(
+            "show", format="%s", patch=False, objects=["HEAD", "v1.0.0"]
+        )
+
+    def test_remote_url(self):
+        self.git.add_remote("origin", "https://example.com/foo.git")
+
+        self.assert_same_output("remote_url")
+
+    def test_status(self):
+        (self.tmp / "foo.txt").write_text("changed", encoding="utf8")
+        (self.tmp / "bar" / "baz.txt").unlink()
+        (self.tmp / "new.txt").write_text("new", encoding="utf8")
+        (self.tmp / "untracked.txt").write_text("new", encoding="utf8")
+        self.git.add(["new.txt"])
+
+        self.assert_same_output("status")
+        self.assert_same_output("status", [Path("bar")])
+
+    def test_status_fallback(self):
+        self.git.move(Path("foo.txt"), Path("renamed.txt"))
+
+        with patch.object(
+            self.in_process, "exec", wraps=self.in_process.exec
+        ) as exec_git:
+            entries = list(self.in_process.status())
+
+        exec_git.assert_called_once()
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(str(entries[0]), "R  renamed.txt")
+        self.assertEqual(entries[0].old_path, Path("foo.txt"))
+
+    def test_fallback(self):
+        with patch.object(
+            self.in_process, "exec", wraps=self.in_process.exec
+        ) as exec_git:
+            self.in_process.log(oneline=True)
+            self.in_process.log(format="%h")
+            self.in_process.rev_list("HEAD", abbrev_commit=True)
+            self.in_process.list_tags(sort="v:refname")
+            self.in_process.show(objects="v1.0.0")
+            self.in_process.show(format="%s", patch=False, objects="v1.1.0")
+
+        self.assertEqual(exec_git.call_count, 6)
+
+    def test_list_tags_sort_config(self):
+        self.git.config("tag.sort", "-refname")
+
+        with patch.object(
+            self.in_process, "exec", wraps=self.in_process.exec
+        ) as exec_git:
+            tags = self.in_process.list_tags()
+
+        exec_git.assert_called_once()
+        self.assertEqual(tags, ["v1.1.0", "v1.0.0", "other"])
+
+    def test_errors(self):
+        with self.assertRaises(GitError):
+            self.in_process.rev_list("unknown")
+
+        with self.assertRaises(GitError):
+            self.in_process.remote_url("unknown")
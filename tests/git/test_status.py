@@ -7,7 +7,15 @@ import os
 import unittest
 from pathlib import Path
 
-from pontos.git._status import Status, StatusEntry, parse_git_status
+from pontos.git import Git
+from pontos.git._status import (
+    Status,
+    StatusEntry,
+    SubmoduleStatus,
+    parse_git_status,
+    parse_git_status_v2,
+)
+from pontos.testing import temp_git_repository
 
 
 class StatusEntryTestCase(unittest.TestCase):
@@ -100,3 +108,160 @@ class ParseGitStatusTestCase(unittest.TestCase):
 
         with self.assertRaises(StopIteration):
             next(it)
+
+    def test_parse_git_status_copied(self):
+        output = "C  foo.txt\0bar.txt\0 M baz.txt\0"
+
+        entries = list(parse_git_status(output))
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0].index, Status.COPIED)
+        self.assertEqual(entries[0].path, Path("foo.txt"))
+        self.assertEqual(entries[0].old_path, Path("bar.txt"))
+        self.assertEqual(entries[1].path, Path("baz.txt"))
+
+    def test_parse_git_status_many(self):
+        output = "\0".join(f" M foo{i}.txt" for i in range(50000))
+
+        entries = list(parse_git_status(output))
+
+        self.assertEqual(len(entries), 50000)
+        self.assertEqual(entries[-1].path, Path("foo49999.txt"))
+
+
+HASH = "1" * 40
+
+
+class ParseGitStatusV2TestCase(unittest.TestCase):
+    def test_parse(self):
+        records = [
+            "# branch.oid 1234",
+            "# branch.head main",
+            f"1 .M N... 100644 100644 100644 {HASH} {HASH} bar baz.json",
+            f"2 R. N... 100644 100644 100644 {HASH} {HASH} R87 foo.rst",
+            "foo.md",
+            f"1 A. N... 000000 100644 100644 {HASH} {HASH} foo.txt",
+            f"1 .M SC.U 160000 160000 160000 {HASH} {HASH} sub",
+            (
+                f"u UU N... 100644 100644 100644 100644 {HASH} {HASH} {HASH} "
+                "conflict.txt"
+            ),
+            "? untracked.txt",
+            "! ignored.txt",
+            "",
+        ]
+
+        entries = list(parse_git_status_v2(records))
+
+        self.assertEqual(len(entries), 7)
+
+        modified = entries[0]
+        self.assertEqual(modified.index, Status.UNMODIFIED)
+        self.assertEqual(modified.working_tree, Status.MODIFIED)
+        self.assertEqual(modified.path, Path("bar baz.json"))
+        self.assertIsNone(modified.score)
+        self.assertIsNone(modified.submodule)
+
+        renamed = entries[1]
+        self.assertEqual(renamed.index, Status.RENAMED)
+        self.assertEqual(renamed.working_tree, Status.UNMODIFIED)
+        self.assertEqual(renamed.path, Path("foo.rst"))
+        self.assertEqual(renamed.old_path, Path("foo.md"))
+        self.assertEqual(renamed.score, 87)
+
+        added = entries[2]
+        self.assertEqual(added.index, Status.ADDED)
+        self.assertEqual(added.path, Path("foo.txt"))
+
+        submodule = entries[3]
+        self.assertEqual(submodule.path, Path("sub"))
+        self.assertEqual(
+            submodule.submodule,
+            SubmoduleStatus(
+                commit_changed=True,
+                tracked_changes=False,
+                untracked_changes=True,
+            ),
+        )
+
+        conflict = entries[4]
+        self.assertEqual(conflict.index, Status.UPDATED)
+        self.assertEqual(conflict.working_tree, Status.UPDATED)
+        self.assertEqual(conflict.path, Path("conflict.txt"))
+
+        untracked = entries[5]
+        self.assertEqual(untracked.index, Status.UNTRACKED)
+        self.assertEqual(untracked.working_tree, Status.UNTRACKED)
+        self.assertEqual(untracked.path, Path("untracked.txt"))
+
+        ignored = entries[6]
+        self.assertEqual(ignored.index, Status.IGNORED)
+        self.assertEqual(ignored.working_tree, Status.IGNORED)
+        self.assertEqual(ignored.path, Path("ignored.txt"))
+
+    def test_parse_type_changed(self):
+        records = [
+            f"1 .T N... 100644 100644 120000 {HASH} {HASH} foo.txt",
+            f"1 T. N... 100644 120000 120000 {HASH} {HASH} bar.txt",
+        ]
+
+        entries = list(parse_git_status_v2(records))
+
+        self.assertEqual(entries[0].index, Status.UNMODIFIED)
+        self.assertEqual(entries[0].working_tree, Status.TYPE_CHANGED)
+        self.assertEqual(entries[0].path, Path("foo.txt"))
+        self.assertEqual(entries[1].index, Status.TYPE_CHANGED)
+        self.assertEqual(entries[1].working_tree, Status.UNMODIFIED)
+
+    def test_parse_lazy(self):
+        def records():
+            yield f"1 .M N... 100644 100644 100644 {HASH} {HASH} foo.txt"
+            raise AssertionError("Records must be consumed lazily")
+
+        entries = parse_git_status_v2(records())
+
+        self.assertEqual(next(entries).path, Path("foo.txt"))
+
+
+class GitIterStatusTestCase(unittest.TestCase):
+    def test_iter_status(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            for name in ("foo.txt", "bar.txt"):
+                (tmp / name).write_text(f"{name}\n" * 10, encoding="utf8")
+            git.add(["foo.txt", "bar.txt"])
+            git.commit("Add files", verify=False, gpg_sign=False)
+
+            git.move(Path("foo.txt"), Path("baz.txt"))
+            (tmp / "bar.txt").write_text("changed", encoding="utf8")
+            (tmp / "new.txt").write_text("new", encoding="utf8")
+
+            entries = {
+                str(entry.path): entry
+                for entry in git.iter_status(untracked=True)
+            }
+            tracked = [str(entry.path) for entry in git.iter_status()]
+
+        self.assertEqual(sorted(entries), ["bar.txt", "baz.txt", "new.txt"])
+        self.assertEqual(entries["baz.txt"].index, Status.RENAMED)
+        self.assertEqual(entries["baz.txt"].old_path, Path("foo.txt"))
+        self.assertEqual(entries["baz.txt"].score, 100)
+        self.assertEqual(entries["bar.txt"].working_tree, Status.MODIFIED)
+        self.assertEqual(entries["new.txt"].index, Status.UNTRACKED)
+        self.assertEqual(sorted(tracked), ["bar.txt", "baz.txt"])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks not supported")
+    def test_iter_status_type_changed(self):
+        with temp_git_repository() as tmp:
+            git = Git(tmp)
+            (tmp / "foo.txt").write_text("foo", encoding="utf8")
+            git.add("foo.txt")
+            git.commit("Add foo", verify=False, gpg_sign=False)
+
+            (tmp / "foo.txt").unlink()
+            (tmp / "foo.txt").symlink_to("bar.txt")
+
+            entries = list(git.iter_status())
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].working_tree, Status.TYPE_CHANGED)
@@ -0,0 +1,231 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from copy import deepcopy
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from pontos.github.api.access_graph import (
+    AccessGraph,
+    GitHubAsyncRESTAccessGraph,
+)
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.models.base import Permission
+from pontos.testing import temp_directory
+from tests import IsolatedAsyncioTestCase
+from tests.github.api.test_organizations import MEMBER_DICT, REPOSITORY_DICT
+
+TAKEN_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def create_user(login: str, **kwargs: Any) -> dict[str, Any]:
+    data = deepcopy(MEMBER_DICT)
+    data["login"] = login
+    data.update(kwargs)
+    return data
+
+
+def create_team(slug: str) -> dict[str, Any]:
+    return {
+        "id": 1,
+        "node_id": "MDQ6VGVhbTE=",
+        "url": f"https://api.github.com/teams/{slug}",
+        "html_url": f"https://github.com/orgs/foo/teams/{slug}",
+        "name": slug.title(),
+        "slug": slug,
+        "description": "A team",
+        "privacy": "closed",
+        "permission": "pull",
+        "members_url": f"https://api.github.com/teams/{slug}/members",
+        "repositories_url": f"https://api.github.com/teams/{slug}/repos",
+        "parent": None,
+    }
+
+
+def create_repository(name: str, **permissions: bool) -> dict[str, Any]:
+    data = deepcopy(REPOSITORY_DICT)
+    data["name"] = name
+    data["full_name"] = f"foo/{name}"
+    data["permissions"] = {
+        "admin": False,
+        "maintain": False,
+        "push": False,
+        "triage": False,
+        "pull": True,
+        **permissions,
+    }
+    return data
+
+
+def create_graph() -> AccessGraph:
+    return AccessGraph(
+        organization="foo",
+        taken_at=TAKEN_AT,
+        owners={"alice"},
+        members={"alice", "bob", "carol"},
+        outside_collaborators={"dave"},
+        teams={"devs": "Devs", "docs": "Docs"},
+        team_members={"devs": {"bob"}, "docs": {"bob", "carol"}},
+        team_repositories={
+            "devs": {"foo/app": Permission.PUSH},
+            "docs": {"foo/app": Permission.PULL, "foo/web": Permission.PUSH},
+        },
+        collaborators={"foo/app": {"dave": Permission.MAINTAIN}},
+    )
+
+
+class AccessGraphTestCase(unittest.TestCase):
+    def test_teams_of(self):
+        graph = create_graph()
+
+        self.assertEqual(graph.teams_of("bob"), ["devs", "docs"])
+        self.assertEqual(graph.teams_of("dave"), [])
+
+    def test_permission(self):
+        graph = create_graph()
+
+        self.assertEqual(graph.permission("alice", "foo/app"), Permission.ADMIN)
+        self.assertEqual(graph.permission("bob", "foo/app"), Permission.PUSH)
+        self.assertEqual(graph.permission("carol", "foo/app"), Permission.PULL)
+        self.assertEqual(
+            graph.permission("dave", "foo/app"), Permission.MAINTAIN
+        )
+        self.assertIsNone(graph.permission("dave", "foo/web"))
+
+    def test_users(self):
+        graph = create_graph()
+
+        self.assertEqual(
+            graph.users("foo/app", Permission.PUSH),
+            {
+                "alice": Permission.ADMIN,
+                "bob": Permission.PUSH,
+                "dave": Permission.MAINTAIN,
+            },
+        )
+        self.assertEqual(
+            list(graph.users("foo/app")), ["alice", "bob", "carol", "dave"]
+        )
+        self.assertEqual(list(graph.users("foo/web", "admin")), ["alice"])
+
+    def test_repositories(self):
+        graph = create_graph()
+
+        self.assertEqual(
+            graph.repositories("carol"),
+            {"foo/app": Permission.PULL, "foo/web": Permission.PUSH},
+        )
+        self.assertEqual(
+            graph.repositories("dave"), {"foo/app": Permission.MAINTAIN}
+        )
+
+    def test_save_and_load(self):
+        graph = create_graph()
+
+        with temp_directory() as temp_dir:
+            path = temp_dir / "access.json"
+            self.assertIsNone(AccessGraph.load(path))
+
+            graph.save(path)
+            loaded = AccessGraph.load(path)
+
+        self.assertEqual(loaded, graph)
+
+
+class Server:
+    def __init__(self) -> None:
+        self.responses: dict[str, list[dict[str, Any]]] = {
+            "/orgs/foo/members": [create_user("alice"), create_user("bob")],
+            "/orgs/foo/outside_collaborators": [create_user("dave")],
+            "/orgs/foo/teams": [create_team("devs"), create_team("ops")],
+            "/orgs/foo/teams/devs/members": [create_user("bob")],
+            "/orgs/foo/teams/ops/members": [],
+            "/orgs/foo/teams/devs/repos": [
+                create_repository("app", push=True),
+                create_repository("web"),
+            ],
+            "/orgs/foo/teams/ops/repos": [
+                create_repository("app", admin=True, push=True),
+            ],
+            "/orgs/foo/repos": [
+                create_repository("app"),
+                create_repository("web"),
+            ],
+            "/repos/foo/app/collaborators": [
+                create_user(
+                    "dave",
+                    permissions={"pull": True, "triage": True, "push": False},
+                )
+            ],
+            "/repos/foo/web/collaborators": [],
+        }
+        self.requested: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requested.append(path)
+        if path == "/orgs/foo/members" and (
+            request.url.params.get("role") == "admin"
+        ):
+            return httpx.Response(200, json=[create_user("alice")])
+        return httpx.Response(200, json=self.responses[path])
+
+
+class GitHubAsyncRESTAccessGraphTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = Server()
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.server)
+        )
+        self.api = GitHubAsyncRESTAccessGraph(client)
+
+    async def test_build(self):
+        graph = await self.api.build("foo", concurrency=2)
+
+        self.assertEqual(graph.organization, "foo")
+        self.assertEqual(graph.owners, {"alice"})
+        self.assertEqual(graph.members, {"alice", "bob"})
+        self.assertEqual(graph.outside_collaborators, {"dave"})
+        self.assertEqual(graph.teams, {"devs": "Devs", "ops": "Ops"})
+        self.assertEqual(graph.team_members, {"devs": {"bob"}, "ops": set()})
+        self.assertEqual(
+            graph.team_repositories,
+            {
+                "devs": {
+                    "foo/app": Permission.PUSH,
+                    "foo/web": Permission.PULL,
+                },
+                "ops": {"foo/app": Permission.ADMIN},
+            },
+        )
+        self.assertEqual(graph.collaborators, {})
+        self.assertNotIn("/orgs/foo/repos", self.server.requested)
+
+        self.assertEqual(list(graph.users("foo/app", "push")), ["alice", "bob"])
+
+    async def test_build_with_collaborators(self):
+        graph = await self.api.build("foo", include_collaborators=True)
+
+        self.assertEqual(
+            graph.collaborators, {"foo/app": {"dave": Permission.TRIAGE}}
+        )
+        self.assertEqual(graph.permission("dave", "foo/app"), Permission.TRIAGE)
+
+    async def test_build_failure(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/orgs/foo/teams/ops/repos":
+                return httpx.Response(500)
+            return self.server(request)
+
+        self.api._client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.build("foo")
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from pontos.github.api.artifact_retention import (
+    ArtifactRetentionPolicy,
+    ArtifactStatistics,
+)
+from pontos.github.models.artifact import Artifact
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def create_artifact(
+    id: int,  # noqa: A002
+    *,
+    name: str = "build",
+    days: float = 0,
+    size: int = 100,
+    expired: bool = False,
+    run: int = 1,
+    branch: str = "main",
+) -> Artifact:
+    return Artifact.from_dict(
+        {
+            "id": id,
+            "node_id": f"node-{id}",
+            "name": name,
+            "size_in_bytes": size,
+            "url": f"https://api.github.com/repos/foo/bar/actions/artifacts/{id}",
+            "archive_download_url": f"https://api.github.com/repos/foo/bar/actions/artifacts/{id}/zip",
+            "expired": expired,
+            "created_at": (NOW - timedelta(days=days)).isoformat(),
+            "workflow_run": {
+                "id": run,
+                "repository_id": 1,
+                "head_repository_id": 1,
+                "head_branch": branch,
+                "head_sha": "abc",
+            },
+        }
+    )
+
+
+class ArtifactStatisticsTestCase(unittest.TestCase):
+    def test_from_artifacts(self):
+        statistics = ArtifactStatistics.from_artifacts(
+            [
+                create_artifact(1, days=0.5, run=1, branch="main"),
+                create_artifact(2, days=3, run=1, branch="main", size=50),
+                create_artifact(3, days=100, run=2, branch="dev", expired=True),
+            ],
+            now=NOW,
+        )
+
+        self.assertEqual(statistics.total.count, 3)
+        self.assertEqual(statistics.total.expired, 1)
+        self.assertEqual(statistics.total.size_in_bytes, 150)
+
+        self.assertEqual(statistics.by_workflow_run[1].count, 2)
+        self.assertEqual(statistics.by_workflow_run[1].size_in_bytes, 150)
+        self.assertEqual(statistics.by_workflow_run[2].expired, 1)
+
+        self.assertEqual(statistics.by_branch["main"].count, 2)
+        self.assertEqual(statistics.by_branch["dev"].size_in_bytes, 0)
+
+        self.assertEqual(statistics.by_age["< 1 day"].count, 1)
+        self.assertEqual(statistics.by_age["1-7 days"].count, 1)
+        self.assertEqual(statistics.by_age["> 90 days"].count, 1)
+
+
+class ArtifactRetentionPolicyTestCase(unittest.TestCase):
+    def test_no_rules(self):
+        policy = ArtifactRetentionPolicy()
+        self.assertEqual(
+            policy.select([create_artifact(1, days=1000)], now=NOW), []
+        )
+
+    def test_max_age(self):
+        policy = ArtifactRetentionPolicy(max_age=timedelta(days=7))
+        selected = policy.select(
+            [
+                create_artifact(1, days=1),
+                create_artifact(2, days=10),
+                create_artifact(3, days=20, expired=True),
+            ],
+            now=NOW,
+        )
+
+        self.assertEqual([a.id for a in selected], [2])
+
+    def test_keep_last(self):
+        policy = ArtifactRetentionPolicy(keep_last=2)
+        selected = policy.select(
+            [
+                create_artifact(1, name="build", days=3),
+                create_artifact(2, name="build", days=1),
+                create_artifact(3, name="build", days=2),
+                create_artifact(4, name="build", days=4),
+                create_artifact(5, name="docs", days=10),
+            ],
+            now=NOW,
+        )
+
+        self.assertEqual([a.id for a in selected], [4, 1])
+
+    def test_max_total_size(self):
+        policy = ArtifactRetentionPolicy(max_total_size=250)
+        selected = policy.select(
+            [
+                create_artifact(1, days=1),
+                create_artifact(2, days=2),
+                create_artifact(3, days=3),
+                create_artifact(4, days=4),
+            ],
+            now=NOW,
+        )
+
+        self.assertEqual([a.id for a in selected], [4, 3])
+
+    def test_combined_rules(self):
+        policy = ArtifactRetentionPolicy(
+            max_age=timedelta(days=30), keep_last=3, max_total_size=200
+        )
+        selected = policy.select(
+            [
+                create_artifact(1, days=1),
+                create_artifact(2, days=2),
+                create_artifact(3, days=40),
+                create_artifact(4, days=3),
+                create_artifact(5, days=4),
+            ],
+            now=NOW,
+        )
+
+        # 3 is too old, 5 exceeds keep_last and 4 exceeds the size budget
+        self.assertEqual([a.id for a in selected], [3, 5, 4])
@@ -5,11 +5,13 @@
 
 # pylint: disable=redefined-builtin, line-too-long
 
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call, patch
 
 import httpx
 
+from pontos.github.api.artifact_retention import ArtifactRetentionPolicy
 from pontos.github.api.artifacts import GitHubAsyncRESTArtifacts
 from tests import AsyncIteratorMock, AsyncMock
 from tests.github.api import GitHubAsyncRESTTestCase, create_response
@@ -153,6 +155,138 @@ class GitHubAsyncRESTArtifactsTestCase(GitHubAsyncRESTTestCase):
             params={"per_page": "100"},
         )
 
+    def create_artifacts_response(self, *artifacts) -> MagicMock:
+        response = create_response()
+        response.json.return_value = {
+            "artifacts": [
+                {
+                    "id": artifact_id,
+                    "node_id": "MDg6QXJ0aWZhY3QxMQ==",
+                    "name": name,
+                    "size_in_bytes": 100,
+                    "url": f"https://api.github.com/repos/foo/bar/actions/artifacts/{artifact_id}",
+                    "archive_download_url": f"https://api.github.com/repos/foo/bar/actions/artifacts/{artifact_id}/zip",
+                    "expired": False,
+                    "created_at": created_at,
+                    "workflow_run": {
+                        "id": 2332938,
+                        "repository_id": 1296269,
+                        "head_repository_id": 1296269,
+                        "head_branch": "main",
+                        "head_sha": "328faa0536e6fef19753d9d91dc96a9931694ce3",
+                    },
+                }
+                for artifact_id, name, created_at in artifacts
+            ]
+        }
+        return response
+
+    async def test_get_all_concurrency(self):
+        self.client.get_all.return_value = AsyncIteratorMock(
+            [self.create_artifacts_response((1, "a", "2020-01-10T14:59:22Z"))]
+        )
+
+        artifacts = [
+            a async for a in self.api.get_all("foo/bar", concurrency=5)
+        ]
+
+        self.assertEqual(len(artifacts), 1)
+        self.client.get_all.assert_called_once_with(
+            "/repos/foo/bar/actions/artifacts",
+            params={"per_page": "100"},
+            concurrency=5,
+        )
+
+    async def test_statistics(self):
+        self.client.get_all.return_value = AsyncIteratorMock(
+            [
+                self.create_artifacts_response(
+                    (1, "a", "2020-01-10T14:59:22Z"),
+                    (2, "b", "2020-01-01T14:59:22Z"),
+                ),
+            ]
+        )
+
+        statistics = await self.api.statistics(
+            "foo/bar",
+            now=datetime(2020, 1, 11, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(statistics.total.count, 2)
+        self.assertEqual(statistics.total.size_in_bytes, 200)
+        self.assertEqual(statistics.by_branch["main"].count, 2)
+        self.assertEqual(statistics.by_age["< 1 day"].count, 1)
+        self.assertEqual(statistics.by_age["7-30 days"].count, 1)
+        self.client.get_all.assert_called_once_with(
+            "/repos/foo/bar/actions/artifacts",
+            params={"per_page": "100"},
+            concurrency=10,
+        )
+
+    async def test_delete_many(self):
+        response = create_response(status_code=204)
+        not_found = create_response(status_code=404)
+        self.client.delete.side_effect = [response, not_found]
+
+        await self.api.delete_many("foo/bar", [1, 2], concurrency=2)
+
+        self.client.delete.assert_has_awaits(
+            [
+                call("/repos/foo/bar/actions/artifacts/1"),
+                call("/repos/foo/bar/actions/artifacts/2"),
+            ],
+            any_order=True,
+        )
+        response.raise_for_status.assert_called_once_with()
+        not_found.raise_for_status.assert_not_called()
+
+    async def test_delete_many_failure(self):
+        response = create_response(status_code=403)
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "403", request=MagicMock(), response=response
+        )
+        self.client.delete.return_value = response
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.delete_many("foo/bar", [1])
+
+    async def test_cleanup(self):
+        self.client.get_all.return_value = AsyncIteratorMock(
+            [
+                self.create_artifacts_response(
+                    (1, "a", "2020-01-10T14:59:22Z"),
+                    (2, "a", "2020-01-01T14:59:22Z"),
+                ),
+            ]
+        )
+        self.client.delete.return_value = create_response(status_code=204)
+
+        deleted = await self.api.cleanup(
+            "foo/bar",
+            ArtifactRetentionPolicy(max_age=timedelta(days=5)),
+            now=datetime(2020, 1, 11, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual([artifact.id for artifact in deleted], [2])
+        self.client.delete.assert_awaited_once_with(
+            "/repos/foo/bar/actions/artifacts/2"
+        )
+
+    async def test_cleanup_dry_run(self):
+        self.client.get_all.return_value = AsyncIteratorMock(
+            [self.create_artifacts_response((1, "a", "2020-01-01T14:59:22Z"))]
+        )
+
+        deleted = await self.api.cleanup(
+            "foo/bar",
+            ArtifactRetentionPolicy(max_age=timedelta(days=5)),
+            dry_run=True,
+            now=datetime(2020, 1, 11, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual([artifact.id for artifact in deleted], [1])
+        self.client.delete.assert_not_awaited()
+
     async def test_get_workflow_run_artifacts(self):
         response1 = create_response()
         response1.json.return_value = {
@@ -287,3 +421,21 @@ class GitHubAsyncRESTArtifactsTestCase(GitHubAsyncRESTTestCase):
         self.client.stream.assert_called_once_with(
             "/repos/foo/bar/actions/artifacts/123/zip"
         )
+
+    @patch("pontos.github.api.artifacts.download_file", new_callable=AsyncMock)
+    async def test_download_to_file(self, download_file_mock: AsyncMock):
+        destination = Path("artifact.zip")
+
+        download = await self.api.download_to_file(
+            "foo/bar", 123, destination, concurrency=2, expected_digest="abc"
+        )
+
+        self.assertEqual(download, download_file_mock.return_value)
+        download_file_mock.assert_awaited_once_with(
+            self.client,
+            "/repos/foo/bar/actions/artifacts/123/zip",
+            destination,
+            part_size=8 * 1024 * 1024,
+            concurrency=2,
+            expected_digest="abc",
+        )
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from pontos.github.api.cache import ResponseCache
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.testing import temp_directory
+from tests import AsyncMock, IsolatedAsyncioTestCase
+
+URL = "https://api.github.com/repos/foo/bar"
+HEADERS = {"Accept": "application/vnd.github+json"}
+
+
+def create_response(
+    status_code: int = 200,
+    *,
+    headers: dict[str, str] | None = None,
+    json: dict[str, str] | None = None,
+) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        json=json,
+        request=httpx.Request("GET", URL),
+    )
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def test_key(self):
+        key = ResponseCache.key(URL, {"per_page": "100"}, HEADERS)
+
+        self.assertEqual(
+            key, ResponseCache.key(URL, {"per_page": "100"}, HEADERS)
+        )
+        self.assertNotEqual(key, ResponseCache.key(URL, None, HEADERS))
+        self.assertNotEqual(
+            key,
+            ResponseCache.key(
+                URL,
+                {"per_page": "100"},
+                {**HEADERS, "Authorization": "token foo"},
+            ),
+        )
+
+    def test_key_repeated_params(self):
+        key = ResponseCache.key(
+            URL,
+            httpx.QueryParams([("state", "open"), ("state", "closed")]),
+            HEADERS,
+        )
+
+        self.assertNotEqual(
+            key, ResponseCache.key(URL, {"state": "closed"}, HEADERS)
+        )
+        self.assertNotEqual(
+            key, ResponseCache.key(URL, [("state", "open")], HEADERS)
+        )
+        self.assertEqual(
+            key,
+            ResponseCache.key(
+                URL, [("state", "open"), ("state", "closed")], HEADERS
+            ),
+        )
+        self.assertEqual(
+            ResponseCache.key(URL, {"a": "1", "b": "2"}, HEADERS),
+            ResponseCache.key(URL, {"b": "2", "a": "1"}, HEADERS),
+        )
+
+    def test_store(self):
+        cache = ResponseCache()
+        cache.store(
+            "foo",
+            create_response(headers={"etag": '"123"'}, json={"id": "1"}),
+        )
+
+        entry = cache.get("foo")
+        self.assertEqual(entry.etag, '"123"')
+        self.assertIsNone(entry.last_modified)
+        self.assertEqual(
+            entry.conditional_headers(), {"If-None-Match": '"123"'}
+        )
+
+        response = entry.to_response(httpx.Request("GET", URL))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"id": "1"})
+
+    def test_dont_store_without_validator(self):
+        cache = ResponseCache()
+        cache.store("foo", create_response(json={"id": "1"}))
+
+        self.assertIsNone(cache.get("foo"))
+        self.assertEqual(len(cache), 0)
+
+    def test_dont_store_errors(self):
+        cache = ResponseCache()
+        cache.store("foo", create_response(404, headers={"etag": '"123"'}))
+
+        self.assertIsNone(cache.get("foo"))
+
+    def test_max_size(self):
+        cache = ResponseCache(max_size=2)
+        for key in ("foo", "bar"):
+            cache.store(key, create_response(headers={"etag": key}))
+
+        # mark foo as recently used
+        cache.get("foo")
+        cache.store("baz", create_response(headers={"etag": "baz"}))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get("foo"))
+        self.assertIsNone(cache.get("bar"))
+        self.assertIsNotNone(cache.get("baz"))
+
+    def test_directory(self):
+        with temp_directory() as temp_dir:
+            cache = ResponseCache(directory=temp_dir)
+            cache.store(
+                "foo",
+                create_response(
+                    headers={"last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+                    json={"id": "1"},
+                ),
+            )
+
+            cache = ResponseCache(directory=temp_dir)
+            entry = cache.get("foo")
+
+            self.assertEqual(
+                entry.conditional_headers(),
+                {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            )
+            self.assertEqual(
+                entry.to_response(httpx.Request("GET", URL)).json(),
+                {"id": "1"},
+            )
+
+            cache.clear()
+
+            self.assertIsNone(ResponseCache(directory=temp_dir).get("foo"))
+
+
+class GitHubAsyncRESTClientCacheTestCase(IsolatedAsyncioTestCase):
+    @patch("pontos.github.api.client.httpx.AsyncClient")
+    def setUp(self, async_client: MagicMock) -> None:
+        self.http_client = AsyncMock()
+        async_client.return_value = self.http_client
+        self.cache = ResponseCache()
+        self.client = GitHubAsyncRESTClient("token", cache=self.cache)
+
+    async def test_replay_not_modified(self):
+        self.http_client.get.side_effect = [
+            create_response(headers={"etag": '"123"'}, json={"id": "1"}),
+            create_response(304, headers={"etag": '"123"'}),
+        ]
+
+        response = await self.client.get("/repos/foo/bar")
+        self.assertEqual(response.json(), {"id": "1"})
+        self.assertNotIn(
+            "If-None-Match", self.http_client.get.await_args.kwargs["headers"]
+        )
+
+        response = await self.client.get("/repos/foo/bar")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"id": "1"})
+        self.assertEqual(
+            self.http_client.get.await_args.kwargs["headers"]["If-None-Match"],
+            '"123"',
+        )
+
+    async def test_update_modified(self):
+        self.http_client.get.side_effect = [
+            create_response(headers={"etag": '"123"'}, json={"id": "1"}),
+            create_response(headers={"etag": '"456"'}, json={"id": "2"}),
+        ]
+
+        await self.client.get("/repos/foo/bar")
+        response = await self.client.get("/repos/foo/bar")
+
+        self.assertEqual(response.json(), {"id": "2"})
+        self.assertEqual(len(self.cache), 1)
@@ -51,6 +51,16 @@ class GitHubAsyncRESTClientTestCase(IsolatedAsyncioTestCase):
             follow_redirects=True,
         )
 
+    def test_request_url(self):
+        self.assertEqual(
+            self.client.request_url("/foo/bar"),
+            f"{DEFAULT_GITHUB_API_URL}/foo/bar",
+        )
+        self.assertEqual(
+            self.client.request_url("https://github.com/foo/bar"),
+            "https://github.com/foo/bar",
+        )
+
     async def test_get_all(self):
         url = "https://foo.bar"
         response1 = MagicMock(links={"next": {"url": url}})
@@ -93,6 +103,73 @@ class GitHubAsyncRESTClientTestCase(IsolatedAsyncioTestCase):
             ]
         )
 
+    async def test_get_all_concurrency(self):
+        url = "https://foo.bar/items?per_page=100"
+        response1 = MagicMock(
+            links={
+                "next": {"url": f"{url}&page=2"},
+                "last": {"url": f"{url}&page=4"},
+            }
+        )
+        response2 = MagicMock()
+        response3 = MagicMock()
+        response4 = MagicMock()
+
+        self.http_client.get.side_effect = [
+            response1,
+            response2,
+            response3,
+            response4,
+        ]
+
+        responses = [
+            response
+            async for response in self.client.get_all("/foo/bar", concurrency=2)
+        ]
+
+        self.assertEqual(
+            responses, [response1, response2, response3, response4]
+        )
+        self.assertEqual(self.http_client.get.await_count, 4)
+        self.assertEqual(
+            [c.args[0] for c in self.http_client.get.await_args_list],
+            [
+                f"{DEFAULT_GITHUB_API_URL}/foo/bar",
+                f"{url}&page=2",
+                f"{url}&page=3",
+                f"{url}&page=4",
+            ],
+        )
+
+    async def test_get_all_concurrency_without_last_link(self):
+        url = "https://foo.bar"
+        response1 = MagicMock(links={"next": {"url": url}})
+        response2 = MagicMock(links=None)
+
+        self.http_client.get.side_effect = [
+            response1,
+            response2,
+        ]
+
+        responses = [
+            response
+            async for response in self.client.get_all(
+                "/foo/bar", concurrency=10
+            )
+        ]
+
+        self.assertEqual(responses, [response1, response2])
+        self.http_client.get.assert_awaited_with(
+            url,
+            headers={
+                "Accept": DEFAULT_ACCEPT_HEADER,
+                "Authorization": "token token",
+                "X-GitHub-Api-Version": GITHUB_API_VERSION,
+            },
+            params=None,
+            follow_redirects=True,
+        )
+
     async def test_delete(self):
         await self.client.delete("/foo/bar")
 
@@ -271,6 +348,30 @@ class GitHubAsyncRESTClientTestCase(IsolatedAsyncioTestCase):
             follow_redirects=True,
         )
 
+    async def test_stream_headers(self):
+        response = MagicMock()
+        response.__aenter__.return_value = MagicMock()
+        self.http_client.stream = MagicMock()
+        self.http_client.stream.return_value = response
+
+        async with self.client.stream(
+            "https://foo.bar/baz",
+            headers={"Range": "bytes=0-99"},
+            authenticated=False,
+        ):
+            pass
+
+        self.http_client.stream.assert_called_once_with(
+            "GET",
+            "https://foo.bar/baz",
+            headers={
+                "Accept": DEFAULT_ACCEPT_HEADER,
+                "X-GitHub-Api-Version": GITHUB_API_VERSION,
+                "Range": "bytes=0-99",
+            },
+            follow_redirects=True,
+        )
+
     async def test_context_manager(self):
         async with self.client:
             pass
@@ -3,9 +3,16 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
+import base64
+import gzip
 import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
 
 from pontos.github.api.code_scanning import GitHubAsyncRESTCodeScanning
+from pontos.github.api.errors import GitHubApiError
 from pontos.github.models.base import SortOrder
 from pontos.github.models.code_scanning import (
     AlertSort,
@@ -17,6 +24,7 @@ from pontos.github.models.code_scanning import (
     SarifProcessingStatus,
     Severity,
 )
+from pontos.testing import temp_directory
 from tests import AsyncIteratorMock
 from tests.github.api import GitHubAsyncRESTTestCase, create_response
 
@@ -1368,3 +1376,169 @@ class GitHubAsyncRESTCodeScanningTestCase(GitHubAsyncRESTTestCase):
             "https://api.github.com/repos/octocat/hello-world/code-scanning/analyses?sarif_id=47177e22-5596-11eb-80a1-c1e54ef945c6",
         )
         self.assertIsNone(resp.errors)
+
+    async def test_upload_sarif_file(self):
+        sarif = json.dumps({"version": "2.1.0", "runs": []}).encode() * 100
+        body = bytearray()
+
+        async def post(*args, **kwargs):
+            async for chunk in kwargs["content"]:
+                body.extend(chunk)
+            response = create_response()
+            response.json.return_value = {"id": "123"}
+            return response
+
+        self.client.post.side_effect = post
+
+        with temp_directory() as temp_dir:
+            sarif_file = temp_dir / "results.sarif"
+            sarif_file.write_bytes(sarif)
+
+            resp = await self.api.upload_sarif_file(
+                "foo/bar",
+                commit_sha="4b6472266afd7b471e86085a6659e8c7f2b119da",
+                ref="refs/heads/main",
+                sarif_file=sarif_file,
+                tool_name="foo",
+                chunk_size=10,
+            )
+
+        self.assertEqual(resp["id"], "123")
+        args = self.client.post.await_args
+        self.assertEqual(args.args, ("/repos/foo/bar/code-scanning/sarifs",))
+        self.assertEqual(args.kwargs["content_type"], "application/json")
+
+        data = json.loads(body)
+        self.assertEqual(
+            data["commit_sha"], "4b6472266afd7b471e86085a6659e8c7f2b119da"
+        )
+        self.assertEqual(data["ref"], "refs/heads/main")
+        self.assertEqual(data["tool_name"], "foo")
+        self.assertEqual(
+            gzip.decompress(base64.b64decode(data["sarif"])), sarif
+        )
+
+    @patch("pontos.github.api.code_scanning.asyncio.sleep", autospec=True)
+    async def test_wait_for_sarif(self, sleep_mock: MagicMock):
+        not_found = create_response(status_code=404)
+        not_found.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=MagicMock(), response=not_found
+        )
+        pending = create_response()
+        pending.json.return_value = {"processing_status": "pending"}
+        complete = create_response()
+        complete.json.return_value = {"processing_status": "complete"}
+        self.client.get.side_effect = [not_found, pending, pending, complete]
+
+        resp = await self.api.wait_for_sarif(
+            "foo/bar", "123", poll_interval=1, max_poll_interval=3
+        )
+
+        self.assertEqual(resp.processing_status, SarifProcessingStatus.COMPLETE)
+        self.assertEqual(self.client.get.await_count, 4)
+        self.assertEqual(
+            [call.args[0] for call in sleep_mock.await_args_list], [1, 2, 3]
+        )
+
+    @patch("pontos.github.api.code_scanning.asyncio.sleep", autospec=True)
+    async def test_wait_for_sarif_error(self, _sleep_mock: MagicMock):
+        response = create_response(status_code=403)
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Forbidden", request=MagicMock(), response=response
+        )
+        self.client.get.return_value = response
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.wait_for_sarif("foo/bar", "123")
+
+    async def test_wait_for_sarif_timeout(self):
+        pending = create_response()
+        pending.json.return_value = {"processing_status": "pending"}
+        self.client.get.return_value = pending
+
+        with self.assertRaisesRegex(GitHubApiError, "hasn't finished"):
+            await self.api.wait_for_sarif(
+                "foo/bar", "123", timeout=0.01, poll_interval=0.001
+            )
+
+    async def test_upload_sarif_files(self):
+        uploaded: dict[str, bytes] = {}
+
+        async def post(*args, **kwargs):
+            body = b"".join([chunk async for chunk in kwargs["content"]])
+            data = json.loads(body)
+            sarif = gzip.decompress(base64.b64decode(data["sarif"]))
+            sarif_id = sarif.decode()
+            uploaded[sarif_id] = sarif
+            response = create_response()
+            response.json.return_value = {"id": sarif_id}
+            return response
+
+        async def get(api):
+            response = create_response()
+            response.json.return_value = {
+                "processing_status": "failed"
+                if api.endswith("/b")
+                else "complete"
+            }
+            return response
+
+        self.client.post.side_effect = post
+        self.client.get.side_effect = get
+
+        with temp_directory() as temp_dir:
+            files = []
+            for name in ("a", "b", "c"):
+                sarif_file = temp_dir / f"{name}.sarif"
+                sarif_file.write_text(name)
+                files.append(sarif_file)
+
+            uploads = {
+                upload.sarif_id: upload
+                async for upload in self.api.upload_sarif_files(
+                    "foo/bar",
+                    commit_sha="4b6472266afd7b471e86085a6659e8c7f2b119da",
+                    ref="refs/heads/main",
+                    sarif_files=files,
+                    concurrency=2,
+                )
+            }
+
+        self.assertEqual(sorted(uploaded), ["a", "b", "c"])
+        self.assertEqual(uploads["a"].path.name, "a.sarif")
+        self.assertFalse(uploads["a"].failed)
+        self.assertTrue(uploads["b"].failed)
+        self.assertEqual(
+            uploads["c"].information.processing_status,
+            SarifProcessingStatus.COMPLETE,
+        )
+
+    async def test_upload_sarif_files_without_wait(self):
+        async def post(*args, **kwargs):
+            async for _ in kwargs["content"]:
+                pass
+            response = create_response()
+            response.json.return_value = {"id": "123"}
+            return response
+
+        self.client.post.side_effect = post
+
+        with temp_directory() as temp_dir:
+            sarif_file = temp_dir / "a.sarif"
+            sarif_file.write_text("a")
+
+            uploads = [
+                upload
+                async for upload in self.api.upload_sarif_files(
+                    "foo/bar",
+                    commit_sha="4b6472266afd7b471e86085a6659e8c7f2b119da",
+                    ref="refs/heads/main",
+                    sarif_files=[sarif_file],
+                    wait=False,
+                )
+            ]
+
+        self.assertEqual(len(uploads), 1)
+        self.assertEqual(uploads[0].path, Path(sarif_file))
+        self.assertIsNone(uploads[0].information)
+        self.client.get.assert_not_awaited()
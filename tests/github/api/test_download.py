@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.download import download_file
+from pontos.github.api.errors import GitHubApiError
+from pontos.testing import temp_directory
+from tests import IsolatedAsyncioTestCase
+
+RANGE_REGEX = re.compile(r"bytes=(\d+)-(\d+)")
+CONTENT = bytes(range(256)) * 40  # 10240 bytes
+
+
+class Server:
+    def __init__(
+        self, content: bytes = CONTENT, *, ranges: bool = True
+    ) -> None:
+        self.content = content
+        self.ranges = ranges
+        self.requests: list[httpx.Request] = []
+        self.fail_ranges: set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+
+        if request.url.host == "api.github.com":
+            return httpx.Response(
+                302, headers={"location": "https://storage.example.com/file"}
+            )
+
+        range_header = request.headers.get("range")
+        if not self.ranges or not range_header:
+            return httpx.Response(200, content=self.content)
+
+        if range_header in self.fail_ranges:
+            return httpx.Response(500)
+
+        match = RANGE_REGEX.match(range_header)
+        start, end = int(match.group(1)), int(match.group(2))  # type: ignore[union-attr]
+        if start >= len(self.content):
+            return httpx.Response(
+                416, headers={"content-range": f"bytes */{len(self.content)}"}
+            )
+
+        return httpx.Response(
+            206,
+            content=self.content[start : end + 1],
+            headers={
+                "content-range": f"bytes {start}-{end}/{len(self.content)}",
+                "etag": '"abc"',
+            },
+        )
+
+    def range_requests(self) -> list[str]:
+        return [
+            request.headers["range"]
+            for request in self.requests
+            if request.url.host == "storage.example.com"
+            and request.headers["range"] != "bytes=0-0"
+        ]
+
+
+class DownloadFileTestCase(IsolatedAsyncioTestCase):
+    def create_client(self, server: Server) -> GitHubAsyncRESTClient:
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(server)
+        )
+        return client
+
+    async def test_download(self):
+        server = Server()
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            destination = temp_dir / "file.zip"
+            download = await download_file(
+                client, "/repos/foo/bar/zip", destination, part_size=4096
+            )
+
+            self.assertEqual(destination.read_bytes(), CONTENT)
+            self.assertEqual(download.path, destination)
+            self.assertEqual(download.size, len(CONTENT))
+            self.assertEqual(
+                download.digest, hashlib.sha256(CONTENT).hexdigest()
+            )
+            self.assertFalse(download.resumed)
+            self.assertEqual(list(temp_dir.iterdir()), [destination])
+
+        self.assertEqual(
+            sorted(server.range_requests()),
+            ["bytes=0-4095", "bytes=4096-8191", "bytes=8192-10239"],
+        )
+
+    @patch("pontos.github.api.download.os", MagicMock(spec=[]))
+    async def test_download_without_pwrite(self):
+        server = Server()
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            destination = temp_dir / "file.zip"
+            download = await download_file(
+                client, "/repos/foo/bar/zip", destination, part_size=1000
+            )
+
+            self.assertEqual(destination.read_bytes(), CONTENT)
+            self.assertEqual(
+                download.digest, hashlib.sha256(CONTENT).hexdigest()
+            )
+
+    async def test_download_doesnt_send_token_to_other_host(self):
+        server = Server()
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            await download_file(
+                client,
+                "/repos/foo/bar/zip",
+                temp_dir / "file.zip",
+                part_size=4096,
+            )
+
+        for request in server.requests:
+            if request.headers.get("range", "bytes=0-0") != "bytes=0-0":
+                self.assertNotIn("authorization", request.headers)
+
+    async def test_download_without_range_support(self):
+        server = Server(ranges=False)
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            destination = temp_dir / "file.zip"
+            download = await download_file(
+                client, "/repos/foo/bar/zip", destination, part_size=4096
+            )
+
+            self.assertEqual(destination.read_bytes(), CONTENT)
+            self.assertEqual(
+                download.digest, hashlib.sha256(CONTENT).hexdigest()
+            )
+
+        self.assertEqual(server.range_requests(), [])
+
+    async def test_download_empty_file(self):
+        server = Server(b"")
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            destination = temp_dir / "file.zip"
+            download = await download_file(
+                client, "/repos/foo/bar/zip", destination
+            )
+
+            self.assertEqual(destination.read_bytes(), b"")
+            self.assertEqual(download.size, 0)
+            self.assertEqual(download.digest, hashlib.sha256().hexdigest())
+            self.assertEqual(list(temp_dir.iterdir()), [destination])
+
+        self.assertEqual(server.range_requests(), [])
+
+    async def test_resume_download(self):
+        server = Server()
+        server.fail_ranges.add("bytes=8192-10239")
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            destination = temp_dir / "file.zip"
+
+            with self.assertRaises(httpx.HTTPStatusError):
+                await download_file(
+                    client,
+                    "/repos/foo/bar/zip",
+                    destination,
+                    part_size=4096,
+                    concurrency=1,
+                )
+
+            self.assertFalse(destination.exists())
+            state = json.loads(
+                (temp_dir / "file.zip.download.json").read_text()
+            )
+            self.assertEqual(state["completed"], [0, 1])
+
+            server.fail_ranges.clear()
+            server.requests.clear()
+
+            download = await download_file(
+                client, "/repos/foo/bar/zip", destination, part_size=4096
+            )
+
+            self.assertTrue(download.resumed)
+            self.assertEqual(destination.read_bytes(), CONTENT)
+            self.assertEqual(
+                download.digest, hashlib.sha256(CONTENT).hexdigest()
+            )
+            self.assertFalse((temp_dir / "file.zip.download.json").exists())
+
+        self.assertEqual(server.range_requests(), ["bytes=8192-10239"])
+
+    async def test_restart_download_if_file_changed(self):
+        server = Server()
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            destination = temp_dir / "file.zip"
+            (temp_dir / "file.zip.download").write_bytes(b"\0" * len(CONTENT))
+            (temp_dir / "file.zip.download.json").write_text(
+                json.dumps(
+                    {
+                        "size": len(CONTENT),
+                        "validator": '"other"',
+                        "completed": [0],
+                    }
+                )
+            )
+
+            download = await download_file(
+                client, "/repos/foo/bar/zip", destination, part_size=4096
+            )
+
+            self.assertFalse(download.resumed)
+            self.assertEqual(destination.read_bytes(), CONTENT)
+
+        self.assertEqual(len(server.range_requests()), 3)
+
+    async def test_digest_mismatch(self):
+        server = Server()
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            destination = temp_dir / "file.zip"
+
+            with self.assertRaisesRegex(GitHubApiError, "doesn't match"):
+                await download_file(
+                    client,
+                    "/repos/foo/bar/zip",
+                    destination,
+                    expected_digest="1234",
+                )
+
+            self.assertEqual(list(Path(temp_dir).iterdir()), [])
+
+    async def test_digest(self):
+        server = Server()
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            download = await download_file(
+                client,
+                "/repos/foo/bar/zip",
+                temp_dir / "file.zip",
+                part_size=1000,
+                expected_digest=hashlib.sha256(CONTENT).hexdigest().upper(),
+            )
+
+        self.assertEqual(download.digest, hashlib.sha256(CONTENT).hexdigest())
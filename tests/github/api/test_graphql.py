@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+# pylint: disable=redefined-builtin
+
+from datetime import datetime, timezone
+
+from pontos.github.api.errors import GitHubApiError
+from pontos.github.api.graphql import GitHubAsyncGraphQL
+from pontos.github.api.helper import DEFAULT_GITHUB_API_URL
+from tests.github.api import GitHubAsyncRESTTestCase, create_response
+
+RULE = {
+    "isAdminEnforced": True,
+    "requiresLinearHistory": False,
+    "allowsForcePushes": False,
+    "allowsDeletions": False,
+    "blocksCreations": False,
+    "requiresConversationResolution": True,
+    "lockBranch": False,
+    "lockAllowsFetchAndMerge": False,
+    "requiresCommitSignatures": False,
+    "requiresApprovingReviews": True,
+    "requiredApprovingReviewCount": 2,
+    "dismissesStaleReviews": True,
+    "requiresCodeOwnerReviews": False,
+    "requireLastPushApproval": False,
+    "requiresStatusChecks": True,
+    "requiresStrictStatusChecks": True,
+    "requiredStatusChecks": [
+        {"context": "build", "app": {"databaseId": 15368}},
+        {"context": "lint", "app": None},
+    ],
+}
+
+
+class GitHubAsyncGraphQLTestCase(GitHubAsyncRESTTestCase):
+    api_cls = GitHubAsyncGraphQL
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.url = DEFAULT_GITHUB_API_URL
+
+    async def test_query(self):
+        response = create_response()
+        response.json.return_value = {"data": {"viewer": {"login": "foo"}}}
+        self.client.post.return_value = response
+
+        data = await self.api.query(
+            "query($id: ID!) { node(id: $id) { id } }", {"id": "1"}
+        )
+
+        self.assertEqual(data, {"viewer": {"login": "foo"}})
+        self.client.post.assert_awaited_once_with(
+            "https://api.github.com/graphql",
+            data={
+                "query": "query($id: ID!) { node(id: $id) { id } }",
+                "variables": {"id": "1"},
+            },
+            mutating=False,
+        )
+
+    async def test_query_enterprise_server(self):
+        self.client.url = "https://github.example.com/api/v3"
+        response = create_response()
+        response.json.return_value = {"data": {"viewer": {"login": "foo"}}}
+        self.client.post.return_value = response
+
+        await self.api.query("query { viewer { login } }")
+
+        self.client.post.assert_awaited_once_with(
+            "https://github.example.com/api/graphql",
+            data={"query": "query { viewer { login } }"},
+            mutating=False,
+        )
+
+    async def test_query_failure(self):
+        response = create_response()
+        response.json.return_value = {
+            "data": None,
+            "errors": [{"message": "Something went wrong"}],
+        }
+        self.client.post.return_value = response
+
+        with self.assertRaisesRegex(GitHubApiError, "Something went wrong"):
+            await self.api.query("query { viewer { login } }")
+
+    async def test_invalid_repository(self):
+        with self.assertRaises(GitHubApiError):
+            await self.api.topics(["foo"])
+
+    async def test_topics(self):
+        response1 = create_response()
+        response1.json.return_value = {
+            "data": {
+                "repo0": {
+                    "repositoryTopics": {
+                        "nodes": [
+                            {"topic": {"name": "foo"}},
+                            {"topic": {"name": "bar"}},
+                        ]
+                    }
+                },
+                "repo1": None,
+            },
+            "errors": [{"type": "NOT_FOUND", "path": ["repo1"]}],
+        }
+        response2 = create_response()
+        response2.json.return_value = {
+            "data": {"repo0": {"repositoryTopics": {"nodes": []}}}
+        }
+        self.client.post.side_effect = [response1, response2]
+
+        topics = await self.api.topics(
+            ["foo/bar", "foo/missing", "foo/baz"], batch_size=2
+        )
+
+        self.assertEqual(
+            topics,
+            {"foo/bar": ["foo", "bar"], "foo/missing": None, "foo/baz": []},
+        )
+        self.assertEqual(self.client.post.await_count, 2)
+
+        variables = self.client.post.await_args_list[0].kwargs["data"][
+            "variables"
+        ]
+        self.assertEqual(
+            variables,
+            {
+                "owner0": "foo",
+                "name0": "bar",
+                "owner1": "foo",
+                "name1": "missing",
+            },
+        )
+
+    async def test_default_branches(self):
+        response = create_response()
+        response.json.return_value = {
+            "data": {
+                "repo0": {"defaultBranchRef": {"name": "main"}},
+                "repo1": {"defaultBranchRef": None},
+            }
+        }
+        self.client.post.return_value = response
+
+        branches = await self.api.default_branches(["foo/bar", "foo/empty"])
+
+        self.assertEqual(branches, {"foo/bar": "main", "foo/empty": None})
+
+    async def test_latest_releases(self):
+        response = create_response()
+        response.json.return_value = {
+            "data": {
+                "repo0": {
+                    "latestRelease": {
+                        "databaseId": 1,
+                        "id": "MDc6UmVsZWFzZTE=",
+                        "name": "v1.0.0",
+                        "tagName": "v1.0.0",
+                        "description": "Description of the release",
+                        "createdAt": "2013-02-27T19:35:32Z",
+                        "publishedAt": "2013-02-27T19:35:32Z",
+                        "isDraft": False,
+                        "isPrerelease": False,
+                        "url": "https://github.com/foo/bar/releases/tag/v1.0.0",
+                        "tagCommit": {"oid": "abc123"},
+                    }
+                },
+                "repo1": {"latestRelease": None},
+            }
+        }
+        self.client.post.return_value = response
+
+        releases = await self.api.latest_releases(["foo/bar", "foo/baz"])
+
+        self.assertIsNone(releases["foo/baz"])
+
+        release = releases["foo/bar"]
+        self.assertEqual(release.id, 1)
+        self.assertEqual(release.tag_name, "v1.0.0")
+        self.assertEqual(release.body, "Description of the release")
+        self.assertEqual(release.target_commitish, "abc123")
+        self.assertEqual(
+            release.url, "https://api.github.com/repos/foo/bar/releases/1"
+        )
+        self.assertEqual(
+            release.upload_url,
+            "https://uploads.github.com/repos/foo/bar/releases/1/assets"
+            "{?name,label}",
+        )
+        self.assertEqual(
+            release.created_at,
+            datetime(2013, 2, 27, 19, 35, 32, tzinfo=timezone.utc),
+        )
+
+    async def test_branch_protections(self):
+        response = create_response()
+        response.json.return_value = {
+            "data": {
+                "repo0": {
+                    "ref": {"name": "main", "branchProtectionRule": RULE}
+                },
+                "repo1": {
+                    "ref": {"name": "main", "branchProtectionRule": None}
+                },
+                "repo2": {"ref": None},
+            }
+        }
+        self.client.post.return_value = response
+
+        protections = await self.api.branch_protections(
+            ["foo/bar", "foo/baz", "foo/lorem"], branch="main"
+        )
+
+        self.assertIsNone(protections["foo/baz"])
+        self.assertIsNone(protections["foo/lorem"])
+
+        protection = protections["foo/bar"]
+        self.assertEqual(
+            protection.url,
+            "https://api.github.com/repos/foo/bar/branches/main/protection",
+        )
+        self.assertTrue(protection.enforce_admins.enabled)
+        self.assertTrue(protection.required_conversation_resolution.enabled)
+        self.assertFalse(protection.allow_force_pushes.enabled)
+        self.assertEqual(
+            protection.required_pull_request_reviews.required_approving_review_count,
+            2,
+        )
+        self.assertTrue(protection.required_status_checks.strict)
+        self.assertEqual(
+            [
+                (check.context, check.app_id)
+                for check in protection.required_status_checks.checks
+            ],
+            [("build", 15368), ("lint", None)],
+        )
+
+        data = self.client.post.await_args.kwargs["data"]
+        self.assertIn("$ref: String!", data["query"])
+        self.assertEqual(data["variables"]["ref"], "refs/heads/main")
+
+    async def test_branch_protections_default_branch(self):
+        response = create_response()
+        response.json.return_value = {
+            "data": {
+                "repo0": {
+                    "defaultBranchRef": {
+                        "name": "develop",
+                        "branchProtectionRule": {
+                            **RULE,
+                            "requiresApprovingReviews": False,
+                            "requiresStatusChecks": False,
+                        },
+                    }
+                },
+            }
+        }
+        self.client.post.return_value = response
+
+        protections = await self.api.branch_protections(["foo/bar"])
+
+        protection = protections["foo/bar"]
+        self.assertEqual(
+            protection.url,
+            "https://api.github.com/repos/foo/bar/branches/develop/protection",
+        )
+        self.assertIsNone(protection.required_pull_request_reviews)
+        self.assertIsNone(protection.required_status_checks)
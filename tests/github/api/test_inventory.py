@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from copy import deepcopy
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.inventory import (
+    GitHubAsyncRESTInventory,
+    InventorySnapshot,
+    RepositoryInventory,
+)
+from pontos.testing import temp_directory
+from tests import IsolatedAsyncioTestCase
+from tests.github.api.test_organizations import REPOSITORY_DICT
+
+TAKEN_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def create_repository(name: str, **kwargs: Any) -> dict[str, Any]:
+    data = deepcopy(REPOSITORY_DICT)
+    data.update(
+        name=name,
+        full_name=f"foo/{name}",
+        default_branch="main",
+        pushed_at="2026-01-01T00:00:00Z",
+        updated_at="2026-01-01T00:00:00Z",
+        topics=["python"],
+    )
+    data.update(kwargs)
+    return data
+
+
+class Server:
+    def __init__(self, repositories: list[dict[str, Any]]) -> None:
+        self.repositories = repositories
+        self.protected: set[str] = set()
+        self.alerts: dict[str, int] = {}
+        self.requested: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/orgs/foo/repos":
+            return httpx.Response(200, json=self.repositories)
+
+        repo = "/".join(path.split("/")[2:4])
+        self.requested.append(repo)
+        if path.endswith("/protection"):
+            return httpx.Response(
+                200 if repo in self.protected else 404, json={}
+            )
+        if path.endswith("/dependabot/alerts"):
+            if repo not in self.alerts:
+                return httpx.Response(403, json={})
+            return httpx.Response(200, json=[{}] * self.alerts[repo])
+        return httpx.Response(500)
+
+
+class InventorySnapshotTestCase(unittest.TestCase):
+    def create_snapshot(self, *repositories: RepositoryInventory):
+        return InventorySnapshot(
+            organization="foo",
+            taken_at=TAKEN_AT,
+            repositories={
+                repository.name: repository for repository in repositories
+            },
+        )
+
+    def test_queries(self):
+        snapshot = self.create_snapshot(
+            RepositoryInventory(
+                "foo/a", branch_protected=False, topics=["python"]
+            ),
+            RepositoryInventory("foo/b", branch_protected=False, archived=True),
+            RepositoryInventory(
+                "foo/c", branch_protected=True, open_dependabot_alerts=2
+            ),
+            RepositoryInventory(
+                "foo/d", branch_protected=None, open_dependabot_alerts=0
+            ),
+        )
+
+        self.assertEqual(
+            [repository.name for repository in snapshot.unprotected()],
+            ["foo/a"],
+        )
+        self.assertEqual(
+            [
+                repository.name
+                for repository in snapshot.with_dependabot_alerts()
+            ],
+            ["foo/c"],
+        )
+        self.assertEqual(
+            [repository.name for repository in snapshot.without_topic()],
+            ["foo/b", "foo/c", "foo/d"],
+        )
+        self.assertEqual(
+            [
+                repository.name
+                for repository in snapshot.without_topic("python")
+            ],
+            ["foo/b", "foo/c", "foo/d"],
+        )
+        self.assertEqual(snapshot.without_topic("go")[0].name, "foo/a")
+
+    def test_diff(self):
+        previous = self.create_snapshot(
+            RepositoryInventory("foo/a", branch_protected=False),
+            RepositoryInventory("foo/b", pushed_at="2026-01-01"),
+        )
+        snapshot = self.create_snapshot(
+            RepositoryInventory("foo/a", branch_protected=True),
+            RepositoryInventory("foo/b", pushed_at="2026-02-01"),
+            RepositoryInventory("foo/c"),
+        )
+
+        diff = snapshot.diff(previous)
+
+        self.assertTrue(diff)
+        self.assertEqual(diff.added, ["foo/c"])
+        self.assertEqual(diff.removed, [])
+        self.assertEqual(
+            diff.changed, {"foo/a": {"branch_protected": (False, True)}}
+        )
+
+        self.assertFalse(snapshot.diff(snapshot))
+        self.assertEqual(
+            previous.diff(snapshot).removed,
+            ["foo/c"],
+        )
+
+    def test_save_and_load(self):
+        snapshot = self.create_snapshot(
+            RepositoryInventory(
+                "foo/a",
+                topics=["python"],
+                branch_protected=True,
+                open_dependabot_alerts=1,
+            ),
+        )
+
+        with temp_directory() as temp_dir:
+            path = temp_dir / "inventory.json"
+            self.assertIsNone(InventorySnapshot.load(path))
+
+            snapshot.save(path)
+            loaded = InventorySnapshot.load(path)
+
+        self.assertEqual(loaded, snapshot)
+
+
+class GitHubAsyncRESTInventoryTestCase(IsolatedAsyncioTestCase):
+    def create_api(self, server: Server) -> GitHubAsyncRESTInventory:
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(server)
+        )
+        return GitHubAsyncRESTInventory(client)
+
+    async def test_snapshot(self):
+        server = Server(
+            [
+                create_repository("a"),
+                create_repository("b", topics=[]),
+                create_repository("c", default_branch=None),
+            ]
+        )
+        server.protected.add("foo/a")
+        server.alerts["foo/b"] = 3
+        api = self.create_api(server)
+
+        snapshot = await api.snapshot("foo", concurrency=2)
+
+        self.assertEqual(snapshot.organization, "foo")
+        self.assertEqual(snapshot.refetched, ["foo/a", "foo/b", "foo/c"])
+
+        a = snapshot.repositories["foo/a"]
+        self.assertTrue(a.branch_protected)
+        self.assertIsNone(a.open_dependabot_alerts)
+        self.assertEqual(a.topics, ["python"])
+        self.assertEqual(a.default_branch, "main")
+        self.assertEqual(a.pushed_at, "2026-01-01T00:00:00+00:00")
+
+        b = snapshot.repositories["foo/b"]
+        self.assertFalse(b.branch_protected)
+        self.assertEqual(b.open_dependabot_alerts, 3)
+
+        # empty repository without a branch
+        c = snapshot.repositories["foo/c"]
+        self.assertIsNone(c.branch_protected)
+        self.assertEqual(
+            server.requested.count("foo/c"), 1, "only alerts requested"
+        )
+
+    async def test_incremental_snapshot(self):
+        server = Server([create_repository("a"), create_repository("b")])
+        api = self.create_api(server)
+        previous = await api.snapshot("foo")
+
+        server.requested.clear()
+        server.repositories = [
+            create_repository("a"),
+            create_repository("b", pushed_at="2026-02-01T00:00:00Z"),
+            create_repository("c"),
+        ]
+        server.protected.add("foo/a")
+        server.protected.add("foo/b")
+
+        snapshot = await api.snapshot("foo", previous=previous)
+
+        self.assertEqual(snapshot.refetched, ["foo/b", "foo/c"])
+        self.assertEqual(set(server.requested), {"foo/b", "foo/c"})
+        # unchanged repositories are taken from the previous snapshot
+        self.assertFalse(snapshot.repositories["foo/a"].branch_protected)
+
+        diff = snapshot.diff(previous)
+        self.assertEqual(diff.added, ["foo/c"])
+        self.assertEqual(
+            diff.changed, {"foo/b": {"branch_protected": (False, True)}}
+        )
+
+    async def test_snapshot_error(self):
+        server = Server([create_repository("a")])
+        server.alerts["foo/a"] = 0
+        api = self.create_api(server)
+
+        async def failing(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/protection"):
+                return httpx.Response(500)
+            return server(request)
+
+        api._client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(failing)
+        )
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await api.snapshot("foo")
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from pontos.github.api.package_retention import (
+    PackageRetentionPolicy,
+    PackageVersionIndex,
+)
+from pontos.github.models.packages import PackageVersion
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def create_version(version_id: int, *tags: str, age: int = 0) -> PackageVersion:
+    created_at = (NOW - timedelta(days=age)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return PackageVersion.from_dict(
+        {
+            "id": version_id,
+            "name": f"sha256:{version_id}",
+            "url": f"https://api.github.com/orgs/foo/packages/container/bar/versions/{version_id}",
+            "package_html_url": "https://github.com/orgs/foo/packages/container/bar/versions",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "html_url": f"https://github.com/orgs/foo/packages/container/bar/{version_id}",
+            "metadata": {
+                "package_type": "container",
+                "container": {"tags": list(tags)},
+            },
+        }
+    )
+
+
+class PackageVersionIndexTestCase(unittest.TestCase):
+    def test_index(self):
+        index = PackageVersionIndex(
+            [
+                create_version(1, "v1", age=3),
+                create_version(2, age=2),
+                create_version(3, "v2", "latest", age=1),
+            ]
+        )
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual([v.id for v in index.versions], [3, 2, 1])
+        self.assertEqual(index.get("latest").id, 3)
+        self.assertEqual(index.get("v1").id, 1)
+        self.assertIsNone(index.get("v3"))
+        self.assertIn("v2", index)
+        self.assertNotIn("v3", index)
+        self.assertEqual(sorted(index.tags), ["latest", "v1", "v2"])
+        self.assertEqual([v.id for v in index.untagged], [2])
+
+
+class PackageRetentionPolicyTestCase(unittest.TestCase):
+    def select(self, policy, versions):
+        return [v.id for v in policy.select(versions, now=NOW)]
+
+    def test_empty_policy(self):
+        policy = PackageRetentionPolicy()
+        self.assertEqual(
+            self.select(policy, [create_version(1), create_version(2)]), []
+        )
+
+    def test_untagged(self):
+        policy = PackageRetentionPolicy(delete_untagged=True)
+        versions = [
+            create_version(1, age=3),
+            create_version(2, "v1", age=2),
+            create_version(3, age=1),
+        ]
+
+        self.assertEqual(self.select(policy, versions), [1, 3])
+
+    def test_max_age(self):
+        policy = PackageRetentionPolicy(max_age=timedelta(days=30))
+        versions = [
+            create_version(1, "v1", age=60),
+            create_version(2, "v2", age=31),
+            create_version(3, "v3", age=10),
+        ]
+
+        self.assertEqual(self.select(policy, versions), [1, 2])
+
+    def test_keep_last_per_prefix(self):
+        policy = PackageRetentionPolicy(
+            keep_last=2, tag_prefixes=("pr-", "nightly-")
+        )
+        versions = [
+            create_version(1, "pr-1", age=6),
+            create_version(2, "nightly-1", age=5),
+            create_version(3, "pr-2", age=4),
+            create_version(4, "nightly-2", age=3),
+            create_version(5, "pr-3", age=2),
+            create_version(6, "v1.0.0", age=10),
+            create_version(7, "nightly-3", age=1),
+        ]
+
+        self.assertEqual(self.select(policy, versions), [1, 2])
+
+    def test_protected_tags(self):
+        policy = PackageRetentionPolicy(
+            max_age=timedelta(days=30), protected_tags=frozenset(["stable"])
+        )
+        versions = [
+            create_version(1, "v1", "stable", age=60),
+            create_version(2, "v2", age=60),
+        ]
+
+        self.assertEqual(self.select(policy, versions), [2])
+
+    def test_select_from_index(self):
+        policy = PackageRetentionPolicy(delete_untagged=True)
+        index = PackageVersionIndex([create_version(1), create_version(2, "a")])
+
+        self.assertEqual(self.select(policy, index), [1])
@@ -3,10 +3,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
-from unittest.mock import MagicMock
+from copy import deepcopy
+from datetime import timedelta
+from unittest.mock import MagicMock, call
 
 from httpx import HTTPStatusError
 
+from pontos.github.api.errors import GitHubApiError
+from pontos.github.api.package_retention import PackageRetentionPolicy
 from pontos.github.api.packages import GitHubAsyncRESTPackages
 from pontos.github.models.packages import (
     Package,
@@ -307,3 +311,94 @@ class GitHubAsyncRESTPackagesTestCase(GitHubAsyncRESTTestCase):
         self.client.delete.assert_awaited_once_with(
             "/orgs/foo/packages/container/bar/versions/1"
         )
+
+    async def test_version_index(self):
+        version2 = deepcopy(PACKAGE_VERSION)
+        version2["id"] = 2
+        version2["created_at"] = "2021-01-01T00:00:00Z"
+        version2["metadata"]["container"]["tags"] = []
+        response1 = create_response()
+        response1.json.return_value = [PACKAGE_VERSION]
+        response2 = create_response()
+        response2.json.return_value = [version2]
+        self.client.get_all.return_value = AsyncIteratorMock(
+            [response1, response2]
+        )
+
+        index = await self.api.version_index(
+            "foo", PackageType.CONTAINER, "bar", concurrency=5
+        )
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.get("latest").id, 1)
+        self.assertEqual([version.id for version in index.untagged], [2])
+        self.client.get_all.assert_called_once_with(
+            "/orgs/foo/packages/container/bar/versions",
+            params={"per_page": "100"},
+            concurrency=5,
+        )
+
+    async def test_delete_package_versions(self):
+        self.client.delete.side_effect = [
+            create_response(is_success=True),
+            create_response(is_success=False, status_code=404),
+        ]
+
+        await self.api.delete_package_versions(
+            "foo", PackageType.CONTAINER, "bar", [1, 2]
+        )
+
+        self.client.delete.assert_has_awaits(
+            [
+                call("/orgs/foo/packages/container/bar/versions/1"),
+                call("/orgs/foo/packages/container/bar/versions/2"),
+            ],
+            any_order=True,
+        )
+
+    async def test_delete_package_versions_failure(self):
+        self.client.delete.return_value = create_response(
+            is_success=False, status_code=403
+        )
+
+        with self.assertRaises(GitHubApiError):
+            await self.api.delete_package_versions(
+                "foo", PackageType.CONTAINER, "bar", [1]
+            )
+
+    async def test_prune(self):
+        untagged = deepcopy(PACKAGE_VERSION)
+        untagged["id"] = 2
+        untagged["metadata"]["container"]["tags"] = []
+        response = create_response()
+        response.json.return_value = [PACKAGE_VERSION, untagged]
+        self.client.get_all.return_value = AsyncIteratorMock([response])
+        self.client.delete.return_value = create_response(is_success=True)
+
+        versions = await self.api.prune(
+            "foo",
+            PackageType.CONTAINER,
+            "bar",
+            PackageRetentionPolicy(delete_untagged=True),
+        )
+
+        self.assertEqual([version.id for version in versions], [2])
+        self.client.delete.assert_awaited_once_with(
+            "/orgs/foo/packages/container/bar/versions/2"
+        )
+
+    async def test_prune_dry_run(self):
+        response = create_response()
+        response.json.return_value = [PACKAGE_VERSION]
+        self.client.get_all.return_value = AsyncIteratorMock([response])
+
+        versions = await self.api.prune(
+            "foo",
+            PackageType.CONTAINER,
+            "bar",
+            PackageRetentionPolicy(max_age=timedelta(days=1)),
+            dry_run=True,
+        )
+
+        self.assertEqual([version.id for version in versions], [1])
+        self.client.delete.assert_not_awaited()
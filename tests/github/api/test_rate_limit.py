@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.rate_limit import RateLimit, RateLimitScheduler
+from tests import AsyncMock, IsolatedAsyncioTestCase
+
+NOW = 1_700_000_000
+
+
+def create_response(
+    status_code: int = 200,
+    *,
+    remaining: int = 4999,
+    limit: int = 5000,
+    reset: int = NOW + 3600,
+    resource: str = "core",
+    headers: dict[str, str] | None = None,
+    text: str = "",
+) -> httpx.Response:
+    response_headers = {
+        "x-ratelimit-limit": str(limit),
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-used": str(limit - remaining),
+        "x-ratelimit-reset": str(reset),
+        "x-ratelimit-resource": resource,
+    }
+    if headers:
+        response_headers.update(headers)
+    return httpx.Response(status_code, headers=response_headers, text=text)
+
+
+class RateLimitTestCase(IsolatedAsyncioTestCase):
+    def test_from_response(self):
+        rate_limit = RateLimit.from_response(
+            create_response(remaining=10, resource="search")
+        )
+
+        self.assertEqual(rate_limit.resource, "search")
+        self.assertEqual(rate_limit.limit, 5000)
+        self.assertEqual(rate_limit.remaining, 10)
+        self.assertEqual(rate_limit.used, 4990)
+        self.assertEqual(
+            rate_limit.reset,
+            datetime.fromtimestamp(NOW + 3600, tz=timezone.utc),
+        )
+
+    def test_from_response_without_headers(self):
+        self.assertIsNone(RateLimit.from_response(httpx.Response(200)))
+
+
+@patch("pontos.github.api.rate_limit.time.time", return_value=NOW)
+@patch("pontos.github.api.rate_limit.asyncio.sleep", autospec=True)
+class RateLimitSchedulerTestCase(IsolatedAsyncioTestCase):
+    async def test_track_budget(self, sleep_mock: MagicMock, _time_mock):
+        scheduler = RateLimitScheduler()
+        self.assertIsNone(scheduler.budget)
+
+        send = AsyncMock(return_value=create_response(remaining=4000))
+        response = await scheduler.run(send)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(scheduler.budget.remaining, 4000)
+        self.assertIn("core", scheduler.budgets)
+        sleep_mock.assert_not_called()
+
+    async def test_pace_low_budget(self, sleep_mock: MagicMock, _time_mock):
+        scheduler = RateLimitScheduler(mutating_request_delay=0)
+        send = AsyncMock(return_value=create_response(remaining=100))
+
+        await scheduler.run(send)
+        sleep_mock.assert_not_called()
+
+        await scheduler.run(send)
+        sleep_mock.assert_awaited_once_with(36.0)
+
+    async def test_wait_for_reset(self, sleep_mock: MagicMock, _time_mock):
+        scheduler = RateLimitScheduler()
+        send = AsyncMock(return_value=create_response(remaining=0))
+
+        await scheduler.run(send)
+        await scheduler.run(send)
+
+        sleep_mock.assert_awaited_once_with(3601.0)
+
+    async def test_secondary_rate_limit_retry_after(
+        self, sleep_mock: MagicMock, _time_mock
+    ):
+        scheduler = RateLimitScheduler()
+        send = AsyncMock(
+            side_effect=[
+                create_response(403, headers={"retry-after": "30"}),
+                create_response(),
+            ]
+        )
+
+        with patch(
+            "pontos.github.api.rate_limit.time.monotonic", return_value=0
+        ):
+            response = await scheduler.run(send)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(send.await_count, 2)
+        sleep_mock.assert_awaited_once_with(30.0)
+
+    async def test_secondary_rate_limit_backoff(
+        self, sleep_mock: MagicMock, _time_mock
+    ):
+        scheduler = RateLimitScheduler(
+            max_retries=2, secondary_rate_limit_delay=10
+        )
+        rate_limited = create_response(
+            403, text="You have exceeded a secondary rate limit."
+        )
+        send = AsyncMock(return_value=rate_limited)
+
+        with patch(
+            "pontos.github.api.rate_limit.time.monotonic", return_value=0
+        ):
+            response = await scheduler.run(send)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(send.await_count, 3)
+        self.assertEqual(
+            [c.args[0] for c in sleep_mock.await_args_list], [10.0, 20.0]
+        )
+
+    async def test_no_retry_on_permission_error(
+        self, sleep_mock: MagicMock, _time_mock
+    ):
+        scheduler = RateLimitScheduler()
+        send = AsyncMock(
+            return_value=create_response(403, text="Resource not accessible")
+        )
+
+        response = await scheduler.run(send)
+
+        self.assertEqual(response.status_code, 403)
+        send.assert_awaited_once()
+        sleep_mock.assert_not_called()
+
+    async def test_no_retry(self, sleep_mock: MagicMock, _time_mock):
+        scheduler = RateLimitScheduler()
+        send = AsyncMock(
+            return_value=create_response(429, headers={"retry-after": "5"})
+        )
+
+        response = await scheduler.run(send, retry=False)
+
+        self.assertEqual(response.status_code, 429)
+        send.assert_awaited_once()
+        sleep_mock.assert_not_called()
+
+    async def test_mutating_request_delay(
+        self, sleep_mock: MagicMock, _time_mock
+    ):
+        scheduler = RateLimitScheduler()
+        send = AsyncMock(return_value=create_response())
+
+        with patch(
+            "pontos.github.api.rate_limit.time.monotonic",
+            side_effect=[10.0, 10.25, 11.0],
+        ):
+            await scheduler.run(send, mutating=True)
+            await scheduler.run(send, mutating=True)
+
+        sleep_mock.assert_awaited_once_with(0.75)
+
+    async def test_concurrent_mutating_requests(
+        self, sleep_mock: MagicMock, _time_mock
+    ):
+        scheduler = RateLimitScheduler()
+        send = AsyncMock(return_value=create_response())
+
+        with patch(
+            "pontos.github.api.rate_limit.time.monotonic", return_value=10.0
+        ):
+            await asyncio.gather(
+                *(scheduler.run(send, mutating=True) for _ in range(3))
+            )
+
+        # each request reserves its own slot
+        self.assertEqual(
+            [c.args[0] for c in sleep_mock.await_args_list], [1.0, 2.0]
+        )
+
+    async def test_concurrent_paced_requests(
+        self, sleep_mock: MagicMock, _time_mock
+    ):
+        scheduler = RateLimitScheduler(mutating_request_delay=0)
+        send = AsyncMock(return_value=create_response(remaining=101))
+
+        # keep the requests waiting until both are scheduled. otherwise the
+        # response of the first one would reset the budget.
+        waiting = asyncio.Event()
+        scheduled = asyncio.Event()
+
+        async def sleep(delay: float) -> None:
+            if sleep_mock.await_count == 2:
+                scheduled.set()
+            await waiting.wait()
+
+        sleep_mock.side_effect = sleep
+
+        with patch(
+            "pontos.github.api.rate_limit.time.monotonic", return_value=10.0
+        ):
+            await scheduler.run(send)
+            tasks = [asyncio.create_task(scheduler.run(send)) for _ in range(2)]
+            await scheduled.wait()
+            waiting.set()
+            await asyncio.gather(*tasks)
+
+        # the second request is paced after the first one
+        first, second = [c.args[0] for c in sleep_mock.await_args_list]
+        self.assertAlmostEqual(first, 3600 / 101)
+        self.assertAlmostEqual(second, 3600 / 101 + 3600 / 100)
+
+    async def test_waiting_request_does_not_block(
+        self, sleep_mock: MagicMock, _time_mock
+    ):
+        scheduler = RateLimitScheduler()
+        send = AsyncMock(return_value=create_response())
+        await scheduler.run(send, mutating=True)
+
+        waiting = asyncio.Event()
+
+        async def sleep(delay: float) -> None:
+            await waiting.wait()
+
+        sleep_mock.side_effect = sleep
+
+        mutating = asyncio.create_task(scheduler.run(send, mutating=True))
+        response = await asyncio.wait_for(scheduler.run(send), timeout=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(mutating.done())
+
+        waiting.set()
+        await mutating
+
+
+class GitHubAsyncRESTClientRateLimitTestCase(IsolatedAsyncioTestCase):
+    @patch("pontos.github.api.client.httpx.AsyncClient")
+    async def test_search_resource(self, async_client: MagicMock):
+        http_client = AsyncMock()
+        http_client.get.return_value = create_response(
+            remaining=20, limit=30, resource="search"
+        )
+        async_client.return_value = http_client
+        scheduler = RateLimitScheduler()
+        client = GitHubAsyncRESTClient("token", rate_limit=scheduler)
+
+        await client.get("/search/repositories")
+
+        self.assertIsNone(scheduler.budget)
+        self.assertEqual(scheduler.budgets["search"].remaining, 20)
+
+    @patch("pontos.github.api.client.httpx.AsyncClient")
+    async def test_non_mutating_post(self, async_client: MagicMock):
+        http_client = AsyncMock()
+        http_client.post.return_value = create_response(resource="graphql")
+        async_client.return_value = http_client
+        scheduler = RateLimitScheduler()
+        client = GitHubAsyncRESTClient(
+            "token",
+            url="https://github.example.com/api/v3",
+            rate_limit=scheduler,
+        )
+
+        with patch.object(scheduler, "run", wraps=scheduler.run) as run:
+            await client.post(
+                "https://github.example.com/api/graphql",
+                data={"query": "query { viewer { login } }"},
+                mutating=False,
+            )
+
+        self.assertFalse(run.call_args.kwargs["mutating"])
+        self.assertEqual(run.call_args.kwargs["resource"], "graphql")
@@ -6,11 +6,15 @@
 # pylint: disable=redefined-builtin, line-too-long, too-many-lines
 
 from pathlib import Path
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 import httpx
 
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.errors import GitHubApiError
 from pontos.github.api.release import GitHubAsyncRESTReleases
+from pontos.github.api.upload import AssetUpload
+from pontos.testing import temp_directory
 from tests import AsyncIteratorMock, AsyncMock
 from tests.github.api import GitHubAsyncRESTTestCase, create_response
 
@@ -431,6 +435,144 @@ class GitHubAsyncRESTReleasesTestCase(GitHubAsyncRESTTestCase):
         with self.assertRaises(StopAsyncIteration):
             await anext(assets_it)
 
+    @patch("pontos.github.api.release.download_file", new_callable=AsyncMock)
+    async def test_download_release_assets_to(
+        self, download_file_mock: AsyncMock
+    ):
+        get_assets_url_response = create_response()
+        data = RELEASE_JSON.copy()
+        data.update({"assets_url": "https://foo.bar/assets"})
+        get_assets_url_response.json.return_value = data
+        get_assets_response = create_response()
+        get_assets_response.json.return_value = [
+            {"browser_download_url": "http://bar", "name": "bar.zip"},
+            {"browser_download_url": "http://baz", "name": "baz.txt"},
+        ]
+        self.client.get.side_effect = [
+            get_assets_url_response,
+            get_assets_response,
+        ]
+        directory = MagicMock(spec=Path)
+        directory.__truediv__.side_effect = lambda name: Path("dist") / name
+
+        downloads = [
+            download
+            async for download in self.api.download_release_assets_to(
+                "foo/bar", "v1.2.3", directory, match_pattern="*.zip"
+            )
+        ]
+
+        self.assertEqual(downloads, [download_file_mock.return_value])
+        directory.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        download_file_mock.assert_awaited_once_with(
+            self.client,
+            "http://bar",
+            Path("dist") / "bar.zip",
+            part_size=8 * 1024 * 1024,
+            concurrency=4,
+        )
+
+    @patch("pontos.github.api.release.download_file", new_callable=AsyncMock)
+    async def test_download_release_assets_to_with_digest(
+        self, download_file_mock: AsyncMock
+    ):
+        get_assets_url_response = create_response()
+        data = RELEASE_JSON.copy()
+        data.update({"assets_url": "https://foo.bar/assets"})
+        get_assets_url_response.json.return_value = data
+        get_assets_response = create_response()
+        get_assets_response.json.return_value = [
+            {
+                "browser_download_url": "http://bar",
+                "name": "bar.zip",
+                "digest": "sha256:1234",
+            },
+        ]
+        self.client.get.side_effect = [
+            get_assets_url_response,
+            get_assets_response,
+        ]
+        directory = MagicMock(spec=Path)
+        directory.__truediv__.side_effect = lambda name: Path("dist") / name
+
+        async for _ in self.api.download_release_assets_to(
+            "foo/bar", "v1.2.3", directory
+        ):
+            pass
+
+        download_file_mock.assert_awaited_once_with(
+            self.client,
+            "http://bar",
+            Path("dist") / "bar.zip",
+            part_size=8 * 1024 * 1024,
+            concurrency=4,
+            expected_digest="1234",
+        )
+
+    async def test_download_release_assets_to_digest_mismatch(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/tags/v1.2.3"):
+                return httpx.Response(200, json=RELEASE_JSON)
+            if request.url.path.endswith("/assets"):
+                return httpx.Response(
+                    200,
+                    json=[
+                        {
+                            "browser_download_url": "https://foo.bar/bar.zip",
+                            "name": "bar.zip",
+                            "digest": f"sha256:{'0' * 64}",
+                        }
+                    ],
+                )
+            return httpx.Response(200, content=b"bar")
+
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        api = GitHubAsyncRESTReleases(client)
+
+        with temp_directory() as temp_dir:
+            with self.assertRaisesRegex(GitHubApiError, "doesn't match"):
+                async for _ in api.download_release_assets_to(
+                    "foo/bar", "v1.2.3", temp_dir
+                ):
+                    pass
+
+            self.assertEqual(list(temp_dir.iterdir()), [])
+
+    @patch("pontos.github.api.release.upload_assets")
+    async def test_upload_release_assets_with_checksums(
+        self, upload_assets_mock: MagicMock
+    ):
+        response = create_response()
+        response.json.return_value = RELEASE_JSON
+        self.client.get.return_value = response
+
+        foo = AssetUpload(path=Path("foo"), name="foo", size=1, sha256="123")
+        manifest_upload = AssetUpload(
+            path=Path("SHA256SUMS"), name="SHA256SUMS", size=1, sha256="456"
+        )
+        upload_assets_mock.side_effect = [
+            AsyncIteratorMock([foo]),
+            AsyncIteratorMock([manifest_upload]),
+        ]
+        manifest = MagicMock(spec=Path)
+
+        uploads = [
+            upload
+            async for upload in self.api.upload_release_assets_with_checksums(
+                "foo/bar", "v1.2.3", [Path("foo")], manifest=manifest
+            )
+        ]
+
+        self.assertEqual(uploads, [foo, manifest_upload])
+        manifest.write_text.assert_called_once_with("123  foo\n")
+        self.assertEqual(
+            upload_assets_mock.call_args_list[1].args[2],
+            [(manifest, "text/plain")],
+        )
+
     async def test_upload_release_assets(self):
         response = create_response()
         data = RELEASE_JSON.copy()
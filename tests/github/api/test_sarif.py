@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import base64
+import gzip
+import os
+import unittest
+
+from pontos.github.api.sarif import encode_sarif, encode_sarif_file
+from pontos.testing import temp_directory
+from tests import IsolatedAsyncioTestCase
+
+
+def decode(chunks: list[bytes]) -> bytes:
+    return gzip.decompress(base64.b64decode(b"".join(chunks)))
+
+
+class EncodeSarifTestCase(unittest.TestCase):
+    def test_encode(self):
+        data = b'{"version": "2.1.0", "runs": []}' * 1000
+
+        chunks = list(
+            encode_sarif(data[i : i + 7] for i in range(0, len(data), 7))
+        )
+
+        self.assertEqual(decode(chunks), data)
+        # no padding within the encoded data
+        self.assertNotIn(b"=", b"".join(chunks[:-1]))
+
+    def test_encode_random_data(self):
+        data = os.urandom(100_000)
+
+        chunks = list(
+            encode_sarif(data[i : i + 4096] for i in range(0, len(data), 4096))
+        )
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(decode(chunks), data)
+
+    def test_encode_empty(self):
+        self.assertEqual(decode(list(encode_sarif([]))), b"")
+
+
+class EncodeSarifFileTestCase(IsolatedAsyncioTestCase):
+    async def test_encode_file(self):
+        data = os.urandom(10_000)
+
+        with temp_directory() as temp_dir:
+            sarif_file = temp_dir / "results.sarif"
+            sarif_file.write_bytes(data)
+
+            chunks = [
+                chunk
+                async for chunk in encode_sarif_file(
+                    sarif_file, chunk_size=1000
+                )
+            ]
+
+        self.assertEqual(decode(chunks), data)
@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from pontos.errors import PontosError
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.security_alerts import (
+    GitHubAsyncRESTSecurityAlerts,
+    SecurityAlert,
+    SecurityAlertStore,
+    SecurityAlertType,
+)
+from tests import IsolatedAsyncioTestCase
+
+
+def create_alert(
+    number: int,
+    updated_at: str,
+    *,
+    repository: str = "foo/bar",
+    state: str = "open",
+    **kwargs: Any,
+) -> dict[str, Any]:
+    data = {
+        "number": number,
+        "state": state,
+        "html_url": f"https://github.com/{repository}/alerts/{number}",
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": updated_at,
+        "repository": {"full_name": repository},
+    }
+    data.update(kwargs)
+    return data
+
+
+class Server:
+    def __init__(self) -> None:
+        self.alerts: dict[str, list[dict[str, Any]]] = {
+            "dependabot": [],
+            "code-scanning": [],
+            "secret-scanning": [],
+        }
+        self.page_size = 2
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        alert_type = request.url.path.split("/")[3]
+        alerts = sorted(
+            self.alerts[alert_type],
+            key=lambda alert: alert["updated_at"],
+            reverse=True,
+        )
+        page = int(request.url.params.get("page", "1"))
+        start = (page - 1) * self.page_size
+        headers = {}
+        if start + self.page_size < len(alerts):
+            next_url = request.url.copy_merge_params({"page": page + 1})
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return httpx.Response(
+            200,
+            json=alerts[start : start + self.page_size],
+            headers=headers,
+        )
+
+    def pages(self, alert_type: str) -> int:
+        return sum(
+            1
+            for request in self.requests
+            if request.url.path.split("/")[3] == alert_type
+        )
+
+
+class SecurityAlertTestCase(unittest.TestCase):
+    def test_dependabot(self):
+        alert = SecurityAlert.from_dict(
+            "dependabot",
+            create_alert(
+                1,
+                "2026-01-02T00:00:00Z",
+                security_advisory={"severity": "high", "summary": "Bad"},
+            ),
+        )
+
+        self.assertEqual(alert.type, SecurityAlertType.DEPENDABOT)
+        self.assertEqual(alert.repository, "foo/bar")
+        self.assertEqual(alert.severity, "high")
+        self.assertEqual(alert.title, "Bad")
+        self.assertEqual(
+            alert.updated_at, datetime(2026, 1, 2, tzinfo=timezone.utc)
+        )
+
+    def test_code_scanning(self):
+        alert = SecurityAlert.from_dict(
+            SecurityAlertType.CODE_SCANNING,
+            create_alert(
+                1,
+                None,
+                rule={
+                    "name": "foo",
+                    "description": "Foo",
+                    "severity": "error",
+                    "security_severity_level": "critical",
+                },
+            ),
+        )
+
+        self.assertEqual(alert.severity, "critical")
+        self.assertEqual(alert.title, "Foo")
+        # falls back to the creation date
+        self.assertEqual(alert.updated_at, alert.created_at)
+
+    def test_secret_scanning(self):
+        alert = SecurityAlert.from_dict(
+            "secret-scanning",
+            create_alert(
+                1,
+                "2026-01-02T00:00:00Z",
+                secret_type="github_pat",
+                secret_type_display_name="GitHub Token",
+            ),
+        )
+
+        self.assertIsNone(alert.severity)
+        self.assertEqual(alert.title, "GitHub Token")
+
+
+class GitHubAsyncRESTSecurityAlertsTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = Server()
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.server)
+        )
+        self.api = GitHubAsyncRESTSecurityAlerts(client)
+
+    async def test_organization_alerts(self):
+        self.server.alerts["dependabot"] = [
+            create_alert(1, "2026-01-02T00:00:00Z"),
+            create_alert(2, "2026-01-03T00:00:00Z"),
+            create_alert(3, "2026-01-04T00:00:00Z"),
+        ]
+        self.server.alerts["secret-scanning"] = [
+            create_alert(1, "2026-01-05T00:00:00Z"),
+        ]
+
+        alerts = await self.api.organization_alerts("foo")
+
+        self.assertEqual(
+            [(str(alert.type), alert.number) for alert in alerts],
+            [
+                ("dependabot", 3),
+                ("dependabot", 2),
+                ("dependabot", 1),
+                ("secret-scanning", 1),
+            ],
+        )
+        request = self.server.requests[0]
+        self.assertEqual(request.url.params["sort"], "updated")
+        self.assertEqual(request.url.params["direction"], "desc")
+
+    async def test_organization_alerts_since(self):
+        self.server.alerts["dependabot"] = [
+            create_alert(number, f"2026-01-{number:02}T00:00:00Z")
+            for number in range(1, 11)
+        ]
+
+        alerts = await self.api.organization_alerts(
+            "foo",
+            since={
+                SecurityAlertType.DEPENDABOT: datetime(
+                    2026, 1, 8, tzinfo=timezone.utc
+                )
+            },
+            alert_types=["dependabot"],
+        )
+
+        self.assertEqual([alert.number for alert in alerts], [10, 9, 8])
+        # only the pages up to the cursor have been requested
+        self.assertEqual(self.server.pages("dependabot"), 2)
+        self.assertEqual(self.server.pages("code-scanning"), 0)
+
+    async def test_organization_alerts_failure(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "secret-scanning" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, json=[])
+
+        self.api._client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.organization_alerts("foo")
+
+
+class SecurityAlertStoreTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = Server()
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.server)
+        )
+        self.api = GitHubAsyncRESTSecurityAlerts(client)
+        self.store = SecurityAlertStore(":memory:")
+        self.store.open()
+
+    def tearDown(self) -> None:
+        self.store.close()
+
+    def test_not_opened(self):
+        store = SecurityAlertStore(":memory:")
+        with self.assertRaises(PontosError):
+            len(store)
+
+    async def test_sync(self):
+        self.server.alerts["dependabot"] = [
+            create_alert(1, "2026-01-02T00:00:00Z"),
+            create_alert(2, "2026-01-03T00:00:00Z"),
+        ]
+        self.server.alerts["code-scanning"] = [
+            create_alert(1, "2026-01-04T00:00:00Z", repository="foo/baz"),
+        ]
+
+        count = await self.store.sync(self.api, "foo")
+
+        self.assertEqual(count, 3)
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(
+            self.store.cursors("foo"),
+            {
+                SecurityAlertType.DEPENDABOT: datetime(
+                    2026, 1, 3, tzinfo=timezone.utc
+                ),
+                SecurityAlertType.CODE_SCANNING: datetime(
+                    2026, 1, 4, tzinfo=timezone.utc
+                ),
+            },
+        )
+
+        alerts = list(self.store.alerts("foo"))
+        self.assertEqual(
+            [(str(alert.type), alert.number) for alert in alerts],
+            [("code-scanning", 1), ("dependabot", 2), ("dependabot", 1)],
+        )
+        self.assertEqual(
+            len(list(self.store.alerts("foo", repository="foo/baz"))), 1
+        )
+        self.assertEqual(
+            len(list(self.store.alerts("foo", alert_type="dependabot"))), 2
+        )
+
+    async def test_incremental_sync(self):
+        self.server.alerts["dependabot"] = [
+            create_alert(1, "2026-01-02T00:00:00Z"),
+            create_alert(2, "2026-01-03T00:00:00Z"),
+            create_alert(3, "2026-01-04T00:00:00Z"),
+        ]
+        await self.store.sync(self.api, "foo")
+
+        self.server.requests.clear()
+        self.server.alerts["dependabot"][0] = create_alert(
+            1, "2026-01-05T00:00:00Z", state="fixed"
+        )
+        self.server.alerts["dependabot"].append(
+            create_alert(4, "2026-01-06T00:00:00Z")
+        )
+
+        count = await self.store.sync(self.api, "foo")
+
+        # the changed, the new and the alert at the cursor
+        self.assertEqual(count, 3)
+        self.assertEqual(self.server.pages("dependabot"), 2)
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(
+            [alert.number for alert in self.store.alerts("foo", state="open")],
+            [4, 3, 2],
+        )
+        self.assertEqual(
+            self.store.cursors("foo")[SecurityAlertType.DEPENDABOT],
+            datetime(2026, 1, 6, tzinfo=timezone.utc),
+        )
@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from pontos.github.api.client import GitHubAsyncRESTClient
+from pontos.github.api.errors import GitHubApiError
+from pontos.github.api.upload import (
+    AssetUpload,
+    create_checksum_manifest,
+    upload_assets,
+)
+from pontos.github.models.release import Release
+from pontos.testing import temp_directory
+from tests import IsolatedAsyncioTestCase
+
+RELEASE_URL = "https://api.github.com/repos/foo/bar/releases/1"
+UPLOAD_URL = "https://uploads.github.com/repos/foo/bar/releases/1/assets"
+
+
+def create_release(assets: list[dict[str, Any]] | None = None) -> Release:
+    return Release.from_dict(
+        {
+            "assets_url": f"{RELEASE_URL}/assets",
+            "created_at": "2013-02-27T19:35:32Z",
+            "draft": False,
+            "html_url": "https://github.com/foo/bar/releases/v1.0.0",
+            "id": 1,
+            "node_id": "MDc6UmVsZWFzZTE=",
+            "prerelease": False,
+            "tag_name": "v1.0.0",
+            "target_commitish": "main",
+            "upload_url": f"{UPLOAD_URL}{{?name,label}}",
+            "url": RELEASE_URL,
+            "assets": assets or [],
+        }
+    )
+
+
+def create_asset(name: str, content: bytes, **kwargs) -> dict[str, Any]:
+    data = {
+        "url": f"https://api.github.com/repos/foo/bar/releases/assets/{name}",
+        "browser_download_url": f"https://github.com/foo/bar/{name}",
+        "id": 1,
+        "node_id": "MDEyOlJlbGVhc2VBc3NldDE=",
+        "name": name,
+        "state": "uploaded",
+        "content_type": "application/octet-stream",
+        "size": len(content),
+        "download_count": 0,
+        "created_at": "2013-02-27T19:35:32Z",
+        "updated_at": "2013-02-27T19:35:32Z",
+        "digest": f"sha256:{hashlib.sha256(content).hexdigest()}",
+    }
+    data.update(kwargs)
+    return data
+
+
+class Server:
+    def __init__(self) -> None:
+        self.uploaded: dict[str, bytes] = {}
+        self.deleted: list[str] = []
+        self.failures: dict[str, int] = {}
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+
+        if request.method == "DELETE":
+            name = request.url.path.rsplit("/", 1)[-1]
+            self.deleted.append(name)
+            self.uploaded.pop(name, None)
+            return httpx.Response(204)
+
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json=[
+                    create_asset(name, content)
+                    for name, content in self.uploaded.items()
+                ],
+            )
+
+        name = request.url.params["name"]
+        content = await request.aread()
+        if self.failures.get(name):
+            self.failures[name] -= 1
+            # a failed upload leaves a broken asset
+            self.uploaded[name] = b""
+            return httpx.Response(502)
+
+        if name in self.uploaded:
+            return httpx.Response(422)
+
+        self.uploaded[name] = content
+        return httpx.Response(201, json={"name": name})
+
+
+class UploadAssetsTestCase(IsolatedAsyncioTestCase):
+    def create_client(self, server: Server) -> GitHubAsyncRESTClient:
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(server)
+        )
+        return client
+
+    async def test_upload(self):
+        server = Server()
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            foo = temp_dir / "foo.txt"
+            foo.write_bytes(b"foo" * 1000)
+            bar = temp_dir / "bar.pdf"
+            bar.write_bytes(b"bar")
+
+            uploads = [
+                upload
+                async for upload in upload_assets(
+                    client,
+                    create_release(),
+                    [foo, (bar, "application/pdf")],
+                    concurrency=2,
+                    chunk_size=100,
+                )
+            ]
+
+        self.assertEqual(server.uploaded["foo.txt"], b"foo" * 1000)
+        self.assertEqual(server.uploaded["bar.pdf"], b"bar")
+
+        uploads = {upload.name: upload for upload in uploads}
+        self.assertEqual(
+            uploads["foo.txt"].sha256,
+            hashlib.sha256(b"foo" * 1000).hexdigest(),
+        )
+        self.assertEqual(uploads["foo.txt"].size, 3000)
+        self.assertEqual(uploads["foo.txt"].attempts, 1)
+        self.assertEqual(
+            uploads["bar.pdf"].sha256, hashlib.sha256(b"bar").hexdigest()
+        )
+
+        content_types = {
+            request.url.params["name"]: request.headers["content-type"]
+            for request in server.requests
+        }
+        self.assertEqual(
+            content_types,
+            {
+                "foo.txt": "application/octet-stream",
+                "bar.pdf": "application/pdf",
+            },
+        )
+
+    async def test_retry_upload(self):
+        server = Server()
+        server.failures["foo.txt"] = 2
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            foo = temp_dir / "foo.txt"
+            foo.write_bytes(b"foo")
+
+            uploads = [
+                upload
+                async for upload in upload_assets(
+                    client, create_release(), [foo], retry_delay=0
+                )
+            ]
+
+        self.assertEqual(len(uploads), 1)
+        self.assertEqual(uploads[0].attempts, 3)
+        self.assertEqual(uploads[0].sha256, hashlib.sha256(b"foo").hexdigest())
+        self.assertEqual(server.uploaded["foo.txt"], b"foo")
+        # the broken asset of the failed upload has been removed
+        self.assertEqual(server.deleted, ["foo.txt", "foo.txt"])
+
+    async def test_retry_upload_failure(self):
+        server = Server()
+        server.failures["foo.txt"] = 5
+        client = self.create_client(server)
+
+        with temp_directory() as temp_dir:
+            foo = temp_dir / "foo.txt"
+            foo.write_bytes(b"foo")
+
+            with self.assertRaises(httpx.HTTPStatusError):
+                async for _ in upload_assets(
+                    client,
+                    create_release(),
+                    [foo],
+                    retry_delay=0,
+                    max_retries=1,
+                ):
+                    pass
+
+    async def test_transport_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused")
+
+        client = GitHubAsyncRESTClient("token")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        with temp_directory() as temp_dir:
+            foo = temp_dir / "foo.txt"
+            foo.write_bytes(b"foo")
+
+            with self.assertRaisesRegex(GitHubApiError, "after 1 attempts"):
+                async for _ in upload_assets(
+                    client, create_release(), [foo], max_retries=0
+                ):
+                    pass
+
+    async def test_skip_uploaded_assets(self):
+        server = Server()
+        client = self.create_client(server)
+        release = create_release(
+            [
+                create_asset("foo.txt", b"foo"),
+                create_asset("bar.txt", b"old"),
+            ]
+        )
+
+        with temp_directory() as temp_dir:
+            foo = temp_dir / "foo.txt"
+            foo.write_bytes(b"foo")
+            bar = temp_dir / "bar.txt"
+            bar.write_bytes(b"new")
+
+            uploads = {
+                upload.name: upload
+                async for upload in upload_assets(client, release, [foo, bar])
+            }
+
+        self.assertTrue(uploads["foo.txt"].skipped)
+        self.assertEqual(
+            uploads["foo.txt"].sha256, hashlib.sha256(b"foo").hexdigest()
+        )
+        self.assertFalse(uploads["bar.txt"].skipped)
+        self.assertEqual(server.deleted, ["bar.txt"])
+        self.assertEqual(server.uploaded, {"bar.txt": b"new"})
+
+
+class CreateChecksumManifestTestCase(IsolatedAsyncioTestCase):
+    def test_create_checksum_manifest(self):
+        manifest = create_checksum_manifest(
+            [
+                AssetUpload(path=Path("b"), name="b", size=1, sha256="222"),
+                AssetUpload(path=Path("a"), name="a", size=1, sha256="111"),
+            ]
+        )
+
+        self.assertEqual(manifest, "111  a\n222  b\n")
+
+    def test_bytes_per_second(self):
+        upload = AssetUpload(
+            path=Path("a"), name="a", size=100, sha256="1", duration=2.0
+        )
+        self.assertEqual(upload.bytes_per_second, 50.0)
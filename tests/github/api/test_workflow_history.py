@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from pontos.errors import PontosError
+from pontos.github.api.workflow_history import (
+    DurationPercentiles,
+    WorkflowRunHistory,
+)
+from pontos.github.api.workflows import GitHubAsyncRESTWorkflows
+from pontos.github.models.workflow import (
+    Event,
+    WorkflowRun,
+    WorkflowRunStatus,
+)
+from tests import AsyncIteratorMock, IsolatedAsyncioTestCase
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def create_run(
+    id: int,  # noqa: A002
+    *,
+    created: int,
+    queued: int = 10,
+    duration: int | None = 100,
+    name: str = "CI",
+    branch: str = "main",
+    conclusion: str | None = "success",
+) -> WorkflowRun:
+    created_at = START + timedelta(minutes=created)
+    run_started_at = created_at + timedelta(seconds=queued)
+    completed = duration is not None
+    run = MagicMock(
+        spec=WorkflowRun,
+        id=id,
+        workflow_id=42,
+        event=Event.PUSH,
+        head_branch=branch,
+        run_attempt=1,
+        created_at=created_at,
+        run_started_at=run_started_at,
+        updated_at=run_started_at + timedelta(seconds=duration or 0),
+        status=(
+            WorkflowRunStatus.COMPLETED
+            if completed
+            else WorkflowRunStatus.IN_PROGRESS
+        ),
+        conclusion=conclusion if completed else None,
+    )
+    # name is an argument of MagicMock itself
+    run.name = name
+    return run
+
+
+class DurationPercentilesTestCase(unittest.TestCase):
+    def test_from_seconds(self):
+        percentiles = DurationPercentiles.from_seconds(range(1, 101))
+
+        self.assertEqual(percentiles.p50, timedelta(seconds=50.5))
+        self.assertEqual(percentiles.p90, timedelta(seconds=90.1))
+        self.assertEqual(percentiles.max, timedelta(seconds=100))
+
+    def test_single_value(self):
+        percentiles = DurationPercentiles.from_seconds([5])
+
+        self.assertEqual(percentiles.p50, timedelta(seconds=5))
+        self.assertEqual(percentiles.p99, timedelta(seconds=5))
+
+    def test_no_values(self):
+        self.assertIsNone(DurationPercentiles.from_seconds([]))
+
+
+class WorkflowRunHistoryTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.history = WorkflowRunHistory(":memory:")
+        self.history.open()
+        self.workflows = MagicMock(spec=GitHubAsyncRESTWorkflows)
+
+    def tearDown(self) -> None:
+        self.history.close()
+
+    def test_not_opened(self):
+        history = WorkflowRunHistory(":memory:")
+        with self.assertRaises(PontosError):
+            len(history)
+
+    async def test_initial_sync(self):
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [create_run(1, created=0), create_run(2, created=5)]
+        )
+
+        count = await self.history.sync(self.workflows, "foo/bar")
+
+        self.assertEqual(count, 2)
+        self.assertEqual(len(self.history), 2)
+        self.workflows.get_workflow_runs.assert_called_once_with(
+            "foo/bar", created=None
+        )
+
+        runs = list(self.history.runs("foo/bar"))
+        self.assertEqual([run.id for run in runs], [1, 2])
+        self.assertEqual(runs[0].name, "CI")
+        self.assertEqual(runs[0].event, "push")
+        self.assertEqual(runs[0].created_at, START)
+        self.assertEqual(runs[0].queue_duration, timedelta(seconds=10))
+        self.assertEqual(runs[0].run_duration, timedelta(seconds=100))
+
+    async def test_incremental_sync(self):
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [create_run(1, created=0), create_run(2, created=5)]
+        )
+        await self.history.sync(self.workflows, "foo/bar")
+
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [create_run(3, created=10)]
+        )
+        await self.history.sync(self.workflows, "foo/bar")
+
+        self.workflows.get_workflow_runs.assert_called_with(
+            "foo/bar", created=">=2026-01-01T00:05:00Z"
+        )
+        self.assertEqual(len(self.history), 3)
+
+    async def test_sync_refreshes_incomplete_runs(self):
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [
+                create_run(1, created=0),
+                create_run(2, created=5, duration=None),
+                create_run(3, created=10),
+            ]
+        )
+        await self.history.sync(self.workflows, "foo/bar")
+
+        run = next(
+            self.history.runs("foo/bar", since=START + timedelta(1)), None
+        )
+        self.assertIsNone(run)
+
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [create_run(2, created=5, duration=300), create_run(3, created=10)]
+        )
+        await self.history.sync(self.workflows, "foo/bar")
+
+        self.workflows.get_workflow_runs.assert_called_with(
+            "foo/bar", created=">=2026-01-01T00:05:00Z"
+        )
+        runs = {run.id: run for run in self.history.runs("foo/bar")}
+        self.assertEqual(runs[2].status, "completed")
+        self.assertEqual(runs[2].run_duration, timedelta(seconds=300))
+
+    async def test_sync_keeps_newer_data(self):
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [create_run(1, created=0, duration=300)]
+        )
+        await self.history.sync(self.workflows, "foo/bar")
+
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [create_run(1, created=0, duration=100)]
+        )
+        await self.history.sync(self.workflows, "foo/bar")
+
+        run = next(self.history.runs("foo/bar"))
+        self.assertEqual(run.run_duration, timedelta(seconds=300))
+
+    async def test_statistics(self):
+        self.workflows.get_workflow_runs.return_value = AsyncIteratorMock(
+            [
+                create_run(1, created=0, queued=10, duration=100),
+                create_run(
+                    2, created=1, queued=20, duration=200, conclusion="failure"
+                ),
+                create_run(3, created=2, queued=30, duration=300),
+                create_run(4, created=3, duration=None),
+                create_run(5, created=4, branch="dev", duration=50),
+                create_run(6, created=5, name="Docs", duration=10),
+            ]
+        )
+        await self.history.sync(self.workflows, "foo/bar")
+
+        statistics = self.history.statistics("foo/bar")
+
+        self.assertEqual(
+            [(s.workflow, s.branch) for s in statistics],
+            [("CI", "dev"), ("CI", "main"), ("Docs", "main")],
+        )
+
+        ci_main = statistics[1]
+        self.assertEqual(ci_main.count, 3)
+        self.assertEqual(ci_main.failures, 1)
+        self.assertAlmostEqual(ci_main.failure_rate, 1 / 3)
+        self.assertEqual(ci_main.queue.p50, timedelta(seconds=20))
+        self.assertEqual(ci_main.run.p50, timedelta(seconds=200))
+        self.assertEqual(ci_main.run.max, timedelta(seconds=300))
+
+        statistics = self.history.statistics(
+            "foo/bar", workflow="CI", branch="main"
+        )
+        self.assertEqual(len(statistics), 1)
+
+        self.assertEqual(self.history.statistics("foo/baz"), [])
@@ -3,19 +3,23 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
+import asyncio
 import io
 import unittest
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from contextlib import redirect_stderr
+from unittest.mock import MagicMock, patch
 
 from pontos.github.script.errors import GitHubScriptError
 from pontos.github.script.load import (
+    fan_out_github_script,
     load_script,
     run_add_arguments_function,
     run_github_script_function,
+    run_github_script_function_fan_out,
 )
 from pontos.testing import temp_file, temp_python_module
-from tests import IsolatedAsyncioTestCase
+from tests import AsyncIteratorMock, IsolatedAsyncioTestCase
 
 
 class LoadScriptTestCase(unittest.TestCase):
@@ -112,3 +116,103 @@ class RunGithubScriptFunctionTestCase(IsolatedAsyncioTestCase):
             self.assertRaises(GitHubScriptError),
         ):
             run_github_script_function(module, "123", 123, {})
+
+
+FAN_OUT_SCRIPT = """
+async def github_script(api, args):
+    if args.repository == "foo/fail":
+        raise ValueError("failed")
+    if args.repository == "foo/error":
+        return 1
+    return 0
+"""
+
+
+class RunGithubScriptFunctionFanOutTestCase(unittest.TestCase):
+    def test_repositories(self):
+        with (
+            temp_file(FAN_OUT_SCRIPT, name="foo.py") as f,
+            load_script(f) as module,
+        ):
+            results = run_github_script_function_fan_out(
+                module,
+                "123",
+                123,
+                Namespace(repository="-"),
+                repositories=["foo/bar", "foo/fail", "foo/error"],
+            )
+
+        self.assertEqual(
+            [result.repository for result in results],
+            ["foo/bar", "foo/fail", "foo/error"],
+        )
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].return_code, 0)
+
+        self.assertFalse(results[1].success)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertIsNone(results[1].return_code)
+
+        self.assertFalse(results[2].success)
+        self.assertEqual(results[2].return_code, 1)
+
+    @patch("pontos.github.script.load.GitHubAsyncRESTApi", autospec=True)
+    def test_organization(self, api_mock: MagicMock):
+        api = api_mock.return_value.__aenter__.return_value
+        api.organizations.get_repositories = MagicMock(
+            return_value=AsyncIteratorMock(
+                [MagicMock(full_name="foo/bar"), MagicMock(full_name="foo/baz")]
+            )
+        )
+
+        with (
+            temp_file(FAN_OUT_SCRIPT, name="foo.py") as f,
+            load_script(f) as module,
+        ):
+            results = run_github_script_function_fan_out(
+                module, "123", 123, Namespace(), organization="foo"
+            )
+
+        api.organizations.get_repositories.assert_called_once_with("foo")
+        self.assertEqual(
+            [result.repository for result in results], ["foo/bar", "foo/baz"]
+        )
+        self.assertTrue(all(result.success for result in results))
+
+    def test_missing_targets(self):
+        with (
+            temp_file(FAN_OUT_SCRIPT, name="foo.py") as f,
+            load_script(f) as module,
+            self.assertRaises(GitHubScriptError),
+        ):
+            run_github_script_function_fan_out(module, "123", 123, Namespace())
+
+
+class FanOutGithubScriptTestCase(IsolatedAsyncioTestCase):
+    async def test_concurrency_and_argument(self):
+        running = 0
+        max_running = 0
+
+        async def github_script(api, args):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return 0 if args.repo.startswith("foo/") else 1
+
+        args = Namespace(repo=None, other="value")
+        results = await fan_out_github_script(
+            github_script,
+            MagicMock(),
+            args,
+            [f"foo/repo{i}" for i in range(10)],
+            concurrency=3,
+            argument="repo",
+        )
+
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(max_running, 3)
+        # the original arguments are not changed
+        self.assertIsNone(args.repo)
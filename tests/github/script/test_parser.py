@@ -3,7 +3,10 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
+import io
 import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
 from unittest.mock import patch
 
 from pontos.github.api.helper import DEFAULT_TIMEOUT
@@ -43,3 +46,54 @@ class CreateParserTestCase(unittest.TestCase):
 
         self.assertEqual(args.timeout, 666)
         self.assertEqual(args.script, "my_script")
+
+    def test_parse_rate_limit(self):
+        parser = create_parser()
+        args = parser.parse_args(["my_script"])
+        self.assertFalse(args.rate_limit)
+
+        args = parser.parse_args(["--rate-limit", "my_script"])
+        self.assertTrue(args.rate_limit)
+
+    def test_parse_fan_out(self):
+        parser = create_parser()
+        args = parser.parse_args(["my_script"])
+        self.assertIsNone(args.fan_out_organization)
+        self.assertIsNone(args.fan_out_file)
+        self.assertEqual(args.fan_out_argument, "repository")
+        self.assertEqual(args.fan_out_concurrency, 10)
+
+        args = parser.parse_args(
+            [
+                "--fan-out-organization",
+                "foo",
+                "--fan-out-argument",
+                "repo",
+                "--fan-out-concurrency",
+                "5",
+                "my_script",
+            ]
+        )
+        self.assertEqual(args.fan_out_organization, "foo")
+        self.assertEqual(args.fan_out_argument, "repo")
+        self.assertEqual(args.fan_out_concurrency, 5)
+
+        args = parser.parse_args(["--fan-out-file", "repos.txt", "my_script"])
+        self.assertEqual(args.fan_out_file, Path("repos.txt"))
+
+    def test_parse_fan_out_exclusive_targets(self):
+        parser = create_parser()
+
+        with (
+            self.assertRaises(SystemExit),
+            redirect_stderr(io.StringIO()),
+        ):
+            parser.parse_args(
+                [
+                    "--fan-out-organization",
+                    "foo",
+                    "--fan-out-file",
+                    "repos.txt",
+                    "my_script",
+                ]
+            )
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+from datetime import datetime, timezone
+from typing import Any
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+from pontos.errors import PontosError
+from pontos.nvd.cpe.dictionary import CPEDictionary
+from pontos.testing import temp_directory
+from tests import AsyncMock, IsolatedAsyncioTestCase
+from tests.nvd import get_cpe_data
+
+CPE_NAME_ID_1 = "9BAECDB2-614D-4E9C-9936-190C30246F03"
+CPE_NAME_ID_2 = "87316812-5F2C-4286-94FE-CC98B9EAEF53"
+CPE_NAME_1 = "cpe:2.3:o:microsoft:windows_10_22h2:-:*:*:*:*:*:arm64:*"
+CPE_NAME_2 = "cpe:2.3:o:microsoft:windows_10_22h2:-:*:*:*:*:*:x64:*"
+
+
+def create_page(*cpes: dict[str, Any]) -> dict[str, Any]:
+    return {"products": [{"cpe": cpe} for cpe in cpes]}
+
+
+def create_api(*pages: dict[str, Any]) -> MagicMock:
+    results = MagicMock()
+    results.json = AsyncMock(side_effect=[*pages, None])
+    api = MagicMock()
+    api.cpes.return_value = results
+    return api
+
+
+class CPEDictionaryTestCase(TestCase):
+    def test_not_opened(self):
+        dictionary = CPEDictionary(":memory:")
+
+        with self.assertRaises(PontosError):
+            dictionary.get(CPE_NAME_ID_1)
+
+    def test_empty(self):
+        with CPEDictionary(":memory:") as dictionary:
+            self.assertEqual(len(dictionary), 0)
+            self.assertIsNone(dictionary.last_sync)
+            self.assertIsNone(dictionary.get(CPE_NAME_ID_1))
+            self.assertIsNone(dictionary.get_by_name(CPE_NAME_1))
+            self.assertNotIn(CPE_NAME_ID_1, dictionary)
+            self.assertEqual(list(dictionary), [])
+
+
+class CPEDictionarySyncTestCase(IsolatedAsyncioTestCase):
+    @patch("pontos.nvd.cpe.dictionary.now", autospec=True)
+    async def test_initial_sync(self, now_mock: MagicMock):
+        now_mock.return_value = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        api = create_api(
+            create_page(get_cpe_data()),
+            create_page(
+                get_cpe_data(
+                    {"cpe_name_id": CPE_NAME_ID_2, "cpe_name": CPE_NAME_2}
+                )
+            ),
+        )
+
+        with CPEDictionary(":memory:") as dictionary:
+            count = await dictionary.sync(api)
+
+            self.assertEqual(count, 2)
+            self.assertEqual(len(dictionary), 2)
+            self.assertEqual(
+                dictionary.last_sync, datetime(2023, 1, 1, tzinfo=timezone.utc)
+            )
+
+            api.cpes.assert_called_once_with(
+                last_modified_start_date=None,
+                last_modified_end_date=None,
+                results_per_page=None,
+            )
+
+            cpe = dictionary.get(CPE_NAME_ID_1)
+            self.assertEqual(cpe.cpe_name, CPE_NAME_1)
+            self.assertEqual(cpe.cpe_name_id, UUID(CPE_NAME_ID_1))
+
+            cpe = dictionary.get(CPE_NAME_ID_2.lower())
+            self.assertEqual(cpe.cpe_name, CPE_NAME_2)
+
+            cpe = dictionary.get_by_name(CPE_NAME_2)
+            self.assertEqual(cpe.cpe_name_id, UUID(CPE_NAME_ID_2))
+
+            self.assertIn(UUID(CPE_NAME_ID_1), dictionary)
+            self.assertEqual(
+                sorted(cpe.cpe_name for cpe in dictionary),
+                [CPE_NAME_1, CPE_NAME_2],
+            )
+
+    @patch("pontos.nvd.cpe.dictionary.now", autospec=True)
+    async def test_incremental_sync(self, now_mock: MagicMock):
+        now_mock.side_effect = [
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            datetime(2023, 1, 2, tzinfo=timezone.utc),
+        ]
+
+        with CPEDictionary(":memory:") as dictionary:
+            await dictionary.sync(create_api(create_page(get_cpe_data())))
+
+            api = create_api(
+                create_page(
+                    get_cpe_data(
+                        {
+                            "deprecated": True,
+                            "last_modified": "2023-01-01T12:00:00.000",
+                        }
+                    )
+                )
+            )
+            count = await dictionary.sync(api, results_per_page=100)
+
+            self.assertEqual(count, 1)
+            self.assertEqual(len(dictionary), 1)
+            api.cpes.assert_called_once_with(
+                last_modified_start_date=datetime(
+                    2023, 1, 1, tzinfo=timezone.utc
+                ),
+                last_modified_end_date=datetime(
+                    2023, 1, 2, tzinfo=timezone.utc
+                ),
+                results_per_page=100,
+            )
+
+            cpe = dictionary.get(CPE_NAME_ID_1)
+            self.assertTrue(cpe.deprecated)
+            self.assertEqual(
+                cpe.last_modified,
+                datetime(2023, 1, 1, 12, tzinfo=timezone.utc),
+            )
+
+    @patch("pontos.nvd.cpe.dictionary.now", autospec=True)
+    async def test_sync_splits_date_range(self, now_mock: MagicMock):
+        now_mock.side_effect = [
+            datetime(2023, 1, 1, tzinfo=timezone.utc),
+            datetime(2023, 6, 1, tzinfo=timezone.utc),
+        ]
+
+        with CPEDictionary(":memory:") as dictionary:
+            await dictionary.sync(create_api())
+
+            api = MagicMock()
+            results = MagicMock()
+            results.json = AsyncMock(return_value=None)
+            api.cpes.return_value = results
+
+            await dictionary.sync(api)
+
+            self.assertEqual(api.cpes.call_count, 2)
+            first, second = api.cpes.call_args_list
+            self.assertEqual(
+                first.kwargs["last_modified_end_date"],
+                datetime(2023, 5, 1, tzinfo=timezone.utc),
+            )
+            self.assertEqual(
+                second.kwargs["last_modified_start_date"],
+                datetime(2023, 5, 1, tzinfo=timezone.utc),
+            )
+            self.assertEqual(
+                second.kwargs["last_modified_end_date"],
+                datetime(2023, 6, 1, tzinfo=timezone.utc),
+            )
+
+    async def test_deprecated_by(self):
+        cpe_name_id_3 = "A09C4E47-6548-40C5-8458-5C07C3292C86"
+        api = create_api(
+            create_page(
+                get_cpe_data(
+                    {
+                        "deprecated": True,
+                        "deprecated_by": [{"cpe_name": CPE_NAME_2}],
+                    }
+                ),
+                get_cpe_data(
+                    {
+                        "cpe_name_id": CPE_NAME_ID_2,
+                        "cpe_name": CPE_NAME_2,
+                        "deprecated": True,
+                        "deprecated_by": [{"cpe_name_id": cpe_name_id_3}],
+                    }
+                ),
+                get_cpe_data(
+                    {
+                        "cpe_name_id": cpe_name_id_3,
+                        "cpe_name": "cpe:2.3:a:foo:bar:1.0:*:*:*:*:*:*:*",
+                    }
+                ),
+            )
+        )
+
+        with temp_directory() as temp_dir:
+            path = temp_dir / "cpes.db"
+            with CPEDictionary(path) as dictionary:
+                await dictionary.sync(api)
+
+            # reopen the persisted dictionary
+            with CPEDictionary(path) as dictionary:
+                replacements = dictionary.deprecated_by(CPE_NAME_ID_1)
+                self.assertEqual(len(replacements), 1)
+                self.assertEqual(
+                    replacements[0].cpe_name_id, UUID(cpe_name_id_3)
+                )
+
+                self.assertEqual(dictionary.deprecated_by(cpe_name_id_3), [])
@@ -10,10 +10,10 @@ from contextlib import redirect_stdout
 from io import StringIO
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-from pontos.errors import PontosError
-from pontos.testing import temp_directory, temp_file
+from pontos.git import Git
+from pontos.testing import temp_directory, temp_file, temp_git_repository
 from pontos.updateheader.updateheader import _add_header as add_header
 from pontos.updateheader.updateheader import (
     _compile_copyright_regex,
@@ -29,7 +29,7 @@ from pontos.updateheader.updateheader import (
     _get_exclude_list as get_exclude_list,
 )
 from pontos.updateheader.updateheader import (
-    _get_modified_year as get_modified_year,
+    _get_modified_years as get_modified_years,
 )
 from pontos.updateheader.updateheader import (
     _remove_outdated_lines as remove_outdated_lines,
@@ -40,25 +40,35 @@ HEADER = """# SPDX-FileCopyrightText: {date} Greenbone AG
 # SPDX-License-Identifier: AGPL-3.0-or-later"""
 
 
-class GetModifiedYearTestCase(TestCase):
-    @patch("pontos.updateheader.updateheader.Git")
-    def test_get_modified_year(self, git_mock):
-        with temp_file(name="test.py", change_into=True) as test_file:
-            git_instance_mock = MagicMock()
-            git_instance_mock.log.return_value = ["2020"]
-            git_mock.return_value = git_instance_mock
-
-            year = get_modified_year(f=test_file)
-            self.assertEqual(year, "2020")
-
-    def test_get_modified_year_error(self):
-        with (
-            temp_directory(change_into=True) as temp_dir,
-            self.assertRaises(PontosError),
-        ):
-            test_file = temp_dir / "test.py"
+class GetModifiedYearsTestCase(TestCase):
+    def test_get_modified_years(self):
+        with temp_git_repository() as temp_dir:
+            git = Git(temp_dir)
+            foo = temp_dir / "foo.py"
+            bar = temp_dir / "bar.py"
+            for date, files in (
+                ("2020-01-01T12:00:00+00:00", [foo, bar]),
+                ("2022-01-01T12:00:00+00:00", [bar]),
+            ):
+                for file in files:
+                    file.write_text(date, encoding="utf8")
+                git.add(files)
+                with patch.dict("os.environ", {"GIT_AUTHOR_DATE": date}):
+                    git.commit("Update", verify=False, gpg_sign=False)
+
+            with patch(
+                "pontos.updateheader.updateheader.Git",
+                return_value=git,
+            ):
+                years = get_modified_years([foo, bar, temp_dir / "baz.py"])
+
+        self.assertEqual(years, {foo.resolve(): "2020", bar.resolve(): "2022"})
+
+    def test_get_modified_years_no_git(self):
+        with temp_directory(change_into=True) as temp_dir:
+            years = get_modified_years([temp_dir / "test.py"])
 
-            get_modified_year(f=test_file)
+        self.assertEqual(years, {})
 
 
 class FindCopyRightTestCase(TestCase):
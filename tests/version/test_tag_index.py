@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from unittest.mock import MagicMock
+
+from pontos.git import Git
+from pontos.testing import temp_git_repository
+from pontos.version import TagIndex
+from pontos.version.helper import get_last_release_versions
+from pontos.version.schemes import (
+    PEP440VersioningScheme,
+    SemanticVersioningScheme,
+)
+from tests import enter_context
+
+parse_version = PEP440VersioningScheme.parse_version
+Version = PEP440VersioningScheme.version_cls
+
+TAGS = [
+    "v1.0.0",
+    "v1.1.0",
+    "v1.10.0",
+    "v1.2.0",
+    "v1.2.1a1",
+    "v2.0.0",
+    "v2.1.0rc1",
+    "foo",
+]
+
+
+class TagIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = enter_context(self, temp_git_repository())
+        self.git = Git(self.tmp)
+        self.git.exec("commit", "--allow-empty", "--no-gpg-sign", "-m", "Init")
+        for tag in TAGS:
+            self.git.tag(tag, sign=False)
+
+    def test_tag_refs(self):
+        refs = self.git.tag_refs()
+
+        self.assertEqual(sorted(refs), sorted(TAGS))
+        self.assertEqual(len(set(refs.values())), 1)
+
+    def test_last_release_version(self):
+        index = TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        self.assertEqual(len(index), 7)
+        self.assertEqual(index.last_release_version(), Version("2.1.0rc1"))
+        self.assertEqual(
+            index.last_release_version(ignore_pre_releases=True),
+            Version("2.0.0"),
+        )
+        self.assertEqual(
+            index.last_release_version(release_series="1"),
+            Version("1.10.0"),
+        )
+        self.assertEqual(
+            index.last_release_version(release_series="1.2"),
+            Version("1.2.1a1"),
+        )
+        self.assertEqual(
+            index.last_release_version(
+                release_series="1.2", ignore_pre_releases=True
+            ),
+            Version("1.2.0"),
+        )
+        self.assertIsNone(index.last_release_version(release_series="3"))
+
+    def test_last_release_versions(self):
+        index = TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        self.assertEqual(
+            list(index.last_release_versions(ignore_pre_releases=True)),
+            [
+                Version("2.0.0"),
+                Version("1.10.0"),
+                Version("1.2.0"),
+                Version("1.1.0"),
+                Version("1.0.0"),
+            ],
+        )
+        self.assertEqual(
+            list(index.last_release_versions(release_series="2")),
+            [Version("2.1.0rc1"), Version("2.0.0")],
+        )
+
+    def test_tag(self):
+        index = TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        self.assertEqual(index.tag(Version("1.2.0")), "v1.2.0")
+        self.assertIsNone(index.tag(Version("1.2.2")))
+
+    def test_cache(self):
+        TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        cache_files = list((self.tmp / ".git" / "pontos").iterdir())
+        self.assertEqual(len(cache_files), 1)
+
+        parse_mock = MagicMock(wraps=parse_version)
+        parse_mock.__self__ = PEP440VersioningScheme
+        index = TagIndex(parse_mock, git=self.git, git_tag_prefix="v")
+
+        parse_mock.assert_not_called()
+
+        self.assertEqual(
+            index.last_release_version(release_series="1"),
+            Version("1.10.0"),
+        )
+        parse_mock.assert_called_once_with("1.10.0")
+
+    def test_cache_updated_tags(self):
+        TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        self.git.tag("v1.11.0", sign=False)
+        self.git.delete_tag("v2.1.0rc1")
+
+        parse_mock = MagicMock(wraps=parse_version)
+        parse_mock.__self__ = PEP440VersioningScheme
+        index = TagIndex(parse_mock, git=self.git, git_tag_prefix="v")
+
+        # the invalid tag is known from the cache
+        self.assertNotIn("foo", [c.args[0] for c in parse_mock.call_args_list])
+        self.assertEqual(index.last_release_version(), Version("2.0.0"))
+        self.assertEqual(
+            index.last_release_version(release_series="1"),
+            Version("1.11.0"),
+        )
+
+    def test_cache_new_tag(self):
+        TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        self.git.tag("v1.11.0", sign=False)
+
+        parse_mock = MagicMock(wraps=parse_version)
+        parse_mock.__self__ = PEP440VersioningScheme
+        index = TagIndex(parse_mock, git=self.git, git_tag_prefix="v")
+
+        # the new tag is parsed. the other versions are only created for the
+        # comparisons of the binary search.
+        self.assertEqual(parse_mock.call_args_list[0].args, ("1.11.0",))
+        self.assertLessEqual(parse_mock.call_count, 4)
+        self.assertEqual(
+            list(index.last_release_versions(release_series="1")),
+            [
+                Version("1.11.0"),
+                Version("1.10.0"),
+                Version("1.2.1a1"),
+                Version("1.2.0"),
+                Version("1.1.0"),
+                Version("1.0.0"),
+            ],
+        )
+
+    def test_cache_changed_tag(self):
+        TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        self.git.exec("commit", "--allow-empty", "--no-gpg-sign", "-m", "2")
+        self.git.tag("v1.0.0", sign=False, force=True)
+        self.git.tag("v3.0.0", sign=False)
+
+        index = TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        self.assertEqual(len(index), 8)
+        self.assertEqual(index.last_release_version(), Version("3.0.0"))
+        self.assertEqual(
+            list(index.last_release_versions(release_series="1.0")),
+            [Version("1.0.0")],
+        )
+
+    def test_cache_other_prefix(self):
+        TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        index = TagIndex(parse_version, git=self.git, git_tag_prefix="v1.")
+
+        self.assertEqual(
+            index.last_release_version(release_series="10"), Version("10.0")
+        )
+
+    def test_cache_per_versioning_scheme(self):
+        TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        index = TagIndex(
+            SemanticVersioningScheme.parse_version,
+            git=self.git,
+            git_tag_prefix="v",
+        )
+
+        self.assertEqual(len(list((self.tmp / ".git" / "pontos").iterdir())), 2)
+        # 2.1.0rc1 and 1.2.1a1 are invalid semantic versions
+        self.assertEqual(len(index), 5)
+        self.assertEqual(
+            index.last_release_version(),
+            SemanticVersioningScheme.parse_version("2.0.0"),
+        )
+
+    def test_without_cache(self):
+        index = TagIndex(
+            parse_version, git=self.git, git_tag_prefix="v", cache=False
+        )
+
+        self.assertEqual(len(index), 7)
+        self.assertFalse((self.tmp / ".git" / "pontos").exists())
+
+    def test_same_versions_as_helper(self):
+        index = TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+
+        for ignore_pre_releases in (False, True):
+            self.assertEqual(
+                list(
+                    index.last_release_versions(
+                        ignore_pre_releases=ignore_pre_releases
+                    )
+                ),
+                list(
+                    get_last_release_versions(
+                        parse_version,
+                        git=self.git,
+                        git_tag_prefix="v",
+                        ignore_pre_releases=ignore_pre_releases,
+                    )
+                ),
+            )
+
+    def test_differences_to_helper(self):
+        self.git.tag("v2.1.0.dev1", sign=False)
+        self.git.tag("v2.2.0-dev", sign=False)
+
+        index = TagIndex(parse_version, git=self.git, git_tag_prefix="v")
+        helper_versions = list(
+            get_last_release_versions(
+                parse_version, git=self.git, git_tag_prefix="v"
+            )
+        )
+
+        # the helper strips the characters of the prefix from both ends
+        self.assertIn(Version("2.2.0.dev0"), index.last_release_versions())
+        self.assertNotIn(Version("2.2.0.dev0"), helper_versions)
+
+        # git sorts the dev release after the release candidate
+        self.assertEqual(helper_versions[0], Version("2.1.0.dev1"))
+        self.assertEqual(
+            list(index.last_release_versions(release_series="2.1")),
+            [Version("2.1.0rc1"), Version("2.1.0.dev1")],
+        )